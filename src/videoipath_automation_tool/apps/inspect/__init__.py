@@ -5,16 +5,23 @@ from videoipath_automation_tool.apps.inspect.app.actions import ConflictStrategy
 from videoipath_automation_tool.apps.inspect.transaction import CommitResult as CommitResult
 from videoipath_automation_tool.apps.inspect.transaction import InspectTransaction as InspectTransaction
 from videoipath_automation_tool.apps.inspect.domain import InspectAlarm as InspectAlarm
+from videoipath_automation_tool.apps.inspect.domain import InspectAlarmDelta as InspectAlarmDelta
 from videoipath_automation_tool.apps.inspect.domain import InspectDevice as InspectDevice
+from videoipath_automation_tool.apps.inspect.domain import InspectDeviceDrift as InspectDeviceDrift
+from videoipath_automation_tool.apps.inspect.domain import InspectDriftCounts as InspectDriftCounts
+from videoipath_automation_tool.apps.inspect.domain import InspectDriftReport as InspectDriftReport
 from videoipath_automation_tool.apps.inspect.domain import InspectEdge as InspectEdge
 from videoipath_automation_tool.apps.inspect.domain import InspectModule as InspectModule
 from videoipath_automation_tool.apps.inspect.domain import InspectPort as InspectPort
 from videoipath_automation_tool.apps.inspect.domain import InspectPortTemplate as InspectPortTemplate
 from videoipath_automation_tool.apps.inspect.domain import InspectService as InspectService
+from videoipath_automation_tool.apps.inspect.domain import InspectSeverityRollup as InspectSeverityRollup
 from videoipath_automation_tool.apps.inspect.domain import PortFromTemplate as PortFromTemplate
 from videoipath_automation_tool.apps.inspect.domain import VirtualDeviceSpec as VirtualDeviceSpec
 from videoipath_automation_tool.apps.inspect.domain import VirtualModuleSpec as VirtualModuleSpec
+from videoipath_automation_tool.apps.inspect.graph import InspectBlastRadius as InspectBlastRadius
 from videoipath_automation_tool.apps.inspect.errors import InspectCommitConflictError as InspectCommitConflictError
+from videoipath_automation_tool.apps.inspect.errors import InspectChunkedCommitError as InspectChunkedCommitError
 from videoipath_automation_tool.apps.inspect.errors import InspectCommitError as InspectCommitError
 from videoipath_automation_tool.apps.inspect.errors import InspectConflict as InspectConflict
 from videoipath_automation_tool.apps.inspect.errors import InspectEntityNotFoundError as InspectEntityNotFoundError
@@ -30,11 +37,17 @@ __all__ = [
     "CommitResult",
     "ConflictStrategy",
     "InspectAlarm",
+    "InspectAlarmDelta",
     "InspectApp",
+    "InspectBlastRadius",
+    "InspectChunkedCommitError",
     "InspectCommitConflictError",
     "InspectCommitError",
     "InspectConflict",
     "InspectDevice",
+    "InspectDeviceDrift",
+    "InspectDriftCounts",
+    "InspectDriftReport",
     "InspectEdge",
     "InspectEntityNotFoundError",
     "InspectError",
@@ -43,6 +56,7 @@ __all__ = [
     "InspectPortTemplate",
     "InspectQueryTooLongError",
     "InspectService",
+    "InspectSeverityRollup",
     "InspectTransaction",
     "PortFromTemplate",
     "VirtualDeviceSpec",
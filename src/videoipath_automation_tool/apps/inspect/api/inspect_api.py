@@ -73,6 +73,15 @@ class InspectAPI:
         items = _extract_items(response.data, "status", "collector", "inspect", "nodeStatus")
         return [InspectApiNodeStatusItem.model_validate(item) for item in items]
 
+    def get_device_skeleton_for(self, device_ids: list[str]) -> list[InspectApiNodeStatusItem]:
+        """Skeleton records of the given devices only (scoped ``where`` reads, chunked)."""
+        result: list[InspectApiNodeStatusItem] = []
+        for path in queries.device_skeleton_for(device_ids):
+            response = self.vip_connector.rest.get(path, allow_projection=True)
+            items = _extract_items(response.data, "status", "collector", "inspect", "nodeStatus")
+            result.extend(InspectApiNodeStatusItem.model_validate(item) for item in items)
+        return result
+
     def get_device_detail(self, device_id: str) -> Optional[InspectApiNodeStatusItem]:
         """One device's full nodeStatus sub-tree (lazy hydration)."""
         response = self.vip_connector.rest.get(queries.device_detail(device_id), allow_projection=True)
@@ -81,6 +90,15 @@ class InspectAPI:
             return None
         return InspectApiNodeStatusItem.model_validate(items[0])
 
+    def get_device_details(self, device_ids: list[str]) -> list[InspectApiNodeStatusItem]:
+        """Several devices' full nodeStatus sub-trees (scoped ``where`` reads, chunked)."""
+        result: list[InspectApiNodeStatusItem] = []
+        for path in queries.device_details(device_ids):
+            response = self.vip_connector.rest.get(path, allow_projection=True)
+            items = _extract_items(response.data, "status", "collector", "inspect", "nodeStatus")
+            result.extend(InspectApiNodeStatusItem.model_validate(item) for item in items)
+        return result
+
     def get_edge_skeleton(self) -> list[InspectApiExternalEdgesByDeviceKeyItem]:
         """All external-edge device pairs, lean projection."""
         response = self.vip_connector.rest.get(queries.edge_skeleton(), allow_projection=True)
@@ -101,6 +119,15 @@ class InspectAPI:
         items = _extract_items(response.data, "status", "collector", "inspect", "paths")
         return [InspectApiPathItem.model_validate(item) for item in items]
 
+    def get_paths_for_bookings(self, booking_ids: list[str]) -> list[InspectApiPathItem]:
+        """The services/paths items of the given bookings (scoped ``where`` reads, chunked)."""
+        result: list[InspectApiPathItem] = []
+        for path in queries.paths_for_bookings(booking_ids):
+            response = self.vip_connector.rest.get(path, allow_projection=True)
+            items = _extract_items(response.data, "status", "collector", "inspect", "paths")
+            result.extend(InspectApiPathItem.model_validate(item) for item in items)
+        return result
+
     def get_alarms_section(self) -> list[InspectApiAlarmItem]:
         """The current-alarms section (``status/alarms/current``)."""
         response = self.vip_connector.rest.get(queries.alarms_section(), allow_projection=True)
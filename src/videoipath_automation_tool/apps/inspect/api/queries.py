@@ -19,6 +19,7 @@ projections here are deliberately trimmed to stay well within the URI limit.
 from __future__ import annotations
 
 import urllib.parse
+from typing import Iterable
 
 from videoipath_automation_tool.apps.inspect.errors import InspectQueryTooLongError
 
@@ -40,11 +41,26 @@ def device_skeleton() -> str:
     return _build(_DEVICE_SKELETON)
 
 
+def device_skeleton_for(device_ids: Iterable[str]) -> list[str]:
+    """GET paths for the skeleton records of the given devices only (same projection as
+    :func:`device_skeleton`, ``where (deviceId='…') or …``), split to fit :data:`MAX_QUERY_LENGTH`."""
+    return _where_chunks(_NODE_STATUS_ROOT, _DEVICE_SKELETON_TAIL, "deviceId", device_ids)
+
+
 def device_detail(device_id: str) -> str:
     """GET path for one device's full nodeStatus sub-tree (modules, ports, vertexInfo, ...)."""
     return _build(f"/status/collector/inspect/nodeStatus/{device_id}/**")
 
 
+def device_details(device_ids: Iterable[str]) -> list[str]:
+    """GET paths for several devices' full nodeStatus sub-trees (batched targeted refresh).
+
+    One ``nodeStatus/* where (deviceId='…') or …/**`` query per chunk; ids are split across as
+    many queries as needed to stay within :data:`MAX_QUERY_LENGTH`.
+    """
+    return _where_chunks(_NODE_STATUS_ROOT, "/**", "deviceId", device_ids)
+
+
 def edge_skeleton() -> str:
     """GET path for the lean edge skeleton (all device pairs, connectivity + status severities)."""
     return _build(_EDGE_SKELETON)
@@ -60,6 +76,16 @@ def paths_section() -> str:
     return _build(_PATHS_SECTION)
 
 
+def paths_for_bookings(booking_ids: Iterable[str]) -> list[str]:
+    """GET paths for the services/paths items of the given bookings (targeted refresh).
+
+    One ``paths/* where (serviceFields.bid='…') or …`` query per chunk, with the section
+    projection; ids are split across as many queries as needed to stay within
+    :data:`MAX_QUERY_LENGTH`.
+    """
+    return _where_chunks(_PATHS_ROOT, _PATHS_TAIL, "serviceFields.bid", booking_ids)
+
+
 def alarms_section() -> str:
     """GET path for the current-alarms section (``status/alarms/current``)."""
     return _build(_ALARMS_SECTION)
@@ -86,10 +112,11 @@ def virtual_devices() -> str:
 # Everything else (spaces, double quotes, ...) is percent-encoded.
 _SAFE = "/*,'=()"
 
+_NODE_STATUS_ROOT = "/status/collector/inspect/nodeStatus/*"
+
 # Device skeleton: identity + descriptor + meta (incl. coordinates) + status + syncSeverity
 # + tags, with the module sub-tree suppressed ("_noId"). ~200 char URL, ~30 KB / 30 devices.
-_DEVICE_SKELETON = (
-    "/status/collector/inspect/nodeStatus/*"
+_DEVICE_SKELETON_TAIL = (
     "/deviceId,resourceId,syncSeverity"
     "/.../descriptor/**"
     "/.../.../meta/**"
@@ -97,6 +124,7 @@ _DEVICE_SKELETON = (
     "/.../.../tags/*"
     '/.../.../modules/"_noId"'
 )
+_DEVICE_SKELETON = _NODE_STATUS_ROOT + _DEVICE_SKELETON_TAIL
 
 # Edge skeleton (lean): device-pair keys, edge ids, endpoint port context+labels, and the
 # pair-level status severities. No pathDescriptions, no bandwidth values. ~370 char URL.
@@ -113,8 +141,8 @@ _EDGE_LEAN_TAIL = (
 _EDGE_SKELETON = "/status/collector/externalEdgesByDeviceKey/*" + _EDGE_LEAN_TAIL
 
 # Services / paths section: serviceFields (endpoints, labels, status) + per-hop path structure.
-_PATHS_SECTION = (
-    "/status/collector/inspect/paths/*"
+_PATHS_ROOT = "/status/collector/inspect/paths/*"
+_PATHS_TAIL = (
     "/serviceFields/bid,from,fromLabel,isMain,to,toLabel"
     "/.../generic/descriptor/**"
     "/.../.../serviceStatus/**"
@@ -122,6 +150,7 @@ _PATHS_SECTION = (
     "/.../structure/deviceId,deviceLabel,devicePid"
     "/.../inputStatus,outputStatus/label,pid"
 )
+_PATHS_SECTION = _PATHS_ROOT + _PATHS_TAIL
 
 # Current alarms: lean projection of identity, acknowledgement, point labels, and severity/message.
 # Verified 2026.2.0: two `/.../` pops after each selected sub-tree (same grammar as the collector
@@ -138,6 +167,29 @@ _VIRTUAL_TEMPLATES = "/status/network/virtualTemplates/**"
 _VIRTUAL_DEVICES = "/status/network/virtualDevices/**"
 
 
+def _where_chunks(root: str, tail: str, field: str, values: Iterable[str]) -> list[str]:
+    """``root where (field='v1') or (field='v2') …tail`` paths, greedily chunked by length."""
+    clauses = []
+    for value in dict.fromkeys(values):
+        if "'" in value:
+            raise ValueError(f"Value {value!r} cannot be quoted in a where clause.")
+        clauses.append(f"({field}='{value}')")
+    paths: list[str] = []
+    chunk: list[str] = []
+    for clause in clauses:
+        if chunk and len(encode(_DATA + _where_path(root, tail, chunk + [clause]))) > MAX_QUERY_LENGTH:
+            paths.append(_build(_where_path(root, tail, chunk)))
+            chunk = []
+        chunk.append(clause)
+    if chunk:
+        paths.append(_build(_where_path(root, tail, chunk)))
+    return paths
+
+
+def _where_path(root: str, tail: str, clauses: list[str]) -> str:
+    return f"{root} where {' or '.join(clauses)}{tail}"
+
+
 def _build(path: str) -> str:
     encoded = encode(_DATA + path)
     if len(encoded) > MAX_QUERY_LENGTH:
@@ -149,10 +201,13 @@ __all__ = [
     "MAX_QUERY_LENGTH",
     "encode",
     "device_skeleton",
+    "device_skeleton_for",
     "device_detail",
+    "device_details",
     "edge_skeleton",
     "edge_pair",
     "paths_section",
+    "paths_for_bookings",
     "alarms_section",
     "collector_full",
     "virtual_templates",
@@ -12,11 +12,14 @@ dedicated network actions.
 from __future__ import annotations
 
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from enum import IntEnum
-from typing import TYPE_CHECKING, Iterable, Mapping, Optional, Protocol, Union
+from typing import TYPE_CHECKING, Iterable, Iterator, Mapping, Optional, Protocol, Union
 
 from videoipath_automation_tool.apps.inspect.api import InspectAPI
 from videoipath_automation_tool.apps.inspect.domain.device import VirtualDeviceSpec
+from videoipath_automation_tool.apps.inspect.domain.drift import InspectDriftReport, _DriftAccumulator
 from videoipath_automation_tool.apps.inspect.domain.port import (
     InspectPortTemplate,
     PortFromTemplate,
@@ -48,6 +51,13 @@ class ConflictStrategy(IntEnum):
     CANCEL_SERVICES = 2
 
 
+# lookupSyncInfo is chunked for fleet-wide drift reports; chunks run concurrently.
+_SYNC_INFO_CHUNK_SIZE = 100
+_SYNC_INFO_WORKERS = 8
+
+# addVirtualTopology takes one device/module per call; bulk port adds fan out over this many workers.
+_VIRTUAL_PORT_WORKERS = 8
+
 # (device_id, x, y) or just device_id (placed at 0,0).
 AddDeviceSpec = Union[str, tuple[str, float, float]]
 
@@ -69,6 +79,69 @@ class InspectActionsMixin:
             raise ValueError("device_ids must not be empty.")
         return self._inspect_api.lookup_sync_info(device_ids).data
 
+    def iter_sync_info(
+        self: _HasInspectApi,
+        device_ids: Iterable[str],
+        *,
+        chunk_size: int = _SYNC_INFO_CHUNK_SIZE,
+        workers: int = _SYNC_INFO_WORKERS,
+    ) -> Iterator[tuple[str, InspectApiLookupSyncInfoItem]]:
+        """Stream ``(device_id, sync info)`` for many devices as ``lookupSyncInfo`` chunks complete.
+
+        Device ids are split into chunks of ``chunk_size`` that run concurrently on ``workers``
+        threads; results are yielded in completion order.
+
+        Raises:
+            InspectError: after all other chunks were yielded, when one or more chunks failed.
+        """
+        failed: list[str] = []
+        for chunk, data, error in _iter_sync_info_chunks(self._inspect_api, device_ids, chunk_size, workers):
+            if data is None:
+                self._logger.warning(f"lookupSyncInfo failed for {len(chunk)} device(s): {error}")
+                failed.extend(chunk)
+                continue
+            yield from data.items()
+        if failed:
+            raise InspectError(f"lookupSyncInfo failed for {len(failed)} device(s): {', '.join(failed)}")
+
+    def get_drift_report(
+        self: _HasInspectApi,
+        device_ids: Optional[Iterable[str]] = None,
+        *,
+        drivers: Optional[Mapping[str, str]] = None,
+        include_clean: bool = False,
+        chunk_size: int = _SYNC_INFO_CHUNK_SIZE,
+        workers: int = _SYNC_INFO_WORKERS,
+    ) -> InspectDriftReport:
+        """Fleet-wide sync drift summary: add/remove/update counts per device, module and driver.
+
+        Args:
+            device_ids: devices to check; defaults to every non-virtual device in the topology.
+            drivers: optional ``{device_id: driver_id}`` (e.g. ``app.inventory.get_device_drivers()``)
+                to aggregate per driver.
+            include_clean: also list devices without drift in ``report.devices``.
+            chunk_size: device ids per ``lookupSyncInfo`` request.
+            workers: concurrent ``lookupSyncInfo`` requests.
+
+        Returns:
+            InspectDriftReport: failed chunks are listed in ``failed_device_ids`` instead of raising.
+        """
+        if device_ids is None:
+            snapshot = self._ensure_snapshot()
+            device_ids = [device.id for device in snapshot.devices if not device.is_virtual]
+        accumulator = _DriftAccumulator(drivers, include_clean)
+        started = time.perf_counter()
+        for chunk, data, error in _iter_sync_info_chunks(self._inspect_api, device_ids, chunk_size, workers):
+            if data is None:
+                self._logger.warning(f"lookupSyncInfo failed for {len(chunk)} device(s): {error}")
+                accumulator.failed_device_ids.extend(chunk)
+                continue
+            for device_id, item in data.items():
+                accumulator.add(device_id, item)
+        report = accumulator.report()
+        _log_action_time(self._logger, "drift report", started, f"{report.checked} device(s)")
+        return report
+
     def add_devices_to_topology(
         self: _HasInspectApi,
         devices: Iterable[AddDeviceSpec],
@@ -221,22 +294,40 @@ class InspectActionsMixin:
         """
         if copies < 1:
             raise ValueError("copies must be at least 1.")
-        body = spec.to_wire()
+        return self.create_virtual_devices_bulk([spec] * copies)
+
+    def create_virtual_devices_bulk(self: _HasInspectApi, specs: Iterable[VirtualDeviceSpec]) -> list["InspectDevice"]:
+        """Create virtual devices from heterogeneous specs in a single ``updateVirtualInstances`` action.
+
+        The snapshot is updated once at the end with a scoped skeleton upsert of the created ids, so
+        building a large virtual studio costs one network action and one read.
+
+        Args:
+            specs: one module/port definition per device to create (order is preserved).
+
+        Returns:
+            Created :class:`InspectDevice` objects (server-assigned ``virtual.N`` ids).
+
+        Raises:
+            InspectError: the network action failed, or created devices are not yet in the snapshot.
+        """
+        bodies = [spec.to_wire() for spec in specs]
+        if not bodies:
+            raise ValueError("specs must not be empty.")
+        started = time.perf_counter()
         response = self._inspect_api.update_virtual_instances(
-            InspectApiUpdateVirtualInstancesData(
-                add=[body for _ in range(copies)],
-                update={},
-                remove=[],
-                force=False,
-            )
+            InspectApiUpdateVirtualInstancesData(add=bodies, update={}, remove=[], force=False)
         )
+        _log_action_time(self._logger, "updateVirtualInstances", started, f"{len(bodies)} device(s)")
         if not (response.header.ok and response.data.res.ok and response.data.validation.result.ok):
             msgs = response.data.res.msg or response.data.validation.result.msg
             detail = "; ".join(m for m in msgs if m) or "updateVirtualInstances reported failure"
             raise InspectError(f"create_virtual_devices failed: {detail}")
         created_ids = list(response.data.addedDeviceLabels)
         snapshot = self._ensure_snapshot()
+        started = time.perf_counter()
         snapshot.upsert_devices_from_skeleton(created_ids)
+        _log_action_time(self._logger, "snapshot upsert", started, f"{len(created_ids)} device(s)")
         devices: list[InspectDevice] = []
         for device_id in created_ids:
             device = snapshot.get_device(device_id)
@@ -273,6 +364,60 @@ class InspectActionsMixin:
         count_by_template = _ports_to_count_by_template(ports)
         if not count_by_template:
             raise ValueError("ports must not be empty.")
+        if not self._add_virtual_topology(device_id, module_number, count_by_template):
+            return False
+        self._refresh_after_network_action([device_id])
+        return True
+
+    def add_virtual_ports_bulk(
+        self: _HasInspectApi,
+        ports_by_device: Mapping[str, Mapping[int, Mapping[str, int] | list[PortFromTemplate]]],
+    ) -> bool:
+        """Add ports from templates to many virtual-device modules, refreshing the snapshot once.
+
+        ``addVirtualTopology`` takes one device/module per call, so every ``(device, module)`` pair
+        is one action (ports for the same pair are merged into a single ``countByVertexTemplate``);
+        the actions run concurrently and the snapshot is refreshed once for every device that
+        received ports.
+
+        Args:
+            ports_by_device: ``{device_id: {module_number: ports}}`` where ``ports`` is
+                ``{template_id: count}`` or a list of :class:`PortFromTemplate`.
+
+        Returns:
+            bool: whether every action reported success (failures and errors are logged per module;
+            the snapshot is still refreshed for every device whose action succeeded).
+        """
+        jobs: list[tuple[str, int, dict[str, int]]] = []
+        for device_id, modules in ports_by_device.items():
+            validate_virtual_device_id(device_id)
+            for module_number, ports in modules.items():
+                if module_number < 0:
+                    raise ValueError("module_number must be non-negative.")
+                count_by_template = _ports_to_count_by_template(ports)
+                if count_by_template:
+                    jobs.append((device_id, module_number, count_by_template))
+        if not jobs:
+            raise ValueError("ports_by_device must not be empty.")
+        started = time.perf_counter()
+        if len(jobs) == 1:
+            results = [self._try_add_virtual_topology(*jobs[0])]
+        else:
+            with ThreadPoolExecutor(max_workers=min(_VIRTUAL_PORT_WORKERS, len(jobs))) as pool:
+                results = list(pool.map(lambda job: self._try_add_virtual_topology(*job), jobs))
+        _log_action_time(self._logger, "addVirtualTopology batch", started, f"{len(jobs)} module(s)")
+        refreshed = list(dict.fromkeys(job[0] for job, ok in zip(jobs, results) if ok))
+        if refreshed:
+            started = time.perf_counter()
+            self._refresh_after_network_action(refreshed)
+            _log_action_time(self._logger, "snapshot refresh", started, f"{len(refreshed)} device(s)")
+        return all(results)
+
+    def _add_virtual_topology(
+        self: _HasInspectApi, device_id: str, module_number: int, count_by_template: dict[str, int]
+    ) -> bool:
+        """Run one timed ``addVirtualTopology`` action; logs and returns ``False`` on failure."""
+        started = time.perf_counter()
         response = self._inspect_api.add_virtual_topology(
             InspectApiAddVirtualTopologyData(
                 deviceId=device_id,
@@ -280,12 +425,24 @@ class InspectActionsMixin:
                 countByVertexTemplate=count_by_template,
             )
         )
+        _log_action_time(self._logger, "addVirtualTopology", started, f"{device_id} module {module_number}")
         if not response.data.ok:
-            self._logger.warning(f"addVirtualTopology reported failure: {response.data.msg}")
+            self._logger.warning(
+                f"addVirtualTopology reported failure for '{device_id}' module {module_number}: {response.data.msg}"
+            )
             return False
-        self._refresh_after_network_action([device_id])
         return True
 
+    def _try_add_virtual_topology(
+        self: _HasInspectApi, device_id: str, module_number: int, count_by_template: dict[str, int]
+    ) -> bool:
+        """:meth:`_add_virtual_topology` for one job of a bulk add: an error is logged and counts as failure."""
+        try:
+            return self._add_virtual_topology(device_id, module_number, count_by_template)
+        except Exception as error:
+            self._logger.warning(f"addVirtualTopology failed for '{device_id}' module {module_number}: {error}")
+            return False
+
     def _ensure_snapshot(self: _HasInspectApi) -> "InspectSnapshot":
         """Return the app snapshot, building it lazily when the read mixin is available."""
         get_snapshot = getattr(self, "_get_snapshot", None)
@@ -307,6 +464,33 @@ class InspectActionsMixin:
             self._snapshot.apply_network_refresh(device_ids)
 
 
+def _log_action_time(logger: logging.Logger, action: str, started: float, detail: str) -> None:
+    logger.debug("%s (%s) took %.1f ms", action, detail, (time.perf_counter() - started) * 1000)
+
+
+def _iter_sync_info_chunks(
+    api: InspectAPI, device_ids: Iterable[str], chunk_size: int, workers: int
+) -> Iterator[tuple[list[str], Optional[dict[str, InspectApiLookupSyncInfoItem]], Optional[Exception]]]:
+    """Run ``lookupSyncInfo`` per chunk concurrently; yield ``(chunk, data, error)`` as chunks complete."""
+    if chunk_size < 1 or workers < 1:
+        raise ValueError("chunk_size and workers must be at least 1.")
+    ids = list(dict.fromkeys(device_ids))
+    chunks = [ids[start : start + chunk_size] for start in range(0, len(ids), chunk_size)]
+    if not chunks:
+        return
+    pool = ThreadPoolExecutor(max_workers=min(workers, len(chunks)))
+    try:
+        futures = {pool.submit(api.lookup_sync_info, chunk): chunk for chunk in chunks}
+        for future in as_completed(futures):
+            try:
+                yield futures[future], future.result().data, None
+            except Exception as error:
+                yield futures[future], None, error
+    finally:
+        # Stop queued chunks when the consumer abandons the stream early.
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
 def _to_add_item(spec: AddDeviceSpec) -> InspectApiAddDevicesItem:
     if isinstance(spec, str):
         return InspectApiAddDevicesItem(id=spec, x=0, y=0)
@@ -13,6 +13,7 @@ import warnings
 from typing import TYPE_CHECKING, Optional
 
 from videoipath_automation_tool.apps.inspect.api import InspectAPI
+from videoipath_automation_tool.connector.capabilities import INSPECT_MIN_VERIFIED_VERSION
 from videoipath_automation_tool.connector.vip_connector import VideoIPathConnector
 
 if TYPE_CHECKING:
@@ -63,27 +64,13 @@ class InspectApp(InspectReadMixin, InspectWriteMixin, InspectActionsMixin):
         self._logger.warning(_BETA_MESSAGE)
 
     def _warn_if_version_unverified(self) -> None:
-        version = self._vip_connector.videoipath_version
-        parsed = _parse_version(version)
-        if parsed is not None and parsed < _MIN_VERIFIED_VERSION:
+        capabilities = self._vip_connector.capabilities
+        if not capabilities.inspect_verified:
+            major, minor = INSPECT_MIN_VERIFIED_VERSION
             self._logger.warning(
-                f"Inspect app: VideoIPath version '{version}' predates the first verified Inspect "
-                f"surface ({_MIN_VERIFIED_VERSION[0]}.{_MIN_VERIFIED_VERSION[1]}). Behaviour is unverified."
+                f"Inspect app: VideoIPath version '{capabilities.version}' predates the first verified Inspect "
+                f"surface ({major}.{minor}). Behaviour is unverified."
             )
 
 
-# First VideoIPath version the Inspect collector surface was verified against.
-_MIN_VERIFIED_VERSION = (2025, 4)
-
-
-def _parse_version(version: str) -> Optional[tuple[int, int]]:
-    parts = version.split(".")
-    if len(parts) < 2:
-        return None
-    try:
-        return int(parts[0]), int(parts[1])
-    except ValueError:
-        return None
-
-
 __all__ = ["InspectApp"]
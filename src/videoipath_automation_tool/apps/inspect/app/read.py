@@ -10,15 +10,25 @@ from __future__ import annotations
 import logging
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import TYPE_CHECKING, Literal, Optional, Protocol
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, Iterator, Literal, Optional, Protocol
 
 from videoipath_automation_tool.apps.inspect.api import InspectAPI
+from videoipath_automation_tool.apps.inspect.model.common import InspectSeverity
 from videoipath_automation_tool.apps.inspect.snapshot import InspectSnapshot
 
 if TYPE_CHECKING:
+    from videoipath_automation_tool.apps.inspect.domain.alarm import (
+        InspectAlarmDelta,
+        InspectRollupScope,
+        InspectSeverityRollup,
+    )
     from videoipath_automation_tool.apps.inspect.domain.device import InspectDevice
     from videoipath_automation_tool.apps.inspect.domain.edge import InspectEdge
+    from videoipath_automation_tool.apps.inspect.domain.port import InspectPort
     from videoipath_automation_tool.apps.inspect.domain.service import InspectService
+    from videoipath_automation_tool.apps.inspect.graph import InspectBlastRadius
+    from videoipath_automation_tool.apps.inspect.tables import InspectTable
 
 LoadMode = Literal["skeleton", "full"]
 
@@ -47,6 +57,13 @@ class InspectReadMixin:
             self._load_mode = load
         self._snapshot = self._load_snapshot(self._load_mode)
 
+    def wait_for_refresh(self: _HasInspectState, timeout: Optional[float] = None) -> bool:
+        """Block until background post-commit refreshes (``commit(background_refresh=True)``) have
+        landed. Returns ``False`` on timeout; ``True`` immediately when nothing is loaded."""
+        if self._snapshot is None:
+            return True
+        return self._snapshot.wait_for_refresh(timeout)
+
     # --- Devices ---
 
     @property
@@ -86,6 +103,36 @@ class InspectReadMixin:
         """When the given device's current data was fetched (freshness introspection)."""
         return self._get_snapshot().fetched_at(device_id)
 
+    # --- Ports ---
+
+    def query_ports(
+        self: _HasInspectState,
+        *,
+        device_ids: Optional[Iterable[str]] = None,
+        device_label: Optional[str] = None,
+        module_id: Optional[str] = None,
+        vertex_type: Optional[str] = None,
+        kind: Optional[str] = None,
+        active: Optional[bool] = None,
+        controlled: Optional[bool] = None,
+        endpoint: Optional[bool] = None,
+    ) -> list["InspectPort"]:
+        """Filter ports across devices (same filters as ``InspectDevice.filter_ports``).
+
+        Without ``device_ids`` only already-hydrated devices are scanned; call :meth:`preload`
+        first to query the whole site.
+        """
+        return self._get_snapshot().query_ports(
+            device_ids=device_ids,
+            device_label=device_label,
+            module_id=module_id,
+            vertex_type=vertex_type,
+            kind=kind,
+            active=active,
+            controlled=controlled,
+            endpoint=endpoint,
+        )
+
     # --- Edges ---
 
     @property
@@ -93,6 +140,34 @@ class InspectReadMixin:
         """All external edges (device-pair connectivity)."""
         return self._get_snapshot().edges
 
+    # --- Graph ---
+
+    def shortest_path(
+        self: _HasInspectState, from_device_id: str, to_device_id: str, *, directed: bool = False
+    ) -> list["InspectDevice"]:
+        """Fewest-hop device path between two devices (both included), or ``[]`` if unconnected.
+
+        Args:
+            directed: Only follow edges in their ``from`` -> ``to`` direction.
+        """
+        snapshot = self._get_snapshot()
+        ids = snapshot.get_graph().shortest_path(from_device_id, to_device_id, directed=directed)
+        return [device for device_id in ids if (device := snapshot.get_device(device_id)) is not None]
+
+    def get_neighbourhood(self: _HasInspectState, device_id: str, hops: int = 1) -> list["InspectDevice"]:
+        """Devices within ``hops`` external edges of a device, nearest first."""
+        snapshot = self._get_snapshot()
+        ids = snapshot.get_graph().neighbourhood(device_id, hops)
+        return [device for device_id in ids if (device := snapshot.get_device(device_id)) is not None]
+
+    def get_connected_components(self: _HasInspectState) -> list[list[str]]:
+        """Device ids grouped by connected component (via external edges), largest first."""
+        return self._get_snapshot().get_graph().connected_components()
+
+    def get_blast_radius(self: _HasInspectState, device_id: str) -> "InspectBlastRadius":
+        """Devices isolated and services affected if the given device fails."""
+        return self._get_snapshot().get_graph().blast_radius(device_id)
+
     # --- Services ---
 
     @property
@@ -108,6 +183,72 @@ class InspectReadMixin:
         """All services whose path traverses the given device."""
         return self._get_snapshot().get_services_for_device(device_id)
 
+    def get_services_for_edge(self: _HasInspectState, edge_id: str) -> list["InspectService"]:
+        """All services whose path crosses the given external edge."""
+        return self._get_snapshot().get_services_for_edge(edge_id)
+
+    # --- Alarms ---
+
+    def poll_alarms(self: _HasInspectState) -> list["InspectAlarmDelta"]:
+        """Re-read the current alarms and return what was raised / updated / cleared since the last read."""
+        return self._get_snapshot().poll_alarms()
+
+    def iter_alarm_deltas(
+        self: _HasInspectState, *, interval: float = 5.0, max_polls: Optional[int] = None
+    ) -> Iterator["InspectAlarmDelta"]:
+        """Poll the current alarms every ``interval`` seconds and yield each change once, in order.
+
+        The feed is bound to the current internal view; :meth:`refresh` starts a new one.
+        """
+        return self._get_snapshot().iter_alarm_deltas(interval=interval, max_polls=max_polls)
+
+    def get_device_alarm_severity(self: _HasInspectState, device_id: str) -> Optional[InspectSeverity | int]:
+        """Worst active alarm severity on a device, or ``None`` without active alarms."""
+        return self._get_snapshot().get_device_alarm_severity(device_id)
+
+    def get_severity_rollup(
+        self: _HasInspectState, scope: "InspectRollupScope", key: str
+    ) -> Optional["InspectSeverityRollup"]:
+        """Cached alarm summary for a device id, module pid or edge pair id (``scope`` ``"device"`` /
+        ``"module"`` / ``"pair"``), or ``None`` without active alarms."""
+        return self._get_snapshot().get_severity_rollup(scope, key)
+
+    def get_severity_rollups(
+        self: _HasInspectState,
+        scope: "InspectRollupScope" = "device",
+        *,
+        min_severity: Optional[InspectSeverity | int] = None,
+    ) -> list["InspectSeverityRollup"]:
+        """Alarm summaries of every device / module / pair with active alarms, worst first.
+
+        Example: devices with MAJOR or worse: ``get_severity_rollups(min_severity=InspectSeverity.MAJOR)``.
+        """
+        return self._get_snapshot().get_severity_rollups(scope, min_severity=min_severity)
+
+    # --- Columnar export ---
+
+    def to_tables(self: _HasInspectState, tables: Optional[Iterable[str]] = None) -> dict[str, "InspectTable"]:
+        """Column-oriented tables for analytics, built from the loaded view without per-object I/O.
+
+        Args:
+            tables: Subset of ``devices``, ``modules``, ``ports``, ``vertices``, ``edges``, ``paths``,
+                ``alarms`` (default: all). ``modules`` / ``ports`` / ``vertices`` cover hydrated devices
+                only; call :meth:`preload` first for a site-wide export.
+        """
+        return self._get_snapshot().to_tables(tables)
+
+    def export_tables(
+        self: _HasInspectState,
+        directory: str | Path,
+        *,
+        format: Literal["csv", "parquet"] = "csv",
+        tables: Optional[Iterable[str]] = None,
+        batch_size: Optional[int] = None,
+    ) -> dict[str, Path]:
+        """Stream tables to ``<directory>/<table>.csv`` (or ``.parquet``, which needs ``pyarrow``)
+        in row batches, so memory stays bounded. Returns the written file per table."""
+        return self._get_snapshot().write_tables(directory, format=format, tables=tables, batch_size=batch_size)
+
     # --- Internal snapshot lifecycle ---
 
     def _get_snapshot(self: _HasInspectState) -> InspectSnapshot:
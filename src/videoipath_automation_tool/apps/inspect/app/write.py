@@ -34,7 +34,7 @@ from videoipath_automation_tool.apps.inspect.transaction import (
     Editable,
     InspectTransaction,
     _is_single_editable,
-    _stage_editable,
+    _stage_editables,
 )
 
 if TYPE_CHECKING:
@@ -76,9 +76,7 @@ class InspectWriteMixin:
             )
 
         txn = self.transaction()
-        flushed_keys: list[tuple[str, str]] = []
-        for item in objects:
-            flushed_keys.extend(_stage_editable(txn, self._snapshot, item))
+        flushed_keys = _stage_editables(txn, self._snapshot, objects)
 
         if not flushed_keys and len(txn) == 0:
             raise ValueError("No pending edits to flush.")
@@ -1,7 +1,13 @@
 from __future__ import annotations
 
-from videoipath_automation_tool.apps.inspect.domain.alarm import InspectAlarm
+from videoipath_automation_tool.apps.inspect.domain.alarm import InspectAlarm, InspectAlarmDelta, InspectSeverityRollup
 from videoipath_automation_tool.apps.inspect.domain.device import InspectDevice, VirtualDeviceSpec
+from videoipath_automation_tool.apps.inspect.domain.drift import (
+    InspectDeviceDrift,
+    InspectDriftCounts,
+    InspectDriftReport,
+    build_drift_report,
+)
 from videoipath_automation_tool.apps.inspect.domain.edge import InspectEdge
 from videoipath_automation_tool.apps.inspect.domain.module import InspectModule, VirtualModuleSpec
 from videoipath_automation_tool.apps.inspect.domain.port import InspectPort, InspectPortTemplate, PortFromTemplate
@@ -16,8 +22,12 @@ from videoipath_automation_tool.apps.inspect.domain.vertex import (
 
 __all__ = [
     "InspectAlarm",
+    "InspectAlarmDelta",
     "InspectCodecVertex",
     "InspectDevice",
+    "InspectDeviceDrift",
+    "InspectDriftCounts",
+    "InspectDriftReport",
     "InspectEdge",
     "InspectGenericVertex",
     "InspectIpVertex",
@@ -26,8 +36,10 @@ __all__ = [
     "InspectPortTemplate",
     "InspectResourceTransformVertex",
     "InspectService",
+    "InspectSeverityRollup",
     "InspectVertex",
     "PortFromTemplate",
     "VirtualDeviceSpec",
     "VirtualModuleSpec",
+    "build_drift_report",
 ]
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import Literal
+
 from videoipath_automation_tool.apps.inspect.model.alarms import InspectApiAlarmItem
 from videoipath_automation_tool.apps.inspect.model.common import InspectFrozenModel, InspectSeverity, format_repr
 
@@ -79,4 +81,68 @@ class InspectAlarm(InspectFrozenModel):
     __str__ = __repr__
 
 
-__all__ = ["InspectAlarm"]
+InspectAlarmChange = Literal["raised", "updated", "cleared"]
+
+
+class InspectAlarmDelta(InspectFrozenModel):
+    """One change between two reads of ``status/alarms/current``, matched by alarm id.
+
+    ``alarm`` is the current state (the last known state for ``"cleared"``); ``previous`` is set
+    for ``"updated"``. ``sequence`` increases monotonically across reads of one snapshot.
+    """
+
+    change: InspectAlarmChange
+    alarm: InspectAlarm
+    previous: InspectAlarm | None = None
+    sequence: int
+
+    @property
+    def id(self) -> str | None:
+        return self.alarm.id
+
+    @property
+    def device_id(self) -> str | None:
+        point_id = self.alarm.point_id
+        return point_id[0] if point_id else None
+
+    def __repr__(self) -> str:
+        return format_repr(self, change=self.change, id=self.id, severity=self.alarm.severity, sequence=self.sequence)
+
+    __str__ = __repr__
+
+
+InspectRollupScope = Literal["device", "module", "pair"]
+
+
+class InspectSeverityRollup(InspectFrozenModel):
+    """Active-alarm summary for one device, module or edge pair: the worst severity and the
+    number of alarms per severity. Read from an incrementally maintained cache."""
+
+    scope: InspectRollupScope
+    key: str
+    worst: InspectSeverity | int | str | None = None
+    counts: dict[InspectSeverity | int | str | None, int]
+    total: int
+
+    def count_at_least(self, severity: InspectSeverity | int) -> int:
+        """Number of alarms whose severity is ``severity`` or worse."""
+        floor = int(severity)
+        return sum(
+            count
+            for value, count in self.counts.items()
+            if isinstance(value, int) and not isinstance(value, bool) and value >= floor
+        )
+
+    def __repr__(self) -> str:
+        return format_repr(self, scope=self.scope, key=self.key, worst=self.worst, total=self.total)
+
+    __str__ = __repr__
+
+
+__all__ = [
+    "InspectAlarm",
+    "InspectAlarmChange",
+    "InspectAlarmDelta",
+    "InspectRollupScope",
+    "InspectSeverityRollup",
+]
@@ -24,12 +24,13 @@ from videoipath_automation_tool.apps.inspect.snapshot import InspectSnapshot
 from videoipath_automation_tool.validators.virtual_device_id import is_virtual_device_id
 
 if TYPE_CHECKING:
-    from videoipath_automation_tool.apps.inspect.domain.alarm import InspectAlarm
+    from videoipath_automation_tool.apps.inspect.domain.alarm import InspectAlarm, InspectSeverityRollup
     from videoipath_automation_tool.apps.inspect.domain.edge import InspectEdge
     from videoipath_automation_tool.apps.inspect.domain.module import InspectModule
     from videoipath_automation_tool.apps.inspect.domain.port import InspectPort
     from videoipath_automation_tool.apps.inspect.domain.service import InspectService
     from videoipath_automation_tool.apps.inspect.domain.vertex import InspectVertex
+    from videoipath_automation_tool.apps.inspect.graph import InspectBlastRadius
     from videoipath_automation_tool.apps.inspect.snapshot import _DeviceRecord
 
 
@@ -142,6 +143,11 @@ class InspectDevice(InspectEditableModel):
         """Active alarms correlated to this device (worst severity first)."""
         return self.snapshot.get_alarms_for_device(self.id)
 
+    @property
+    def alarm_rollup(self) -> InspectSeverityRollup | None:
+        """Worst severity and per-severity counts of this device's active alarms (cached)."""
+        return self.snapshot.get_severity_rollup("device", self.id)
+
     @property
     def status_message(self) -> str | None:
         """Message of the worst active alarm on this device, if any."""
@@ -282,32 +288,15 @@ class InspectDevice(InspectEditableModel):
         with a single batched ``lookupInspectVertexByIds`` call. A port whose value for an explicit
         filter is unknown never matches.
         """
-        result: list[InspectPort] = []
-        for port in self.ports:
-            if module_id is not None and port.indexed.module_id != module_id:
-                continue
-            vertices = port._offline_vertices()
-            if vertex_type is not None and _port_direction(vertices) != vertex_type:
-                continue
-            if active is not None and _aggregate_flag(vertices, "is_active") is not active:
-                continue
-            if controlled is not None and _aggregate_flag(vertices, "is_controlled") is not controlled:
-                continue
-            if endpoint is not None and _aggregate_flag(vertices, "is_endpoint") is not endpoint:
-                continue
-            result.append(port)
-
-        if kind is not None:
-            first_sides = [sides[0] for p in result if (sides := p._vertex_sides())]
-            self.snapshot.get_vertex_details_many([vid for vid, _ in first_sides])
-            result = [
-                p
-                for p in result
-                if (sides := p._vertex_sides())
-                and (v := self.snapshot.get_vertex(sides[0][0], vertex_info=sides[0][1])) is not None
-                and v.vertex_kind == kind
-            ]
-        return result
+        return self.snapshot.query_ports(
+            device_ids=[self.id],
+            module_id=module_id,
+            vertex_type=vertex_type,
+            kind=kind,
+            active=active,
+            controlled=controlled,
+            endpoint=endpoint,
+        )
 
     @property
     def edges(self) -> list[InspectEdge]:
@@ -321,6 +310,15 @@ class InspectDevice(InspectEditableModel):
     def linked_devices(self) -> list[InspectDevice]:
         return self.snapshot.get_linked_devices(self.id)
 
+    def neighbourhood(self, hops: int = 1) -> list[InspectDevice]:
+        """Devices within ``hops`` external edges of this device, nearest first."""
+        ids = self.snapshot.get_graph().neighbourhood(self.id, hops)
+        return [device for device_id in ids if (device := self.snapshot.get_device(device_id)) is not None]
+
+    def blast_radius(self) -> InspectBlastRadius:
+        """Devices isolated and services affected if this device fails."""
+        return self.snapshot.get_graph().blast_radius(self.id)
+
     def __repr__(self) -> str:
         return format_repr(
             self,
@@ -405,26 +403,4 @@ class VirtualDeviceSpec(InspectInternalModel):
         return cls(modules=[VirtualModuleSpec(ports=resolved)])
 
 
-# --- Internal ---
-
-
-def _port_direction(vertices: list[InspectVertex]) -> str | None:
-    """Port-level direction: ``"BiDirectional"`` for a two-vertex port, else the single vertex's
-    direction (None for a port without vertices)."""
-    if len(vertices) > 1:
-        return "BiDirectional"
-    return vertices[0].vertex_type if vertices else None
-
-
-def _aggregate_flag(vertices: list[InspectVertex], attr: str) -> bool | None:
-    """Aggregate a vertex boolean flag across a port: True if any vertex is True, False only if all
-    are known False, else None (unknown)."""
-    values = [getattr(vertex, attr) for vertex in vertices]
-    if any(value is True for value in values):
-        return True
-    if values and all(value is False for value in values):
-        return False
-    return None
-
-
 __all__ = ["InspectDevice", "VirtualDeviceSpec"]
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+from typing import Iterable, Mapping, Optional
+
+from videoipath_automation_tool.apps.inspect.model.actions import InspectApiLookupSyncInfoItem
+from videoipath_automation_tool.apps.inspect.model.common import InspectFrozenModel, InspectSeverity, format_repr
+
+_UNKNOWN_DRIVER = "unknown"
+
+
+class InspectDriftCounts(InspectFrozenModel):
+    """Number of elements a re-sync would add, remove and update."""
+
+    add: int = 0
+    remove: int = 0
+    update: int = 0
+
+    @property
+    def total(self) -> int:
+        return self.add + self.remove + self.update
+
+    def __repr__(self) -> str:
+        return format_repr(self, add=self.add, remove=self.remove, update=self.update)
+
+    __str__ = __repr__
+
+
+class InspectDeviceDrift(InspectFrozenModel):
+    """``lookupSyncInfo`` differences of one device, counted per device and per module."""
+
+    device_id: str
+    label: str
+    severity: InspectSeverity | int | str | None = None
+    driver: str | None = None
+    counts: InspectDriftCounts
+    modules: dict[str, InspectDriftCounts]
+
+    @property
+    def drifted(self) -> bool:
+        return self.counts.total > 0
+
+    def __repr__(self) -> str:
+        return format_repr(self, device_id=self.device_id, label=self.label, total=self.counts.total)
+
+    __str__ = __repr__
+
+
+class InspectDriftReport(InspectFrozenModel):
+    """Fleet-wide sync drift summary built from streamed ``lookupSyncInfo`` results.
+
+    ``devices`` holds drifted devices only (all checked devices with ``include_clean=True``);
+    ``by_driver`` is filled when a device → driver mapping was supplied.
+    """
+
+    checked: int
+    devices: dict[str, InspectDeviceDrift]
+    by_driver: dict[str, InspectDriftCounts]
+    by_module: dict[str, InspectDriftCounts]
+    totals: InspectDriftCounts
+    failed_device_ids: list[str]
+
+    @property
+    def drifted_device_ids(self) -> list[str]:
+        return [device_id for device_id, drift in self.devices.items() if drift.drifted]
+
+    def __repr__(self) -> str:
+        return format_repr(
+            self,
+            checked=self.checked,
+            drifted=len(self.drifted_device_ids),
+            total=self.totals.total,
+            failed=len(self.failed_device_ids) or None,
+        )
+
+    __str__ = __repr__
+
+
+class _DriftAccumulator:
+    """Mutable per-driver / per-module tallies while sync info streams in."""
+
+    def __init__(self, drivers: Optional[Mapping[str, str]], include_clean: bool) -> None:
+        self._drivers = drivers
+        self._include_clean = include_clean
+        self.checked = 0
+        self.devices: dict[str, InspectDeviceDrift] = {}
+        self.by_driver: dict[str, list[int]] = {}
+        self.by_module: dict[str, list[int]] = {}
+        self.totals = [0, 0, 0]
+        self.failed_device_ids: list[str] = []
+
+    def add(self, device_id: str, item: InspectApiLookupSyncInfoItem) -> None:
+        self.checked += 1
+        counts = [len(item.add), len(item.remove), len(item.update)]
+        modules: dict[str, list[int]] = {}
+        for index, elements in enumerate((item.add, item.remove, item.update)):
+            for element_id in elements:
+                module_id = _module_of(device_id, element_id)
+                modules.setdefault(module_id, [0, 0, 0])[index] += 1
+                self.by_module.setdefault(module_id, [0, 0, 0])[index] += 1
+        driver = None
+        if self._drivers is not None:
+            driver = self._drivers.get(device_id) or _UNKNOWN_DRIVER
+            _add_counts(self.by_driver.setdefault(driver, [0, 0, 0]), counts)
+        _add_counts(self.totals, counts)
+        if sum(counts) or self._include_clean:
+            self.devices[device_id] = InspectDeviceDrift(
+                device_id=device_id,
+                label=item.label,
+                severity=item.severity,
+                driver=driver,
+                counts=_to_counts(counts),
+                modules={module_id: _to_counts(values) for module_id, values in modules.items()},
+            )
+
+    def report(self) -> InspectDriftReport:
+        return InspectDriftReport(
+            checked=self.checked,
+            devices=self.devices,
+            by_driver={driver: _to_counts(values) for driver, values in self.by_driver.items()},
+            by_module={module_id: _to_counts(values) for module_id, values in self.by_module.items()},
+            totals=_to_counts(self.totals),
+            failed_device_ids=self.failed_device_ids,
+        )
+
+
+def build_drift_report(
+    items: Iterable[tuple[str, InspectApiLookupSyncInfoItem]],
+    *,
+    drivers: Optional[Mapping[str, str]] = None,
+    include_clean: bool = False,
+) -> InspectDriftReport:
+    """Aggregate ``(device_id, sync info)`` pairs (consumed lazily) into an :class:`InspectDriftReport`."""
+    accumulator = _DriftAccumulator(drivers, include_clean)
+    for device_id, item in items:
+        accumulator.add(device_id, item)
+    return accumulator.report()
+
+
+def _module_of(device_id: str, element_id: str) -> str:
+    """Module of a sync-info element: the device id plus the first id segment after it
+    (``device12.1.Ethernet1.out`` -> ``device12.1``); elements not prefixed by the device id keep
+    the device id."""
+    prefix = f"{device_id}."
+    if not element_id.startswith(prefix):
+        return device_id
+    return f"{device_id}.{element_id[len(prefix) :].split('.', 1)[0]}"
+
+
+def _add_counts(target: list[int], counts: list[int]) -> None:
+    for index, value in enumerate(counts):
+        target[index] += value
+
+
+def _to_counts(values: list[int]) -> InspectDriftCounts:
+    return InspectDriftCounts(add=values[0], remove=values[1], update=values[2])
+
+
+__all__ = ["InspectDeviceDrift", "InspectDriftCounts", "InspectDriftReport", "build_drift_report"]
@@ -14,7 +14,7 @@ from videoipath_automation_tool.apps.inspect.model.common import (
 from videoipath_automation_tool.apps.inspect.snapshot import InspectSnapshot, _IndexedEdge
 
 if TYPE_CHECKING:
-    from videoipath_automation_tool.apps.inspect.domain.alarm import InspectAlarm
+    from videoipath_automation_tool.apps.inspect.domain.alarm import InspectAlarm, InspectSeverityRollup
     from videoipath_automation_tool.apps.inspect.domain.device import InspectDevice
     from videoipath_automation_tool.apps.inspect.domain.port import InspectPort
     from videoipath_automation_tool.apps.inspect.domain.service import InspectService
@@ -86,6 +86,11 @@ class InspectEdge(InspectEditableModel):
         """Active alarms correlated to this edge or its pair (worst severity first)."""
         return self.snapshot.get_alarms_for_edge(self.id, pair_id=self.pair_id)
 
+    @property
+    def alarm_rollup(self) -> InspectSeverityRollup | None:
+        """Worst severity and per-severity counts of the active alarms on this edge's pair."""
+        return self.snapshot.get_severity_rollup("pair", self.pair_id)
+
     @property
     def services(self) -> list[InspectService]:
         services: list[InspectService] = []
@@ -100,6 +105,12 @@ class InspectEdge(InspectEditableModel):
                 services.append(service)
         return services
 
+    @property
+    def crossing_services(self) -> list[InspectService]:
+        """Services whose path crosses this edge (``from`` device directly followed by ``to`` device).
+        Unlike :attr:`services`, services that only touch an endpoint device are left out."""
+        return self.snapshot.get_services_for_edge(self.id)
+
     # --- Config (the "Edit Edge" dialog fields; lazily fetched via lookupInspectEdgesByIds) ---
 
     @property
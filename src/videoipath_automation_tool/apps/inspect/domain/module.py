@@ -15,7 +15,7 @@ from videoipath_automation_tool.apps.inspect.model.virtual import InspectApiVirt
 from videoipath_automation_tool.apps.inspect.snapshot import InspectSnapshot, _STAGED_MISSING
 
 if TYPE_CHECKING:
-    from videoipath_automation_tool.apps.inspect.domain.alarm import InspectAlarm
+    from videoipath_automation_tool.apps.inspect.domain.alarm import InspectAlarm, InspectSeverityRollup
     from videoipath_automation_tool.apps.inspect.domain.device import InspectDevice
     from videoipath_automation_tool.apps.inspect.domain.port import InspectPort
     from videoipath_automation_tool.apps.inspect.domain.vertex import InspectVertex
@@ -87,6 +87,11 @@ class InspectModule(InspectEditableModel):
         """Active alarms correlated to this module (worst severity first)."""
         return self.snapshot.get_alarms_for_module(self.device_id, self.module_id)
 
+    @property
+    def alarm_rollup(self) -> InspectSeverityRollup | None:
+        """Worst severity and per-severity counts of the active alarms on this module and its ports."""
+        return self.snapshot.get_severity_rollup("module", self.module_id)
+
     @property
     def tags(self) -> list[str]:
         """Locally assigned module tags (``tagsInfo.assigned.local``; writable via assign/unassign)."""
@@ -23,6 +23,7 @@ from videoipath_automation_tool.apps.inspect.snapshot import (
     InspectSnapshot,
     _IndexedPort,
     _port_id_from_status,
+    _vertex_sides_from_status,
 )
 
 if TYPE_CHECKING:
@@ -202,12 +203,7 @@ class InspectPort(InspectFrozenModel):
 
     def _vertex_sides(self) -> list[tuple[str, InspectApiSingleVertexInfo]]:
         """(vertex id, its offline ``vertexInfo`` side) for each vertex the port carries."""
-        info = self.indexed.port.parsed_vertex_info
-        if info is None:
-            return []
-        if isinstance(info, InspectApiSingleVertexInfo):
-            return [(info.id, info)] if info.id else []
-        return [(side.id, side) for side in (info.out, info.in_) if side is not None and side.id]
+        return _vertex_sides_from_status(self.indexed.port)
 
     def _offline_vertices(self) -> list[InspectVertex]:
         """Base vertex views built purely from the offline ``vertexInfo`` (no lookup). Used for
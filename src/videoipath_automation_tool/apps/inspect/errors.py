@@ -15,6 +15,7 @@ if TYPE_CHECKING:
     from videoipath_automation_tool.apps.inspect.model.update_topology import (
         InspectApiUpdateTopologyResponse,
     )
+    from videoipath_automation_tool.apps.inspect.transaction import CommitResult
 
 
 class InspectError(Exception):
@@ -63,6 +64,32 @@ class InspectCommitError(InspectError):
         super().__init__(f"Inspect commit failed: {detail}")
 
 
+class InspectChunkedCommitError(InspectError):
+    """One or more chunks of a chunked commit were rejected or their request failed.
+
+    Unlike a single ``updateTopology`` commit, a chunked commit is not all-or-nothing: chunks
+    accepted before (or, without ``stop_on_rejection``, after) a rejection stay applied. ``results``
+    holds the per-chunk results of the accepted chunks, ``failures`` the ``(chunk_index, error)``
+    of each rejected chunk (an :class:`InspectCommitError`, or the exception the request raised),
+    and ``unapplied_ids`` every staged id that was not written.
+    """
+
+    def __init__(
+        self,
+        results: list["CommitResult"],
+        failures: list[tuple[int, Exception]],
+        unapplied_ids: list[str],
+    ) -> None:
+        self.results = results
+        self.failures = failures
+        self.unapplied_ids = unapplied_ids
+        first_index, first_error = failures[0]
+        super().__init__(
+            f"{len(failures)} commit chunk(s) rejected ({len(results)} applied, {len(unapplied_ids)} "
+            f"change(s) not written); first rejection in chunk {first_index}: {first_error}"
+        )
+
+
 class InspectConflict:
     """One entity whose server state changed between staging and commit."""
 
@@ -98,6 +125,7 @@ __all__ = [
     "InspectEntityNotFoundError",
     "InspectQueryTooLongError",
     "InspectCommitError",
+    "InspectChunkedCommitError",
     "InspectConflict",
     "InspectCommitConflictError",
 ]
@@ -0,0 +1,384 @@
+"""InspectGraph: device-level graph queries over an :class:`InspectSnapshot`.
+
+The graph is a compressed-sparse-row (CSR) adjacency of device indices built from the snapshot's
+edge index, stored in stdlib ``array`` columns (``offsets`` / ``targets`` / ``slots`` / ``forward``).
+Every directed external edge contributes one entry per endpoint, so traversals are undirected by
+default and can follow edge direction on request.
+
+The snapshot's post-commit hooks invalidate the touched devices and edge pairs; the next query
+re-reads only those into a small delta overlay (added entries + removed edge slots) on top of the
+CSR base, and the base is compacted once the overlay outgrows a fraction of it.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections import deque
+from typing import TYPE_CHECKING, Iterable, Iterator
+
+from videoipath_automation_tool.apps.inspect.model.common import InspectFrozenModel, format_repr
+from videoipath_automation_tool.apps.inspect.snapshot import _port_id_from_endpoint
+
+if TYPE_CHECKING:
+    from videoipath_automation_tool.apps.inspect.model.collector import InspectApiPathItem
+    from videoipath_automation_tool.apps.inspect.snapshot import InspectSnapshot, _IndexedEdge
+
+
+class InspectBlastRadius(InspectFrozenModel):
+    """What a device failure takes down: the devices cut off from the rest of its connected
+    component and the services whose path traverses the device."""
+
+    device_id: str
+    isolated_device_ids: list[str]
+    affected_booking_ids: list[str]
+
+    def __repr__(self) -> str:
+        return format_repr(
+            self,
+            device_id=self.device_id,
+            isolated=len(self.isolated_device_ids),
+            affected_services=len(self.affected_booking_ids),
+        )
+
+    __str__ = __repr__
+
+
+class InspectGraph:
+    def __init__(self, snapshot: InspectSnapshot) -> None:
+        self._snapshot = snapshot
+
+        # Nodes: device id <-> dense index. Removed devices keep their index but are skipped.
+        self._node_ids: list[str] = []
+        self._node_index: dict[str, int] = {}
+        self._dead: set[int] = set()
+
+        # Edge table: one slot per (pair, edge); freed slots are tombstoned until the next compaction.
+        self._edge_indexed: list[_IndexedEdge | None] = []
+        self._edge_slots_by_id: dict[str, list[int]] = {}
+        self._edge_slots_by_pair_id: dict[str, list[int]] = {}
+
+        # CSR base: entries offsets[n]:offsets[n + 1] are node n's (target, slot, forward) triples.
+        self._offsets = array("l", [0])
+        self._targets = array("l")
+        self._slots = array("l")
+        self._forward = array("b")
+
+        # Delta overlay on top of the CSR base, folded in by the next compaction.
+        self._added: dict[int, list[tuple[int, int, bool]]] = {}
+        self._added_count = 0
+        self._removed_slots: set[int] = set()
+
+        # Snapshot changes not yet applied (post-commit hooks only record ids; queries apply them).
+        self._dirty_devices: set[str] = set()
+        self._dirty_pairs: set[str] = set()
+
+        self._build()
+
+    def __repr__(self) -> str:
+        return format_repr(
+            self,
+            devices=len(self._node_ids) - len(self._dead),
+            edges=len(self._edge_slots_by_id),
+            pending=len(self._dirty_devices) + len(self._dirty_pairs) or None,
+        )
+
+    __str__ = __repr__
+
+    # --- Incremental updates ---
+
+    def invalidate(self, device_ids: Iterable[str] = (), pair_ids: Iterable[str] = ()) -> None:
+        """Record snapshot changes; they are applied (O(affected edges)) on the next query."""
+        self._dirty_devices.update(device_ids)
+        self._dirty_pairs.update(pair_ids)
+
+    # --- Queries ---
+
+    def shortest_path(self, source_id: str, target_id: str, *, directed: bool = False) -> list[str]:
+        """Fewest-hop device path from ``source_id`` to ``target_id`` (both included), or ``[]`` if
+        they are not connected. ``directed=True`` only follows edges from their ``from`` side."""
+        with self._snapshot._lock:
+            self._sync()
+            source = self._live_index(source_id)
+            target = self._live_index(target_id)
+            if source is None or target is None:
+                return []
+            if source == target:
+                return [source_id]
+            parents = array("l", [-1]) * len(self._node_ids)
+            parents[source] = source
+            queue = deque([source])
+            while queue:
+                node = queue.popleft()
+                for neighbour, _, forward in self._neighbours(node):
+                    if parents[neighbour] != -1 or (directed and not forward):
+                        continue
+                    parents[neighbour] = node
+                    if neighbour == target:
+                        return self._unwind(parents, source, target)
+                    queue.append(neighbour)
+            return []
+
+    def neighbourhood(self, device_id: str, hops: int = 1) -> list[str]:
+        """Devices within ``hops`` edges of ``device_id`` (excluding it), nearest first."""
+        with self._snapshot._lock:
+            self._sync()
+            source = self._live_index(device_id)
+            if source is None or hops < 1:
+                return []
+            distances = self._distances(source, hops)
+            ordered = sorted((distance, self._node_ids[node]) for node, distance in distances.items() if node != source)
+            return [node_id for _, node_id in ordered]
+
+    def connected_components(self) -> list[list[str]]:
+        """All connected components as sorted device-id lists, largest first."""
+        with self._snapshot._lock:
+            self._sync()
+            seen = bytearray(len(self._node_ids))
+            for node in self._dead:
+                seen[node] = 1
+            components: list[list[str]] = []
+            for start in range(len(self._node_ids)):
+                if seen[start]:
+                    continue
+                components.append(sorted(self._node_ids[node] for node in self._flood(start, seen)))
+            components.sort(key=lambda component: (-len(component), component[0]))
+            return components
+
+    def edge_endpoints(self, edge_id: str) -> _IndexedEdge | None:
+        with self._snapshot._lock:
+            self._sync()
+            for slot in self._edge_slots_by_id.get(edge_id, ()):
+                indexed = self._edge_indexed[slot]
+                if indexed is not None:
+                    return indexed
+            return None
+
+    def services_for_edge(self, edge_id: str) -> list[str]:
+        """Booking ids of the services whose path crosses the edge: the ``from`` device's segment is
+        directly followed by the ``to`` device's, on the edge's ports when the path carries them."""
+        indexed = self.edge_endpoints(edge_id)
+        if indexed is None or not indexed.from_device_id or not indexed.to_device_id:
+            return []
+        snapshot = self._snapshot
+        snapshot._ensure_section_paths()
+        result: list[str] = []
+        for booking_id in snapshot._services_by_device_id.get(indexed.from_device_id, []):
+            item = snapshot._paths_by_booking_id.get(booking_id)
+            if item is not None and _path_crosses(item, indexed):
+                result.append(booking_id)
+        return result
+
+    def blast_radius(self, device_id: str) -> InspectBlastRadius:
+        """Devices isolated by a failure of ``device_id`` and the services traversing it.
+
+        Removing the device splits its component into parts; every part but the largest is
+        considered isolated (a leaf device isolates nothing, a single-homed spine its leaves)."""
+        with self._snapshot._lock:
+            self._sync()
+            source = self._live_index(device_id)
+            isolated: list[str] = []
+            if source is not None:
+                seen = bytearray(len(self._node_ids))
+                for node in self._dead:
+                    seen[node] = 1
+                seen[source] = 1
+                parts = [
+                    self._flood(neighbour, seen)
+                    for neighbour, _, _ in list(self._neighbours(source))
+                    if not seen[neighbour]
+                ]
+                parts.sort(key=len, reverse=True)
+                isolated = sorted(self._node_ids[node] for part in parts[1:] for node in part)
+        self._snapshot._ensure_section_paths()
+        affected = list(self._snapshot._services_by_device_id.get(device_id, []))
+        return InspectBlastRadius(device_id=device_id, isolated_device_ids=isolated, affected_booking_ids=affected)
+
+    # --- Internal: construction ---
+
+    def _build(self) -> None:
+        snapshot = self._snapshot
+        for device_id in snapshot._devices_by_id:
+            self._node(device_id)
+        for pair_id in snapshot._devices_by_pair_id:
+            self._add_pair(pair_id)
+        self._compact()
+
+    def _compact(self) -> None:
+        """Fold the overlay into a fresh CSR base and drop tombstoned edge slots."""
+        live = [indexed for indexed in self._edge_indexed if indexed is not None]
+        self._edge_indexed = list(live)
+        self._edge_slots_by_id = {}
+        self._edge_slots_by_pair_id = {}
+        endpoints: list[tuple[int, int]] = []
+        for slot, indexed in enumerate(live):
+            self._register_slot(slot, indexed)
+            endpoints.append(self._endpoints(indexed))
+        num_nodes = len(self._node_ids)
+        degrees = array("l", [0]) * (num_nodes + 1)
+        for source, target in endpoints:
+            degrees[source + 1] += 1
+            degrees[target + 1] += 1
+        for node in range(num_nodes):
+            degrees[node + 1] += degrees[node]
+        offsets = degrees
+        cursor = array("l", offsets)
+        total = offsets[num_nodes]
+        targets = array("l", [0]) * total
+        slots = array("l", [0]) * total
+        forward = array("b", [0]) * total
+        for slot, (source, target) in enumerate(endpoints):
+            for node, neighbour, is_forward in ((source, target, 1), (target, source, 0)):
+                position = cursor[node]
+                targets[position] = neighbour
+                slots[position] = slot
+                forward[position] = is_forward
+                cursor[node] = position + 1
+        self._offsets, self._targets, self._slots, self._forward = offsets, targets, slots, forward
+        self._added = {}
+        self._added_count = 0
+        self._removed_slots = set()
+
+    def _sync(self) -> None:
+        if not self._dirty_devices and not self._dirty_pairs:
+            return
+        snapshot = self._snapshot
+        for device_id in self._dirty_devices:
+            if device_id in snapshot._devices_by_id:
+                self._dead.discard(self._node(device_id))
+            elif device_id in self._node_index:
+                self._dead.add(self._node_index[device_id])
+        for pair_id in self._dirty_pairs:
+            for slot in self._edge_slots_by_pair_id.pop(pair_id, ()):
+                self._remove_slot(slot)
+            self._add_pair(pair_id)
+        self._dirty_devices.clear()
+        self._dirty_pairs.clear()
+        if self._added_count + len(self._removed_slots) > max(_MIN_OVERLAY, len(self._targets) // _OVERLAY_RATIO):
+            self._compact()
+
+    def _add_pair(self, pair_id: str) -> None:
+        snapshot = self._snapshot
+        seen: set[str] = set()
+        for device_id in snapshot._devices_by_pair_id.get(pair_id, ()):
+            for indexed in snapshot._edges_by_device_id.get(device_id, {}).get(pair_id, ()):
+                if indexed.edge_id in seen or not indexed.from_device_id or not indexed.to_device_id:
+                    continue
+                if indexed.from_device_id == indexed.to_device_id:
+                    continue
+                seen.add(indexed.edge_id)
+                self._add_edge(indexed)
+
+    def _add_edge(self, indexed: _IndexedEdge) -> None:
+        slot = len(self._edge_indexed)
+        self._edge_indexed.append(indexed)
+        self._register_slot(slot, indexed)
+        source, target = self._endpoints(indexed)
+        self._added.setdefault(source, []).append((target, slot, True))
+        self._added.setdefault(target, []).append((source, slot, False))
+        self._added_count += 2
+
+    def _register_slot(self, slot: int, indexed: _IndexedEdge) -> None:
+        self._edge_slots_by_id.setdefault(indexed.edge_id, []).append(slot)
+        self._edge_slots_by_pair_id.setdefault(indexed.pair_id, []).append(slot)
+
+    def _remove_slot(self, slot: int) -> None:
+        indexed = self._edge_indexed[slot]
+        if indexed is None:
+            return
+        self._edge_indexed[slot] = None
+        self._removed_slots.add(slot)
+        slots = self._edge_slots_by_id.get(indexed.edge_id)
+        if slots is not None:
+            slots.remove(slot)
+            if not slots:
+                self._edge_slots_by_id.pop(indexed.edge_id, None)
+
+    def _node(self, device_id: str) -> int:
+        index = self._node_index.get(device_id)
+        if index is None:
+            index = len(self._node_ids)
+            self._node_ids.append(device_id)
+            self._node_index[device_id] = index
+        return index
+
+    def _endpoints(self, indexed: _IndexedEdge) -> tuple[int, int]:
+        # Only edges with both endpoint devices are added (see _add_pair).
+        return self._node(indexed.from_device_id or ""), self._node(indexed.to_device_id or "")
+
+    # --- Internal: traversal ---
+
+    def _live_index(self, device_id: str) -> int | None:
+        index = self._node_index.get(device_id)
+        return None if index is None or index in self._dead else index
+
+    def _neighbours(self, node: int) -> Iterator[tuple[int, int, bool]]:
+        removed, dead = self._removed_slots, self._dead
+        if node + 1 < len(self._offsets):
+            targets, slots, forward = self._targets, self._slots, self._forward
+            for position in range(self._offsets[node], self._offsets[node + 1]):
+                neighbour, slot = targets[position], slots[position]
+                if slot not in removed and neighbour not in dead:
+                    yield neighbour, slot, bool(forward[position])
+        for neighbour, slot, is_forward in self._added.get(node, ()):
+            if slot not in removed and neighbour not in dead:
+                yield neighbour, slot, is_forward
+
+    def _distances(self, source: int, max_hops: int) -> dict[int, int]:
+        distances = {source: 0}
+        queue = deque([source])
+        while queue:
+            node = queue.popleft()
+            distance = distances[node]
+            if distance == max_hops:
+                continue
+            for neighbour, _, _ in self._neighbours(node):
+                if neighbour not in distances:
+                    distances[neighbour] = distance + 1
+                    queue.append(neighbour)
+        return distances
+
+    def _flood(self, start: int, seen: bytearray) -> list[int]:
+        """All unseen nodes reachable from ``start``; marks them seen."""
+        seen[start] = 1
+        reached = [start]
+        queue = deque([start])
+        while queue:
+            for neighbour, _, _ in self._neighbours(queue.popleft()):
+                if not seen[neighbour]:
+                    seen[neighbour] = 1
+                    reached.append(neighbour)
+                    queue.append(neighbour)
+        return reached
+
+    def _unwind(self, parents: array, source: int, target: int) -> list[str]:
+        path = [target]
+        while path[-1] != source:
+            path.append(parents[path[-1]])
+        return [self._node_ids[node] for node in reversed(path)]
+
+
+# --- Internal ---
+
+# The overlay is compacted into the CSR base once it exceeds 1/_OVERLAY_RATIO of the base entries.
+_OVERLAY_RATIO = 8
+_MIN_OVERLAY = 1024
+
+
+def _path_crosses(item: InspectApiPathItem, indexed: _IndexedEdge) -> bool:
+    for current, following in zip(item.path, item.path[1:]):
+        here, there = current.structure, following.structure
+        if here is None or there is None:
+            continue
+        if here.deviceId != indexed.from_device_id or there.deviceId != indexed.to_device_id:
+            continue
+        out_port = _port_id_from_endpoint(here.outputStatus)
+        in_port = _port_id_from_endpoint(there.inputStatus)
+        if out_port and indexed.from_port_id and out_port != indexed.from_port_id:
+            continue
+        if in_port and indexed.to_port_id and in_port != indexed.to_port_id:
+            continue
+        return True
+    return False
+
+
+__all__ = ["InspectBlastRadius", "InspectGraph"]
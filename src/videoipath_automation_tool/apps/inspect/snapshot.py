@@ -13,14 +13,19 @@ touched entities via targeted scoped re-reads instead of a full reload.
 
 from __future__ import annotations
 
+import hashlib
 import logging
 import threading
-from concurrent.futures import ThreadPoolExecutor
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from datetime import datetime, timezone
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Iterator, Optional
+from functools import partial
+from itertools import compress
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, Literal, Optional
 
-from pydantic import Field
 
 from videoipath_automation_tool.apps.inspect.model.alarms import InspectApiAlarmItem
 from videoipath_automation_tool.apps.inspect.model.collector import (
@@ -35,15 +40,20 @@ from videoipath_automation_tool.apps.inspect.model.collector import (
     InspectPortStatus,
 )
 from videoipath_automation_tool.apps.inspect.model.common import (
-    InspectFrozenModel,
-    InspectInternalModel,
     InspectSeverity,
+    InspectVertexKind,
+    InspectVertexType,
     _STAGED_MISSING,
     format_repr,
 )
 
 if TYPE_CHECKING:
-    from videoipath_automation_tool.apps.inspect.domain.alarm import InspectAlarm
+    from videoipath_automation_tool.apps.inspect.domain.alarm import (
+        InspectAlarm,
+        InspectAlarmDelta,
+        InspectRollupScope,
+        InspectSeverityRollup,
+    )
     from videoipath_automation_tool.apps.inspect.domain.device import InspectDevice
     from videoipath_automation_tool.apps.inspect.domain.edge import InspectEdge
     from videoipath_automation_tool.apps.inspect.domain.module import InspectModule
@@ -51,6 +61,8 @@ if TYPE_CHECKING:
     from videoipath_automation_tool.apps.inspect.domain.service import InspectService
     from videoipath_automation_tool.apps.inspect.domain.vertex import InspectVertex
     from videoipath_automation_tool.apps.inspect.api import InspectAPI
+    from videoipath_automation_tool.apps.inspect.graph import InspectGraph
+    from videoipath_automation_tool.apps.inspect.tables import InspectTable
     from videoipath_automation_tool.apps.inspect.model.actions import (
         InspectApiEdgeForm,
         InspectApiLookupVertexResponseData,
@@ -81,14 +93,25 @@ class InspectSnapshot:
         self._devices_by_id: dict[str, _DeviceRecord] = {}
         self._devices_by_label: dict[str, list[str]] = {}
         self._edge_pairs: dict[str, InspectApiExternalEdgesByDeviceKeyItem] = {}
-        self._edges_by_device_id: dict[str, list[_IndexedEdge]] = {}
+        # device id -> pair id -> indexed edges of that pair listed under the device
+        self._edges_by_device_id: dict[str, dict[str, list[_IndexedEdge]]] = {}
         self._edge_by_port_key: dict[tuple[str, str], _IndexedEdge] = {}
 
+        # Reverse edge indexes, so pair/edge drops touch only the affected entries
+        self._devices_by_pair_id: dict[str, set[str]] = {}
+        self._port_keys_by_pair_id: dict[str, set[tuple[str, str]]] = {}
+        self._edge_ids_by_pair_id: dict[str, set[str]] = {}
+        self._pair_ids_by_edge_id: dict[str, set[str]] = {}
+
         # Per-device port + module indexes (populated on hydration)
         self._ports_by_device_id: dict[str, list[_IndexedPort]] = {}
         self._port_by_key: dict[tuple[str, str], _IndexedPort] = {}
         self._ports_by_pid: dict[str, list[_IndexedPort]] = {}
         self._modules_by_device_id: dict[str, dict[str, InspectApiModuleStatus]] = {}
+        # Byte-coded port attribute columns for query_ports, built lazily per hydrated device and
+        # dropped whenever the device's ports are rebuilt.
+        self._port_columns: dict[str, _PortColumns] = {}
+        self._direction_codes: dict[str | None, int] = {None: 0}
 
         # Vertex edit-form details, fetched lazily per vertex and invalidated when the
         # owning device's ports are rebuilt after a refresh/commit.
@@ -101,13 +124,21 @@ class InspectSnapshot:
         # Section: services / paths
         self._paths_by_booking_id: dict[str, InspectApiPathItem] = {}
         self._services_by_device_id: dict[str, list[str]] = {}
+        # Bookings traversing entities touched by a commit; re-read with a scoped query on next access.
+        self._stale_booking_ids: set[str] = set()
         self._section_loaded: dict[str, bool] = {"paths": False, "alarms": False}
         self._section_fetched_at: dict[str, datetime] = {}
 
-        # Section: current alarms (status/alarms/current), indexed by resource key
-        self._alarms: list[InspectApiAlarmItem] = []
-        self._alarms_by_device_id: dict[str, list[InspectApiAlarmItem]] = {}
-        self._alarms_by_resource_key: dict[str, list[InspectApiAlarmItem]] = {}
+        # Section: current alarms (status/alarms/current), keyed by alarm id and indexed by device /
+        # resource key. Re-reads are diffed by id, so only raised / updated / cleared alarms touch the
+        # indexes and the severity rollups; each change is appended to a bounded log.
+        self._alarms: dict[str, InspectApiAlarmItem] = {}
+        self._alarms_by_device_id: dict[str, dict[str, InspectApiAlarmItem]] = {}
+        self._alarms_by_resource_key: dict[str, dict[str, InspectApiAlarmItem]] = {}
+        # Severity rollups per scope ("device" / "module" / "pair") -> key, patched per alarm change.
+        self._alarm_rollups: dict[str, dict[str, _SeverityRollup]] = {scope: {} for scope in _ROLLUP_SCOPES}
+        self._alarm_log: deque["InspectAlarmDelta"] = deque(maxlen=_ALARM_LOG_LIMIT)
+        self._alarm_sequence = 0
 
         # Domain-object caches
         self._device_cache: dict[str, "InspectDevice"] = {}
@@ -118,6 +149,11 @@ class InspectSnapshot:
         # Entities whose post-write re-fetch failed; re-fetched lazily on next access.
         self._stale_devices: set[str] = set()
         self._stale_pairs: set[str] = set()
+        self._refresh_executor: Optional[ThreadPoolExecutor] = None
+        self._pending_refreshes: list[Future[None]] = []
+
+        # Device graph (CSR adjacency), built on first graph query and then patched incrementally.
+        self._graph: Optional["InspectGraph"] = None
 
         # Pending domain-object edits (wire-field intents) staged by setters before update()/commit.
         # Keyed by (kind, entity_id) where kind is "device" / "vertex" / "edge".
@@ -132,7 +168,7 @@ class InspectSnapshot:
             self._section_loaded["paths"] = True
             self._section_fetched_at["paths"] = self._created_at
         if alarm_items is not None:
-            self._index_alarms(alarm_items)
+            self._apply_alarm_section(alarm_items)
             self._section_loaded["alarms"] = True
             self._section_fetched_at["alarms"] = self._created_at
 
@@ -249,6 +285,75 @@ class InspectSnapshot:
         indexed = self._port_by_key.get((device_id, port_id))
         return self._wrap_port(indexed) if indexed else None
 
+    def query_ports(
+        self,
+        *,
+        device_ids: Iterable[str] | None = None,
+        device_label: str | None = None,
+        module_id: str | None = None,
+        vertex_type: InspectVertexType | str | None = None,
+        kind: InspectVertexKind | str | None = None,
+        active: bool | None = None,
+        controlled: bool | None = None,
+        endpoint: bool | None = None,
+    ) -> list["InspectPort"]:
+        """Filter ports across devices with the same semantics as ``InspectDevice.filter_ports``.
+
+        Without ``device_ids`` every already-hydrated device is scanned (nothing is fetched; call
+        ``preload()`` first for the whole site); explicit ``device_ids`` are hydrated on demand.
+        ``device_label`` restricts the scan to devices with that label. Direction / flag / module
+        filters are evaluated as byte masks over per-device columns; ``kind`` then resolves the
+        surviving ports with one batched vertex lookup. Results are in device order, then port order.
+        """
+        if device_ids is None:
+            scope = [device_id for device_id in self._devices_by_id if device_id in self._ports_by_device_id]
+        else:
+            scope = list(dict.fromkeys(device_ids))
+            for device_id in scope:
+                self._ensure_device_detail(device_id)
+        if device_label is not None:
+            labelled = set(self._devices_by_label.get(device_label, ()))
+            scope = [device_id for device_id in scope if device_id in labelled]
+
+        matched: list[_IndexedPort] = []
+        with self._lock:
+            indexed_columns: list[tuple[list[_IndexedPort], _PortColumns]] = []
+            for device_id in scope:
+                entries = self._ports_by_device_id.get(device_id)
+                if not entries:
+                    continue
+                columns = self._port_columns.get(device_id)
+                if columns is None:
+                    columns = self._port_columns[device_id] = _PortColumns(entries, self._direction_codes)
+                indexed_columns.append((entries, columns))
+            direction = None if vertex_type is None else self._direction_codes.get(vertex_type)
+            if vertex_type is not None and direction is None:
+                return []
+            flags = [
+                (name, _FLAG_TRUE if wanted else _FLAG_FALSE)
+                for name, wanted in (("active", active), ("controlled", controlled), ("endpoint", endpoint))
+                if wanted is not None
+            ]
+            for entries, columns in indexed_columns:
+                mask = columns.mask(module_id=module_id, direction=direction, flags=flags)
+                matched.extend(entries if mask is None else compress(entries, mask))
+            if direction == _DIRECTION_OVERFLOW:
+                # Codes past 254 share one byte value; confirm those matches exactly.
+                matched = [i for i in matched if _sides_direction(_vertex_sides_from_status(i.port)) == vertex_type]
+        result = [self._wrap_port(indexed) for indexed in matched]
+
+        if kind is not None:
+            first_sides = [sides[0] for p in result if (sides := p._vertex_sides())]
+            self.get_vertex_details_many([vid for vid, _ in first_sides])
+            result = [
+                p
+                for p in result
+                if (sides := p._vertex_sides())
+                and (v := self.get_vertex(sides[0][0], vertex_info=sides[0][1])) is not None
+                and v.vertex_kind == kind
+            ]
+        return result
+
     def find_port_by_id(self, port_id: str) -> Optional["InspectPort"]:
         indexed = self._ports_by_pid.get(port_id)
         return self._wrap_port(indexed[0]) if indexed else None
@@ -299,8 +404,8 @@ class InspectSnapshot:
         self._reconcile_stale_pairs()
         seen: set[str] = set()
         result: list["InspectEdge"] = []
-        for indexed_edges in self._edges_by_device_id.values():
-            for indexed in indexed_edges:
+        for pairs in self._edges_by_device_id.values():
+            for indexed in _chain_pairs(pairs):
                 if indexed.edge_id in seen:
                     continue
                 seen.add(indexed.edge_id)
@@ -314,7 +419,7 @@ class InspectSnapshot:
         self._reconcile_stale_pairs()
         seen: set[str] = set()
         result: list["InspectEdge"] = []
-        for indexed in self._edges_by_device_id.get(device_id, []):
+        for indexed in self._iter_device_edges(device_id):
             if indexed.edge_id in seen:
                 continue
             seen.add(indexed.edge_id)
@@ -327,7 +432,7 @@ class InspectSnapshot:
         self._reconcile_stale_pairs()
         seen: set[str] = set()
         result: list["InspectEdge"] = []
-        for indexed in self._edges_by_device_id.get(device_id, []):
+        for indexed in self._iter_device_edges(device_id):
             on_port = (indexed.from_device_id == device_id and indexed.from_port_id == port_id) or (
                 indexed.to_device_id == device_id and indexed.to_port_id == port_id
             )
@@ -359,12 +464,23 @@ class InspectSnapshot:
     def get_linked_devices(self, device_id: str) -> list["InspectDevice"]:
         self._reconcile_stale_pairs()
         linked: set[str] = set()
-        for indexed in self._edges_by_device_id.get(device_id, []):
+        for indexed in self._iter_device_edges(device_id):
             for candidate in (indexed.from_device_id, indexed.to_device_id):
                 if candidate and candidate != device_id:
                     linked.add(candidate)
         return [d for lid in sorted(linked) if (d := self.get_device(lid)) is not None]
 
+    # --- Graph reads (device-level adjacency; no hydration) ---
+
+    def get_graph(self) -> "InspectGraph":
+        from videoipath_automation_tool.apps.inspect.graph import InspectGraph
+
+        self._reconcile_stale_pairs()
+        with self._lock:
+            if self._graph is None:
+                self._graph = InspectGraph(self)
+            return self._graph
+
     # --- Service reads (section, trigger section load) ---
 
     @property
@@ -389,16 +505,24 @@ class InspectSnapshot:
                 result.append(self._wrap_service(item))
         return result
 
+    def get_services_for_edge(self, edge_id: str) -> list["InspectService"]:
+        result: list["InspectService"] = []
+        for booking_id in self.get_graph().services_for_edge(edge_id):
+            item = self._paths_by_booking_id.get(booking_id)
+            if item is not None:
+                result.append(self._wrap_service(item))
+        return result
+
     # --- Alarm reads (section, trigger section load) ---
 
     def get_alarms_for_device(self, device_id: str) -> list["InspectAlarm"]:
         self._ensure_section_alarms()
-        return _sorted_alarms(self._alarms_by_device_id.get(device_id, []))
+        return _sorted_alarms(self._alarms_by_device_id.get(device_id, {}).values())
 
     def get_alarms_for_resource(self, resource_key: str) -> list["InspectAlarm"]:
         """Alarms whose joined ``pointId`` equals ``resource_key`` (module/port pid, edge id, …)."""
         self._ensure_section_alarms()
-        return _sorted_alarms(self._alarms_by_resource_key.get(resource_key, []))
+        return _sorted_alarms(self._alarms_by_resource_key.get(resource_key, {}).values())
 
     def get_alarms_for_module(self, device_id: str, module_id: str) -> list["InspectAlarm"]:
         """Alarms whose joined ``pointId`` equals the module pid (device_id reserved for callers)."""
@@ -413,14 +537,108 @@ class InspectSnapshot:
 
     def get_alarms_for_edge(self, edge_id: str, *, pair_id: str | None = None) -> list["InspectAlarm"]:
         self._ensure_section_alarms()
-        items = list(self._alarms_by_resource_key.get(edge_id, []))
+        items = list(self._alarms_by_resource_key.get(edge_id, {}).values())
         if pair_id and pair_id != edge_id:
-            items.extend(self._alarms_by_resource_key.get(pair_id, []))
+            items.extend(self._alarms_by_resource_key.get(pair_id, {}).values())
         return _sorted_alarms(items)
 
     def get_alarms_for_service(self, booking_id: str) -> list["InspectAlarm"]:
         return self.get_alarms_for_resource(booking_id)
 
+    def get_device_alarm_severity(self, device_id: str) -> InspectSeverity | int | None:
+        """Worst active alarm severity on a device (O(1) from the incremental rollup); None if none."""
+        self._ensure_section_alarms()
+        rollup = self._alarm_rollups["device"].get(device_id)
+        return rollup.worst if rollup is not None else None
+
+    # --- Severity rollups (incremental; O(1) per key) ---
+
+    def get_severity_rollup(self, scope: InspectRollupScope, key: str) -> Optional["InspectSeverityRollup"]:
+        """Worst severity and per-severity counts of the active alarms under one key, or None.
+
+        ``scope`` is ``"device"`` (device id), ``"module"`` (module pid; includes its ports'
+        alarms) or ``"pair"`` (edge pair id or directed edge id).
+        """
+        self._ensure_section_alarms()
+        rollups = _rollups_for_scope(self._alarm_rollups, scope)
+        with self._lock:
+            rollup = rollups.get(key)
+            return rollup.freeze(scope, key) if rollup is not None else None
+
+    def get_severity_rollups(
+        self, scope: InspectRollupScope = "device", *, min_severity: InspectSeverity | int | None = None
+    ) -> list["InspectSeverityRollup"]:
+        """All rollups of a scope, worst first (then most alarms, then key).
+
+        ``min_severity`` keeps only keys whose worst active alarm is at least that severity, e.g.
+        ``get_severity_rollups("device", min_severity=InspectSeverity.MAJOR)``.
+        """
+        self._ensure_section_alarms()
+        rollups = _rollups_for_scope(self._alarm_rollups, scope)
+        floor = None if min_severity is None else int(min_severity)
+        with self._lock:
+            selected = [
+                (key, rollup)
+                for key, rollup in rollups.items()
+                if floor is None or _severity_rank(rollup.worst) >= floor
+            ]
+        selected.sort(key=lambda entry: (-_severity_rank(entry[1].worst), -entry[1].total, entry[0]))
+        return [rollup.freeze(scope, key) for key, rollup in selected]
+
+    # --- Alarm stream (diffed by alarm id) ---
+
+    def poll_alarms(self) -> list["InspectAlarmDelta"]:
+        """Re-read ``status/alarms/current`` and apply only the changes since the last read.
+
+        Alarms are matched by id: new ids are ``"raised"``, ids whose seqno / time / severity /
+        ack / hidden state changed are ``"updated"`` and missing ids are ``"cleared"``. Returns the
+        deltas applied by this read (all current alarms are ``"raised"`` on the first read).
+        """
+        if self._fetcher is None:
+            return []
+        items = self._fetcher.get_alarms_section()
+        with self._lock:
+            deltas = self._apply_alarm_section(items)
+            self._section_loaded["alarms"] = True
+            self._section_fetched_at["alarms"] = _now()
+        return deltas
+
+    def iter_alarm_deltas(
+        self, *, interval: float = 5.0, max_polls: int | None = None
+    ) -> Iterator["InspectAlarmDelta"]:
+        """Poll the alarms section every ``interval`` seconds and yield each change once, in order.
+
+        The feed starts from the state at call time. Changes applied by other reads of the section
+        (e.g. the lazy reload after a commit) are yielded too, since every read appends to the same
+        bounded change log. Stops after ``max_polls`` reads (never, by default).
+        """
+        return self._stream_alarm_deltas(self._alarm_sequence, interval, max_polls)
+
+    # --- Columnar export (no hydration; sections load once when requested) ---
+
+    def to_tables(self, tables: Optional[Iterable[str]] = None) -> dict[str, "InspectTable"]:
+        """Column-oriented tables (default: all of ``devices``, ``modules``, ``ports``, ``vertices``,
+        ``edges``, ``paths``, ``alarms``), built from the internal indexes without domain wrappers."""
+        from videoipath_automation_tool.apps.inspect.tables import build_tables
+
+        return build_tables(self, tables)
+
+    def write_tables(
+        self,
+        directory: str | Path,
+        *,
+        format: Literal["csv", "parquet"] = "csv",
+        tables: Optional[Iterable[str]] = None,
+        batch_size: Optional[int] = None,
+    ) -> dict[str, Path]:
+        """Stream tables to ``<directory>/<table>.<format>`` in row batches (bounded memory)."""
+        from videoipath_automation_tool.apps.inspect import tables as _tables
+
+        writer = {"csv": _tables.write_csv, "parquet": _tables.write_parquet}.get(format)
+        if writer is None:
+            raise ValueError(f"Unsupported table format {format!r}; expected 'csv' or 'parquet'.")
+        return writer(self, directory, tables, batch_size or _tables.DEFAULT_BATCH_ROWS)
+
     # --- Bulk preload ---
 
     def preload(self, devices: Optional[list[str]] = None) -> None:
@@ -435,8 +653,7 @@ class InspectSnapshot:
             for device_id in pending:
                 self._try_ensure_device_detail(device_id)
             return
-        with ThreadPoolExecutor(max_workers=min(_PRELOAD_WORKERS, len(pending))) as pool:
-            list(pool.map(self._try_ensure_device_detail, pending))
+        _fan_out([partial(self._try_ensure_device_detail, device_id) for device_id in pending])
 
     # --- Pending domain edits (setters → update()) ---
 
@@ -515,63 +732,115 @@ class InspectSnapshot:
         device_ids: Optional[list[str]] = None,
         pair_ids: Optional[list[str]] = None,
         mark_paths_stale: bool = True,
+        *,
+        background: bool = False,
     ) -> None:
         """Targeted refresh after a successful commit: drop removed entities locally, re-fetch the
-        affected devices and edge pairs, and mark the services section stale.
+        affected devices and edge pairs, and mark the affected services stale.
+
+        Devices are re-fetched in batched ``nodeStatus/* where`` reads and edge pairs one per
+        query, all fanned out in parallel (same pool size as :meth:`preload`). With
+        ``background=True`` the re-fetch runs on a background thread and this returns at once;
+        the touched entities are marked stale until their refresh lands, so a read in between
+        re-fetches them itself. :meth:`wait_for_refresh` joins outstanding background refreshes.
+
+        Services: a commit that removes devices or edges can tear services down, so the whole
+        section is reloaded on next access (as it is when no scope is given). Otherwise only the
+        bookings that traverse a touched device or edge pair are re-read (scoped ``paths/* where``
+        queries) on next access.
 
         Never raises: a failed re-fetch marks the entity stale (re-fetched lazily on next access)
         and logs, so a post-commit hook cannot lose the caller's already-successful commit result.
         """
         self._apply_removals(removed_ids or [])
-        if self._fetcher is not None:
-            for device_id in device_ids or []:
-                if device_id in self._devices_by_id:
-                    self._try_refresh_device(device_id)
-            for pair_id in pair_ids or []:
-                self._try_refresh_edge_pair(pair_id)
         if mark_paths_stale:
-            self._mark_paths_stale()
+            if removed_ids or not (device_ids or pair_ids):
+                self._mark_paths_stale()
+            else:
+                self._mark_bookings_stale(device_ids or [], pair_ids or [])
             self._mark_alarms_stale()
+        if self._fetcher is None:
+            return
+        devices = [device_id for device_id in dict.fromkeys(device_ids or []) if device_id in self._devices_by_id]
+        pairs = list(dict.fromkeys(pair_ids or []))
+        if not (devices or pairs):
+            return
+        if background:
+            self._submit_refresh(partial(self._refresh_many, devices, pairs), devices, pairs)
+        else:
+            self._refresh_many(devices, pairs)
 
-    def apply_network_refresh(self, device_ids: list[str]) -> None:
+    def apply_network_refresh(self, device_ids: list[str], *, background: bool = False) -> None:
         """Targeted refresh after a network action (addDevices / syncDevices): upsert the named
         devices (new or restructured) and reconcile the edge pairs touching them, then mark the
         services section stale. Never raises (same contract as :meth:`apply_post_commit`).
 
         Unlike a commit, a network action does not report the exact touched entities and can create
         pairs to previously-unconnected devices, so edges are reconciled from one cheap edge-skeleton
-        read scoped to pairs touching an affected device (per-device detail stays targeted)."""
+        read scoped to pairs touching an affected device, taken after the batched device detail
+        reads so pairs to devices added by the action resolve. ``background`` as for
+        :meth:`apply_post_commit`; pairs created by the action only appear once the background
+        refresh lands."""
         if self._fetcher is None or not device_ids:
             return
-        affected = set(device_ids)
-        for device_id in device_ids:
-            self._try_refresh_device(device_id)
-        self._reconcile_pairs_for_devices(affected)
         self._mark_paths_stale()
         self._mark_alarms_stale()
+        devices = list(dict.fromkeys(device_ids))
+        job = partial(self._refresh_for_network_action, devices)
+        if background:
+            affected = set(devices)
+            pairs = [pair_id for d in affected for pair_id in self._edges_by_device_id.get(d, {})]
+            self._submit_refresh(job, devices, pairs)
+        else:
+            job()
+
+    def wait_for_refresh(self, timeout: Optional[float] = None) -> bool:
+        """Block until outstanding background refreshes have landed. Returns ``False`` on timeout."""
+        with self._lock:
+            pending = list(self._pending_refreshes)
+        if not pending:
+            return True
+        _, not_done = wait(pending, timeout=timeout)
+        with self._lock:
+            self._pending_refreshes = [f for f in self._pending_refreshes if not f.done()]
+        return not not_done
 
     def upsert_devices_from_skeleton(self, device_ids: list[str]) -> None:
-        """Insert or refresh named devices from one device-skeleton read.
+        """Insert or refresh named devices from their device-skeleton records.
 
         Used after creating virtual devices: per-device detail fetches often miss brand-new
         ``virtual.N`` nodes (detail-less / dash-vs-dot id form), while the skeleton indexes them
         under the public ``deviceId`` (``virtual.N``) that ``addedDeviceLabels`` returns.
+        Reads only the named devices (scoped ``nodeStatus/* where deviceId=…`` skeleton queries);
+        falls back to one full skeleton read if the scoped read fails or misses ids.
         Never raises (same contract as :meth:`apply_network_refresh`).
         """
         if self._fetcher is None or not device_ids:
             return
         wanted = set(device_ids)
+        try:
+            found = self._upsert_skeleton_nodes(self._fetcher.get_device_skeleton_for(sorted(wanted)), wanted)
+        except Exception as exc:
+            _logger.warning("Inspect snapshot: scoped skeleton upsert failed (%s); reading full skeleton.", exc)
+            found = set()
+        missing = wanted - found
+        if not missing:
+            return
         try:
             nodes = self._fetcher.get_device_skeleton()
         except Exception as exc:
-            for device_id in device_ids:
+            for device_id in missing:
                 self._stale_devices.add(device_id)
             _logger.warning(
                 "Inspect snapshot: skeleton upsert for %s failed: %s",
-                sorted(wanted),
+                sorted(missing),
                 exc,
             )
             return
+        self._upsert_skeleton_nodes(nodes, missing)
+
+    def _upsert_skeleton_nodes(self, nodes: list[InspectApiNodeStatusItem], wanted: set[str]) -> set[str]:
+        found: set[str] = set()
         with self._lock:
             for node in nodes:
                 device_id = node.deviceId or node.id
@@ -579,6 +848,8 @@ class InspectSnapshot:
                     continue
                 self._index_device(node, HydrationLevel.SKELETON)
                 self._stale_devices.discard(device_id)
+                found.add(device_id)
+        return found
 
     # --- Internal: hydration ---
 
@@ -628,6 +899,67 @@ class InspectSnapshot:
                 self._index_edge_pair(pair)
             self._stale_pairs.discard(pair_id)
 
+    # --- Internal: parallel / background post-write refresh ---
+
+    def _refresh_many(self, device_ids: list[str], pair_ids: list[str]) -> None:
+        """Re-fetch devices (batched) and edge pairs in one parallel fan-out. Never raises."""
+        jobs = [
+            partial(self._try_refresh_device_batch, device_ids[i : i + _REFRESH_BATCH_DEVICES])
+            for i in range(0, len(device_ids), _REFRESH_BATCH_DEVICES)
+        ]
+        jobs.extend(partial(self._try_refresh_edge_pair, pair_id) for pair_id in pair_ids)
+        _fan_out(jobs)
+
+    def _refresh_for_network_action(self, device_ids: list[str]) -> None:
+        # Devices first: pair reconciliation resolves dash-form pids (``virtual-5``) only for devices
+        # already in the snapshot, so pairs to devices added by this action must wait for the upserts.
+        _fan_out(
+            [
+                partial(self._try_refresh_device_batch, device_ids[i : i + _REFRESH_BATCH_DEVICES])
+                for i in range(0, len(device_ids), _REFRESH_BATCH_DEVICES)
+            ]
+        )
+        self._reconcile_pairs_for_devices(set(device_ids))
+
+    def _try_refresh_device_batch(self, device_ids: list[str]) -> None:
+        """Re-fetch several devices with one batched read; devices the batch does not return (or
+        all of them, if the read fails) fall back to the per-device query."""
+        if self._fetcher is None:
+            return
+        found: set[str] = set()
+        if len(device_ids) > 1:
+            try:
+                details = self._fetcher.get_device_details(device_ids)
+            except Exception as exc:
+                _logger.warning(
+                    "Inspect snapshot: batched re-fetch of %d device(s) failed (%s); re-fetching one by one.",
+                    len(device_ids),
+                    exc,
+                )
+                details = []
+            wanted = set(device_ids)
+            with self._lock:
+                for detail in details:
+                    device_id = detail.deviceId or detail.id
+                    if device_id in wanted and device_id not in found:
+                        self._upsert_device(device_id, detail)
+                        found.add(device_id)
+        for device_id in device_ids:
+            if device_id not in found:
+                self._try_refresh_device(device_id)
+
+    def _submit_refresh(self, job: Callable[[], None], device_ids: list[str], pair_ids: list[str]) -> None:
+        """Mark the entities stale and run ``job`` on the snapshot's background refresh thread.
+
+        One worker thread keeps background refreshes in commit order; each refresh still fans out."""
+        with self._lock:
+            self._stale_devices.update(device_ids)
+            self._stale_pairs.update(pair_ids)
+            if self._refresh_executor is None:
+                self._refresh_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="inspect-refresh")
+            self._pending_refreshes = [f for f in self._pending_refreshes if not f.done()]
+            self._pending_refreshes.append(self._refresh_executor.submit(job))
+
     # --- Internal: resilient refresh + lazy-stale self-heal ---
 
     def _try_ensure_device_detail(self, device_id: str) -> None:
@@ -674,7 +1006,7 @@ class InspectSnapshot:
         """Reconcile every edge pair touching an affected device from one fresh edge-skeleton read."""
         if self._fetcher is None or not device_ids:
             return
-        affected_pairs = {indexed.pair_id for d in device_ids for indexed in self._edges_by_device_id.get(d, [])}
+        affected_pairs = {pair_id for d in device_ids for pair_id in self._edges_by_device_id.get(d, {})}
         try:
             pairs = self._fetcher.get_edge_skeleton()
         except Exception as exc:
@@ -699,13 +1031,43 @@ class InspectSnapshot:
             self._section_loaded["paths"] = False
             self._paths_by_booking_id.clear()
             self._services_by_device_id.clear()
+            self._stale_booking_ids.clear()
+
+    def _mark_bookings_stale(self, device_ids: Iterable[str], pair_ids: Iterable[str]) -> None:
+        """Mark the bookings traversing the given devices / edge pairs for a scoped re-read."""
+        with self._lock:
+            if not self._section_loaded.get("paths"):
+                return  # nothing indexed yet; the first access loads the whole section fresh
+            touched = set(device_ids)
+            for pair_id in pair_ids:
+                touched.update(self._devices_by_pair_id.get(pair_id, ()))
+                touched.update(part for part in pair_id.split("::") if part)
+            for device_id in touched:
+                self._stale_booking_ids.update(self._services_by_device_id.get(device_id, ()))
+
+    def _stream_alarm_deltas(
+        self, cursor: int, interval: float, max_polls: int | None
+    ) -> Iterator["InspectAlarmDelta"]:
+        polls = 0
+        while max_polls is None or polls < max_polls:
+            if polls:
+                time.sleep(interval)
+            self.poll_alarms()
+            polls += 1
+            with self._lock:
+                if self._alarm_log and self._alarm_log[0].sequence > cursor + 1:
+                    _logger.warning(
+                        "Alarm change log overflowed; %d change(s) were not streamed.",
+                        self._alarm_log[0].sequence - cursor - 1,
+                    )
+                pending = [delta for delta in self._alarm_log if delta.sequence > cursor]
+                cursor = self._alarm_sequence
+            yield from pending
 
     def _mark_alarms_stale(self) -> None:
+        # The indexes are kept: the next read diffs against them instead of rebuilding.
         with self._lock:
             self._section_loaded["alarms"] = False
-            self._alarms.clear()
-            self._alarms_by_device_id.clear()
-            self._alarms_by_resource_key.clear()
 
     def _upsert_device(self, device_id: str, detail: InspectApiNodeStatusItem) -> None:
         """Insert or replace a device record (FULL), keeping the label index and caches consistent."""
@@ -727,9 +1089,14 @@ class InspectSnapshot:
         self._device_cache.pop(device_id, None)
         self._rebuild_device_ports(device_id, detail)
         self._stale_devices.discard(device_id)
+        self._invalidate_graph(device_ids=(device_id,))
 
     def _ensure_section_paths(self) -> None:
-        if self._section_loaded.get("paths") or self._fetcher is None:
+        if self._fetcher is None:
+            return
+        if self._section_loaded.get("paths"):
+            if self._stale_booking_ids:
+                self._refresh_stale_bookings()
             return
         items = self._fetcher.get_paths_section()
         with self._lock:
@@ -740,6 +1107,31 @@ class InspectSnapshot:
             self._section_fetched_at["paths"] = _now()
             self._service_cache.clear()
 
+    def _refresh_stale_bookings(self) -> None:
+        """Re-read only the stale bookings; a booking missing from the answer is gone. Falls back to
+        a full section reload if the scoped read fails."""
+        assert self._fetcher is not None
+        with self._lock:
+            booking_ids = sorted(self._stale_booking_ids)
+            self._stale_booking_ids.clear()
+        if not booking_ids:
+            return
+        try:
+            items = self._fetcher.get_paths_for_bookings(booking_ids)
+        except Exception as exc:
+            _logger.warning(
+                "Inspect snapshot: scoped services refresh for %d booking(s) failed (%s); reloading section.",
+                len(booking_ids),
+                exc,
+            )
+            self._mark_paths_stale()
+            self._ensure_section_paths()
+            return
+        with self._lock:
+            for booking_id in booking_ids:
+                self._unindex_booking(booking_id)
+            self._index_paths(items)
+
     def _ensure_section_alarms(self) -> None:
         if self._section_loaded.get("alarms") or self._fetcher is None:
             return
@@ -747,7 +1139,7 @@ class InspectSnapshot:
         with self._lock:
             if self._section_loaded.get("alarms"):
                 return
-            self._index_alarms(items)
+            self._apply_alarm_section(items)
             self._section_loaded["alarms"] = True
             self._section_fetched_at["alarms"] = _now()
 
@@ -766,6 +1158,7 @@ class InspectSnapshot:
                 ids.append(device_id)
         if level is HydrationLevel.FULL:
             self._rebuild_device_ports(device_id, node)
+        self._invalidate_graph(device_ids=(device_id,))
 
     def _rebuild_device_ports(self, device_id: str, node: InspectApiNodeStatusItem) -> None:
         # Drop existing port index entries for this device
@@ -784,6 +1177,7 @@ class InspectSnapshot:
         # Drop the device's module index + wrappers
         for module_id in self._modules_by_device_id.pop(device_id, {}):
             self._module_cache.pop((device_id, module_id), None)
+        self._port_columns.pop(device_id, None)
         # Rebuild
         entries: list[_IndexedPort] = []
         modules: dict[str, InspectApiModuleStatus] = {}
@@ -815,7 +1209,13 @@ class InspectSnapshot:
         return dotted if dotted in self._devices_by_id else pid
 
     def _index_edge_pair(self, pair_item: InspectApiExternalEdgesByDeviceKeyItem) -> None:
+        if pair_item.id in self._edge_pairs:
+            self._drop_edge_pair(pair_item.id)
         self._edge_pairs[pair_item.id] = pair_item
+        self._invalidate_graph(pair_ids=(pair_item.id,))
+        pair_devices = self._devices_by_pair_id.setdefault(pair_item.id, set())
+        pair_port_keys = self._port_keys_by_pair_id.setdefault(pair_item.id, set())
+        pair_edge_ids = self._edge_ids_by_pair_id.setdefault(pair_item.id, set())
         primary_device_id = self._resolve_device_id(pair_item.primary.devicePid)
         secondary_device_id = self._resolve_device_id(pair_item.secondary.devicePid)
         for side, device_id in (
@@ -849,32 +1249,38 @@ class InspectSnapshot:
                     to_device_id=to_device_id,
                     to_port_id=to_port_id,
                 )
-                self._edges_by_device_id.setdefault(device_id, []).append(indexed)
+                self._edges_by_device_id.setdefault(device_id, {}).setdefault(pair_item.id, []).append(indexed)
+                pair_devices.add(device_id)
+                pair_edge_ids.add(edge.id)
+                self._pair_ids_by_edge_id.setdefault(edge.id, set()).add(pair_item.id)
                 for endpoint_device_id, port_id in (
                     (from_device_id, from_port_id),
                     (to_device_id, to_port_id),
                 ):
                     if endpoint_device_id and port_id:
                         self._edge_by_port_key[(endpoint_device_id, port_id)] = indexed
+                        pair_port_keys.add((endpoint_device_id, port_id))
 
     def _drop_edge_pair(self, pair_id: str) -> None:
+        """Remove one pair from all edge indexes; cost is proportional to the pair's own edges."""
         self._edge_pairs.pop(pair_id, None)
-        for edges in self._edges_by_device_id.values():
-            for edge in edges:
-                if edge.pair_id == pair_id:
-                    self._edge_details.pop(edge.edge_id, None)
-        for device_id, edges in list(self._edges_by_device_id.items()):
-            kept = [e for e in edges if e.pair_id != pair_id]
-            if kept:
-                self._edges_by_device_id[device_id] = kept
-            else:
-                self._edges_by_device_id.pop(device_id, None)
-        for key, indexed in list(self._edge_by_port_key.items()):
-            if indexed.pair_id == pair_id:
+        self._invalidate_graph(pair_ids=(pair_id,))
+        for device_id in self._devices_by_pair_id.pop(pair_id, ()):
+            pairs = self._edges_by_device_id.get(device_id)
+            if pairs is not None:
+                pairs.pop(pair_id, None)
+                if not pairs:
+                    self._edges_by_device_id.pop(device_id, None)
+        for key in self._port_keys_by_pair_id.pop(pair_id, ()):
+            indexed = self._edge_by_port_key.get(key)
+            if indexed is not None and indexed.pair_id == pair_id:
                 self._edge_by_port_key.pop(key, None)
-        for edge_id, edge in list(self._edge_cache.items()):
-            if edge.pair_id == pair_id:
+        for edge_id in self._edge_ids_by_pair_id.pop(pair_id, ()):
+            self._edge_details.pop(edge_id, None)
+            cached = self._edge_cache.get(edge_id)
+            if cached is not None and cached.pair_id == pair_id:
                 self._edge_cache.pop(edge_id, None)
+            self._unlink_edge_pair(edge_id, pair_id)
 
     def _index_paths(self, path_items: list[InspectApiPathItem]) -> None:
         for item in path_items:
@@ -890,22 +1296,87 @@ class InspectSnapshot:
                 if booking_id not in ids:
                     ids.append(booking_id)
 
-    def _index_alarms(self, alarm_items: list[InspectApiAlarmItem]) -> None:
-        self._alarms = list(alarm_items)
-        self._alarms_by_device_id.clear()
-        self._alarms_by_resource_key.clear()
+    def _unindex_booking(self, booking_id: str) -> None:
+        item = self._paths_by_booking_id.pop(booking_id, None)
+        self._service_cache.pop(booking_id, None)
+        if item is None:
+            return
+        for segment in item.path:
+            structure = segment.structure
+            if not (structure and structure.deviceId):
+                continue
+            remaining = [b for b in self._services_by_device_id.get(structure.deviceId, []) if b != booking_id]
+            if remaining:
+                self._services_by_device_id[structure.deviceId] = remaining
+            else:
+                self._services_by_device_id.pop(structure.deviceId, None)
+
+    def _apply_alarm_section(self, alarm_items: list[InspectApiAlarmItem]) -> list["InspectAlarmDelta"]:
+        """Diff a full section read against the indexes by alarm id; apply and log the changes."""
+        from videoipath_automation_tool.apps.inspect.domain.alarm import InspectAlarm, InspectAlarmDelta
+
+        incoming: dict[str, InspectApiAlarmItem] = {}
         for item in alarm_items:
-            point_id = list(item.id.pointId) if item.id is not None else []
-            if not point_id:
+            incoming[_alarm_key(item)] = item
+        changes: list[tuple[str, InspectApiAlarmItem, InspectApiAlarmItem | None]] = []
+        for key in [key for key in self._alarms if key not in incoming]:
+            cleared = self._alarms.pop(key)
+            self._unindex_alarm(key, cleared)
+            changes.append(("cleared", cleared, None))
+        for key, item in incoming.items():
+            previous = self._alarms.get(key)
+            if previous is not None and _alarm_version(previous) == _alarm_version(item):
                 continue
-            device_id = point_id[0]
-            self._alarms_by_device_id.setdefault(device_id, []).append(item)
-            resource_key = ".".join(point_id)
-            self._alarms_by_resource_key.setdefault(resource_key, []).append(item)
-            # Edge pair / directed edge keys appear as a single pointId element containing "::".
-            for part in point_id:
-                if "::" in part:
-                    self._alarms_by_resource_key.setdefault(part, []).append(item)
+            if previous is not None:
+                self._unindex_alarm(key, previous)
+            self._alarms[key] = item
+            self._index_alarm(key, item)
+            changes.append(("raised" if previous is None else "updated", item, previous))
+
+        deltas: list[InspectAlarmDelta] = []
+        for change, item, previous in changes:
+            self._alarm_sequence += 1
+            deltas.append(
+                InspectAlarmDelta(
+                    change=change,
+                    alarm=InspectAlarm(item=item),
+                    previous=InspectAlarm(item=previous) if previous is not None else None,
+                    sequence=self._alarm_sequence,
+                )
+            )
+        self._alarm_log.extend(deltas)
+        return deltas
+
+    def _index_alarm(self, key: str, item: InspectApiAlarmItem) -> None:
+        point_id = list(item.id.pointId) if item.id is not None else []
+        if not point_id:
+            return
+        device_id = point_id[0]
+        self._alarms_by_device_id.setdefault(device_id, {})[key] = item
+        for resource_key in _alarm_resource_keys(point_id):
+            self._alarms_by_resource_key.setdefault(resource_key, {})[key] = item
+        severity = _alarm_severity(item)
+        for scope, rollup_key in _alarm_rollup_keys(point_id):
+            rollups = self._alarm_rollups[scope]
+            rollup = rollups.get(rollup_key)
+            if rollup is None:
+                rollup = rollups[rollup_key] = _SeverityRollup()
+            rollup.add(severity)
+
+    def _unindex_alarm(self, key: str, item: InspectApiAlarmItem) -> None:
+        point_id = list(item.id.pointId) if item.id is not None else []
+        if not point_id:
+            return
+        device_id = point_id[0]
+        _discard_nested(self._alarms_by_device_id, device_id, key)
+        for resource_key in _alarm_resource_keys(point_id):
+            _discard_nested(self._alarms_by_resource_key, resource_key, key)
+        severity = _alarm_severity(item)
+        for scope, rollup_key in _alarm_rollup_keys(point_id):
+            rollups = self._alarm_rollups[scope]
+            rollup = rollups.get(rollup_key)
+            if rollup is not None and rollup.remove(severity):
+                rollups.pop(rollup_key, None)
 
     def _apply_removals(self, removed_ids: list[str]) -> None:
         if not removed_ids:
@@ -926,25 +1397,71 @@ class InspectSnapshot:
                             self._vertex_details.pop(vertex_id, None)
                     for module_id in self._modules_by_device_id.pop(removed, {}):
                         self._module_cache.pop((removed, module_id), None)
-                    self._edges_by_device_id.pop(removed, None)
+                    self._port_columns.pop(removed, None)
+                    removed_pairs = self._edges_by_device_id.pop(removed, {})
+                    for pair_id in removed_pairs:
+                        devices = self._devices_by_pair_id.get(pair_id)
+                        if devices is not None:
+                            devices.discard(removed)
+                    self._invalidate_graph(device_ids=(removed,), pair_ids=removed_pairs)
                 # Edge removal by edge id or pair id
                 if "::" in removed:
                     self._drop_edge_id(removed)
 
     def _drop_edge_id(self, edge_or_pair_id: str) -> None:
-        for device_id, edges in list(self._edges_by_device_id.items()):
-            kept = [e for e in edges if e.edge_id != edge_or_pair_id and e.pair_id != edge_or_pair_id]
-            if kept != edges:
-                if kept:
-                    self._edges_by_device_id[device_id] = kept
-                else:
-                    self._edges_by_device_id.pop(device_id, None)
-        for key, indexed in list(self._edge_by_port_key.items()):
-            if indexed.edge_id == edge_or_pair_id or indexed.pair_id == edge_or_pair_id:
-                self._edge_by_port_key.pop(key, None)
+        """Remove a single edge (by edge id) or a whole pair (by pair id) from the edge indexes."""
+        for pair_id in list(self._pair_ids_by_edge_id.get(edge_or_pair_id, ())):
+            self._drop_edge_from_pair(edge_or_pair_id, pair_id)
+        if edge_or_pair_id in self._devices_by_pair_id:
+            self._drop_pair_edges(edge_or_pair_id)
         self._edge_cache.pop(edge_or_pair_id, None)
         self._edge_details.pop(edge_or_pair_id, None)
 
+    def _drop_edge_from_pair(self, edge_id: str, pair_id: str) -> None:
+        self._invalidate_graph(pair_ids=(pair_id,))
+        for device_id in list(self._devices_by_pair_id.get(pair_id, ())):
+            pairs = self._edges_by_device_id.get(device_id)
+            entries = pairs.get(pair_id) if pairs is not None else None
+            if entries is None:
+                continue
+            kept = [e for e in entries if e.edge_id != edge_id]
+            if kept:
+                pairs[pair_id] = kept
+                continue
+            pairs.pop(pair_id, None)
+            self._devices_by_pair_id[pair_id].discard(device_id)
+            if not pairs:
+                self._edges_by_device_id.pop(device_id, None)
+        port_keys = self._port_keys_by_pair_id.get(pair_id, set())
+        for key in list(port_keys):
+            indexed = self._edge_by_port_key.get(key)
+            if indexed is not None and indexed.pair_id == pair_id and indexed.edge_id == edge_id:
+                self._edge_by_port_key.pop(key, None)
+                port_keys.discard(key)
+        self._edge_ids_by_pair_id.get(pair_id, set()).discard(edge_id)
+        self._unlink_edge_pair(edge_id, pair_id)
+
+    def _drop_pair_edges(self, pair_id: str) -> None:
+        """Drop a pair's edges from the device/port indexes but keep the pair item itself."""
+        item = self._edge_pairs.pop(pair_id, None)
+        self._drop_edge_pair(pair_id)
+        if item is not None:
+            self._edge_pairs[pair_id] = item
+
+    def _unlink_edge_pair(self, edge_id: str, pair_id: str) -> None:
+        pair_ids = self._pair_ids_by_edge_id.get(edge_id)
+        if pair_ids is not None:
+            pair_ids.discard(pair_id)
+            if not pair_ids:
+                self._pair_ids_by_edge_id.pop(edge_id, None)
+
+    def _iter_device_edges(self, device_id: str) -> Iterator[_IndexedEdge]:
+        return _chain_pairs(self._edges_by_device_id.get(device_id, {}))
+
+    def _invalidate_graph(self, device_ids: Iterable[str] = (), pair_ids: Iterable[str] = ()) -> None:
+        if self._graph is not None:
+            self._graph.invalidate(device_ids, pair_ids)
+
     # --- Internal: domain wrappers (cached) ---
 
     def _wrap_device(self, device_id: str) -> "InspectDevice":
@@ -998,6 +1515,25 @@ class InspectSnapshot:
 
 _PRELOAD_WORKERS = 8
 
+# Devices per batched ``nodeStatus/* where`` re-fetch; small enough that a large commit still
+# spreads over several parallel queries.
+_REFRESH_BATCH_DEVICES = 16
+
+
+def _fan_out(jobs: list[Callable[[], None]]) -> None:
+    """Run independent fetch jobs in parallel (inline when there is only one)."""
+    if len(jobs) <= 1:
+        for job in jobs:
+            job()
+        return
+    with ThreadPoolExecutor(max_workers=min(_PRELOAD_WORKERS, len(jobs))) as pool:
+        for future in [pool.submit(job) for job in jobs]:
+            future.result()
+
+
+_ALARM_LOG_LIMIT = 10_000
+_ROLLUP_SCOPES = ("device", "module", "pair")
+
 _logger = logging.getLogger("videoipath_automation_tool_inspect_snapshot")
 
 
@@ -1005,6 +1541,11 @@ def _now() -> datetime:
     return datetime.now(timezone.utc)
 
 
+def _chain_pairs(pairs: dict[str, list[_IndexedEdge]]) -> Iterator[_IndexedEdge]:
+    for entries in list(pairs.values()):
+        yield from entries
+
+
 def _severity_rank(value: Any) -> int:
     """Sort key: higher severity first; unknown / missing treated as lowest."""
     if isinstance(value, InspectSeverity):
@@ -1014,7 +1555,7 @@ def _severity_rank(value: Any) -> int:
     return -1
 
 
-def _sorted_alarms(items: list[InspectApiAlarmItem]) -> list["InspectAlarm"]:
+def _sorted_alarms(items: Iterable[InspectApiAlarmItem]) -> list["InspectAlarm"]:
     from videoipath_automation_tool.apps.inspect.domain.alarm import InspectAlarm
 
     ordered = sorted(
@@ -1025,11 +1566,125 @@ def _sorted_alarms(items: list[InspectApiAlarmItem]) -> list["InspectAlarm"]:
     return [InspectAlarm(item=item) for item in ordered]
 
 
-class _DeviceRecord(InspectInternalModel):
-    device_id: str
-    node: InspectApiNodeStatusItem
-    level: HydrationLevel
-    fetched_at: datetime = Field(default_factory=_now)
+def _alarm_key(item: InspectApiAlarmItem) -> str:
+    """Stable alarm identity across reads: ``_id``, else ``component:point.id:alertId``, else a
+    digest of the alarm's component, details and severity (its list position shifts between reads)."""
+    if item.id_field:
+        return item.id_field
+    if item.id is not None and (item.id.alertId or item.id.pointId):
+        return f"{item.id.component}:{'.'.join(item.id.pointId)}:{item.id.alertId}"
+    component = item.id.component if item.id is not None else None
+    details, severity = (item.info.details, item.info.severity) if item.info is not None else (None, None)
+    return "#" + hashlib.sha1(repr((component, details, severity)).encode()).hexdigest()[:16]
+
+
+def _alarm_version(item: InspectApiAlarmItem) -> tuple[Any, ...]:
+    """What makes a re-read alarm an update: its seqno / time plus the user-visible state."""
+    info = item.info
+    if info is None:
+        return (item.acked, item.hidden)
+    return (info.seqno, info.time, info.severity, info.sa, info.details, item.acked, item.hidden)
+
+
+def _alarm_severity(item: InspectApiAlarmItem) -> Any:
+    return item.info.severity if item.info is not None else None
+
+
+def _alarm_resource_keys(point_id: list[str]) -> Iterator[str]:
+    """The joined ``pointId`` plus any edge pair / directed edge element (contains ``"::"``)."""
+    resource_key = ".".join(point_id)
+    yield resource_key
+    for part in point_id:
+        if "::" in part and part != resource_key:
+            yield part
+
+
+def _discard_nested(index: dict[str, dict[str, InspectApiAlarmItem]], outer: str, key: str) -> None:
+    entries = index.get(outer)
+    if entries is None:
+        return
+    entries.pop(key, None)
+    if not entries:
+        index.pop(outer, None)
+
+
+def _alarm_rollup_keys(point_id: list[str]) -> Iterator[tuple[str, str]]:
+    """Rollup keys an alarm counts towards. ``pointId`` is hierarchical (device, ``dev``, module,
+    port, …), so the module pid is the first three elements joined; edge alarms carry an element
+    containing ``"::"`` (pair id or directed edge id)."""
+    yield "device", point_id[0]
+    if len(point_id) >= 3 and "::" not in point_id[2]:
+        yield "module", ".".join(point_id[:3])
+    for part in dict.fromkeys(part for part in point_id if "::" in part):
+        yield "pair", part
+
+
+def _rollups_for_scope(rollups: dict[str, dict[str, "_SeverityRollup"]], scope: str) -> dict[str, "_SeverityRollup"]:
+    if scope not in rollups:
+        raise ValueError(f"Unknown rollup scope {scope!r}; expected one of {', '.join(_ROLLUP_SCOPES)}.")
+    return rollups[scope]
+
+
+class _SeverityRollup:
+    """Active-alarm counts per severity under one key; ``worst`` is maintained on every change."""
+
+    __slots__ = ("counts", "total", "worst")
+
+    def __init__(self) -> None:
+        self.counts: dict[Any, int] = {}
+        self.total = 0
+        self.worst: Any = None
+
+    def add(self, severity: Any) -> None:
+        self.counts[severity] = self.counts.get(severity, 0) + 1
+        self.total += 1
+        if self.total == 1 or _severity_rank(severity) > _severity_rank(self.worst):
+            self.worst = severity
+
+    def remove(self, severity: Any) -> bool:
+        """Decrement ``severity``; True when no alarm is left."""
+        remaining = self.counts.get(severity, 0) - 1
+        if remaining < 0:
+            return not self.counts
+        self.total -= 1
+        if remaining:
+            self.counts[severity] = remaining
+        else:
+            self.counts.pop(severity)
+            if severity == self.worst:
+                self.worst = max(self.counts, key=_severity_rank) if self.counts else None
+        return not self.counts
+
+    def freeze(self, scope: str, key: str) -> "InspectSeverityRollup":
+        from videoipath_automation_tool.apps.inspect.domain.alarm import InspectSeverityRollup
+
+        return InspectSeverityRollup(scope=scope, key=key, worst=self.worst, counts=dict(self.counts), total=self.total)
+
+    def __repr__(self) -> str:
+        return format_repr(self, worst=self.worst, total=self.total)
+
+    __str__ = __repr__
+
+
+# Index records are plain ``__slots__`` classes rather than pydantic models: one is allocated per
+# device / port / edge, their inputs are already-validated wire models, and a big site holds
+# hundreds of thousands of them. Pydantic stays at the wire boundary.
+
+
+class _DeviceRecord:
+    __slots__ = ("device_id", "node", "level", "fetched_at")
+
+    def __init__(
+        self,
+        device_id: str,
+        node: InspectApiNodeStatusItem,
+        level: HydrationLevel,
+        fetched_at: datetime | None = None,
+    ) -> None:
+        self.device_id = device_id
+        self.node = node
+        self.level = level
+        self.fetched_at = fetched_at if fetched_at is not None else _now()
 
     @property
     def label(self) -> str | None:
@@ -1045,10 +1700,13 @@ class _DeviceRecord(InspectInternalModel):
     __str__ = __repr__
 
 
-class _IndexedPort(InspectFrozenModel):
-    device_id: str
-    module_id: str | None
-    port: InspectPortStatus
+class _IndexedPort:
+    __slots__ = ("device_id", "module_id", "port")
+
+    def __init__(self, device_id: str, module_id: str | None, port: InspectPortStatus) -> None:
+        self.device_id = device_id
+        self.module_id = module_id
+        self.port = port
 
     def __repr__(self) -> str:
         return format_repr(
@@ -1061,17 +1719,43 @@ class _IndexedPort(InspectFrozenModel):
     __str__ = __repr__
 
 
-class _IndexedEdge(InspectFrozenModel):
-    edge_id: str
-    pair_id: str
-    edge: InspectApiExternalEdgeStatus
-    pair_status: InspectApiExternalEdgeLiveStatus | None
-    primary_device_id: str | None
-    secondary_device_id: str | None
-    from_device_id: str | None
-    from_port_id: str | None
-    to_device_id: str | None
-    to_port_id: str | None
+class _IndexedEdge:
+    __slots__ = (
+        "edge_id",
+        "pair_id",
+        "edge",
+        "pair_status",
+        "primary_device_id",
+        "secondary_device_id",
+        "from_device_id",
+        "from_port_id",
+        "to_device_id",
+        "to_port_id",
+    )
+
+    def __init__(
+        self,
+        edge_id: str,
+        pair_id: str,
+        edge: InspectApiExternalEdgeStatus,
+        pair_status: InspectApiExternalEdgeLiveStatus | None,
+        primary_device_id: str | None,
+        secondary_device_id: str | None,
+        from_device_id: str | None,
+        from_port_id: str | None,
+        to_device_id: str | None,
+        to_port_id: str | None,
+    ) -> None:
+        self.edge_id = edge_id
+        self.pair_id = pair_id
+        self.edge = edge
+        self.pair_status = pair_status
+        self.primary_device_id = primary_device_id
+        self.secondary_device_id = secondary_device_id
+        self.from_device_id = from_device_id
+        self.from_port_id = from_port_id
+        self.to_device_id = to_device_id
+        self.to_port_id = to_port_id
 
     def __repr__(self) -> str:
         return format_repr(
@@ -1084,6 +1768,77 @@ class _IndexedEdge(InspectFrozenModel):
     __str__ = __repr__
 
 
+# Tri-state flag codes in ``_PortColumns``; an unknown value never matches an explicit filter.
+_FLAG_UNKNOWN, _FLAG_FALSE, _FLAG_TRUE = 0, 1, 2
+_FLAG_CODES = {None: _FLAG_UNKNOWN, False: _FLAG_FALSE, True: _FLAG_TRUE}
+# Direction codes are assigned per snapshot in first-seen order (0 = no vertex); the handful of
+# wire values fits a byte, anything past 254 shares the overflow code and is re-checked exactly.
+_DIRECTION_OVERFLOW = 255
+# ``column.translate(_EQUALS[code])`` turns a byte column into a 0/1 equality mask in one C loop.
+_EQUALS = tuple(bytes(int(value == code) for value in range(256)) for code in range(256))
+
+
+class _PortColumns:
+    """One device's port attributes as byte columns aligned with its ``_ports_by_device_id`` list.
+
+    Filters become 0/1 masks via ``bytes.translate`` and are combined with a single big-int ``&``,
+    so ``query_ports`` touches Python objects only for the ports that match.
+    """
+
+    __slots__ = ("size", "direction", "active", "controlled", "endpoint", "module_spans")
+
+    def __init__(self, entries: list[_IndexedPort], direction_codes: dict[str | None, int]) -> None:
+        size = len(entries)
+        direction = bytearray(size)
+        active = bytearray(size)
+        controlled = bytearray(size)
+        endpoint = bytearray(size)
+        module_spans: dict[str, list[tuple[int, int]]] = {}
+        for position, indexed in enumerate(entries):
+            sides = _vertex_sides_from_status(indexed.port)
+            value = _sides_direction(sides)
+            code = direction_codes.get(value)
+            if code is None:
+                code = direction_codes[value] = min(len(direction_codes), _DIRECTION_OVERFLOW)
+            direction[position] = code
+            active[position] = _FLAG_CODES[_sides_flag(sides, "isActive")]
+            controlled[position] = _FLAG_CODES[_sides_flag(sides, "isControlled")]
+            endpoint[position] = _FLAG_CODES[_sides_flag(sides, "isEndpoint")]
+            if indexed.module_id is not None:
+                spans = module_spans.setdefault(indexed.module_id, [])
+                if spans and spans[-1][1] == position:
+                    spans[-1] = (spans[-1][0], position + 1)
+                else:
+                    spans.append((position, position + 1))
+        self.size = size
+        self.direction = bytes(direction)
+        self.active = bytes(active)
+        self.controlled = bytes(controlled)
+        self.endpoint = bytes(endpoint)
+        self.module_spans = module_spans
+
+    def mask(self, *, module_id: str | None, direction: int | None, flags: list[tuple[str, int]]) -> bytes | None:
+        """0/1 byte mask of the matching ports, or None when no filter applies (all match)."""
+        masks: list[bytes] = []
+        if module_id is not None:
+            span_mask = bytearray(self.size)
+            for start, end in self.module_spans.get(module_id, ()):
+                span_mask[start:end] = b"\x01" * (end - start)
+            masks.append(bytes(span_mask))
+        if direction is not None:
+            masks.append(self.direction.translate(_EQUALS[direction]))
+        for name, code in flags:
+            masks.append(getattr(self, name).translate(_EQUALS[code]))
+        if not masks:
+            return None
+        if len(masks) == 1:
+            return masks[0]
+        combined = int.from_bytes(masks[0], "little")
+        for mask in masks[1:]:
+            combined &= int.from_bytes(mask, "little")
+        return combined.to_bytes(self.size, "little")
+
+
 # --- Module-level helpers (kept stable for the domain layer) ---
 
 
@@ -1123,12 +1878,40 @@ def _port_id_from_status(port: InspectPortStatus) -> str | None:
 
 def _vertex_ids_from_status(port: InspectPortStatus) -> tuple[str, ...]:
     """All vertex ids carried by a port's ``vertexInfo`` (one for single, out+in for double)."""
+    return tuple(vertex_id for vertex_id, _ in _vertex_sides_from_status(port))
+
+
+def _vertex_sides_from_status(port: InspectPortStatus) -> list[tuple[str, InspectApiSingleVertexInfo]]:
+    """(vertex id, its offline ``vertexInfo`` side) for each vertex the port carries."""
     info = port.parsed_vertex_info
     if info is None:
-        return ()
+        return []
     if isinstance(info, InspectApiSingleVertexInfo):
-        return (info.id,) if info.id else ()
-    return tuple(side.id for side in (info.out, info.in_) if side is not None and side.id)
+        return [(info.id, info)] if info.id else []
+    return [(side.id, side) for side in (info.out, info.in_) if side is not None and side.id]
+
+
+def _sides_direction(sides: list[tuple[str, InspectApiSingleVertexInfo]]) -> str | None:
+    """Port-level direction: ``"BiDirectional"`` for a two-vertex port, else the single vertex's
+    direction (None for a port without vertices)."""
+    if len(sides) > 1:
+        return "BiDirectional"
+    return sides[0][1].vertexType if sides else None
+
+
+def _sides_flag(sides: list[tuple[str, InspectApiSingleVertexInfo]], name: str) -> bool | None:
+    """Aggregate a vertex flag across a port: True if any vertex is True, False only if all are
+    known False, else None (unknown)."""
+    if not sides:
+        return None
+    values = [_side_flag(side, name) for _, side in sides]
+    if True in values:
+        return True
+    return False if all(value is False for value in values) else None
+
+
+def _side_flag(side: InspectApiSingleVertexInfo, name: str) -> bool | None:
+    return getattr(side.fields, name, None) if side.fields is not None else None
 
 
 def _iter_modules(
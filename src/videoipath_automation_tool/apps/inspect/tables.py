@@ -0,0 +1,466 @@
+"""Columnar export of an :class:`InspectSnapshot` for analytics and reports.
+
+Each table (``devices``, ``modules``, ``ports``, ``vertices``, ``edges``, ``paths``, ``alarms``) is
+produced in a single pass over the snapshot's internal indexes, without allocating domain wrappers,
+as row batches of at most ``batch_size`` rows. :func:`write_csv` / :func:`write_parquet` consume the
+batches one at a time, so a site-wide export streams to disk with bounded memory.
+
+Tables reflect the server state held by the snapshot: staged (unsaved) edits are not included, and
+``modules`` / ``ports`` / ``vertices`` only cover hydrated devices (``preload()`` first for all).
+"""
+
+from __future__ import annotations
+
+import csv
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator
+
+from videoipath_automation_tool.apps.inspect.model.common import InspectSeverity, format_repr
+from videoipath_automation_tool.apps.inspect.snapshot import (
+    HydrationLevel,
+    _port_id_from_status,
+    _side_flag,
+    _sides_direction,
+    _sides_flag,
+    _vertex_sides_from_status,
+)
+from videoipath_automation_tool.validators.virtual_device_id import is_virtual_device_id
+
+if TYPE_CHECKING:
+    from videoipath_automation_tool.apps.inspect.snapshot import InspectSnapshot
+
+DEFAULT_BATCH_ROWS = 10_000
+
+# Column name -> logical type: "str", "int", "float", "bool", "list" (of str) or "datetime".
+TABLE_SCHEMAS: dict[str, tuple[tuple[str, str], ...]] = {
+    "devices": (
+        ("device_id", "str"),
+        ("label", "str"),
+        ("description", "str"),
+        ("pid", "str"),
+        ("hydrated", "bool"),
+        ("is_virtual", "bool"),
+        ("site_id", "str"),
+        ("severity", "int"),
+        ("sync_severity", "int"),
+        ("tags", "list"),
+        ("x", "float"),
+        ("y", "float"),
+        ("fetched_at", "datetime"),
+    ),
+    "modules": (
+        ("device_id", "str"),
+        ("module_id", "str"),
+        ("label", "str"),
+        ("severity", "int"),
+        ("tags", "list"),
+    ),
+    "ports": (
+        ("device_id", "str"),
+        ("module_id", "str"),
+        ("port_id", "str"),
+        ("label", "str"),
+        ("factory_label", "str"),
+        ("direction", "str"),
+        ("active", "bool"),
+        ("controlled", "bool"),
+        ("endpoint", "bool"),
+        ("severity", "int"),
+        ("tags", "list"),
+    ),
+    "vertices": (
+        ("vertex_id", "str"),
+        ("device_id", "str"),
+        ("module_id", "str"),
+        ("port_id", "str"),
+        ("label", "str"),
+        ("vertex_type", "str"),
+        ("active", "bool"),
+        ("controlled", "bool"),
+        ("endpoint", "bool"),
+    ),
+    "edges": (
+        ("edge_id", "str"),
+        ("pair_id", "str"),
+        ("from_device_id", "str"),
+        ("from_port_id", "str"),
+        ("to_device_id", "str"),
+        ("to_port_id", "str"),
+        ("bandwidth", "float"),
+        ("max_bandwidth", "float"),
+        ("alarm_severity", "int"),
+        ("ptp_severity", "int"),
+    ),
+    "paths": (
+        ("booking_id", "str"),
+        ("path_id", "str"),
+        ("is_main", "bool"),
+        ("hop", "int"),
+        ("device_id", "str"),
+        ("device_label", "str"),
+        ("from_label", "str"),
+        ("to_label", "str"),
+    ),
+    "alarms": (
+        ("alarm_id", "str"),
+        ("device_id", "str"),
+        ("resource_key", "str"),
+        ("severity", "int"),
+        ("acked", "bool"),
+        ("details", "str"),
+        ("time", "int"),
+    ),
+}
+
+TABLE_NAMES = tuple(TABLE_SCHEMAS)
+
+
+class InspectTable:
+    """A column-oriented table: equal-length column lists keyed by column name."""
+
+    __slots__ = ("name", "columns")
+
+    def __init__(self, name: str, columns: dict[str, list[Any]]) -> None:
+        self.name = name
+        self.columns = columns
+
+    def __len__(self) -> int:
+        return len(next(iter(self.columns.values()), []))
+
+    def __repr__(self) -> str:
+        return format_repr(self, name=self.name, rows=len(self), columns=len(self.columns))
+
+    __str__ = __repr__
+
+    @property
+    def column_names(self) -> list[str]:
+        return list(self.columns)
+
+    def column(self, name: str) -> list[Any]:
+        return self.columns[name]
+
+    def rows(self) -> Iterator[dict[str, Any]]:
+        names = list(self.columns)
+        for values in zip(*self.columns.values()):
+            yield dict(zip(names, values))
+
+    def to_arrow(self) -> Any:
+        """This table as a ``pyarrow.Table`` (requires the optional ``pyarrow`` package)."""
+        return _arrow_table(self)
+
+
+def iter_table_batches(
+    snapshot: InspectSnapshot, name: str, batch_size: int = DEFAULT_BATCH_ROWS
+) -> Iterator[InspectTable]:
+    """Stream one table as row batches of at most ``batch_size`` rows (at least one batch)."""
+    if name not in TABLE_SCHEMAS:
+        raise ValueError(f"Unknown Inspect table {name!r}; expected one of {', '.join(TABLE_NAMES)}.")
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1.")
+    names = [column for column, _ in TABLE_SCHEMAS[name]]
+    batch: list[tuple[Any, ...]] = []
+    emitted = False
+    for row in _ROW_SOURCES[name](snapshot):
+        batch.append(row)
+        if len(batch) == batch_size:
+            yield _to_columns(name, names, batch)
+            batch = []
+            emitted = True
+    if batch or not emitted:
+        yield _to_columns(name, names, batch)
+
+
+def build_tables(snapshot: InspectSnapshot, tables: Iterable[str] | None = None) -> dict[str, InspectTable]:
+    """Materialise the requested tables (default: all) in memory."""
+    result: dict[str, InspectTable] = {}
+    for name in _selected(tables):
+        columns: dict[str, list[Any]] = {}
+        for batch in iter_table_batches(snapshot, name, batch_size=DEFAULT_BATCH_ROWS):
+            for column, values in batch.columns.items():
+                columns.setdefault(column, []).extend(values)
+        result[name] = InspectTable(name, columns)
+    return result
+
+
+def write_csv(
+    snapshot: InspectSnapshot,
+    directory: str | Path,
+    tables: Iterable[str] | None = None,
+    batch_size: int = DEFAULT_BATCH_ROWS,
+) -> dict[str, Path]:
+    """Stream the requested tables to ``<directory>/<table>.csv``. List columns are ``;``-joined,
+    datetimes ISO-formatted and missing values empty."""
+    target = Path(directory)
+    target.mkdir(parents=True, exist_ok=True)
+    written: dict[str, Path] = {}
+    for name in _selected(tables):
+        path = target / f"{name}.csv"
+        with path.open("w", newline="", encoding="utf-8") as handle:
+            writer = csv.writer(handle)
+            writer.writerow([column for column, _ in TABLE_SCHEMAS[name]])
+            for batch in iter_table_batches(snapshot, name, batch_size):
+                writer.writerows([_csv_value(value) for value in row] for row in zip(*batch.columns.values()))
+        written[name] = path
+    return written
+
+
+def write_parquet(
+    snapshot: InspectSnapshot,
+    directory: str | Path,
+    tables: Iterable[str] | None = None,
+    batch_size: int = DEFAULT_BATCH_ROWS,
+) -> dict[str, Path]:
+    """Stream the requested tables to ``<directory>/<table>.parquet``, one row group per batch
+    (requires the optional ``pyarrow`` package)."""
+    pyarrow, parquet = _import_pyarrow()
+    target = Path(directory)
+    target.mkdir(parents=True, exist_ok=True)
+    written: dict[str, Path] = {}
+    for name in _selected(tables):
+        path = target / f"{name}.parquet"
+        with parquet.ParquetWriter(str(path), _arrow_schema(pyarrow, name)) as writer:
+            for batch in iter_table_batches(snapshot, name, batch_size):
+                writer.write_table(_arrow_table(batch))
+        written[name] = path
+    return written
+
+
+# --- Internal: row sources (one pass over the snapshot indexes, no domain wrappers) ---
+
+
+def _device_rows(snapshot: InspectSnapshot) -> Iterator[tuple[Any, ...]]:
+    with snapshot._lock:
+        records = list(snapshot._devices_by_id.values())
+    for record in records:
+        node = record.node
+        meta = node.meta
+        coordinates = meta.coordinates if meta is not None and meta.coordinates else {}
+        is_virtual = True if is_virtual_device_id(record.device_id) else (meta.isVirtual if meta else None)
+        yield (
+            record.device_id,
+            record.label,
+            node.effective_description,
+            record.pid,
+            record.level is HydrationLevel.FULL,
+            is_virtual,
+            meta.siteId if meta is not None else None,
+            _severity(node.status.severity if node.status is not None else None),
+            _severity(node.syncSeverity),
+            list(node.tags),
+            _number(coordinates.get("x")),
+            _number(coordinates.get("y")),
+            record.fetched_at,
+        )
+
+
+def _module_rows(snapshot: InspectSnapshot) -> Iterator[tuple[Any, ...]]:
+    with snapshot._lock:
+        modules = [(device_id, dict(by_id)) for device_id, by_id in snapshot._modules_by_device_id.items()]
+    for device_id, by_id in modules:
+        for module_id, module in by_id.items():
+            yield (
+                device_id,
+                module_id,
+                module.effective_label,
+                _severity(module.status.severity if module.status is not None else None),
+                module.local_assigned_tags,
+            )
+
+
+def _port_rows(snapshot: InspectSnapshot) -> Iterator[tuple[Any, ...]]:
+    with snapshot._lock:
+        entries = [indexed for ports in snapshot._ports_by_device_id.values() for indexed in ports]
+    for indexed in entries:
+        port = indexed.port
+        sides = _vertex_sides_from_status(port)
+        yield (
+            indexed.device_id,
+            indexed.module_id,
+            _port_id_from_status(port),
+            port.effective_label,
+            port.label,
+            _sides_direction(sides),
+            _sides_flag(sides, "isActive"),
+            _sides_flag(sides, "isControlled"),
+            _sides_flag(sides, "isEndpoint"),
+            _severity(port.status.severity if port.status is not None else None),
+            port.assigned_tags,
+        )
+
+
+def _vertex_rows(snapshot: InspectSnapshot) -> Iterator[tuple[Any, ...]]:
+    with snapshot._lock:
+        entries = [indexed for ports in snapshot._ports_by_device_id.values() for indexed in ports]
+    for indexed in entries:
+        port_id = _port_id_from_status(indexed.port)
+        for vertex_id, side in _vertex_sides_from_status(indexed.port):
+            yield (
+                vertex_id,
+                indexed.device_id,
+                indexed.module_id,
+                port_id,
+                side.label,
+                side.vertexType,
+                _side_flag(side, "isActive"),
+                _side_flag(side, "isControlled"),
+                _side_flag(side, "isEndpoint"),
+            )
+
+
+def _edge_rows(snapshot: InspectSnapshot) -> Iterator[tuple[Any, ...]]:
+    snapshot._reconcile_stale_pairs()
+    with snapshot._lock:
+        seen: set[str] = set()
+        entries = []
+        for pairs in snapshot._edges_by_device_id.values():
+            for edges in pairs.values():
+                for indexed in edges:
+                    if indexed.edge_id not in seen:
+                        seen.add(indexed.edge_id)
+                        entries.append(indexed)
+    for indexed in entries:
+        status = indexed.edge.status or indexed.pair_status
+        yield (
+            indexed.edge_id,
+            indexed.pair_id,
+            indexed.from_device_id,
+            indexed.from_port_id,
+            indexed.to_device_id,
+            indexed.to_port_id,
+            _number(indexed.edge.bandwidth),
+            _number(indexed.edge.maxBandwidth),
+            _severity(status.alarm if status is not None else None),
+            _severity(status.ptp if status is not None else None),
+        )
+
+
+def _path_rows(snapshot: InspectSnapshot) -> Iterator[tuple[Any, ...]]:
+    snapshot._ensure_section_paths()
+    with snapshot._lock:
+        items = list(snapshot._paths_by_booking_id.values())
+    for item in items:
+        fields = item.serviceFields
+        for hop, segment in enumerate(item.path):
+            structure = segment.structure
+            yield (
+                fields.bid,
+                item.id,
+                fields.isMain,
+                hop,
+                structure.deviceId if structure is not None else None,
+                structure.deviceLabel if structure is not None else None,
+                fields.fromLabel,
+                fields.toLabel,
+            )
+
+
+def _alarm_rows(snapshot: InspectSnapshot) -> Iterator[tuple[Any, ...]]:
+    snapshot._ensure_section_alarms()
+    with snapshot._lock:
+        items = list(snapshot._alarms.values())
+    for item in items:
+        point_id = list(item.id.pointId) if item.id is not None else []
+        info = item.info
+        yield (
+            item.id_field,
+            point_id[0] if point_id else None,
+            ".".join(point_id) if point_id else None,
+            _severity(info.severity if info is not None else None),
+            item.acked,
+            info.details if info is not None else None,
+            info.time if info is not None else None,
+        )
+
+
+_ROW_SOURCES: dict[str, Callable[[InspectSnapshot], Iterator[tuple[Any, ...]]]] = {
+    "devices": _device_rows,
+    "modules": _module_rows,
+    "ports": _port_rows,
+    "vertices": _vertex_rows,
+    "edges": _edge_rows,
+    "paths": _path_rows,
+    "alarms": _alarm_rows,
+}
+
+
+# --- Internal: values, batches and writers ---
+
+
+def _selected(tables: Iterable[str] | None) -> list[str]:
+    names = list(TABLE_NAMES if tables is None else tables)
+    unknown = [name for name in names if name not in TABLE_SCHEMAS]
+    if unknown:
+        raise ValueError(f"Unknown Inspect table(s) {unknown}; expected one of {', '.join(TABLE_NAMES)}.")
+    return names
+
+
+def _to_columns(name: str, names: list[str], rows: list[tuple[Any, ...]]) -> InspectTable:
+    if not rows:
+        return InspectTable(name, {column: [] for column in names})
+    return InspectTable(name, {column: list(values) for column, values in zip(names, zip(*rows))})
+
+
+def _severity(value: Any) -> int | None:
+    if isinstance(value, InspectSeverity):
+        return int(value)
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    return None
+
+
+def _number(value: Any) -> float | None:
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    return None
+
+
+def _csv_value(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, list):
+        return ";".join(str(item) for item in value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def _import_pyarrow() -> tuple[Any, Any]:
+    try:
+        import pyarrow
+        import pyarrow.parquet as parquet
+    except ImportError as error:
+        raise ImportError(
+            "Parquet/Arrow export requires the optional 'pyarrow' package: pip install pyarrow"
+        ) from error
+    return pyarrow, parquet
+
+
+def _arrow_schema(pyarrow: Any, name: str) -> Any:
+    types = {
+        "str": pyarrow.string(),
+        "int": pyarrow.int64(),
+        "float": pyarrow.float64(),
+        "bool": pyarrow.bool_(),
+        "list": pyarrow.list_(pyarrow.string()),
+        "datetime": pyarrow.timestamp("us", tz="UTC"),
+    }
+    return pyarrow.schema([(column, types[kind]) for column, kind in TABLE_SCHEMAS[name]])
+
+
+def _arrow_table(table: InspectTable) -> Any:
+    pyarrow, _ = _import_pyarrow()
+    schema = _arrow_schema(pyarrow, table.name)
+    return pyarrow.Table.from_pydict(table.columns, schema=schema)
+
+
+__all__ = [
+    "DEFAULT_BATCH_ROWS",
+    "TABLE_NAMES",
+    "TABLE_SCHEMAS",
+    "InspectTable",
+    "build_tables",
+    "iter_table_batches",
+    "write_csv",
+    "write_parquet",
+]
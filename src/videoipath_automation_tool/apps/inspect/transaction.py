@@ -24,12 +24,16 @@ Verified server facts encoded here (2025.4.9):
 from __future__ import annotations
 
 import copy
+import hashlib
 import logging
-from typing import TYPE_CHECKING, Any, Optional, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable, Iterator, Optional, Sequence
 
 from pydantic import Field
 
 from videoipath_automation_tool.apps.inspect.errors import (
+    InspectChunkedCommitError,
     InspectCommitConflictError,
     InspectCommitError,
     InspectConflict,
@@ -75,6 +79,10 @@ if TYPE_CHECKING:
 else:
     Editable = Any
 
+# Chunked-commit bounds: entities per ``updateTopology`` call and serialised form bytes per call.
+_CHUNK_MAX_ENTITIES = 1000
+_CHUNK_MAX_BYTES = 2_000_000
+
 
 class CommitResult(InspectFrozenModel):
     """Outcome of a successful commit; a failed commit raises ``InspectCommitError``.
@@ -124,6 +132,8 @@ class InspectTransaction:
         self._snapshot = snapshot
         self._logger = logger or logging.getLogger("videoipath_automation_tool_inspect_txn")
         self._entries: dict[tuple[str, str], _Staged] = {}
+        # Baselines fetched in bulk ahead of staging (``update([...])``); consumed by ``_stage``.
+        self._prefetched: dict[tuple[str, str], Any] = {}
         self._committed = False
         self._discarded = False
 
@@ -185,10 +195,7 @@ class InspectTransaction:
         if not objects:
             raise ValueError("Nothing to update.")
 
-        flushed_keys: list[tuple[str, str]] = []
-        for item in objects:
-            flushed_keys.extend(_stage_editable(self, self._snapshot, item))
-
+        flushed_keys = _stage_editables(self, self._snapshot, objects)
         for kind, entity_id in flushed_keys:
             self._snapshot.clear_staged(kind=kind, entity_id=entity_id)
         return self
@@ -534,16 +541,21 @@ class InspectTransaction:
 
     # --- Commit lifecycle ---
 
-    def commit(self, check_conflicts: bool = True) -> CommitResult:
+    def commit(self, check_conflicts: bool = True, *, background_refresh: bool = False) -> CommitResult:
         """Validate, send, and (on success) refresh. Raises on conflict or server rejection.
 
         Topology entries go through ``updateTopology``. Module tag intents are applied
         afterward via ``assignTag`` / ``unassignTag`` (not one atomic server transaction).
 
+        With ``background_refresh=True`` the bound snapshot's post-commit refresh runs on a
+        background thread and this returns as soon as the server accepted the change; touched
+        entities read stale-then-refetched until it lands (see ``InspectSnapshot.apply_post_commit``).
+
         Raises:
             InspectCommitConflictError: a staged entity changed on the server since staging.
             InspectCommitError: the server rejected the topology commit (validation or apply gate).
-            InspectError: a module tag assign/unassign action failed.
+            InspectError: one or more module tag assign/unassign actions failed (all are attempted;
+                the message lists every failed tag).
         """
         self._ensure_open()
         if not self._entries:
@@ -574,10 +586,122 @@ class InspectTransaction:
             created_ids=created_ids,
             response=response,
         )
-        self._refresh_snapshot()
+        self._refresh_snapshot(background=background_refresh)
         self._logger.debug("Inspect commit applied %d change(s): %s", len(applied_ids), applied_ids)
         return result
 
+    def commit_chunked(
+        self,
+        check_conflicts: bool = True,
+        *,
+        max_entities: int = _CHUNK_MAX_ENTITIES,
+        max_bytes: int = _CHUNK_MAX_BYTES,
+        stop_on_rejection: bool = True,
+        background_refresh: bool = False,
+    ) -> list[CommitResult]:
+        """Commit a very large change set as several ``updateTopology`` calls.
+
+        The delta is split into chunks of at most ``max_entities`` entities and roughly
+        ``max_bytes`` of serialised forms (an entity larger than ``max_bytes`` goes alone), in
+        dependency order: devices, then vertices, then edges, then removals (edges before vertices
+        before devices). The next chunk is built and serialised on a worker thread while the
+        current one is in flight. Module tag intents are applied after the last chunk, as in
+        :meth:`commit`.
+
+        Each chunk is atomic server-side, the whole set is not. Returns one :class:`CommitResult`
+        per chunk (plus one for module tags, if any). On a rejection, stops at once when
+        ``stop_on_rejection`` (the default), else carries on with the remaining chunks; a chunk whose
+        ``updateTopology`` call raises (e.g. a transport error) counts as rejected, and a chunk that
+        cannot be built after others were sent (e.g. an invalid intent) stops the commit. Either way
+        :class:`InspectChunkedCommitError` is raised at the end with the applied results, the
+        rejected chunks and the ids not written. The snapshot is refreshed for applied entities.
+
+        Raises:
+            InspectCommitConflictError: a staged entity changed on the server since staging
+                (checked once, up front; nothing is written).
+            InspectChunkedCommitError: at least one chunk was rejected or its request failed.
+            InspectError: one or more module tag assign/unassign actions failed (all are attempted;
+                the message lists every failed tag).
+        """
+        self._ensure_open()
+        if not self._entries:
+            raise ValueError("Nothing staged; commit aborted.")
+        if max_entities < 1 or max_bytes < 1:
+            raise ValueError("max_entities and max_bytes must be positive.")
+
+        topology_entries = [e for e in self._entries.values() if e.kind != _MODULE]
+        module_entries = [e for e in self._entries.values() if e.kind == _MODULE]
+        if check_conflicts and topology_entries:
+            self._check_conflicts()
+
+        results: list[CommitResult] = []
+        failures: list[tuple[int, Exception]] = []
+        applied: list[_Staged] = []
+        chunks = self._iter_delta_chunks(topology_entries, max_entities, max_bytes)
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="inspect-commit") as pool:
+            upcoming = pool.submit(next, chunks, None)
+            index = 0
+            while True:
+                try:
+                    chunk = upcoming.result()
+                except Exception as error:
+                    if not applied and not failures:
+                        raise  # nothing sent yet: the staged set is untouched on the server
+                    # Building a later chunk failed (e.g. an invalid intent): no further chunk can be
+                    # built, so stop and report the chunks already applied.
+                    self._logger.warning("Inspect chunked commit: building chunk %d failed: %s", index, error)
+                    failures.append((index, error))
+                    break
+                if chunk is None:
+                    break
+                upcoming = pool.submit(next, chunks, None)  # build the next chunk while this one is in flight
+                entries, delta = chunk
+                try:
+                    response = self._api.update_topology(delta)
+                except Exception as error:
+                    # Transport / unexpected errors count as a rejection so applied chunks are still recorded.
+                    self._logger.warning("Inspect chunked commit: chunk %d failed: %s", index, error)
+                    failures.append((index, error))
+                    if stop_on_rejection:
+                        break
+                    index += 1
+                    continue
+                if response.committed:
+                    applied.extend(entries)
+                    results.append(
+                        CommitResult(
+                            applied_ids=[e.entity_id for e in entries],
+                            created_ids=list(response.data.validation.createIds),
+                            response=response,
+                        )
+                    )
+                else:
+                    failures.append((index, InspectCommitError(response)))
+                    if stop_on_rejection:
+                        break
+                index += 1
+
+        if not failures and module_entries:
+            self._commit_module_tags(module_entries)
+            applied.extend(module_entries)
+            results.append(CommitResult(applied_ids=[e.entity_id for e in module_entries], created_ids=[]))
+
+        if applied:
+            # Partly applied: the staged set no longer matches one server state, so close it.
+            self._committed = True
+            self._refresh_snapshot(background=background_refresh, entries=applied)
+        self._logger.debug(
+            "Inspect chunked commit applied %d change(s) in %d chunk(s); %d chunk(s) rejected.",
+            len(applied),
+            len(results),
+            len(failures),
+        )
+        if failures:
+            applied_keys = {(e.kind, e.entity_id) for e in applied}
+            unapplied = [e.entity_id for key, e in self._entries.items() if key not in applied_keys]
+            raise InspectChunkedCommitError(results, failures, unapplied)
+        return results
+
     def rebase(self) -> "InspectTransaction":
         """Re-fetch baselines for all staged entities, keeping the recorded intents.
 
@@ -592,18 +716,17 @@ class InspectTransaction:
                 continue
             if entry.kind == _MODULE:
                 if self._snapshot is not None:
-                    tags = self._module_local_tags(entry.entity_id)
-                    entry.baseline_form = list(tags)
-                    entry.baseline_dump = {"tags": list(tags)}
+                    entry.baseline_form = list(self._module_local_tags(entry.entity_id))
                 continue
             fresh = self._fetch_baseline(entry.kind, entry.entity_id)
             entry.baseline_form = fresh
-            entry.baseline_dump = fresh.model_dump(mode="json")
+            entry.baseline_digest = _form_digest(fresh)
         return self
 
     def discard(self) -> None:
         """Drop all staged changes; the transaction can no longer be committed."""
         self._entries.clear()
+        self._prefetched.clear()
         self._discarded = True
 
     # --- Internal: staging helpers ---
@@ -642,7 +765,6 @@ class InspectTransaction:
             kind=_MODULE,
             entity_id=module_id,
             baseline_form=list(baseline_tags),
-            baseline_dump={"tags": list(baseline_tags)},
         )
         self._entries[key] = entry
         return entry
@@ -653,12 +775,14 @@ class InspectTransaction:
         existing = self._entries.get(key)
         if existing is not None and not existing.remove:
             return existing
-        baseline = self._fetch_baseline(kind, entity_id)
+        baseline = self._prefetched.pop(key, None)
+        if baseline is None:
+            baseline = self._fetch_baseline(kind, entity_id)
         entry = _Staged(
             kind=kind,
             entity_id=entity_id,
             baseline_form=baseline,
-            baseline_dump=baseline.model_dump(mode="json"),
+            baseline_digest=_form_digest(baseline),
         )
         self._entries[key] = entry
         return entry
@@ -671,18 +795,14 @@ class InspectTransaction:
         existing = self._lookup_edge_form(edge_id)
         if existing is not None and not overwrite:
             raise ValueError(f"Edge '{edge_id}' already exists; pass overwrite=True to replace it.")
-        form = (
-            existing.model_copy(deep=True)
-            if existing is not None
-            else InspectApiEdgeForm(fromId=from_vertex, toId=to_vertex)
-        )
+        form = existing.model_copy() if existing is not None else InspectApiEdgeForm(fromId=from_vertex, toId=to_vertex)
         form.fromId = from_vertex
         form.toId = to_vertex
         entry = _Staged(
             kind=_EDGE,
             entity_id=edge_id,
             baseline_form=form,
-            baseline_dump=None if existing is None else existing.model_dump(mode="json"),
+            baseline_digest=None if existing is None else _form_digest(existing),
             intents=dict(edge_fields),
             is_new=existing is None,
         )
@@ -700,6 +820,65 @@ class InspectTransaction:
             raise InspectEntityNotFoundError(entity_id, kind="edge")
         return form
 
+    def _prefetch_baselines(self, keys: Sequence[tuple[str, str]]) -> None:
+        """Fetch the baselines of entities about to be staged in one concurrent round (see
+        :meth:`_lookup_baselines`). Entities the lookups miss are left to ``_stage``, which
+        fetches them singly and raises the usual not-found error."""
+        wanted = [
+            key
+            for key in dict.fromkeys(keys)
+            if key[0] in (_DEVICE, _VERTEX, _EDGE)
+            and key not in self._prefetched
+            and (key not in self._entries or self._entries[key].remove)
+        ]
+        if len(wanted) < 2:
+            return
+        self._prefetched.update(
+            self._lookup_baselines(
+                device_ids=[eid for kind, eid in wanted if kind == _DEVICE],
+                vertex_ids=[eid for kind, eid in wanted if kind == _VERTEX],
+                edge_ids=[eid for kind, eid in wanted if kind == _EDGE],
+            )
+        )
+
+    def _lookup_baselines(
+        self, device_ids: list[str], vertex_ids: list[str], edge_ids: list[str]
+    ) -> dict[tuple[str, str], Any]:
+        """Current server forms keyed by ``(kind, entity_id)``; missing entities are absent.
+
+        Vertices and edges take one batched lookup each; ``lookupInspectDevice`` accepts a single
+        id, so devices take one POST each. All of them run concurrently on a bounded pool.
+        """
+
+        def vertices() -> dict[tuple[str, str], Any]:
+            data = self._api.lookup_vertices(vertex_ids).data
+            return {(_VERTEX, vid): data[vid].fields for vid in vertex_ids if data.get(vid) is not None}
+
+        def edges() -> dict[tuple[str, str], Any]:
+            data = self._api.lookup_edges(edge_ids).data
+            return {(_EDGE, eid): data[eid].edge for eid in edge_ids if data.get(eid) is not None}
+
+        def device(device_id: str) -> dict[tuple[str, str], Any]:
+            form = self._lookup_device_form(device_id, required=False)
+            return {} if form is None else {(_DEVICE, device_id): form}
+
+        jobs: list[Callable[[], dict[tuple[str, str], Any]]] = []
+        if vertex_ids:
+            jobs.append(vertices)
+        if edge_ids:
+            jobs.append(edges)
+        jobs.extend(partial(device, device_id) for device_id in device_ids)
+
+        current: dict[tuple[str, str], Any] = {}
+        if len(jobs) <= 1:
+            for job in jobs:
+                current.update(job())
+            return current
+        with ThreadPoolExecutor(max_workers=min(_LOOKUP_WORKERS, len(jobs))) as pool:
+            for future in [pool.submit(job) for job in jobs]:
+                current.update(future.result())
+        return current
+
     def _lookup_device_form(self, device_id: str, required: bool) -> Optional[InspectApiLookupInspectDeviceFields]:
         try:
             response = self._api.lookup_inspect_device(device_id)
@@ -729,65 +908,58 @@ class InspectTransaction:
         current = self._refetch_baselines()
         conflicts: list[InspectConflict] = []
         for entry in self._entries.values():
-            if entry.kind == _MODULE or entry.remove or entry.is_new or entry.baseline_dump is None:
+            if entry.kind == _MODULE or not _checkable(entry):
                 continue
             key = (entry.kind, entry.entity_id)
             server_form = current.get(key)
             if server_form is None:
                 conflicts.append(InspectConflict(entry.entity_id, entry.kind, {"__exists__": (True, False)}))
                 continue
-            server_dump = server_form.model_dump(mode="json")
-            if server_dump != entry.baseline_dump:
-                diffs = _field_diffs(entry.baseline_dump, server_dump)
+            if _form_digest(server_form) == entry.baseline_digest:
+                continue
+            # Digest mismatch: compare field by field (a mere key-order difference is no conflict).
+            diffs = _field_diffs(entry.baseline_form.model_dump(mode="json"), server_form.model_dump(mode="json"))
+            if diffs:
                 conflicts.append(InspectConflict(entry.entity_id, entry.kind, diffs))
         if conflicts:
             raise InspectCommitConflictError(conflicts)
 
     def _refetch_baselines(self) -> dict[tuple[str, str], Any]:
-        """Batched re-fetch of every conflict-checkable staged entity's current server form."""
-        vertex_ids = [e.entity_id for e in self._entries.values() if e.kind == _VERTEX and _checkable(e)]
-        edge_ids = [e.entity_id for e in self._entries.values() if e.kind == _EDGE and _checkable(e)]
-        device_ids = [e.entity_id for e in self._entries.values() if e.kind == _DEVICE and _checkable(e)]
-
-        current: dict[tuple[str, str], Any] = {}
-        if vertex_ids:
-            data = self._api.lookup_vertices(vertex_ids).data
-            for vid in vertex_ids:
-                item = data.get(vid)
-                if item is not None:
-                    current[(_VERTEX, vid)] = item.fields
-        if edge_ids:
-            data = self._api.lookup_edges(edge_ids).data
-            for eid in edge_ids:
-                item = data.get(eid)
-                if item is not None:
-                    current[(_EDGE, eid)] = item.edge
-        for did in device_ids:
-            form = self._lookup_device_form(did, required=False)
-            if form is not None:
-                current[(_DEVICE, did)] = form
-        return current
+        """Batched, concurrent re-fetch of every conflict-checkable staged entity's current server form."""
+        return self._lookup_baselines(
+            device_ids=[e.entity_id for e in self._entries.values() if e.kind == _DEVICE and _checkable(e)],
+            vertex_ids=[e.entity_id for e in self._entries.values() if e.kind == _VERTEX and _checkable(e)],
+            edge_ids=[e.entity_id for e in self._entries.values() if e.kind == _EDGE and _checkable(e)],
+        )
 
     # --- Internal: payload build ---
 
     def _build_delta(self) -> InspectApiUpdateTopologyData:
         delta = InspectApiUpdateTopologyData()
         for entry in self._entries.values():
-            if entry.kind == _MODULE:
-                continue
-            if entry.remove:
-                delta.remove.append(entry.entity_id)
-                continue
-            form = entry.baseline_form.model_copy(deep=True)
-            _apply_intents(form, entry.intents)
-            if entry.kind == _DEVICE:
-                delta.replaceDevices[entry.entity_id] = form
-            elif entry.kind == _VERTEX:
-                delta.replaceVertices[entry.entity_id] = form
-            else:
-                delta.replaceEdges[entry.entity_id] = form
+            if entry.kind != _MODULE:
+                _add_to_delta(delta, entry, None if entry.remove else _desired_form(entry))
         return delta
 
+    def _iter_delta_chunks(
+        self, entries: list[_Staged], max_entities: int, max_bytes: int
+    ) -> Iterator[tuple[list[_Staged], InspectApiUpdateTopologyData]]:
+        """Yield ``(entries, delta)`` chunks in dependency order, bounded by count and serialised size."""
+        chunk: list[_Staged] = []
+        delta = InspectApiUpdateTopologyData()
+        size = 0
+        for entry in sorted(entries, key=_chunk_rank):
+            form = None if entry.remove else _desired_form(entry)
+            cost = len(entry.entity_id) + (len(form.model_dump_json()) if form is not None else 0)
+            if chunk and (len(chunk) >= max_entities or size + cost > max_bytes):
+                yield chunk, delta
+                chunk, delta, size = [], InspectApiUpdateTopologyData(), 0
+            _add_to_delta(delta, entry, form)
+            chunk.append(entry)
+            size += cost
+        if chunk:
+            yield chunk, delta
+
     def _commit_module_tags(self, entries: list[_Staged]) -> None:
         """Diff desired vs current local tags and call assignTag / unassignTag (batched by tag)."""
         to_assign: dict[str, list[str]] = {}
@@ -804,10 +976,23 @@ class InspectTransaction:
             for tag_id in current_set - desired_set:
                 to_unassign.setdefault(tag_id, []).append(element_id)
 
-        for tag_id, element_ids in to_assign.items():
-            _raise_if_tag_action_failed("assignTag", tag_id, self._api.assign_tag(tag_id, element_ids))
-        for tag_id, element_ids in to_unassign.items():
-            _raise_if_tag_action_failed("unassignTag", tag_id, self._api.unassign_tag(tag_id, element_ids))
+        # The action payload takes one tag id, so modules are merged per tag and the per-tag calls
+        # run concurrently (a tag's assign and unassign element sets are disjoint).
+        actions = [("assignTag", self._api.assign_tag, tag_id, ids) for tag_id, ids in to_assign.items()]
+        actions += [("unassignTag", self._api.unassign_tag, tag_id, ids) for tag_id, ids in to_unassign.items()]
+        if not actions:
+            return
+        if len(actions) == 1:
+            failures = [_run_tag_action(*actions[0])]
+        else:
+            with ThreadPoolExecutor(max_workers=min(_TAG_ACTION_WORKERS, len(actions))) as pool:
+                failures = list(pool.map(lambda action: _run_tag_action(*action), actions))
+        messages = [message for message in failures if message is not None]
+        if messages:
+            raise InspectError(
+                f"Inspect module tag update failed for {len(messages)} of {len(actions)} tag action(s): "
+                + "; ".join(messages)
+            )
 
     def _module_local_tags(self, module_id: str) -> list[str]:
         """Current local (or effective) tags for ``module_id`` from the bound snapshot."""
@@ -821,13 +1006,13 @@ class InspectTransaction:
 
     # --- Internal: post-commit targeted refresh ---
 
-    def _refresh_snapshot(self) -> None:
+    def _refresh_snapshot(self, background: bool = False, entries: Optional[list[_Staged]] = None) -> None:
         if self._snapshot is None:
             return
         removed_ids: list[str] = []
         device_ids: set[str] = set()
         pair_ids: set[str] = set()
-        for entry in self._entries.values():
+        for entry in self._entries.values() if entries is None else entries:
             if entry.remove:
                 removed_ids.append(entry.entity_id)
                 if entry.kind == _EDGE:
@@ -844,11 +1029,18 @@ class InspectTransaction:
             device_ids=list(device_ids),
             pair_ids=list(pair_ids),
             mark_paths_stale=True,
+            background=background,
         )
 
 
 # --- Internal ---
 
+# Concurrent assignTag / unassignTag calls (one tag id per call).
+_TAG_ACTION_WORKERS = 8
+
+# Concurrent baseline lookups (``lookupInspectDevice`` is one POST per device).
+_LOOKUP_WORKERS = 8
+
 # Staged-entry kinds.
 _DEVICE = "device"
 _VERTEX = "vertex"
@@ -860,9 +1052,11 @@ class _Staged(InspectInternalModel):
     kind: str
     entity_id: str
     # The write-shape baseline (edit/edge form) as fetched at stage time; None for a raw remove.
+    # Never mutated: the commit form is a copy-on-write overlay of the intents (``_desired_form``).
     baseline_form: Any | None = None
-    # JSON dump of the baseline at stage time, used for the compare-and-commit conflict check.
-    baseline_dump: dict[str, Any] | None = None
+    # Digest of the server baseline's JSON at stage time, for the compare-and-commit conflict check;
+    # None for entities that are not conflict-checked (new edges, raw removes, module tags).
+    baseline_digest: bytes | None = None
     # Field-level intents (wire field names; dotted for one level of nesting, e.g. "descriptor.label").
     intents: dict[str, Any] = Field(default_factory=dict)
     remove: bool = False
@@ -888,68 +1082,118 @@ def _is_single_editable(obj: Any) -> bool:
     return isinstance(obj, (InspectDevice, InspectVertex, InspectEdge, InspectModule))
 
 
-def _stage_editable(
+def _stage_editables(
     tx: InspectTransaction,
     snapshot: "InspectSnapshot",
-    obj: Editable,
+    objects: Sequence[Editable],
 ) -> list[tuple[str, str]]:
-    """Stage pending edits for ``obj`` (and cascade children for a device). Returns flushed keys."""
+    """Stage pending edits for ``objects`` (cascading children for devices). Returns flushed keys.
+
+    Baselines for everything about to be staged are prefetched in one concurrent round first, so
+    staging many devices does not pay one sequential lookup per device.
+    """
+    planned = [edit for obj in objects for edit in _editable_intents(snapshot, obj)]
+    tx._prefetch_baselines([(kind, entity_id) for kind, entity_id, _ in planned])
+    stage = {
+        "device": tx.update_device,
+        "vertex": tx.update_vertex,
+        "edge": tx.update_edge,
+        "module": tx.update_module,
+    }
+    for kind, entity_id, intents in planned:
+        stage[kind](entity_id, intents=intents)
+    return [(kind, entity_id) for kind, entity_id, _ in planned]
+
+
+def _editable_intents(snapshot: "InspectSnapshot", obj: Editable) -> list[tuple[str, str, dict[str, Any]]]:
+    """Pending ``(kind, entity_id, intents)`` for ``obj``; a device cascades its vertices, modules
+    and edges (unit of work)."""
     from videoipath_automation_tool.apps.inspect.domain.device import InspectDevice
     from videoipath_automation_tool.apps.inspect.domain.edge import InspectEdge
     from videoipath_automation_tool.apps.inspect.domain.module import InspectModule
     from videoipath_automation_tool.apps.inspect.domain.vertex import InspectVertex
 
-    flushed: list[tuple[str, str]] = []
-
     if isinstance(obj, InspectDevice):
+        planned: list[tuple[str, str, dict[str, Any]]] = []
         device_edits = snapshot.get_staged_edits("device", obj.id)
         if device_edits:
-            tx.update_device(obj.id, intents=device_edits)
-            flushed.append(("device", obj.id))
+            planned.append(("device", obj.id, device_edits))
         for kind, entity_id, intents in snapshot.iter_staged_edits():
-            if kind == "vertex" and _device_of(entity_id) == obj.id and intents:
-                tx.update_vertex(entity_id, intents=intents)
-                flushed.append((kind, entity_id))
-            elif kind == "module" and _device_of(entity_id) == obj.id and intents:
-                tx.update_module(entity_id, intents=intents)
-                flushed.append((kind, entity_id))
-            elif kind == "edge" and intents:
+            if not intents:
+                continue
+            if kind in ("vertex", "module") and _device_of(entity_id) == obj.id:
+                planned.append((kind, entity_id, intents))
+            elif kind == "edge":
                 from_id, _, to_id = entity_id.partition("::")
                 if _device_of(from_id) == obj.id or _device_of(to_id) == obj.id:
-                    tx.update_edge(entity_id, intents=intents)
-                    flushed.append((kind, entity_id))
-        return flushed
-
-    if isinstance(obj, InspectVertex):
-        edits = snapshot.get_staged_edits("vertex", obj.id)
-        if edits:
-            tx.update_vertex(obj.id, intents=edits)
-            flushed.append(("vertex", obj.id))
-        return flushed
-
-    if isinstance(obj, InspectEdge):
-        edits = snapshot.get_staged_edits("edge", obj.id)
-        if edits:
-            tx.update_edge(obj.id, intents=edits)
-            flushed.append(("edge", obj.id))
-        return flushed
-
-    if isinstance(obj, InspectModule):
-        edits = snapshot.get_staged_edits("module", obj.id)
-        if edits:
-            tx.update_module(obj.id, intents=edits)
-            flushed.append(("module", obj.id))
-        return flushed
+                    planned.append((kind, entity_id, intents))
+        return planned
+
+    for kind, cls in (("vertex", InspectVertex), ("edge", InspectEdge), ("module", InspectModule)):
+        if isinstance(obj, cls):
+            edits = snapshot.get_staged_edits(kind, obj.id)
+            return [(kind, obj.id, edits)] if edits else []
 
     raise TypeError(f"Unsupported update target: {type(obj)!r}")
 
 
-def _raise_if_tag_action_failed(action: str, tag_id: str, response: InspectApiSimpleActionResponse) -> None:
+def _desired_form(entry: _Staged) -> Any:
+    """The write form to send for ``entry``: its baseline with the recorded intents overlaid.
+
+    Copy-on-write: the form and every container on an intent's path are shallow-copied before
+    being changed, everything else is shared with the (unchanged) baseline.
+    """
+    form = entry.baseline_form.model_copy()
+    _apply_intents(form, entry.intents)
+    return form
+
+
+def _form_digest(form: Any) -> bytes:
+    return hashlib.blake2b(form.model_dump_json().encode(), digest_size=16).digest()
+
+
+def _add_to_delta(delta: InspectApiUpdateTopologyData, entry: _Staged, form: Any) -> None:
+    if entry.remove:
+        delta.remove.append(entry.entity_id)
+    elif entry.kind == _DEVICE:
+        delta.replaceDevices[entry.entity_id] = form
+    elif entry.kind == _VERTEX:
+        delta.replaceVertices[entry.entity_id] = form
+    else:
+        delta.replaceEdges[entry.entity_id] = form
+
+
+# Chunk order: replacements parent-first (devices, vertices, edges), then removals child-first.
+_CHUNK_RANKS = {
+    (False, "device"): 0,
+    (False, "vertex"): 1,
+    (False, "edge"): 2,
+    (True, "edge"): 3,
+    (True, "vertex"): 4,
+    (True, "device"): 5,
+}
+
+
+def _chunk_rank(entry: _Staged) -> int:
+    return _CHUNK_RANKS[(entry.remove, entry.kind)]
+
+
+def _run_tag_action(
+    action: str,
+    call: Callable[[str, list[str]], InspectApiSimpleActionResponse],
+    tag_id: str,
+    element_ids: list[str],
+) -> Optional[str]:
+    """Run one assign/unassign call; return a failure description, or ``None`` on success."""
+    try:
+        response = call(tag_id, element_ids)
+    except Exception as exc:
+        return f"{action} '{tag_id}': {exc}"
     if response.header.ok and response.data.ok:
-        return
+        return None
     messages = list(response.data.msg) + list(response.header.msg)
-    detail = "; ".join(m for m in messages if m) or "tag action rejected by the server"
-    raise InspectError(f"Inspect {action} failed for tag '{tag_id}': {detail}")
+    detail = ", ".join(m for m in messages if m) or "tag action rejected by the server"
+    return f"{action} '{tag_id}': {detail}"
 
 
 def _entity_kind(entity_id: str) -> str:
@@ -997,11 +1241,11 @@ def _conflict_priority_to_wire(value: InspectConfigPriority | int | str) -> int
 def _merged_weight_factors(
     baseline: Any, bandwidth_weight_factor: Optional[int], weight_per_service: Optional[int]
 ) -> dict[str, Any]:
-    """Merge the requested weight-factor changes onto a deep copy of the baseline ``weightFactors``
+    """Merge the requested weight-factor changes onto a copy of the baseline ``weightFactors``
     (a nested dict), preserving untouched sub-values (e.g. ``service.max``)."""
-    merged: dict[str, Any] = copy.deepcopy(baseline) if isinstance(baseline, dict) else {}
-    merged.setdefault("bandwidth", {})
-    merged.setdefault("service", {})
+    merged: dict[str, Any] = dict(baseline) if isinstance(baseline, dict) else {}
+    merged["bandwidth"] = dict(merged.get("bandwidth") or {})
+    merged["service"] = dict(merged.get("service") or {})
     if bandwidth_weight_factor is not None:
         merged["bandwidth"]["weight"] = bandwidth_weight_factor
     if weight_per_service is not None:
@@ -1010,8 +1254,10 @@ def _merged_weight_factors(
 
 
 def _apply_intents(form: Any, intents: dict[str, Any]) -> None:
-    """Apply wire-field intents onto a baseline form. Supports arbitrary dotted paths and deep-merges
-    when the terminal parent is a ``dict`` (e.g. codec ``mainDstInfo.port``, edge ``weightFactors``)."""
+    """Apply wire-field intents onto a (shallow-copied) form. Supports arbitrary dotted paths and
+    merges when the terminal parent is a ``dict`` (e.g. codec ``mainDstInfo.port``, edge
+    ``weightFactors``). Containers on the path are replaced by shallow copies before being
+    changed, so values shared with the baseline form are never mutated."""
     for key, value in intents.items():
         if "." not in key:
             setattr(form, key, value)
@@ -1019,33 +1265,28 @@ def _apply_intents(form: Any, intents: dict[str, Any]) -> None:
         parts = key.split(".")
         target: Any = form
         for index, part in enumerate(parts[:-1]):
+            child = _get_path_child(target, part)
+            # Intermediate containers are dicts (codec generic/specific, weightFactors, …) or models.
+            _set_path_child(target, part, {} if child is None else _shallow_copy(child))
+            # Re-fetch in case the parent model replaced the assigned value.
             next_target = _get_path_child(target, part)
             if next_target is None:
-                # Intermediate containers are dicts (codec generic/specific, weightFactors, …).
-                next_target = {}
-                _set_path_child(target, part, next_target)
-                # Re-fetch in case the parent model replaced the assigned value.
-                next_target = _get_path_child(target, part)
-                if next_target is None:
-                    raise ValueError(f"Cannot create intermediate path '{'.'.join(parts[: index + 1])}' on form.")
+                raise ValueError(f"Cannot create intermediate path '{'.'.join(parts[: index + 1])}' on form.")
             target = next_target
         leaf = parts[-1]
-        if isinstance(target, dict):
-            existing = target.get(leaf)
-            if isinstance(existing, dict) and isinstance(value, dict):
-                merged = copy.deepcopy(existing)
-                merged.update(value)
-                target[leaf] = merged
-            else:
-                target[leaf] = value
-        else:
-            existing = getattr(target, leaf, None)
-            if isinstance(existing, dict) and isinstance(value, dict):
-                merged = copy.deepcopy(existing)
-                merged.update(value)
-                setattr(target, leaf, merged)
-            else:
-                setattr(target, leaf, value)
+        existing = _get_path_child(target, leaf)
+        if isinstance(existing, dict) and isinstance(value, dict):
+            value = {**existing, **value}
+        _set_path_child(target, leaf, value)
+
+
+def _shallow_copy(value: Any) -> Any:
+    if isinstance(value, dict):
+        return dict(value)
+    if isinstance(value, list):
+        return list(value)
+    model_copy = getattr(value, "model_copy", None)
+    return model_copy() if callable(model_copy) else copy.copy(value)
 
 
 def _get_path_child(obj: Any, name: str) -> Any:
@@ -1062,7 +1303,7 @@ def _set_path_child(obj: Any, name: str, value: Any) -> None:
 
 
 def _checkable(entry: _Staged) -> bool:
-    return not entry.remove and not entry.is_new and entry.baseline_dump is not None
+    return not entry.remove and not entry.is_new and entry.baseline_digest is not None
 
 
 def _field_diffs(baseline: dict[str, Any], current: dict[str, Any]) -> dict[str, tuple[object, object]]:
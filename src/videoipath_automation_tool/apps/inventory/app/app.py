@@ -195,6 +195,19 @@ class InventoryApp(InventoryCreateDeviceMixin, InventoryCreateDeviceFromDiscover
         device.status = self._inventory_api._fetch_device_status(device_id)
         return device
 
+    def get_devices_reachability(self, device_ids: List[str]) -> dict[str, bool]:
+        """Method to get the reachability of many devices with batched status reads.
+
+        Args:
+            device_ids (List[str]): Device IDs to check.
+
+        Returns:
+            dict[str, bool]: {device_id: reachable}. Devices without a status (yet) are omitted.
+        """
+        if not device_ids:
+            return {}
+        return self._inventory_api.fetch_devices_reachability(device_ids)
+
     # Note: create_device(), create_device_from_discovered_device(), get_device() are implemented in the respective mixins.
 
     def get_discovered_devices(self) -> List[DiscoveredInventoryDevice]:
@@ -241,6 +254,14 @@ class InventoryApp(InventoryCreateDeviceMixin, InventoryCreateDeviceFromDiscover
         """
         return self._inventory_api.fetch_device_ids_by_driver(driver=driver)
 
+    def get_device_drivers(self) -> dict[str, str]:
+        """Method to get the driver id of every device in VideoIPath-Inventory with a single request.
+
+        Returns:
+            dict[str, str]: {device_id: driver_id}, e.g. for per-driver drift reports.
+        """
+        return self._inventory_api.fetch_devices_driver_ids_as_dict()
+
     def enable_device(self, device_id: str) -> InventoryDevice[CustomSettings]:
         """Method to enable a device in VideoIPath-Inventory.
 
@@ -27,6 +27,7 @@ from videoipath_automation_tool.validators.device_id import validate_device_id
 class InventoryAPI:
     STATUS_FETCH_RETRY_DEFAULT = 20
     STATUS_FETCH_DELAY_DEFAULT = 2
+    REACHABILITY_CHUNK_SIZE = 50
 
     def __init__(self, vip_connector: VideoIPathConnector, logger: Optional[logging.Logger] = None):
         """
@@ -396,6 +397,24 @@ class InventoryAPI:
         device_ids = [device["_id"] for device in response.data["config"]["devman"]["devices"]["_items"]]
         return sorted(device_ids, key=extract_natural_sort_key)
 
+    def fetch_devices_reachability(self, device_ids: List[str]) -> dict[str, bool]:
+        """Fetch the ``reachable`` flag for many devices, ``REACHABILITY_CHUNK_SIZE`` ids per request.
+
+        Returns:
+            dict: {device_id: reachable}; ids without a status entry (yet) are omitted.
+        """
+        ids = list(dict.fromkeys(validate_device_id(device_id=device_id) for device_id in device_ids))
+        reachability: dict[str, bool] = {}
+        for start in range(0, len(ids), self.REACHABILITY_CHUNK_SIZE):
+            chunk = ids[start : start + self.REACHABILITY_CHUNK_SIZE]
+            where = " or ".join(f"(id='{device_id}')" for device_id in chunk)
+            response = self.vip_connector.rest.get(f"/rest/v2/data/status/devman/devices/* where {where} /reachable")
+            if not response.data:
+                continue
+            for item in response.data["status"]["devman"]["devices"]["_items"]:
+                reachability[item["_id"]] = bool(item.get("reachable"))
+        return reachability
+
     # --- Bulk Device Label Fetching Methods ---
     def fetch_devices_factory_labels_as_dict(self) -> dict[str, str]:
         """Method to fetch all device factory labels from VideoIPath-Inventory
@@ -412,6 +431,26 @@ class InventoryAPI:
             for device in response.data["status"]["devman"]["devices"]["_items"]
         }
 
+    def fetch_devices_driver_ids_as_dict(self) -> dict[str, str]:
+        """Method to fetch the driver id of all devices from VideoIPath-Inventory in one request
+
+        Returns:
+            dict: {device_id: driver_id}
+        """
+        url = "/rest/v2/data/config/devman/devices/*/config/driver"
+        response = self.vip_connector.rest.get(url)
+        if not response.data:
+            raise ValueError("Response data is empty.")
+        drivers = {}
+        for device in response.data["config"]["devman"]["devices"]["_items"]:
+            driver = device["config"]["driver"]
+            drivers[device["_id"]] = construct_driver_id_from_info(
+                driver_organization=driver["organization"],
+                driver_name=driver["name"],
+                driver_version=driver["version"],
+            )
+        return drivers
+
     def fetch_devices_user_defined_labels_as_dict(self) -> dict[str, str]:
         """
         Method to fetch all user defined device labels from VideoIPath-Inventory
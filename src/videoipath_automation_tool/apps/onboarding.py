@@ -0,0 +1,492 @@
+"""Streaming onboarding pipeline: discovered / staged devices → inventory → reachable → topology → synced.
+
+Each device flows through four stages connected by bounded queues, so inventory adds, status waits,
+topology adds and syncs overlap instead of running device by device:
+
+1. **inventory** — ``InventoryApp.add_device`` (a pool of workers; there is no bulk add endpoint),
+2. **status** — one poller that checks every waiting device with batched reachability reads,
+3. **topology** — ``addDevices`` once per batch,
+4. **synced** — ``syncDevices`` once per batch.
+
+Progress is reported per device and can be persisted to a JSON checkpoint file; re-running with the
+same checkpoint skips finished devices and resumes the others after their last completed stage.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Iterable, Literal, Mapping, Optional, Union
+
+from pydantic import BaseModel
+
+from videoipath_automation_tool.apps.inspect.app import InspectApp
+from videoipath_automation_tool.apps.inspect.app.actions import ConflictStrategy
+from videoipath_automation_tool.apps.inventory import InventoryApp
+from videoipath_automation_tool.apps.inventory.model.inventory_device import InventoryDevice
+from videoipath_automation_tool.utils.cross_app_utils import create_fallback_logger
+
+# Last completed stage of a device ("pending" = nothing done yet).
+OnboardingStage = Literal["pending", "inventory", "status", "topology", "synced"]
+
+# A staged InventoryDevice (keyed by its label) or a discovered device id (keyed by that id).
+OnboardingSource = Union[InventoryDevice, str]
+
+_STAGE_ORDER: tuple[OnboardingStage, ...] = ("pending", "inventory", "status", "topology", "synced")
+_CHECKPOINT_VERSION = 1
+_DONE = object()
+
+
+class OnboardingProgress(BaseModel):
+    """Per-device pipeline state; ``error`` is set when the step after ``stage`` failed."""
+
+    key: str
+    stage: OnboardingStage = "pending"
+    device_id: Optional[str] = None
+    error: Optional[str] = None
+
+    @property
+    def failed(self) -> bool:
+        return self.error is not None
+
+
+class OnboardingResult(BaseModel):
+    """Outcome of :meth:`OnboardingPipeline.run`, keyed like the input devices."""
+
+    devices: dict[str, OnboardingProgress]
+    final_stage: OnboardingStage
+
+    @property
+    def completed(self) -> list[OnboardingProgress]:
+        return [entry for entry in self.devices.values() if entry.stage == self.final_stage and not entry.failed]
+
+    @property
+    def failed(self) -> list[OnboardingProgress]:
+        return [entry for entry in self.devices.values() if entry.failed]
+
+    @property
+    def ok(self) -> bool:
+        return len(self.completed) == len(self.devices)
+
+
+class OnboardingPipeline:
+    """Pipelined onboarding of many devices from inventory into a synchronized Inspect topology."""
+
+    def __init__(
+        self,
+        inventory: InventoryApp,
+        inspect: InspectApp,
+        *,
+        batch_size: int = 50,
+        batch_wait: float = 1.0,
+        queue_size: int = 100,
+        inventory_workers: int = 4,
+        duplicate_checks: bool = True,
+        wait_for_reachable: bool = True,
+        status_attempts: int = 10,
+        status_delay: float = 3.0,
+        sync: bool = True,
+        add_only: bool = True,
+        conflict_strategy: ConflictStrategy = ConflictStrategy.STRICT,
+        checkpoint_interval: float = 1.0,
+        logger: Optional[logging.Logger] = None,
+    ):
+        """
+        Args:
+            inventory (InventoryApp): Inventory app used to add devices and read reachability.
+            inspect (InspectApp): Inspect app used for ``addDevices`` / ``syncDevices``.
+            batch_size (int, optional): Maximum devices per ``addDevices`` / ``syncDevices`` call. Defaults to 50.
+            batch_wait (float, optional): Seconds a partial batch waits for more devices. Defaults to 1.0.
+            queue_size (int, optional): Capacity of each queue between stages. Defaults to 100.
+            inventory_workers (int, optional): Concurrent inventory adds. Defaults to 4.
+            duplicate_checks (bool, optional): Run the label/address checks of ``add_device``. Defaults to True.
+            wait_for_reachable (bool, optional): Only add devices to the topology once reachable. Defaults to True.
+            status_attempts (int, optional): Reachability polls before a device fails. Defaults to 10.
+            status_delay (float, optional): Seconds between reachability polls. Defaults to 3.0.
+            sync (bool, optional): Run ``syncDevices`` after adding to the topology. Defaults to True.
+            add_only (bool, optional): Forwarded to ``syncDevices``. Defaults to True.
+            conflict_strategy (ConflictStrategy, optional): Forwarded to ``syncDevices``.
+            checkpoint_interval (float, optional): Minimum seconds between checkpoint writes; the final state is
+                always written when the run ends. Defaults to 1.0.
+            logger (Optional[logging.Logger], optional): Logger instance to use for logging.
+        """
+        if batch_size < 1 or queue_size < 1 or inventory_workers < 1 or status_attempts < 1:
+            raise ValueError("batch_size, queue_size, inventory_workers and status_attempts must be at least 1.")
+        self._inventory = inventory
+        self._inspect = inspect
+        self._batch_size = batch_size
+        self._batch_wait = batch_wait
+        self._queue_size = queue_size
+        self._inventory_workers = inventory_workers
+        self._duplicate_checks = duplicate_checks
+        self._wait_for_reachable = wait_for_reachable
+        self._status_attempts = status_attempts
+        self._status_delay = status_delay
+        self._sync = sync
+        self._add_only = add_only
+        self._conflict_strategy = conflict_strategy
+        self._checkpoint_interval = checkpoint_interval
+        self._logger = logger or create_fallback_logger("videoipath_automation_tool_onboarding")
+
+    @property
+    def final_stage(self) -> OnboardingStage:
+        return "synced" if self._sync else "topology"
+
+    def run(
+        self,
+        devices: Iterable[OnboardingSource],
+        *,
+        positions: Optional[Mapping[str, tuple[float, float]]] = None,
+        checkpoint_path: Optional[Union[str, Path]] = None,
+        on_progress: Optional[Callable[[OnboardingProgress], None]] = None,
+    ) -> OnboardingResult:
+        """Onboard ``devices`` and return the per-device outcome.
+
+        Args:
+            devices (Iterable[OnboardingSource]): Staged ``InventoryDevice`` objects (keyed by label) or
+                discovered device ids (created from their first suggested configuration).
+            positions (Optional[Mapping[str, tuple[float, float]]], optional): Topology ``(x, y)`` per key;
+                devices without a position are placed at ``(0, 0)``.
+            checkpoint_path (Optional[Union[str, Path]], optional): JSON checkpoint to resume from and update.
+            on_progress (Optional[Callable[[OnboardingProgress], None]], optional): Called after every
+                per-device state change (from pipeline threads).
+
+        Returns:
+            OnboardingResult: Final state of every device.
+        """
+        run = _PipelineRun(self, positions or {}, checkpoint_path, on_progress)
+        return run.execute(devices)
+
+
+class _PipelineRun:
+    """State of one :meth:`OnboardingPipeline.run` call (queues, progress, checkpoint)."""
+
+    def __init__(
+        self,
+        pipeline: OnboardingPipeline,
+        positions: Mapping[str, tuple[float, float]],
+        checkpoint_path: Optional[Union[str, Path]],
+        on_progress: Optional[Callable[[OnboardingProgress], None]],
+    ):
+        self._pipeline = pipeline
+        self._logger = pipeline._logger
+        self._positions = positions
+        self._checkpoint_path = Path(checkpoint_path) if checkpoint_path is not None else None
+        self._on_progress = on_progress
+        self._lock = threading.Lock()
+        self._checkpoint_pending = False
+        self._checkpoint_written_at = float("-inf")
+        self._error: Optional[BaseException] = None
+        self._local = threading.local()
+        self._progress: dict[str, OnboardingProgress] = self._load_checkpoint()
+        size = pipeline._queue_size
+        self._inventory_queue: queue.Queue = queue.Queue(maxsize=size)
+        self._status_queue: queue.Queue = queue.Queue(maxsize=size)
+        self._topology_queue: queue.Queue = queue.Queue(maxsize=size)
+        self._sync_queue: queue.Queue = queue.Queue(maxsize=size)
+
+    def execute(self, devices: Iterable[OnboardingSource]) -> OnboardingResult:
+        pipeline = self._pipeline
+        sources: list[tuple[str, OnboardingSource]] = []
+        seen: set[str] = set()
+        for source in devices:
+            key = _source_key(source)
+            if key in seen:
+                raise ValueError(f"Duplicate onboarding key '{key}'.")
+            seen.add(key)
+            sources.append((key, source))
+        if self._checkpoint_path is not None:
+            self._checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+
+        inventory_threads = [
+            self._start(self._inventory_stage, self._inventory_queue, f"onboarding-inventory-{index}")
+            for index in range(pipeline._inventory_workers)
+        ]
+        status_thread = self._start(self._status_stage, self._status_queue, "onboarding-status")
+        topology_thread = self._start(self._topology_stage, self._topology_queue, "onboarding-topology")
+        sync_thread = self._start(self._sync_stage, self._sync_queue, "onboarding-sync")
+
+        for key, source in sources:
+            self._enqueue(key, source)
+
+        # Stages shut down in order so every queued device is drained before its consumer stops.
+        for _ in inventory_threads:
+            self._inventory_queue.put(_DONE)
+        for thread in inventory_threads:
+            thread.join()
+        self._status_queue.put(_DONE)
+        status_thread.join()
+        self._topology_queue.put(_DONE)
+        topology_thread.join()
+        self._sync_queue.put(_DONE)
+        sync_thread.join()
+        try:
+            self._flush_checkpoint()
+        except Exception as error:
+            if self._error is None:
+                raise
+            self._logger.warning(f"Onboarding checkpoint write failed: {error}")
+        if self._error is not None:
+            raise self._error
+
+        with self._lock:
+            results = {key: self._progress.get(key, OnboardingProgress(key=key)).model_copy() for key in seen}
+        return OnboardingResult(devices=results, final_stage=pipeline.final_stage)
+
+    def _start(self, target: Callable[[], None], source: queue.Queue, name: str) -> threading.Thread:
+        thread = threading.Thread(target=self._guard, args=(target, source), name=name, daemon=True)
+        thread.start()
+        return thread
+
+    def _guard(self, target: Callable[[], None], source: queue.Queue) -> None:
+        """Run a stage; on an unexpected error keep the error for ``execute`` and drain the stage's queue
+        until its ``_DONE`` so upstream ``put()`` calls (and ``run()``) cannot block forever."""
+        self._local.done = False
+        try:
+            target()
+        except BaseException as error:
+            self._logger.error(f"Onboarding stage {threading.current_thread().name} stopped: {error!r}")
+            with self._lock:
+                if self._error is None:
+                    self._error = error
+            while not self._local.done:
+                self._take(source)
+
+    def _take(self, source: queue.Queue, block: bool = True, timeout: Optional[float] = None):
+        """``source.get()`` that remembers (per stage thread) whether the stage consumed its ``_DONE``."""
+        item = source.get(block, timeout)
+        if item is _DONE:
+            self._local.done = True
+        return item
+
+    def _enqueue(self, key: str, source: OnboardingSource) -> None:
+        """Route a device to the stage after its last completed (checkpointed) stage."""
+        with self._lock:
+            entry = self._progress.get(key)
+        if entry is None or entry.stage == "pending" or entry.device_id is None:
+            self._inventory_queue.put((key, source))
+        elif _STAGE_ORDER.index(entry.stage) >= _STAGE_ORDER.index(self._pipeline.final_stage):
+            return
+        elif entry.stage == "inventory":
+            self._status_queue.put((key, entry.device_id))
+        elif entry.stage == "status":
+            self._topology_queue.put((key, entry.device_id))
+        else:
+            self._sync_queue.put((key, entry.device_id))
+
+    # --- Stages ---
+
+    def _inventory_stage(self) -> None:
+        pipeline = self._pipeline
+        while True:
+            item = self._take(self._inventory_queue)
+            if item is _DONE:
+                return
+            key, source = item
+            try:
+                device = source
+                if isinstance(device, str):
+                    device = pipeline._inventory.create_device_from_discovered_device(discovered_device_id=device)
+                online = pipeline._inventory.add_device(
+                    device,
+                    label_check=pipeline._duplicate_checks,
+                    address_check=pipeline._duplicate_checks,
+                    config_only=True,
+                )
+                device_id = online.device_id
+            except Exception as error:
+                self._fail([key], "pending", None, f"inventory add failed: {error}")
+                continue
+            self._record([(key, "inventory", device_id, None)])
+            self._status_queue.put((key, device_id))
+
+    def _status_stage(self) -> None:
+        pipeline = self._pipeline
+        pending: dict[str, tuple[str, int]] = {}
+        done = False
+        while True:
+            if not pending and not done:
+                item = self._take(self._status_queue)
+                if item is _DONE:
+                    done = True
+                else:
+                    pending[item[1]] = (item[0], 0)
+            while not done:
+                try:
+                    item = self._take(self._status_queue, block=False)
+                except queue.Empty:
+                    break
+                if item is _DONE:
+                    done = True
+                else:
+                    pending[item[1]] = (item[0], 0)
+            if not pending:
+                if done:
+                    return
+                continue
+            try:
+                reachability = pipeline._inventory.get_devices_reachability(list(pending))
+            except Exception as error:
+                self._logger.warning(f"Onboarding status poll failed: {error}")
+                reachability = {}
+            ready: list[tuple[str, OnboardingStage, Optional[str], Optional[str]]] = []
+            for device_id, (key, attempts) in list(pending.items()):
+                reachable = reachability.get(device_id)
+                if reachable or (reachable is not None and not pipeline._wait_for_reachable):
+                    ready.append((key, "status", device_id, None))
+                    del pending[device_id]
+                elif attempts + 1 >= pipeline._status_attempts:
+                    del pending[device_id]
+                    state = "not reachable" if reachable is not None else "has no status"
+                    self._fail([key], "inventory", device_id, f"device {state} after {attempts + 1} poll(s)")
+                else:
+                    pending[device_id] = (key, attempts + 1)
+            if ready:
+                self._record(ready)
+                for key, _, ready_id, _ in ready:
+                    self._topology_queue.put((key, ready_id))
+            if pending:
+                time.sleep(pipeline._status_delay)
+
+    def _topology_stage(self) -> None:
+        pipeline = self._pipeline
+        for batch in self._batches(self._topology_queue):
+            specs = [(device_id, *self._positions.get(key, (0.0, 0.0))) for key, device_id in batch]
+            started = time.perf_counter()
+            try:
+                ok = pipeline._inspect.add_devices_to_topology(specs, sync=False)
+                error = None if ok else "addDevices reported failure"
+            except Exception as exc:
+                error = f"addDevices failed: {exc}"
+            self._logger.debug(
+                "addDevices (%d device(s)) took %.1f ms", len(batch), (time.perf_counter() - started) * 1000
+            )
+            if error is not None:
+                for key, device_id in batch:
+                    self._fail([key], "status", device_id, error)
+                continue
+            self._record([(key, "topology", device_id, None) for key, device_id in batch])
+            if pipeline._sync:
+                for item in batch:
+                    self._sync_queue.put(item)
+            self._logger.info(f"Onboarding: added {len(batch)} device(s) to the topology.")
+
+    def _sync_stage(self) -> None:
+        pipeline = self._pipeline
+        for batch in self._batches(self._sync_queue):
+            device_ids = [device_id for _, device_id in batch]
+            started = time.perf_counter()
+            try:
+                ok = pipeline._inspect.sync_devices(
+                    device_ids, add_only=pipeline._add_only, conflict_strategy=pipeline._conflict_strategy
+                )
+                error = None if ok else "syncDevices reported failure"
+            except Exception as exc:
+                error = f"syncDevices failed: {exc}"
+            self._logger.debug(
+                "syncDevices (%d device(s)) took %.1f ms", len(batch), (time.perf_counter() - started) * 1000
+            )
+            if error is not None:
+                for key, device_id in batch:
+                    self._fail([key], "topology", device_id, error)
+                continue
+            self._record([(key, "synced", device_id, None) for key, device_id in batch])
+            self._logger.info(f"Onboarding: synchronized {len(device_ids)} device(s).")
+
+    def _batches(self, source: queue.Queue) -> Iterable[list[tuple[str, str]]]:
+        """Yield batches of up to ``batch_size`` items; a partial batch waits at most ``batch_wait``."""
+        pipeline = self._pipeline
+        while True:
+            first = self._take(source)
+            if first is _DONE:
+                return
+            batch = [first]
+            done = False
+            deadline = time.monotonic() + pipeline._batch_wait
+            while len(batch) < pipeline._batch_size:
+                remaining = deadline - time.monotonic()
+                try:
+                    item = self._take(source, timeout=remaining) if remaining > 0 else self._take(source, block=False)
+                except queue.Empty:
+                    break
+                if item is _DONE:
+                    done = True
+                    break
+                batch.append(item)
+            yield batch
+            if done:
+                return
+
+    # --- Progress / checkpoint ---
+
+    def _fail(self, keys: list[str], stage: OnboardingStage, device_id: Optional[str], error: str) -> None:
+        self._logger.warning(f"Onboarding failed for {', '.join(keys)}: {error}")
+        self._record([(key, stage, device_id, error) for key in keys])
+
+    def _record(self, updates: list[tuple[str, OnboardingStage, Optional[str], Optional[str]]]) -> None:
+        """Apply state changes, persist the checkpoint (at most once per ``checkpoint_interval``), then notify
+        ``on_progress``."""
+        with self._lock:
+            entries = []
+            for key, stage, device_id, error in updates:
+                entry = OnboardingProgress(key=key, stage=stage, device_id=device_id, error=error)
+                self._progress[key] = entry
+                entries.append(entry)
+            self._checkpoint_pending = True
+            if self._checkpoint_path is not None:
+                now = time.monotonic()
+                if now - self._checkpoint_written_at >= self._pipeline._checkpoint_interval:
+                    self._checkpoint_written_at = now
+                    self._checkpoint_pending = False
+                    self._write_checkpoint()
+        if self._on_progress is not None:
+            for entry in entries:
+                try:
+                    self._on_progress(entry)
+                except Exception as error:
+                    self._logger.warning(f"Onboarding progress callback failed: {error}")
+
+    def _load_checkpoint(self) -> dict[str, OnboardingProgress]:
+        if self._checkpoint_path is None or not self._checkpoint_path.exists():
+            return {}
+        data = json.loads(self._checkpoint_path.read_text(encoding="utf-8"))
+        if data.get("version") != _CHECKPOINT_VERSION:
+            raise ValueError(f"Unsupported onboarding checkpoint version in '{self._checkpoint_path}'.")
+        return {key: OnboardingProgress(key=key, **entry) for key, entry in data.get("devices", {}).items()}
+
+    def _flush_checkpoint(self) -> None:
+        """Write state changes that the ``checkpoint_interval`` held back."""
+        with self._lock:
+            if self._checkpoint_path is None or not self._checkpoint_pending:
+                return
+            self._checkpoint_written_at = time.monotonic()
+            self._checkpoint_pending = False
+            self._write_checkpoint()
+
+    def _write_checkpoint(self) -> None:
+        if self._checkpoint_path is None:
+            return
+        payload = {
+            "version": _CHECKPOINT_VERSION,
+            "devices": {key: entry.model_dump(exclude={"key"}) for key, entry in self._progress.items()},
+        }
+        temporary = self._checkpoint_path.with_name(self._checkpoint_path.name + ".tmp")
+        temporary.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        os.replace(temporary, self._checkpoint_path)
+
+
+def _source_key(source: OnboardingSource) -> str:
+    if isinstance(source, str):
+        return source
+    label = source.configuration.config.desc.label
+    if not label:
+        raise ValueError("Staged inventory devices need a label to be tracked by the onboarding pipeline.")
+    return label
+
+
+__all__ = ["OnboardingPipeline", "OnboardingProgress", "OnboardingResult", "OnboardingSource", "OnboardingStage"]
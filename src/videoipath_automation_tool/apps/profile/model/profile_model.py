@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import List, Optional, Union
+from typing import List, Literal, Optional, Union
 
 from pydantic import BaseModel, Field, field_validator
 
@@ -537,3 +537,15 @@ class Profile(SuperProfile):
         id = generate_uuid_4()
         vid = f"_: {id}"
         return cls(_id=id, _vid=vid, name=name)
+
+
+# --- Bulk Action Outcome ---
+class ProfileActionOutcome(BaseModel):
+    """Per-Profile result of a bulk add / update / remove."""
+
+    action: Literal["add", "update", "remove"]
+    name: str = ""
+    profile_id: Optional[str] = None
+    ok: bool
+    message: Optional[str] = None
+    profile: Optional[Profile] = None
@@ -1,31 +1,50 @@
+import json
 import logging
+import threading
+import time
 import urllib.parse
-from typing import List, Literal, Optional
+from typing import List, Literal, Mapping, Optional
 
 from deepdiff.diff import DeepDiff
 
 from videoipath_automation_tool.apps.preferences.model import *
-from videoipath_automation_tool.apps.profile.model.profile_model import Profile, SuperProfile
-from videoipath_automation_tool.connector.models.request_rest_v2 import RequestV2Patch
+from videoipath_automation_tool.apps.profile.model.profile_model import Profile, ProfileActionOutcome, SuperProfile
+from videoipath_automation_tool.connector.models.request_rest_v2 import Action, RequestV2Patch
 from videoipath_automation_tool.connector.models.response_rest_v2 import ResponseV2Get
 from videoipath_automation_tool.connector.vip_connector import VideoIPathConnector
 from videoipath_automation_tool.utils.cross_app_utils import create_fallback_logger
 
 
 class ProfileAPI:
-    def __init__(self, vip_connector: VideoIPathConnector, logger: Optional[logging.Logger] = None):
+    SERVICE_INDEX_TTL_DEFAULT = 30
+    PROFILE_BATCH_MAX_ACTIONS = 100
+    PROFILE_BATCH_MAX_BYTES = 1_000_000
+
+    def __init__(
+        self,
+        vip_connector: VideoIPathConnector,
+        logger: Optional[logging.Logger] = None,
+        service_index_ttl: float = SERVICE_INDEX_TTL_DEFAULT,
+    ):
         """
         Class for VideoIPath Profile API.
 
         Args:
             vip_connector (VideoIPathConnector): VideoIPathConnector instance to handle the connection to the VideoIPath-Server.
             logger (Optional[logging.Logger]): Logger instance. If `None`, a fallback logger is used.
+            service_index_ttl (float): Seconds the Profile → active Service index is reused before the Services are read again; `0` disables reuse.
         """
 
         # --- Setup Logging ---
         self._logger = logger or create_fallback_logger("videoipath_automation_tool_profile_api")
         self.vip_connector = vip_connector
 
+        # --- Profile → active Service index (one Services scan answers every Profile) ---
+        self._service_index_ttl = service_index_ttl
+        self._service_index: Optional[dict[str, List[str]]] = None
+        self._service_index_built_at = 0.0
+        self._service_index_lock = threading.Lock()
+
         self._logger.debug("Profile API logger initialized.")
 
     def _generate_profile_action_request_body(
@@ -97,6 +116,18 @@ class ProfileAPI:
         else:
             return [Profile.model_validate(item) for item in data]
 
+    def get_profiles_by_id(self) -> dict[str, Profile]:
+        """
+        Get all VideoIPath Profile configurations with a single read, indexed by Profile ID.
+
+        Returns:
+            dict[str, Profile]: Profile ID → Profile object.
+        """
+        self._logger.debug("Requesting all Profiles (indexed by ID)")
+        response = self.vip_connector.rest.get("/rest/v2/data/config/pathman/profiles/**")
+        profiles = [Profile.model_validate(item) for item in self._validate_response(response)]
+        return {profile.id: profile for profile in profiles if profile.id}
+
     def get_profile_by_name(self, name: str) -> Profile | List[Profile] | None:
         """
         Get a VideoIPath Profile by its name.
@@ -223,6 +254,117 @@ class ProfileAPI:
         response = self.vip_connector.rest.patch("/rest/v2/data/config/pathman/profiles", body)
         return response
 
+    def add_profiles(self, profiles: List[SuperProfile | Profile], refetch: bool = True) -> List[ProfileActionOutcome]:
+        """Add many Profiles with one PATCH request per batch (`PROFILE_BATCH_MAX_ACTIONS` / `PROFILE_BATCH_MAX_BYTES`).
+
+        Args:
+            profiles (List[SuperProfile | Profile]): Profiles to add.
+            refetch (bool, optional): Attach the added Profiles as stored on the server (one read for all batches). Defaults to True.
+
+        Returns:
+            List[ProfileActionOutcome]: One outcome per Profile, in input order.
+        """
+        return self._run_profile_batches("add", profiles, refetch)
+
+    def update_profiles(self, profiles: List[Profile], refetch: bool = True) -> List[ProfileActionOutcome]:
+        """Update many Profiles with one PATCH request per batch.
+
+        Args:
+            profiles (List[Profile]): Profiles to update.
+            refetch (bool, optional): Attach the updated Profiles as stored on the server (one read for all batches). Defaults to True.
+
+        Returns:
+            List[ProfileActionOutcome]: One outcome per Profile, in input order.
+        """
+        return self._run_profile_batches("update", profiles, refetch)
+
+    def remove_profiles(self, profiles: List[Profile]) -> List[ProfileActionOutcome]:
+        """Remove many Profiles with one PATCH request per batch.
+
+        Args:
+            profiles (List[Profile]): Profiles to remove (only ID and revision are sent).
+
+        Returns:
+            List[ProfileActionOutcome]: One outcome per Profile, in input order.
+        """
+        return self._run_profile_batches("remove", profiles, refetch=False)
+
+    def _run_profile_batches(
+        self,
+        action: Literal["add", "update", "remove"],
+        profiles: List[SuperProfile | Profile],
+        refetch: bool,
+    ) -> List[ProfileActionOutcome]:
+        """Pack Profile actions into size-limited PATCH bodies and map the response items back to each Profile."""
+        expected = {"add": "added", "update": "updated", "remove": "removed"}[action]
+        actions: List[tuple[SuperProfile | Profile, Action, int]] = []
+        for profile in profiles:
+            if action != "add" and not (isinstance(profile, Profile) and profile.id):
+                raise ValueError(f"Profile '{profile.name}' has no ID; only existing Profiles can be {action}d.")
+            entry = getattr(RequestV2Patch(), action)(profile).actions[0]
+            actions.append((profile, entry, len(json.dumps(entry.model_dump(mode="json", by_alias=True)))))
+
+        outcomes: List[ProfileActionOutcome] = []
+        for batch in self._profile_batches(actions):
+            body = RequestV2Patch(actions=[entry for _, entry, _ in batch])
+            batch_profiles = [profile for profile, _, _ in batch]
+            try:
+                response = self.vip_connector.rest.patch("/rest/v2/data/config/pathman/profiles", body)
+            except Exception as e:
+                self._logger.warning(f"Profile {action} batch of {len(batch)} failed: {e}")
+                outcomes.extend(
+                    _profile_outcome(action, profile, ok=False, message=str(e)) for profile in batch_profiles
+                )
+                continue
+            if not (response.header.ok and response.result):
+                message = "; ".join(response.header.msg or []) or "Response not OK."
+                outcomes.extend(
+                    _profile_outcome(action, profile, ok=False, message=message) for profile in batch_profiles
+                )
+                continue
+            items = response.result.items
+            if len(items) != len(batch_profiles):
+                by_id = {item.id: item for item in items}
+                matched = [by_id.get(getattr(profile, "id", None) or "") for profile in batch_profiles]
+            else:
+                matched = list(items)
+            for profile, item in zip(batch_profiles, matched):
+                if item is None or not item.id:
+                    outcomes.append(_profile_outcome(action, profile, ok=False, message="No result item in response."))
+                elif item.res == expected or (action == "update" and item.res.startswith("ignored")):
+                    outcomes.append(
+                        _profile_outcome(action, profile, ok=True, message=item.msg or None, profile_id=item.id)
+                    )
+                else:
+                    outcomes.append(
+                        _profile_outcome(action, profile, ok=False, message=item.msg or item.res, profile_id=item.id)
+                    )
+
+        if refetch and any(outcome.ok for outcome in outcomes):
+            stored = self.get_profiles_by_id()
+            for outcome in outcomes:
+                if outcome.ok and outcome.profile_id:
+                    outcome.profile = stored.get(outcome.profile_id)
+        self._logger.debug(
+            f"Profile {action}: {sum(outcome.ok for outcome in outcomes)} of {len(outcomes)} Profile(s) succeeded."
+        )
+        return outcomes
+
+    def _profile_batches(self, actions: List[tuple[SuperProfile | Profile, Action, int]]):
+        """Split actions into batches of at most `PROFILE_BATCH_MAX_ACTIONS` actions / `PROFILE_BATCH_MAX_BYTES` bytes."""
+        batch: List[tuple[SuperProfile | Profile, Action, int]] = []
+        size = 0
+        for entry in actions:
+            if batch and (
+                len(batch) >= self.PROFILE_BATCH_MAX_ACTIONS or size + entry[2] > self.PROFILE_BATCH_MAX_BYTES
+            ):
+                yield batch
+                batch, size = [], 0
+            batch.append(entry)
+            size += entry[2]
+        if batch:
+            yield batch
+
     def get_all_profile_tags(self, mode: Literal["all", "exclude_hidden", "hidden_only"] = "all") -> List[str]:
         """
         Get a list of all Profile tags. Optionally filtered by hidden status.
@@ -261,24 +403,86 @@ class ProfileAPI:
         )
         return diff
 
-    def analyze_profile_configuration_changes(self, staged_profile: Profile):
+    def analyze_profile_configuration_changes(
+        self, staged_profile: Profile, reference_profiles: Optional[Mapping[str, Profile]] = None
+    ):
         """
         Analyze the configuration changes between a Profile and the VideoIPath System.
 
         Args:
             staged_profile (Profile): Staged Profile.
+            reference_profiles (Optional[Mapping[str, Profile]]): Reference Profiles by ID (e.g. from `get_profiles_by_id`);
+                if `None`, the reference Profile is fetched by ID.
         """
         profile_id = staged_profile.id
         if not profile_id:
             raise ValueError("Profile ID not found in Profile object.")
-        reference_profile = self.get_profile_by_id(profile_id)
+        if reference_profiles is None:
+            reference_profile = self.get_profile_by_id(profile_id)
+        else:
+            reference_profile = reference_profiles.get(profile_id)
         if type(reference_profile) is not Profile:
             return None
         return self.analyze_profile_configuration_changes_local(reference_profile, staged_profile)
 
+    def analyze_profiles_configuration_changes(self, staged_profiles: List[Profile]) -> dict[str, Optional[DeepDiff]]:
+        """
+        Analyze the configuration changes of many Profiles against a single read of all Profiles.
+
+        Args:
+            staged_profiles (List[Profile]): Staged Profiles (each with an ID).
+
+        Returns:
+            dict[str, Optional[DeepDiff]]: Profile ID → diff, or `None` if the Profile does not exist on the server.
+        """
+        reference_profiles = self.get_profiles_by_id()
+        return {
+            staged_profile.id or "": self.analyze_profile_configuration_changes(staged_profile, reference_profiles)
+            for staged_profile in staged_profiles
+        }
+
+    def get_active_services_by_profile(self, refresh: bool = False) -> dict[str, List[str]]:
+        """
+        Get the IDs of all active Services per Profile ID from a single Services read.
+        The index is cached for `service_index_ttl` seconds.
+
+        Args:
+            refresh (bool, optional): Read the Services again even if the cached index is still valid. Defaults to False.
+
+        Returns:
+            dict[str, List[str]]: Profile ID → IDs of the active Services using it (Profiles without active Services are omitted); a copy, safe to modify.
+        """
+        index = self._fresh_service_index(refresh)
+        return {profile_id: list(service_ids) for profile_id, service_ids in index.items()}
+
+    def _fresh_service_index(self, refresh: bool = False) -> dict[str, List[str]]:
+        """Return the cached Profile → active Service index (read-only), rebuilding it when missing, expired or `refresh` is set."""
+        with self._service_index_lock:
+            age = time.monotonic() - self._service_index_built_at
+            if self._service_index is not None and not refresh and age < self._service_index_ttl:
+                return self._service_index
+            response = self.vip_connector.rest.get(
+                "/rest/v2/data/status/conman/services/*/connection/profileIds,generic/**"
+            )
+            index: dict[str, List[str]] = {}
+            for service in response.data["status"]["conman"]["services"]["_items"]:
+                if service["connection"]["generic"]["state"] != 1:
+                    continue
+                for profile_id in dict.fromkeys(service["connection"]["profileIds"]):
+                    index.setdefault(profile_id, []).append(service["_id"])
+            self._service_index = index
+            self._service_index_built_at = time.monotonic()
+            self._logger.debug(f"Indexed active Services for {len(index)} Profile(s).")
+            return index
+
+    def invalidate_service_index(self):
+        """Drop the cached Profile → active Service index; the next lookup reads the Services again."""
+        with self._service_index_lock:
+            self._service_index = None
+
     def get_services_using_profile(self, profile_id: str) -> Optional[List[str] | str]:
         """
-        Get a list of all Services using a Profile.
+        Get a list of all Services using a Profile (answered from the cached Profile → Service index).
 
         Args:
             profile_id (str): ID of the Profile.
@@ -286,20 +490,47 @@ class ProfileAPI:
         Returns:
             Optional[List[str] | str]: List of Service IDs if successful, None otherwise.
         """
-        response = self.vip_connector.rest.get(
-            "/rest/v2/data/status/conman/services/*/connection/profileIds,generic/**"
-        )
-        service_ids = []
-        for service in response.data["status"]["conman"]["services"]["_items"]:
-            if profile_id in service["connection"]["profileIds"] and service["connection"]["generic"]["state"] == 1:
-                service_ids.append(service["_id"])
+        service_ids = self._fresh_service_index().get(profile_id, [])
 
         if len(service_ids) == 0:
             return None
         if len(service_ids) == 1:
             return service_ids[0]
         else:
-            return service_ids
+            return list(service_ids)
+
+    def get_usage_counts(
+        self, profile_ids: List[str], mode: Literal["build_in", "enhanced"] = "enhanced"
+    ) -> dict[str, int]:
+        """
+        Get the number of Services using each of many Profiles with a single read.
+
+        Args:
+            profile_ids (List[str]): IDs of the Profiles.
+            mode (Literal["build_in", "enhanced"], optional): The mode for calculating the usage counts.
+                - "build_in": Uses built-in GUI data (one read of all Profile usage counts).
+                - "enhanced" (default): Counts active Services from the cached Profile → Service index.
+
+        Returns:
+            dict[str, int]: Profile ID → number of Services using the Profile.
+
+        Raises:
+            ValueError: If an invalid mode is provided.
+        """
+        if mode == "build_in":
+            response = self.vip_connector.rest.get("/rest/v2/data/status/pathman/profiles/*/usageCount")
+            if not response.data:
+                raise ValueError("Usage count not found in response data.")
+            counts = {
+                item["_id"]: item.get("usageCount", 0)
+                for item in response.data["status"]["pathman"]["profiles"]["_items"]
+            }
+            return {profile_id: counts.get(profile_id, 0) for profile_id in profile_ids}
+        elif mode == "enhanced":
+            index = self._fresh_service_index()
+            return {profile_id: len(index.get(profile_id, [])) for profile_id in profile_ids}
+        else:
+            raise ValueError("Invalid mode provided. Please provide 'build_in' or 'enhanced'.")
 
     def get_usage_count(self, profile_id: str, mode: Literal["build_in", "enhanced"] = "build_in") -> int:
         """
@@ -327,12 +558,22 @@ class ProfileAPI:
             else:
                 raise ValueError("Usage count not found in response data.")
         elif mode == "enhanced":
-            service_ids = self.get_services_using_profile(profile_id)
-            if not service_ids:
-                return 0
-            if type(service_ids) is list:
-                return len(service_ids)
-            else:
-                return 1
+            return len(self._fresh_service_index().get(profile_id, []))
         else:
             raise ValueError("Invalid mode provided. Please provide 'build_in' or 'enhanced'.")
+
+
+def _profile_outcome(
+    action: Literal["add", "update", "remove"],
+    profile: SuperProfile | Profile,
+    ok: bool,
+    message: Optional[str] = None,
+    profile_id: Optional[str] = None,
+) -> ProfileActionOutcome:
+    return ProfileActionOutcome(
+        action=action,
+        name=profile.name,
+        profile_id=profile_id or getattr(profile, "id", None),
+        ok=ok,
+        message=message,
+    )
@@ -1,7 +1,7 @@
 import logging
-from typing import List, Optional
+from typing import List, Literal, Optional
 
-from videoipath_automation_tool.apps.profile.model.profile_model import Profile, SuperProfile
+from videoipath_automation_tool.apps.profile.model.profile_model import Profile, ProfileActionOutcome, SuperProfile
 from videoipath_automation_tool.apps.profile.profile_api import ProfileAPI
 from videoipath_automation_tool.connector.vip_connector import VideoIPathConnector
 from videoipath_automation_tool.utils.cross_app_utils import create_fallback_logger, generate_uuid_4
@@ -101,6 +101,21 @@ class ProfileApp:
         """
         return self._profile_api.get_profiles()
 
+    def get_usage_counts(
+        self, profile_ids: List[str], mode: Literal["build_in", "enhanced"] = "enhanced"
+    ) -> dict[str, int]:
+        """Get the number of Services using each of many Profiles with a single read.
+
+        Args:
+            profile_ids (List[str]): IDs of the Profiles.
+            mode (Literal["build_in", "enhanced"], optional): "enhanced" (default) counts active Services from a cached
+                Profile → Service index; "build_in" uses the GUI usage counts.
+
+        Returns:
+            dict[str, int]: Profile ID → number of Services using the Profile.
+        """
+        return self._profile_api.get_usage_counts(profile_ids, mode=mode)
+
     def add_profile(self, profile: SuperProfile | Profile) -> Profile:
         """Add a Profile to the VideoIPath System.
 
@@ -180,6 +195,39 @@ class ProfileApp:
         except Exception as e:
             raise ValueError(f"Error updating Profile: {e}")
 
+    def add_profiles(self, profiles: List[SuperProfile | Profile]) -> List[ProfileActionOutcome]:
+        """Add many Profiles to the VideoIPath System with one request per batch.
+
+        Args:
+            profiles (List[SuperProfile | Profile]): Profile objects to add.
+
+        Returns:
+            List[ProfileActionOutcome]: Per-Profile outcome (in input order) including the stored Profile on success.
+        """
+        return self._profile_api.add_profiles(profiles)
+
+    def update_profiles(self, profiles: List[Profile]) -> List[ProfileActionOutcome]:
+        """Update many Profiles in the VideoIPath System with one request per batch.
+
+        Args:
+            profiles (List[Profile]): Profile objects to update.
+
+        Returns:
+            List[ProfileActionOutcome]: Per-Profile outcome (in input order) including the stored Profile on success.
+        """
+        return self._profile_api.update_profiles(profiles)
+
+    def remove_profiles(self, profiles: List[Profile]) -> List[ProfileActionOutcome]:
+        """Remove many Profiles from the VideoIPath System with one request per batch.
+
+        Args:
+            profiles (List[Profile]): Profile objects to remove.
+
+        Returns:
+            List[ProfileActionOutcome]: Per-Profile outcome (in input order).
+        """
+        return self._profile_api.remove_profiles(profiles)
+
     def create_profile(self, name: str) -> Profile:
         """Create a new Profile-Object.
         Profile can be added to the VideoIPath System using the add_profile() method.
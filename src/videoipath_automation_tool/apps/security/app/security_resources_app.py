@@ -1,7 +1,11 @@
 from logging import Logger
 from typing import Optional
 
-from videoipath_automation_tool.apps.security.model.domain_membership_model import LocalMemberships, ResourceType
+from videoipath_automation_tool.apps.security.model.domain_membership_model import (
+    LocalMemberships,
+    MembershipActionOutcome,
+    ResourceType,
+)
 from videoipath_automation_tool.apps.security.security_api import SecurityAPI
 from videoipath_automation_tool.apps.security.security_exceptions import MembershipsNotFoundError
 from videoipath_automation_tool.validators.device_id_including_virtual import validate_device_id_including_virtual
@@ -94,7 +98,7 @@ class SecurityResources:
         """
         try:
             existing_membership = self._security_api.get_memberships_by_type_and_id(
-                memberships.resource_type, memberships.resource_id
+                memberships.resource_type, memberships.resource_id, use_index=False
             )
         except MembershipsNotFoundError:
             existing_membership = None
@@ -115,6 +119,57 @@ class SecurityResources:
 
             return self._security_api.update_memberships(memberships)
 
+    def update_memberships_bulk(self, memberships: list[LocalMemberships]) -> list[MembershipActionOutcome]:
+        """
+        Updates the memberships of many resources, batching the requests.
+        Like `update_memberships`: resources without memberships are added, empty domain sets are removed.
+
+        Args:
+            memberships (list[LocalMemberships]): The LocalMemberships objects to update.
+
+        Returns:
+            list[MembershipActionOutcome]: One outcome per resource, in input order.
+        """
+        existing = self._security_api.get_memberships_by_id(refresh=True)
+        outcomes: dict[int, MembershipActionOutcome] = {}
+        grouped: dict[str, list[tuple[int, LocalMemberships]]] = {"add": [], "update": [], "remove": []}
+        for position, entry in enumerate(memberships):
+            current = existing.get(entry.id or "")
+            if current is None:
+                if entry.domains:
+                    grouped["add"].append((position, entry))
+                else:
+                    outcomes[position] = MembershipActionOutcome(
+                        action="remove", membership_id=entry.id, ok=True, message="No memberships to remove."
+                    )
+            elif current.rev != entry.rev:
+                outcomes[position] = MembershipActionOutcome(
+                    action="update",
+                    membership_id=entry.id,
+                    ok=False,
+                    message=f"Different revision. Expected: {entry.rev}, Found: {current.rev}",
+                )
+            elif entry.domains:
+                grouped["update"].append((position, entry))
+            else:
+                # Empty Domains will result in VALIDATION_ERROR, remove the key instead.
+                grouped["remove"].append((position, entry))
+
+        runs = {
+            "add": lambda entries: self._security_api.add_memberships_bulk(entries, check_existing=False),
+            "update": self._security_api.update_memberships_bulk,
+            "remove": self._security_api.remove_memberships_bulk,
+        }
+        for action, entries in grouped.items():
+            if entries:
+                results = runs[action]([entry for _, entry in entries])
+                outcomes.update(zip((position for position, _ in entries), results))
+
+        failed = sum(not outcome.ok for outcome in outcomes.values())
+        if failed:
+            self._logger.warning(f"Memberships update failed for {failed} of {len(memberships)} resource(s).")
+        return [outcomes[position] for position in range(len(memberships))]
+
     def convert_domain_ids_to_names(self, domain_ids: list[str]) -> list[str]:
         """
         Converts a list of domain IDs to their corresponding names.
@@ -139,10 +194,8 @@ class SecurityResources:
             else:
                 raise ValueError(f"Domain ID '{domain_ids[0]}' not found in the system, cannot convert to name.")
         elif len(domain_ids) > 1:
-            self._logger.debug(
-                f"Converting multiple domain IDs {domain_ids} to names by fetching all domains from the API."
-            )
-            all_domains = self._security_api.get_all_domains()
+            self._logger.debug(f"Converting multiple domain IDs {domain_ids} to names using the domain index.")
+            all_domains = list(self._security_api.get_domains_by_id().values())
             domain_map = {domain.id: domain.name for domain in all_domains}
             for domain_id in domain_ids:
                 if domain_id in domain_map:
@@ -184,10 +237,8 @@ class SecurityResources:
             else:
                 raise ValueError(f"Domain name '{domain_names[0]}' not found in the system, cannot convert to ID.")
         elif len(domain_names) > 1:
-            self._logger.debug(
-                f"Converting multiple domain names {domain_names} to IDs by fetching all domains from the API."
-            )
-            all_domains = self._security_api.get_all_domains()
+            self._logger.debug(f"Converting multiple domain names {domain_names} to IDs using the domain index.")
+            all_domains = list(self._security_api.get_domains_by_id().values())
 
             seen = {}
             duplicates = {}
@@ -1,4 +1,5 @@
 from enum import Enum
+from typing import Literal, Optional
 
 from pydantic import BaseModel, Field
 
@@ -43,3 +44,13 @@ class LocalMemberships(BaseModel):
         if not self.id or ":" not in self.id:
             raise ValueError(f"Malformed ID: {self.id}")
         return self.id.split(":", 1)[1]
+
+
+class MembershipActionOutcome(BaseModel):
+    """Per-resource result of a bulk membership add / update / remove."""
+
+    action: Literal["add", "update", "remove"]
+    membership_id: Optional[str] = None
+    ok: bool
+    message: Optional[str] = None
+    memberships: Optional[LocalMemberships] = None
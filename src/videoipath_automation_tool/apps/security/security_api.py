@@ -1,7 +1,13 @@
 import logging
-from typing import List, Optional
-
-from videoipath_automation_tool.apps.security.model.domain_membership_model import LocalMemberships, ResourceType
+import threading
+import time
+from typing import List, Literal, Optional
+
+from videoipath_automation_tool.apps.security.model.domain_membership_model import (
+    LocalMemberships,
+    MembershipActionOutcome,
+    ResourceType,
+)
 from videoipath_automation_tool.apps.security.model.domain_model import Domain
 from videoipath_automation_tool.apps.security.security_exceptions import (
     DomainAlreadyExistsError,
@@ -18,31 +24,52 @@ from videoipath_automation_tool.utils.cross_app_utils import create_fallback_log
 
 
 class SecurityAPI:
-    def __init__(self, vip_connector: VideoIPathConnector, logger: Optional[logging.Logger] = None):
+    INDEX_TTL_DEFAULT = 30
+    MEMBERSHIP_BATCH_MAX_ACTIONS = 500
+
+    def __init__(
+        self,
+        vip_connector: VideoIPathConnector,
+        logger: Optional[logging.Logger] = None,
+        index_ttl: float = INDEX_TTL_DEFAULT,
+    ):
         """
         Class for VideoIPath Security-App API.
 
         Args:
             vip_connector (VideoIPathConnector): VideoIPathConnector instance to handle the connection to the VideoIPath-Server.
             logger (Optional[logging.Logger]): Logger instance. If `None`, a fallback logger is used.
+            index_ttl (float): Seconds the domain and membership indexes are reused before they are read again; `0` disables reuse.
         """
 
         # --- Setup Logging ---
         self._logger = logger or create_fallback_logger("videoipath_automation_tool_security_api")
         self.vip_connector = vip_connector
 
+        # --- Domain / membership indexes (one full read answers every lookup, writes go through) ---
+        self._index_ttl = index_ttl
+        self._index_lock = threading.RLock()
+        self._domain_index: Optional[dict[str, Domain]] = None
+        self._domain_ids_by_name: dict[str, List[str]] = {}
+        self._domain_index_built_at = 0.0
+        self._membership_index: Optional[dict[str, LocalMemberships]] = None
+        self._membership_index_built_at = 0.0
+
         self._logger.debug("Security-App API initialized.")
 
     # --- Domain CRUD ---
 
-    def get_all_domains(self) -> List[Domain]:
+    def get_all_domains(self, use_cache: bool = True) -> List[Domain]:
         """
         Fetch all domains from the VideoIPath Security-App.
 
+        Args:
+            use_cache (bool): If False, bypass the connector's response cache.
+
         Returns:
             List[Domain]: List of Domain objects.
         """
-        response = self.vip_connector.rest.get("/rest/v2/data/config/domainman/domains/**")
+        response = self.vip_connector.rest.get("/rest/v2/data/config/domainman/domains/**", use_cache=use_cache)
         if response.data and isinstance(response.data["config"]["domainman"]["domains"]["_items"], list):
             domains = response.data["config"]["domainman"]["domains"]["_items"]
             return [Domain.model_validate(domain) for domain in domains]
@@ -73,9 +100,24 @@ class SecurityAPI:
         """
         return {domain.name: domain.id for domain in domains if domain.id and domain.name}
 
+    def get_domains_by_id(self, refresh: bool = False) -> dict[str, Domain]:
+        """
+        Return all domains indexed by ID, read once and reused for `index_ttl` seconds.
+
+        Args:
+            refresh (bool): If True, re-read the domains even if the index is still fresh.
+
+        Returns:
+            dict[str, Domain]: Mapping of domain IDs to Domain objects (copies, safe to modify).
+        """
+        with self._index_lock:
+            index = self._fresh_domain_index(refresh)
+            return {domain_id: domain.model_copy(deep=True) for domain_id, domain in index.items()}
+
     def get_domain_by_id(self, domain_id: str) -> Domain:
         """
         Fetch a specific domain by its ID.
+        Answered from the domain index; an unknown ID re-reads the index once before failing.
 
         Args:
             domain_id (str): The ID of the domain to fetch.
@@ -83,24 +125,18 @@ class SecurityAPI:
         Returns:
             Domain: The Domain object corresponding to the given ID.
         """
-        response = self.vip_connector.rest.get(
-            f"/rest/v2/data/config/domainman/domains/* where _id = '{domain_id}' /**"
-        )
-
-        domains = (
-            response.data.get("config", {}).get("domainman", {}).get("domains", {}).get("_items")
-            if response.data
-            else None
-        )
-
-        if domains and isinstance(domains, list):
-            return self._validate_filtered_response(response.data, "id", domain_id)
-        else:
-            raise DomainNotFoundError(f"Domain with ID '{domain_id}' not found or malformed response.")
+        with self._index_lock:
+            domain = self._fresh_domain_index().get(domain_id)
+            if domain is None and not self._index_is_new(self._domain_index_built_at):
+                domain = self._fresh_domain_index(refresh=True).get(domain_id)
+            if domain is None:
+                raise DomainNotFoundError(f"No domains found with id '{domain_id}'.")
+            return domain.model_copy(deep=True)
 
     def get_domain_by_name(self, domain_name: str) -> Domain:
         """
         Fetch a specific domain by its name.
+        Answered from the domain index; an unknown name re-reads the index once before failing.
 
         Args:
             domain_name (str): The name of the domain to fetch.
@@ -108,13 +144,64 @@ class SecurityAPI:
         Returns:
             Domain: The Domain object corresponding to the given name.
         """
-        response = self.vip_connector.rest.get(
-            f"/rest/v2/data/config/domainman/domains/* where desc.label = '{domain_name}' /**"
-        )
-        if response.data and "config" in response.data and "domainman" in response.data["config"]:
-            return self._validate_filtered_response(response.data, "name", domain_name)
-        else:
-            raise DomainNotFoundError(f"Domain with name '{domain_name}' not found or malformed.")
+        with self._index_lock:
+            index = self._fresh_domain_index()
+            domain_ids = self._domain_ids_by_name.get(domain_name)
+            if not domain_ids and not self._index_is_new(self._domain_index_built_at):
+                index = self._fresh_domain_index(refresh=True)
+                domain_ids = self._domain_ids_by_name.get(domain_name)
+            if not domain_ids:
+                raise DomainNotFoundError(f"No domains found with name '{domain_name}'.")
+            if len(domain_ids) > 1:
+                raise MultipleDomainsFoundError(f"Multiple domains found with name '{domain_name}'.")
+            return index[domain_ids[0]].model_copy(deep=True)
+
+    def invalidate_indexes(self):
+        """Drop the cached domain and membership indexes; the next lookup reads them again."""
+        with self._index_lock:
+            self._domain_index = None
+            self._domain_ids_by_name = {}
+            self._membership_index = None
+
+    def _fresh_domain_index(self, refresh: bool = False) -> dict[str, Domain]:
+        """Return the domain index, rebuilding it when missing, expired or `refresh` is set (caller holds the lock)."""
+        age = time.monotonic() - self._domain_index_built_at
+        if self._domain_index is None or refresh or age >= self._index_ttl:
+            # The index is the cache: (re)builds always read from the server.
+            domains = self.get_all_domains(use_cache=False)
+            self._domain_index = {domain.id: domain for domain in domains if domain.id}
+            self._domain_ids_by_name = {}
+            for domain in self._domain_index.values():
+                self._domain_ids_by_name.setdefault(domain.name, []).append(domain.id)  # type: ignore[arg-type]
+            self._domain_index_built_at = time.monotonic()
+            self._logger.debug(f"Domain index built with {len(self._domain_index)} domain(s).")
+        return self._domain_index
+
+    def _index_is_new(self, built_at: float) -> bool:
+        """True if an index was (re)built within the last second, so a miss is not worth another read."""
+        return time.monotonic() - built_at < 1.0
+
+    def _index_domain(self, domain: Domain):
+        """Write an added / updated domain through to the index (if one is held)."""
+        with self._index_lock:
+            if self._domain_index is None or not domain.id:
+                return
+            self._unindex_domain(domain.id)
+            self._domain_index[domain.id] = domain.model_copy(deep=True)
+            self._domain_ids_by_name.setdefault(domain.name, []).append(domain.id)
+
+    def _unindex_domain(self, domain_id: str):
+        """Drop a removed domain from the index (if one is held)."""
+        with self._index_lock:
+            if self._domain_index is None:
+                return
+            previous = self._domain_index.pop(domain_id, None)
+            if previous is not None:
+                ids = self._domain_ids_by_name.get(previous.name, [])
+                if domain_id in ids:
+                    ids.remove(domain_id)
+                if not ids:
+                    self._domain_ids_by_name.pop(previous.name, None)
 
     def add_domain(self, domain: Domain, name_id_check: bool = True) -> Domain:
         """
@@ -129,19 +216,14 @@ class SecurityAPI:
         """
         if name_id_check:
             errors = []
-            # Check by name
-            try:
-                self.get_domain_by_name(domain.desc.label)
-                errors.append(f"Domain with name '{domain.desc.label}' already exists.")
-            except DomainNotFoundError:
-                pass
-            # Check by ID
-            if domain.id is not None:
-                try:
-                    self.get_domain_by_id(domain.id)
+            with self._index_lock:
+                index = self._fresh_domain_index()
+                # Check by name
+                if self._domain_ids_by_name.get(domain.desc.label):
+                    errors.append(f"Domain with name '{domain.desc.label}' already exists.")
+                # Check by ID
+                if domain.id is not None and domain.id in index:
                     errors.append(f"Domain with ID '{domain.id}' already exists.")
-                except DomainNotFoundError:
-                    pass
             if errors:
                 raise DomainAlreadyExistsError(" ".join(errors))
 
@@ -158,6 +240,7 @@ class SecurityAPI:
         added_domain = response.result.items[0]
         domain.id = added_domain.id
         domain.rev = added_domain.rev
+        self._index_domain(domain)
         self._logger.info(f"Domain '{domain.desc.label}' added with ID '{domain.id}'.")
         return domain
 
@@ -174,14 +257,17 @@ class SecurityAPI:
         """
 
         if name_check:
-            try:
-                existing_domain = self.get_domain_by_name(domain.desc.label)
-                if existing_domain.id != domain.id:
-                    raise DomainAlreadyExistsError(
-                        f"A domain with the name '{domain.desc.label}' already exists with ID '{existing_domain.id}'."
-                    )
-            except DomainNotFoundError:
-                pass
+            with self._index_lock:
+                self._fresh_domain_index()
+                other_ids = [
+                    domain_id
+                    for domain_id in self._domain_ids_by_name.get(domain.desc.label, [])
+                    if domain_id != domain.id
+                ]
+            if other_ids:
+                raise DomainAlreadyExistsError(
+                    f"A domain with the name '{domain.desc.label}' already exists with ID '{other_ids[0]}'."
+                )
 
         body = self._generate_domain_action_request_body(add_list=[], update_list=[domain], remove_list=[])
         response = self.vip_connector.rest.patch("/rest/v2/data/config/domainman/domains", body=body)
@@ -195,6 +281,7 @@ class SecurityAPI:
         domain.rev = updated_domain.rev
 
         if updated_domain.res == "updated":
+            self._index_domain(domain)
             self._logger.info(f"Domain '{domain.desc.label}' updated with new revision '{domain.rev}'.")
         elif updated_domain.res.startswith("ignored"):
             self._logger.warning(f"Ignored update for domain '{domain.desc.label}' because no changes were made.")
@@ -223,32 +310,12 @@ class SecurityAPI:
 
         removed_domain = response.result.items[0]
         if removed_domain.res == "removed":
+            if domain.id:
+                self._unindex_domain(domain.id)
             self._logger.info(f"Domain '{domain.desc.label}' with ID '{domain.id}' removed successfully.")
         else:
             raise DomainRemoveError(f"Domain removal failed with response: {removed_domain.msg}")
 
-    def _validate_filtered_response(self, response_data: dict, filter_type: str, filter_value: str) -> Domain:
-        """
-        Validate the response data for a filtered query.
-
-        Args:
-            response_data (dict): The response data from the API.
-            filter_type (str): The type of filter used (e.g., "id" or "name").
-            filter_value (str): The value used for filtering.
-
-        Returns:
-            Domain: The Domain object if found, otherwise raises an error.
-        """
-        if response_data and "config" in response_data and "domainman" in response_data["config"]:
-            domain_data = response_data["config"]["domainman"]["domains"]["_items"]
-            if not isinstance(domain_data, list) or len(domain_data) == 0:
-                raise DomainNotFoundError(f"No domains found with {filter_type} '{filter_value}'.")
-            if len(domain_data) > 1:
-                raise MultipleDomainsFoundError(f"Multiple domains found with {filter_type} '{filter_value}'.")
-            return Domain.model_validate(domain_data[0])
-        else:
-            raise ValueError(f"Domain with {filter_type} '{filter_value}' not found or malformed response.")
-
     def _generate_domain_action_request_body(
         self, add_list: List[Domain], update_list: List[Domain], remove_list: List[Domain]
     ):
@@ -269,34 +336,70 @@ class SecurityAPI:
         return body
 
     # --- Resources ---
-    def get_all_memberships(self) -> List[LocalMemberships]:
+    def get_all_memberships(self, use_cache: bool = True) -> List[LocalMemberships]:
         """
         Fetch all local domain memberships from the VideoIPath Security-App.
 
+        Args:
+            use_cache (bool): If False, bypass the connector's response cache.
+
         Returns:
             List[LocalMemberships]: List of LocalMemberships objects representing memberships.
         """
-        response = self.vip_connector.rest.get("/rest/v2/data/config/domainman/localDomainMemberships/**")
+        response = self.vip_connector.rest.get(
+            "/rest/v2/data/config/domainman/localDomainMemberships/**", use_cache=use_cache
+        )
         if response.data and isinstance(response.data["config"]["domainman"]["localDomainMemberships"]["_items"], list):
             memberships = response.data["config"]["domainman"]["localDomainMemberships"]["_items"]
             return [LocalMemberships.model_validate(membership) for membership in memberships]
         else:
             raise ValueError("Response data is empty or malformed.")
 
-    def get_memberships_by_type_and_id(self, resource_type: ResourceType, resource_id: str) -> LocalMemberships:
+    def get_memberships_by_id(self, refresh: bool = False) -> dict[str, LocalMemberships]:
+        """
+        Return all local domain memberships indexed by membership ID (e.g. `device:device177`),
+        read once and reused for `index_ttl` seconds.
+
+        Args:
+            refresh (bool): If True, re-read the memberships even if the index is still fresh.
+
+        Returns:
+            dict[str, LocalMemberships]: Mapping of membership IDs to LocalMemberships objects (copies, safe to modify).
+        """
+        with self._index_lock:
+            index = self._fresh_membership_index(refresh)
+            return {membership_id: memberships.model_copy(deep=True) for membership_id, memberships in index.items()}
+
+    def get_memberships_by_type_and_id(
+        self, resource_type: ResourceType, resource_id: str, use_index: bool = True
+    ) -> LocalMemberships:
         """
         Fetch a specific local domain membership by resource type and ID.
 
         Args:
             resource_type (ResourceType): The type of the resource (e.g., "device", "profile").
             resource_id (str): The ID of the resource.
+            use_index (bool): If True, answer from the membership index (an unknown resource re-reads the index once
+                before failing); otherwise issue a filtered request that bypasses the response cache.
 
         Returns:
             LocalMemberships: The LocalMemberships object corresponding to the given type and ID.
         """
+        if use_index:
+            with self._index_lock:
+                membership_id = f"{resource_type.value}:{resource_id}"
+                memberships = self._fresh_membership_index().get(membership_id)
+                if memberships is None and not self._index_is_new(self._membership_index_built_at):
+                    memberships = self._fresh_membership_index(refresh=True).get(membership_id)
+                if memberships is None:
+                    raise MembershipsNotFoundError(
+                        f"No memberships found for {resource_type.value} with ID '{resource_id}'."
+                    )
+                return memberships.model_copy(deep=True)
 
         response = self.vip_connector.rest.get(
-            f"/rest/v2/data/config/domainman/localDomainMemberships/* where _id = '{resource_type.value}:{resource_id}' /**"
+            f"/rest/v2/data/config/domainman/localDomainMemberships/* where _id = '{resource_type.value}:{resource_id}' /**",
+            use_cache=False,
         )
 
         if response.data and "config" in response.data and "domainman" in response.data["config"]:
@@ -315,6 +418,27 @@ class SecurityAPI:
                 f"Membership with {resource_type.value} ID '{resource_id}' not found or malformed response."
             )
 
+    def _fresh_membership_index(self, refresh: bool = False) -> dict[str, LocalMemberships]:
+        """Return the membership index, rebuilding it when missing, expired or `refresh` is set (caller holds the lock)."""
+        age = time.monotonic() - self._membership_index_built_at
+        if self._membership_index is None or refresh or age >= self._index_ttl:
+            # The index is the cache: (re)builds always read from the server.
+            memberships = self.get_all_memberships(use_cache=False)
+            self._membership_index = {entry.id: entry for entry in memberships if entry.id}
+            self._membership_index_built_at = time.monotonic()
+            self._logger.debug(f"Membership index built with {len(self._membership_index)} resource(s).")
+        return self._membership_index
+
+    def _index_memberships(self, memberships: LocalMemberships, removed: bool = False):
+        """Write added / updated / removed memberships through to the index (if one is held)."""
+        with self._index_lock:
+            if self._membership_index is None or not memberships.id:
+                return
+            if removed:
+                self._membership_index.pop(memberships.id, None)
+            else:
+                self._membership_index[memberships.id] = memberships.model_copy(deep=True)
+
     def add_memberships(self, memberships: LocalMemberships, check_existing: bool = True) -> LocalMemberships:
         """
         Add new local domain memberships.
@@ -331,7 +455,8 @@ class SecurityAPI:
                 resource_id = memberships.resource_id
                 if not resource_type or not resource_id:
                     raise ValueError("Memberships must have a valid resource type and ID.")
-                self.get_memberships_by_type_and_id(resource_type, resource_id)
+                # Authoritative read: a stale index must not let an "ignore_revs" add overwrite server memberships.
+                self.get_memberships_by_type_and_id(resource_type, resource_id, use_index=False)
                 raise MembershipAlreadyExistsError(
                     f"Memberships for {resource_type.value} with ID '{resource_id}' already exist."
                 )
@@ -356,6 +481,7 @@ class SecurityAPI:
         added_membership = response.result.items[0]
         memberships.id = added_membership.id
         memberships.rev = added_membership.rev
+        self._index_memberships(memberships)
 
         return memberships
 
@@ -393,6 +519,7 @@ class SecurityAPI:
             raise ValueError(f"Memberships update failed with response: {updated_membership.msg}")
 
         memberships.rev = updated_membership.rev
+        self._index_memberships(memberships)
         return memberships
 
     def remove_memberships(self, memberships: LocalMemberships) -> None:
@@ -420,4 +547,132 @@ class SecurityAPI:
             )
         else:
             raise ValueError(f"Memberships removal failed with response: {removed_membership.msg}")
+        self._index_memberships(memberships, removed=True)
         # No return value, as the membership is removed
+
+    def add_memberships_bulk(
+        self, memberships: List[LocalMemberships], check_existing: bool = True
+    ) -> List[MembershipActionOutcome]:
+        """
+        Add local domain memberships for many resources with one PATCH request per batch (`MEMBERSHIP_BATCH_MAX_ACTIONS`).
+
+        Args:
+            memberships (List[LocalMemberships]): The LocalMemberships objects to add.
+            check_existing (bool): If True, resources that already have memberships (per a fresh index read) are reported as failed and not sent.
+
+        Returns:
+            List[MembershipActionOutcome]: One outcome per resource, in input order.
+        """
+        rejected: dict[int, MembershipActionOutcome] = {}
+        if check_existing:
+            with self._index_lock:
+                index = self._fresh_membership_index(refresh=True)
+                for position, entry in enumerate(memberships):
+                    if entry.id in index:
+                        rejected[position] = MembershipActionOutcome(
+                            action="add", membership_id=entry.id, ok=False, message="Memberships already exist."
+                        )
+        pending = [entry for position, entry in enumerate(memberships) if position not in rejected]
+        sent = iter(self._run_membership_batches("add", pending, mode="ignore_revs"))
+        return [rejected[position] if position in rejected else next(sent) for position in range(len(memberships))]
+
+    def update_memberships_bulk(
+        self, memberships: List[LocalMemberships], ignore_revs: bool = False
+    ) -> List[MembershipActionOutcome]:
+        """
+        Update local domain memberships of many resources with one PATCH request per batch.
+
+        Args:
+            memberships (List[LocalMemberships]): The LocalMemberships objects with updated values.
+            ignore_revs (bool): If True, the server skips the revision checks.
+
+        Returns:
+            List[MembershipActionOutcome]: One outcome per resource, in input order.
+        """
+        return self._run_membership_batches("update", memberships, mode="ignore_revs" if ignore_revs else "strict")
+
+    def remove_memberships_bulk(self, memberships: List[LocalMemberships]) -> List[MembershipActionOutcome]:
+        """
+        Remove local domain memberships of many resources with one PATCH request per batch.
+
+        Args:
+            memberships (List[LocalMemberships]): The LocalMemberships objects to remove (only ID and revision are sent).
+
+        Returns:
+            List[MembershipActionOutcome]: One outcome per resource, in input order.
+        """
+        return self._run_membership_batches("remove", memberships, mode="strict")
+
+    def _run_membership_batches(
+        self,
+        action: Literal["add", "update", "remove"],
+        memberships: List[LocalMemberships],
+        mode: Literal["strict", "ignore_revs"],
+    ) -> List[MembershipActionOutcome]:
+        """Send membership actions in batches and map the response items back to each resource."""
+        expected = {"add": "added", "update": "updated", "remove": "removed"}[action]
+        for entry in memberships:
+            if not entry.id or ":" not in entry.id:
+                raise ValueError(f"Memberships must have a valid resource type and ID, got '{entry.id}'.")
+
+        outcomes: List[MembershipActionOutcome] = []
+        for start in range(0, len(memberships), self.MEMBERSHIP_BATCH_MAX_ACTIONS):
+            batch = memberships[start : start + self.MEMBERSHIP_BATCH_MAX_ACTIONS]
+            body = RequestV2Patch(mode=mode)
+            for entry in batch:
+                getattr(body, action)(entry)
+            try:
+                response = self.vip_connector.rest.patch(
+                    "/rest/v2/data/config/domainman/localDomainMemberships", body=body
+                )
+            except Exception as e:
+                self._logger.warning(f"Memberships {action} batch of {len(batch)} failed: {e}")
+                outcomes.extend(
+                    MembershipActionOutcome(action=action, membership_id=entry.id, ok=False, message=str(e))
+                    for entry in batch
+                )
+                continue
+            if not (response.header.ok and response.result):
+                message = "; ".join(response.header.msg or []) or "Response not OK."
+                outcomes.extend(
+                    MembershipActionOutcome(action=action, membership_id=entry.id, ok=False, message=message)
+                    for entry in batch
+                )
+                continue
+            items = response.result.items
+            if len(items) != len(batch):
+                by_id = {item.id: item for item in items}
+                matched = [by_id.get(entry.id or "") for entry in batch]
+            else:
+                matched = list(items)
+            for entry, item in zip(batch, matched):
+                if item is None:
+                    outcomes.append(
+                        MembershipActionOutcome(
+                            action=action, membership_id=entry.id, ok=False, message="No result item in response."
+                        )
+                    )
+                elif item.res == expected or (action == "update" and item.res.startswith("ignored")):
+                    if action != "remove":
+                        entry.id = item.id or entry.id
+                        entry.rev = item.rev or entry.rev
+                    self._index_memberships(entry, removed=action == "remove")
+                    outcomes.append(
+                        MembershipActionOutcome(
+                            action=action,
+                            membership_id=entry.id,
+                            ok=True,
+                            message=item.msg or None,
+                            memberships=None if action == "remove" else entry,
+                        )
+                    )
+                else:
+                    outcomes.append(
+                        MembershipActionOutcome(
+                            action=action, membership_id=entry.id, ok=False, message=item.msg or item.res
+                        )
+                    )
+        self._logger.debug(
+            f"Memberships {action}: {sum(outcome.ok for outcome in outcomes)} of {len(outcomes)} resource(s) succeeded."
+        )
+        return outcomes
@@ -22,9 +22,6 @@ from videoipath_automation_tool.connector.vip_connector import VideoIPathConnect
 from videoipath_automation_tool.utils.cross_app_utils import create_fallback_logger
 from videoipath_automation_tool.validators.device_id_including_virtual import validate_device_id_including_virtual
 
-_DEPRECATION_MAJOR = 2025
-_UNSUPPORTED_MAJOR = 2026
-
 
 class TopologyApp:
     def __init__(self, vip_connector: VideoIPathConnector, logger: Optional[logging.Logger] = None):
@@ -54,17 +51,12 @@ class TopologyApp:
         self._logger.debug("Topology APP initialized.")
 
     def _check_version_compatibility(self, vip_connector: VideoIPathConnector) -> None:
-        version = vip_connector.videoipath_version
-        parsed = _parse_version(version)
-        if parsed is None:
-            return
-
-        major, _minor = parsed
-        if major >= _UNSUPPORTED_MAJOR:
+        capabilities = vip_connector.capabilities
+        if not capabilities.topology_app_supported:
             raise TopologyUnsupportedError(
-                f"TopologyApp is not supported on VideoIPath {version}. Use InspectApp (app.inspect) instead."
+                f"TopologyApp is not supported on VideoIPath {capabilities.version}. Use InspectApp (app.inspect) instead."
             )
-        if major == _DEPRECATION_MAJOR:
+        if capabilities.topology_app_deprecated:
             message = (
                 "TopologyApp is deprecated on VideoIPath 2025.x and will not be supported on 2026.x. "
                 "Migrate to InspectApp (app.inspect)."
@@ -437,16 +429,6 @@ class TopologyApp:
         )
 
 
-def _parse_version(version: str) -> Optional[tuple[int, int]]:
-    parts = version.split(".")
-    if len(parts) < 2:
-        return None
-    try:
-        return int(parts[0]), int(parts[1])
-    except ValueError:
-        return None
-
-
 class TopologyExperimental:
     def __init__(self, topology_api: TopologyAPI, logger: logging.Logger, get_device_method):
         """Experimental layer for the TopologyApp."""
@@ -4,15 +4,18 @@ from typing import Literal, Optional
 from videoipath_automation_tool.apps.inspect.app import InspectApp
 from videoipath_automation_tool.apps.inventory import InventoryApp
 from videoipath_automation_tool.apps.inventory.model.drivers import AVAILABLE_SCHEMA_VERSIONS, SELECTED_SCHEMA_VERSION
+from videoipath_automation_tool.apps.onboarding import OnboardingPipeline
 from videoipath_automation_tool.apps.preferences.preferences_app import PreferencesApp
 from videoipath_automation_tool.apps.profile.profile_app import ProfileApp
 from videoipath_automation_tool.apps.security.security_app import SecurityApp
 from videoipath_automation_tool.apps.topology.errors import TopologyUnsupportedError
 from videoipath_automation_tool.apps.topology.topology_app import TopologyApp
+from videoipath_automation_tool.connector.capabilities import VideoIPathCapabilities
 from videoipath_automation_tool.connector.vip_connector import VideoIPathConnector
 from videoipath_automation_tool.settings import Settings
 from videoipath_automation_tool.utils.driver_schema_comparison import (
     DriverSchemaComparator,
+    DriverSchemaDigestCache,
     load_driver_schema_from_file,
 )
 
@@ -35,6 +38,9 @@ class VideoIPathApp:
         timeout_http_get: Optional[int] = None,
         timeout_http_patch: Optional[int] = None,
         timeout_http_post: Optional[int] = None,
+        lazy_connect: Optional[bool] = None,
+        bootstrap_cache_ttl: Optional[int] = None,
+        response_cache: Optional[bool] = None,
     ):
         """
         Initialize the VideoIPath Automation Tool, establish connection to the VideoIPath-Server and initialize the Apps for interaction.
@@ -52,6 +58,9 @@ class VideoIPathApp:
             timeout_http_get (int, optional): Timeout for HTTP GET requests in seconds. [ENV: VIPAT_TIMEOUT_HTTP_GET]
             timeout_http_patch (int, optional): Timeout for HTTP PATCH requests in seconds. [ENV: VIPAT_TIMEOUT_HTTP_PATCH]
             timeout_http_post (int, optional): Timeout for HTTP POST requests in seconds. [ENV: VIPAT_TIMEOUT_HTTP_POST]
+            lazy_connect (bool, optional): Defer the connection probe and version checks until the first request. [ENV: VIPAT_LAZY_CONNECT]
+            bootstrap_cache_ttl (int, optional): Seconds a successful connection probe is reused within the process, `0` disables reuse. [ENV: VIPAT_BOOTSTRAP_CACHE_TTL]
+            response_cache (bool, optional): Cache slow-changing GET responses (profiles, domains, driver schema, ...) with per-path TTLs; writes invalidate affected entries. Size via [ENV: VIPAT_RESPONSE_CACHE_MAX_ENTRIES]. [ENV: VIPAT_RESPONSE_CACHE]
         """
 
         # --- Load environment variables ---
@@ -104,6 +113,7 @@ class VideoIPathApp:
             if advanced_driver_schema_check is not None
             else _settings.VIPAT_ADVANCED_DRIVER_SCHEMA_CHECK
         )
+        self._driver_schema_cache = DriverSchemaDigestCache(cache_dir=_settings.VIPAT_DRIVER_SCHEMA_CACHE_DIR)
 
         # --- Setup Timeouts ---
         timeout_http_get = timeout_http_get if timeout_http_get is not None else _settings.VIPAT_TIMEOUT_HTTP_GET
@@ -135,6 +145,19 @@ class VideoIPathApp:
                 f"HTTP POST timeout is set to a low value ({timeout_http_post} seconds). This may lead to timeouts during API requests."
             )
 
+        # --- Setup Connection Bootstrap ---
+        lazy_connect = lazy_connect if lazy_connect is not None else _settings.VIPAT_LAZY_CONNECT
+        bootstrap_cache_ttl = (
+            bootstrap_cache_ttl if bootstrap_cache_ttl is not None else _settings.VIPAT_BOOTSTRAP_CACHE_TTL
+        )
+        if bootstrap_cache_ttl < 0:
+            raise ValueError("Bootstrap cache TTL must not be negative.")
+
+        # --- Setup Response Cache ---
+        response_cache = response_cache if response_cache is not None else _settings.VIPAT_RESPONSE_CACHE
+        response_cache_max_entries = _settings.VIPAT_RESPONSE_CACHE_MAX_ENTRIES
+        self._logger.debug("Response cache enabled." if response_cache else "Response cache disabled.")
+
         # --- Initialize VideoIPath API Connector including check for connection and authentication ---
         self._logger.debug("Initialize VideoIPath API Connector.")
 
@@ -184,6 +207,10 @@ class VideoIPathApp:
             timeout_http_get=timeout_http_get,
             timeout_http_patch=timeout_http_patch,
             timeout_http_post=timeout_http_post,
+            lazy_connect=lazy_connect,
+            bootstrap_cache_ttl=bootstrap_cache_ttl,
+            response_cache=response_cache,
+            response_cache_max_entries=response_cache_max_entries,
         )
 
         # --- Reset the variables ---
@@ -212,10 +239,15 @@ class VideoIPathApp:
             if advanced_driver_schema_check
             else "Advanced driver schema check disabled. Only basic version check will be performed."
         )
-        self._basic_version_check()
 
-        if advanced_driver_schema_check:
-            self._advanced_driver_schema_check()
+        def run_version_checks():
+            self._basic_version_check()
+
+            if advanced_driver_schema_check:
+                self._advanced_driver_schema_check()
+
+        # With lazy connect the checks run right after the deferred probe (first request); otherwise immediately.
+        self._videoipath_connector.on_connected(run_version_checks)
 
         # --- Initialize App placeholders ---
         self._inventory = None
@@ -282,15 +314,29 @@ class VideoIPathApp:
             self._inspect = InspectApp(vip_connector=self._videoipath_connector, logger=self._logger)
         return self._inspect
 
+    def onboarding_pipeline(self, **options) -> OnboardingPipeline:
+        """Create a pipelined onboarding engine (inventory → reachable → topology → synced) for this server.
+
+        Args:
+            **options: Tuning options forwarded to `OnboardingPipeline` (e.g. `batch_size`, `inventory_workers`).
+
+        Returns:
+            OnboardingPipeline: Pipeline bound to this app's Inventory and Inspect apps; start it with `run(devices)`.
+        """
+        return OnboardingPipeline(self.inventory, self.inspect, logger=self._logger, **options)
+
     # --- Basic Methods ---
-    def _determine_fallback_driver_schema_version(self) -> Optional[str]:
+    def _determine_fallback_driver_schema_version(self, server_version: Optional[str] = None) -> Optional[str]:
         """
         Determine the fallback driver schema version based on the VideoIPath Server version.
 
+        Args:
+            server_version (Optional[str]): Already known server version; read from the capability registry if omitted.
+
         Returns:
             Optional[str]: The fallback driver schema version or None if no fallback is needed.
         """
-        server_version = self.get_server_version()
+        server_version = server_version if server_version is not None else self.get_server_version()
         self._logger.debug(f"VideoIPath Server version: {server_version}")
 
         if server_version in AVAILABLE_SCHEMA_VERSIONS:
@@ -323,7 +369,7 @@ class VideoIPathApp:
             f"A fallback driver schema version may be used, or support for this version can be requested. "
             f"To request support, open an issue at: https://github.com/SWR-MoIP/VideoIPath-Automation-Tool/issues"
         )
-        fallback_version = self._determine_fallback_driver_schema_version()
+        fallback_version = self._determine_fallback_driver_schema_version(server_version)
         if fallback_version:
             if fallback_version == SELECTED_SCHEMA_VERSION:
                 self._logger.warning(
@@ -345,21 +391,29 @@ class VideoIPathApp:
             return
 
         try:
-            server_schema = self._videoipath_connector.fetch_driver_schema_from_server()
             server_version = self.get_server_version()
-            self._logger.debug(f"Driver schema fetched from VideoIPath Server: {server_version}")
         except Exception as e:
             self._logger.warning(
-                f"Failed to fetch driver schema from the VideoIPath server: {e}, skipping advanced driver schema checks."
+                f"Failed to determine the VideoIPath server version: {e}, skipping advanced driver schema checks."
             )
             return
 
+        def fetch_server_schema() -> list[dict]:
+            server_schema = self._videoipath_connector.fetch_driver_schema_from_server()
+            self._logger.debug(f"Driver schema fetched from VideoIPath Server: {server_version}")
+            return server_schema
+
         try:
-            comparison_result = DriverSchemaComparator.compare_driver_schemas(
-                compare_schema=local_schema, reference_schema=server_schema
+            comparison_result = DriverSchemaComparator.compare_driver_schema_with_server(
+                compare_schema=local_schema,
+                server_version=server_version,
+                fetch_server_schema=fetch_server_schema,
+                cache=self._driver_schema_cache,
             )
         except Exception as e:
-            self._logger.error(f"Error during driver schema comparison: {e}")
+            self._logger.warning(
+                f"Failed to compare with the driver schema from the VideoIPath server: {e}, skipping advanced driver schema checks."
+            )
             return
 
         if comparison_result:
@@ -375,11 +429,26 @@ class VideoIPathApp:
 
     def get_server_version(self) -> str:
         """Get the VideoIPath Server version.
+        The version is discovered once per process and server, see `get_server_capabilities`.
 
         Returns:
             str: The VideoIPath Server version (e.g. '2024.1.4').
         """
-        return self._videoipath_connector.videoipath_version
+        return self._videoipath_connector.capabilities.version
+
+    def get_server_capabilities(self) -> VideoIPathCapabilities:
+        """Get the memoised version and feature flags of the VideoIPath Server.
+
+        Returns:
+            VideoIPathCapabilities: Server version and derived feature flags.
+        """
+        return self._videoipath_connector.capabilities
+
+    def invalidate_server_capabilities(self):
+        """Forget the memoised server version and feature flags, e.g. after a VideoIPath Server upgrade.
+        The next access fetches them again.
+        """
+        self._videoipath_connector.invalidate_capabilities()
 
     def check_connection(self):
         """Check the connection to the VideoIPath Server including authentication.
@@ -0,0 +1,60 @@
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict
+
+# TopologyApp is deprecated from this VideoIPath major version on ...
+TOPOLOGY_APP_DEPRECATION_MAJOR = 2025
+# ... and no longer supported from this one.
+TOPOLOGY_APP_UNSUPPORTED_MAJOR = 2026
+# First VideoIPath version the Inspect collector surface was verified against.
+INSPECT_MIN_VERIFIED_VERSION = (2025, 4)
+
+
+class VideoIPathCapabilities(BaseModel):
+    """
+    Version and feature flags of a VideoIPath server, discovered once and shared by all apps.
+
+    The flags are derived from the server version. An unparseable version (e.g. a development build)
+    enables every feature and suppresses all deprecation handling, matching the previous per-app checks.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    version: str
+    version_tuple: Optional[tuple[int, int]] = None
+
+    @classmethod
+    def from_version(cls, version: str) -> "VideoIPathCapabilities":
+        """Builds the capabilities for a server version string (e.g. `'2024.4.30'`)."""
+        return cls(version=version, version_tuple=parse_version(version))
+
+    @property
+    def topology_app_deprecated(self) -> bool:
+        return self.version_tuple is not None and self.version_tuple[0] == TOPOLOGY_APP_DEPRECATION_MAJOR
+
+    @property
+    def topology_app_supported(self) -> bool:
+        return self.version_tuple is None or self.version_tuple[0] < TOPOLOGY_APP_UNSUPPORTED_MAJOR
+
+    @property
+    def inspect_verified(self) -> bool:
+        return self.version_tuple is None or self.version_tuple >= INSPECT_MIN_VERIFIED_VERSION
+
+
+def parse_version(version: str) -> Optional[tuple[int, int]]:
+    """
+    Parses the major and minor part of a VideoIPath version string.
+
+    Args:
+        version (str): Version string, e.g. `'2024.4.30'`.
+
+    Returns:
+        Optional[tuple[int, int]]: `(major, minor)`, or `None` if the version cannot be parsed.
+    """
+    parts = version.split(".")
+    if len(parts) < 2:
+        return None
+    try:
+        return int(parts[0]), int(parts[1])
+    except ValueError:
+        return None
@@ -0,0 +1,97 @@
+import threading
+from typing import Callable, Generic, Hashable, Optional, TypeVar
+
+from pydantic import BaseModel
+
+T = TypeVar("T")
+
+
+class SingleFlightStats(BaseModel):
+    """Counters of a `SingleFlight` group."""
+
+    executed: int = 0
+    """Calls that actually ran (one per burst of identical concurrent calls)."""
+    coalesced: int = 0
+    """Calls that joined an identical in-flight call instead of running themselves."""
+    in_flight: int = 0
+    """Calls currently running."""
+
+
+class SingleFlight(Generic[T]):
+    """
+    Coalesces identical concurrent calls: while a call for a key is running, further calls for the same key
+    wait for it and receive its result (or exception) instead of running again. Nothing is cached once the
+    call has finished. A nested call for the same key from the running call's own thread runs uncoalesced.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call] = {}
+        self._executed = 0
+        self._coalesced = 0
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """
+        Runs `fn`, unless an identical call (same `key`) is already running; then waits for and shares its outcome.
+
+        Args:
+            key (Hashable): Identity of the call.
+            fn (Callable[[], T]): The call to run.
+
+        Returns:
+            T: The result of `fn`, shared by all coalesced callers.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            # Re-entered from the running call's own thread: waiting for it would deadlock, so run uncoalesced.
+            nested = call is not None and call.thread_id == threading.get_ident()
+            leader = call is None
+            if nested or leader:
+                self._executed += 1
+            else:
+                self._coalesced += 1
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if nested:
+            return fn()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    @property
+    def stats(self) -> SingleFlightStats:
+        with self._lock:
+            return SingleFlightStats(executed=self._executed, coalesced=self._coalesced, in_flight=len(self._calls))
+
+    def reset_stats(self):
+        with self._lock:
+            self._executed = 0
+            self._coalesced = 0
+
+
+# --- Internal ---
+
+
+class _Call:
+    __slots__ = ("done", "result", "error", "thread_id")
+
+    def __init__(self):
+        self.thread_id = threading.get_ident()
+        self.done = threading.Event()
+        self.result = None
+        self.error: Optional[BaseException] = None
@@ -0,0 +1,173 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Generic, Hashable, Optional, TypeVar
+
+from pydantic import BaseModel
+
+T = TypeVar("T")
+
+# Slow-changing GET paths that are cached by default, with their time-to-live in seconds.
+DEFAULT_RESPONSE_CACHE_TTLS: dict[str, float] = {
+    "/rest/v2/data/config/pathman/profiles": 300,
+    "/rest/v2/data/config/profiles": 300,
+    "/rest/v2/data/config/domainman/": 300,
+    "/rest/v2/data/status/configman/multicastRangeInfo": 300,
+    "/rest/v2/data/config/system/snmp": 300,
+    "/rest/v2/data/status/network/virtualTemplates": 300,
+    "/rest/v2/data/status/system/drivers": 3600,
+}
+
+# Writes that only read server state and therefore never invalidate cached responses.
+READ_ONLY_WRITE_PREFIXES = (
+    "/rest/v2/actions/status/collector/lookup",
+    "/rest/v2/actions/status/pathman/validateTopologyUpdate",
+    "/api/getUtcTime",
+    "/api/getCurrentUser",
+)
+
+# RPC endpoints and the data domains (segment after `/rest/v2/data/config|status/`) they modify.
+RPC_INVALIDATED_DOMAINS: dict[str, set[str]] = {
+    "/api/updateDevices": {"devman", "network"},
+    "/api/updateMulticastRanges": {"configman"},
+    "/api/updateSnmpConfig": {"system"},
+    "/api/uploadLicense": {"licensing"},
+    "/api/activateLicense": {"licensing"},
+    "/api/deactivateLicense": {"licensing"},
+}
+
+# Action groups (segment after `/rest/v2/actions/status/`) that modify a differently named data domain.
+ACTION_DOMAIN_ALIASES: dict[str, str] = {"tags": "network"}
+
+
+class ResponseCacheStats(BaseModel):
+    """Counters of a `ResponseCache`."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+    size: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ResponseCache(Generic[T]):
+    """
+    Size-bounded LRU cache for GET responses, keyed by URL path.
+
+    Only paths starting with one of the configured prefixes are cached, each with the TTL of its longest
+    matching prefix. Writes (PATCH/POST/RPC) invalidate every entry of the data domains they touch, i.e. a
+    write to `/rest/v2/data/config/pathman/...` drops all cached `config/pathman/...` and `status/pathman/...`
+    responses. Writes without a known domain drop the whole cache.
+    """
+
+    def __init__(self, max_entries: int = 512, prefix_ttls: Optional[dict[str, float]] = None):
+        """
+        Args:
+            max_entries (int): Maximum number of cached responses; the least recently used entry is evicted first.
+            prefix_ttls (Optional[dict[str, float]]): Cached URL prefixes with their TTL in seconds
+                (default: `DEFAULT_RESPONSE_CACHE_TTLS`).
+        """
+        if max_entries <= 0:
+            raise ValueError("Response cache size must be greater than 0.")
+        self.max_entries = max_entries
+        self.prefix_ttls = dict(DEFAULT_RESPONSE_CACHE_TTLS if prefix_ttls is None else prefix_ttls)
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Hashable, tuple[str, float, T]] = OrderedDict()
+        self._generation = 0
+        self._stats = ResponseCacheStats()
+
+    def ttl_for(self, url_path: str) -> Optional[float]:
+        """Returns the TTL of the longest configured prefix matching `url_path`, or `None` if it is not cached."""
+        matches = [prefix for prefix in self.prefix_ttls if url_path.startswith(prefix)]
+        return self.prefix_ttls[max(matches, key=len)] if matches else None
+
+    @property
+    def generation(self) -> int:
+        """Incremented by every invalidation; pass it to `put` to drop responses fetched before a write."""
+        return self._generation
+
+    def get(self, key: Hashable) -> Optional[T]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] < time.monotonic():
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self._stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats.hits += 1
+            return entry[2]
+
+    def put(self, key: Hashable, url_path: str, value: T, generation: int):
+        """Stores `value` unless it is not cacheable or a write invalidated the cache since `generation`."""
+        ttl = self.ttl_for(url_path)
+        if ttl is None or ttl <= 0:
+            return
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._entries[key] = (url_path, time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats.evictions += 1
+
+    def invalidate_for_write(self, url_path: str):
+        """Drops all cached responses a write to `url_path` may have changed."""
+        if url_path.startswith(READ_ONLY_WRITE_PREFIXES):
+            return
+        domains = _write_domains(url_path)
+        with self._lock:
+            self._generation += 1
+            if domains is None:
+                dropped = list(self._entries)
+            else:
+                # Entries without a single domain (e.g. `config/*`) may overlap any write.
+                dropped = [
+                    key
+                    for key, entry in self._entries.items()
+                    if (domain := _data_domain(entry[0])) is None or domain in domains
+                ]
+            for key in dropped:
+                del self._entries[key]
+            self._stats.invalidations += len(dropped)
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    @property
+    def stats(self) -> ResponseCacheStats:
+        with self._lock:
+            return self._stats.model_copy(update={"size": len(self._entries)})
+
+
+# --- Internal ---
+
+
+def _data_domain(url_path: str) -> Optional[str]:
+    """`/rest/v2/data/config/pathman/profiles/**` -> `pathman`."""
+    for prefix in ("/rest/v2/data/config/", "/rest/v2/data/status/", "/rest/v2/actions/status/"):
+        if url_path.startswith(prefix):
+            domain = url_path.removeprefix(prefix).split("/", 1)[0]
+            return domain if domain and "*" not in domain else None
+    return None
+
+
+def _write_domains(url_path: str) -> Optional[set[str]]:
+    """Data domains touched by a write, or `None` if unknown (invalidate everything)."""
+    if url_path in RPC_INVALIDATED_DOMAINS:
+        return RPC_INVALIDATED_DOMAINS[url_path]
+    domain = _data_domain(url_path)
+    if domain is None:
+        return None
+    if url_path.startswith("/rest/v2/actions/status/"):
+        domain = ACTION_DOMAIN_ALIASES.get(domain, domain)
+    return {domain}
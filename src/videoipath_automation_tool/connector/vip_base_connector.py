@@ -1,7 +1,7 @@
 import json
 import logging
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Callable, Optional
 
 import requests
 
@@ -33,6 +33,7 @@ class VideoIPathBaseConnector(ABC):
         timeouts: VideoIPathBaseConnectorTimeouts,
         use_https: bool = True,
         verify_ssl_cert: bool = True,
+        validate_connection: bool = True,
     ):
         """
         Low-level HTTP client for the VideoIPath API with support for REST v2 and RPC calls.
@@ -49,6 +50,8 @@ class VideoIPathBaseConnector(ABC):
             use_https (bool): If `True`, HTTPS is used for the connection (default: `True`).
             verify_ssl_cert (bool): If `True`, SSL certificate verification is enabled (default: `True`).
             logger (Optional[logging.Logger]): Logger instance. If `None`, a fallback logger is used.
+            validate_connection (bool): If `True`, connection and authentication are probed on construction
+                (default: `True`). `VideoIPathConnector` disables this and runs one shared probe instead.
         """
         self._username = username
         self._password = password
@@ -57,12 +60,19 @@ class VideoIPathBaseConnector(ABC):
         self.verify_ssl_cert = verify_ssl_cert
         self._videoipath_version = ""
         self.timeouts = timeouts
+        # Called before every HTTP request; used by VideoIPathConnector for lazy connection bootstrap.
+        self._before_request: Optional[Callable[[], None]] = None
+        # Called with the URL path after every attempted write (PATCH/POST); used to invalidate cached responses.
+        self._after_write: Optional[Callable[[str], None]] = None
 
         self.server_address = self._parse_server_address(
             server_address
         )  # Server address has to be set after use_https, because address might change use_https setting
 
-        self._validate_and_initialize_connector()
+        if validate_connection:
+            self._validate_and_initialize_connector()
+        else:
+            self._validate_connector_settings()
         self._logger.debug(f"{self.__class__.__name__} initialized.")
 
     @abstractmethod
@@ -85,7 +95,7 @@ class VideoIPathBaseConnector(ABC):
 
     # --- Internal methods ---
 
-    def _validate_and_initialize_connector(self):
+    def _validate_connector_settings(self):
         if not self.server_address:
             raise ValueError("Server address is required.")
 
@@ -95,6 +105,9 @@ class VideoIPathBaseConnector(ABC):
         if not self._password:
             raise ValueError("Password is required.")
 
+    def _validate_and_initialize_connector(self):
+        self._validate_connector_settings()
+
         self._logger.debug(
             f"Testing connection to VideoIPath-Server with address: '{self.server_address}', username: '{self._username}' and provided password (Use HTTPS: '{self.use_https}', Verify SSL Cert: '{self.verify_ssl_cert}')."
         )
@@ -139,6 +152,8 @@ class VideoIPathBaseConnector(ABC):
         self, method: str, url: str, timeout: int, request_payload: Optional[dict] = None
     ) -> requests.Response:
         """Executes an HTTP request and returns the response."""
+        if self._before_request is not None:
+            self._before_request()
 
         handlers = {
             "GET": requests.get,
@@ -154,6 +169,16 @@ class VideoIPathBaseConnector(ABC):
             "headers": {"Content-Type": "application/json", "Accept-Encoding": "gzip, deflate"},
         }
 
+        if method != "GET" and self._after_write is not None:
+            try:
+                return self._execute_http_request(method, url, request_config, handlers, request_payload)
+            finally:
+                self._after_write("/" + url.removeprefix(self.base_url).lstrip("/"))
+        return self._execute_http_request(method, url, request_config, handlers, request_payload)
+
+    def _execute_http_request(
+        self, method: str, url: str, request_config: dict, handlers: dict, request_payload: Optional[dict]
+    ) -> requests.Response:
         try:
             handle_request = handlers[method]
             if method == "GET":
@@ -1,6 +1,14 @@
+import hashlib
 import logging
-from typing import Optional
+import threading
+import time
+from typing import Callable, Optional
 
+from pydantic import BaseModel
+
+from videoipath_automation_tool.connector.capabilities import VideoIPathCapabilities
+from videoipath_automation_tool.connector.models.response_rest_v2 import ResponseV2Get
+from videoipath_automation_tool.connector.response_cache import ResponseCache
 from videoipath_automation_tool.connector.vip_base_connector import VideoIPathBaseConnectorTimeouts
 from videoipath_automation_tool.connector.vip_rest_connector import (
     VideoIPathRestConnector,
@@ -10,6 +18,9 @@ from videoipath_automation_tool.connector.vip_rpc_connector import (
 )
 from videoipath_automation_tool.utils.cross_app_utils import create_fallback_logger
 
+# Default lifetime of a cached bootstrap probe in seconds.
+DEFAULT_BOOTSTRAP_CACHE_TTL = 300
+
 
 class VideoIPathConnector:
     def __init__(
@@ -23,6 +34,10 @@ class VideoIPathConnector:
         timeout_http_get: int = 10,
         timeout_http_patch: int = 10,
         timeout_http_post: int = 10,
+        lazy_connect: bool = False,
+        bootstrap_cache_ttl: float = DEFAULT_BOOTSTRAP_CACHE_TTL,
+        response_cache: bool = False,
+        response_cache_max_entries: int = 512,
     ):
         """
         Low-level HTTP client for the VideoIPath API with support for REST v2 and RPC calls.
@@ -32,6 +47,12 @@ class VideoIPathConnector:
         requests to a VideoIPath server. Additionally, it offers functionality to verify
         connection and authentication status.
 
+        Reachability, authentication and the server version are validated for both connectors by a
+        single authenticated probe (REST and RPC share server, credentials and transport). Successful
+        probes are cached per process, keyed by server and user, for `bootstrap_cache_ttl` seconds.
+        The probed version feeds a process-wide capability registry (see `capabilities`), so apps
+        never request the version themselves.
+
         Args:
             server_address (str): The IP address or url of the VideoIPath server.
             username (str): Username for authentication.
@@ -39,9 +60,17 @@ class VideoIPathConnector:
             use_https (bool): If `True`, HTTPS is used for the connection (default: `True`).
             verify_ssl_cert (bool): If `True`, SSL certificate verification is enabled (default: `True`).
             logger (Optional[logging.Logger]): Logger instance. If `None`, a fallback logger is used.
+            lazy_connect (bool): If `True`, the probe is deferred until the first request (default: `False`).
+            bootstrap_cache_ttl (float): Lifetime of a cached probe in seconds; `0` disables the cache (default: `300`).
+            response_cache (bool): If `True`, slow-changing GET responses are cached, see `enable_response_cache` (default: `False`).
+            response_cache_max_entries (int): Maximum number of cached GET responses (default: `512`).
         """
         self._logger = logger or create_fallback_logger("videoipath_automation_tool_connector")
-        self._videoipath_version = ""
+        self._bootstrap_cache_ttl = bootstrap_cache_ttl
+        self._bootstrap_lock = threading.RLock()
+        self._connected = False
+        self._probing = False
+        self._on_connected: list[Callable[[], None]] = []
 
         timeouts = VideoIPathBaseConnectorTimeouts(
             get=timeout_http_get,
@@ -57,6 +86,7 @@ class VideoIPathConnector:
             verify_ssl_cert=verify_ssl_cert,
             logger=self._logger,
             timeouts=timeouts,
+            validate_connection=False,
         )
         self._rpc_connector = VideoIPathRPCConnector(
             server_address=server_address,
@@ -66,19 +96,92 @@ class VideoIPathConnector:
             verify_ssl_cert=verify_ssl_cert,
             logger=self._logger,
             timeouts=timeouts,
+            validate_connection=False,
         )
+        # RPC writes start a new REST write generation (GET coalescing) and invalidate cached responses.
+        self._rpc_connector._after_write = self._rest_connector._note_write
+        self._bootstrap_key = (
+            self._rest_connector.base_url,
+            username,
+            hashlib.sha256(password.encode("utf-8")).hexdigest(),
+        )
+
+        if response_cache:
+            self.enable_response_cache(ResponseCache(max_entries=response_cache_max_entries))
+
+        if lazy_connect:
+            self._rest_connector._before_request = self.ensure_connected
+            self._rpc_connector._before_request = self.ensure_connected
+            self._logger.debug("VideoIPath Connectors initialized (lazy connect, probe deferred to first request).")
+        else:
+            self.ensure_connected()
+            self._logger.debug("VideoIPath Connectors initialized.")
+
+    def ensure_connected(self):
+        """
+        Validates reachability, authentication and version with one probe, unless already done.
+        Thread-safe; concurrent callers wait for the running probe.
+
+        Raises:
+            ConnectionError: If the VideoIPath server cannot be reached.
+            PermissionError: If the authentication fails.
+        """
+        if self._connected:
+            return
+
+        with self._bootstrap_lock:
+            if self._connected or self._probing:
+                return  # Already connected, or the probe's own request re-entered on this thread.
+            self._probing = True
+            try:
+                self._probe()
+            finally:
+                self._probing = False
+            self._connected = True
+            listeners, self._on_connected = self._on_connected, []
+
+        for listener in listeners:
+            listener()
 
-        self._logger.debug("VideoIPath Connectors initialized.")
+    def on_connected(self, listener: Callable[[], None]):
+        """Runs `listener` once the connection is validated (immediately if it already is)."""
+        with self._bootstrap_lock:
+            if not self._connected:
+                self._on_connected.append(listener)
+                return
+        listener()
 
     def refresh_videoipath_version(self):
-        """Method to refresh the VideoIPath version attribute."""
+        """Method to refresh the VideoIPath version attribute (and the capabilities derived from it)."""
+        self.refresh_capabilities()
+
+    def refresh_capabilities(self) -> VideoIPathCapabilities:
+        """
+        Fetches the server version once and updates the process-wide capability registry.
+
+        Returns:
+            VideoIPathCapabilities: The freshly discovered capabilities.
+        """
         try:
             response = self.rest.get("/rest/v2/data/status/system/about/version", auth_check=False)
             version = response.data["status"]["system"]["about"]["version"]
-            self._videoipath_version = version
         except Exception as error:
             error_message = f"Error while fetching VideoIPath version: {error}"
             raise Exception(error_message)
+        return self._register_capabilities(version)
+
+    def invalidate_capabilities(self):
+        """
+        Forgets the memoised version and capabilities of this server for the whole process, e.g. after a
+        server upgrade. The next access to `capabilities` fetches them again.
+        """
+        base_url = self._rest_connector.base_url
+        with _CAPABILITY_REGISTRY_LOCK:
+            _CAPABILITY_REGISTRY.pop(base_url, None)
+        with _BOOTSTRAP_CACHE_LOCK:
+            for key in [key for key in _BOOTSTRAP_CACHE if key[0] == base_url]:
+                del _BOOTSTRAP_CACHE[key]
+        self._logger.debug(f"VideoIPath capabilities of '{self._rest_connector.server_address}' invalidated.")
 
     def fetch_driver_schema_from_server(self) -> list[dict]:
         """
@@ -94,6 +197,33 @@ class VideoIPathConnector:
             error_message = f"Error while fetching driver schema from server: {error}"
             raise Exception(error_message)
 
+    def enable_response_cache(
+        self, cache: Optional[ResponseCache[ResponseV2Get]] = None
+    ) -> ResponseCache[ResponseV2Get]:
+        """
+        Enables the read-through GET response cache of the REST connector and lets REST and RPC writes
+        invalidate it.
+
+        Args:
+            cache (Optional[ResponseCache]): Cache to use; a default cache (512 entries, default per-prefix TTLs) if `None`.
+
+        Returns:
+            ResponseCache: The active cache; its `stats` expose hits, misses, evictions and invalidations.
+        """
+        return self._rest_connector.enable_response_cache(cache)
+
+    def disable_response_cache(self):
+        """Disables and drops the GET response cache."""
+        self._rest_connector.disable_response_cache()
+
+    @staticmethod
+    def clear_bootstrap_cache():
+        """Forgets all cached bootstrap probes and capabilities of this process (e.g. after a password change)."""
+        with _BOOTSTRAP_CACHE_LOCK:
+            _BOOTSTRAP_CACHE.clear()
+        with _CAPABILITY_REGISTRY_LOCK:
+            _CAPABILITY_REGISTRY.clear()
+
     # --- Getter and Setter ---
 
     @property
@@ -104,8 +234,69 @@ class VideoIPathConnector:
     def rpc(self) -> VideoIPathRPCConnector:
         return self._rpc_connector
 
+    @property
+    def capabilities(self) -> VideoIPathCapabilities:
+        """Version and feature flags of the server, fetched at most once per process and server."""
+        self.ensure_connected()
+        capabilities = _CAPABILITY_REGISTRY.get(self._rest_connector.base_url)
+        if capabilities is not None:
+            return capabilities
+        with self._bootstrap_lock:
+            capabilities = _CAPABILITY_REGISTRY.get(self._rest_connector.base_url)
+            return capabilities if capabilities is not None else self.refresh_capabilities()
+
     @property
     def videoipath_version(self) -> str:
-        if self._videoipath_version == "":
-            self.refresh_videoipath_version()
-        return self._videoipath_version
+        return self.capabilities.version
+
+    # --- Internal methods ---
+
+    def _probe(self):
+        """Validates the connection from the process-wide cache or with one authenticated version request."""
+        cached = _BOOTSTRAP_CACHE.get(self._bootstrap_key)
+        if cached is not None and time.monotonic() - cached.probed_at < self._bootstrap_cache_ttl:
+            self._logger.debug(f"Using cached connection probe for '{self._rest_connector.server_address}'.")
+            if self._rest_connector.base_url not in _CAPABILITY_REGISTRY:
+                self._register_capabilities(cached.version)
+            return
+
+        self._logger.debug(
+            f"Probing VideoIPath-Server '{self._rest_connector.server_address}' (reachability, authentication, version)."
+        )
+        try:
+            response = self.rest.get("/rest/v2/data/status/system/about/version")
+            version = response.data["status"]["system"]["about"]["version"]
+        except PermissionError as error:
+            raise PermissionError("Authentication to VideoIPath failed.") from error
+        except Exception as error:
+            raise ConnectionError(f"Connection to VideoIPath failed: {error}") from error
+
+        if self._bootstrap_cache_ttl > 0:
+            with _BOOTSTRAP_CACHE_LOCK:
+                _BOOTSTRAP_CACHE[self._bootstrap_key] = _BootstrapProbe(version=version, probed_at=time.monotonic())
+        self._register_capabilities(version)
+        self._logger.debug("Connection and authentication to VideoIPath successful.")
+
+    def _register_capabilities(self, version: str) -> VideoIPathCapabilities:
+        capabilities = VideoIPathCapabilities.from_version(version)
+        with _CAPABILITY_REGISTRY_LOCK:
+            _CAPABILITY_REGISTRY[self._rest_connector.base_url] = capabilities
+        self._logger.debug(f"VideoIPath capabilities registered: {capabilities}")
+        return capabilities
+
+
+# --- Internal ---
+
+
+class _BootstrapProbe(BaseModel):
+    version: str
+    probed_at: float
+
+
+# (base url, username, password digest) -> last successful probe
+_BOOTSTRAP_CACHE: dict[tuple[str, str, str], _BootstrapProbe] = {}
+_BOOTSTRAP_CACHE_LOCK = threading.Lock()
+
+# base url -> memoised server capabilities
+_CAPABILITY_REGISTRY: dict[str, VideoIPathCapabilities] = {}
+_CAPABILITY_REGISTRY_LOCK = threading.Lock()
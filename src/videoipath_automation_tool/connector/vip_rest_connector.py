@@ -1,7 +1,14 @@
-from typing import Literal
+import threading
+from typing import Literal, Optional
 
 from videoipath_automation_tool.connector.models.request_rest_v2 import RequestV2Patch, RequestV2Post
 from videoipath_automation_tool.connector.models.response_rest_v2 import ResponseV2Get, ResponseV2Patch, ResponseV2Post
+from videoipath_automation_tool.connector.request_coalescing import SingleFlight, SingleFlightStats
+from videoipath_automation_tool.connector.response_cache import (
+    READ_ONLY_WRITE_PREFIXES,
+    ResponseCache,
+    ResponseCacheStats,
+)
 from videoipath_automation_tool.connector.vip_base_connector import VideoIPathBaseConnector
 
 
@@ -22,6 +29,55 @@ class VideoIPathRestConnector(VideoIPathBaseConnector):
         },
     }
 
+    def __init__(self, *args, coalesce_gets: bool = True, **kwargs):
+        """
+        REST v2 connector, see `VideoIPathBaseConnector` for the connection arguments.
+
+        Args:
+            coalesce_gets (bool): If `True`, identical concurrent GET requests share one in-flight request
+                and its parsed response (default: `True`). A GET only joins a request started after the last
+                write (REST PATCH/POST or RPC write reported via `_note_write`).
+        """
+        # Set before the base initializer, which may already issue GET requests for the connection check.
+        self.coalesce_gets = coalesce_gets
+        self._get_flights: SingleFlight[ResponseV2Get] = SingleFlight()
+        self._response_cache: Optional[ResponseCache[ResponseV2Get]] = None
+        self._write_generation = 0
+        self._write_lock = threading.Lock()
+        super().__init__(*args, **kwargs)
+        self._after_write = self._note_write
+
+    def _note_write(self, url_path: str):
+        """Called after every attempted write: starts a new write generation (so later GETs do not join
+        flights that began before the write) and invalidates the affected cached responses."""
+        if not url_path.startswith(READ_ONLY_WRITE_PREFIXES):
+            with self._write_lock:
+                self._write_generation += 1
+        cache = self._response_cache
+        if cache is not None:
+            cache.invalidate_for_write(url_path)
+
+    def enable_response_cache(
+        self, cache: Optional[ResponseCache[ResponseV2Get]] = None
+    ) -> ResponseCache[ResponseV2Get]:
+        """
+        Enables the opt-in read-through cache for slow-changing GET paths (profiles, domains, driver schema, ...).
+        Cached responses are shared between callers and must be treated as read-only. Writes through this
+        connector (and RPC writes, if wired by `VideoIPathConnector`) invalidate the affected entries.
+
+        Args:
+            cache (Optional[ResponseCache]): Cache to use; a default-sized cache with the default per-prefix TTLs if `None`.
+
+        Returns:
+            ResponseCache: The active cache.
+        """
+        self._response_cache = cache or ResponseCache()
+        return self._response_cache
+
+    def disable_response_cache(self):
+        """Disables and drops the read-through response cache."""
+        self._response_cache = None
+
     def get(
         self,
         url_path: str,
@@ -30,12 +86,15 @@ class VideoIPathRestConnector(VideoIPathBaseConnector):
         url_validation: bool = True,
         allow_projection: bool = False,
         version: Literal["v2"] = "v2",
+        use_cache: bool = True,
     ) -> ResponseV2Get:
         """
         Executes a REST v2 GET request to the VideoIPath API.
 
         This method validates the URL, constructs the request, and handles API responses.
         It optionally checks authentication and validates if response data matches the expected structure.
+        Identical concurrent GET requests are coalesced into one HTTP request (see `coalesce_gets`); all callers
+        then receive the same response object, which must be treated as read-only.
 
         Args:
             url_path (str): The API endpoint path (e.g., "/rest/v2/data/status/system/about/version").
@@ -48,6 +107,8 @@ class VideoIPathRestConnector(VideoIPathBaseConnector):
                 node structure. Defaults to `False` (the `/...` wildcard is rejected, preserving the
                 behaviour of all existing callers).
             version (Literal["v2"], optional): The API version to use (default: "v2").
+            use_cache (bool, optional): If `False`, skip the response cache lookup and read from the server;
+                the fresh response still replaces the cached one (default: `True`).
 
         Returns:
             ResponseV2Get: The validated API response object.
@@ -74,6 +135,25 @@ class VideoIPathRestConnector(VideoIPathBaseConnector):
             # Projected responses only carry the selected sub-tree, so the full-node check cannot pass.
             node_check = False
 
+        key = (url_path, auth_check, node_check)
+        cache = self._response_cache
+        if cache is not None:
+            cached = cache.get(key) if use_cache else None
+            if cached is not None:
+                return cached
+            generation = cache.generation
+
+        if not self.coalesce_gets:
+            response_object = self._get(url_path, auth_check, node_check)
+        else:
+            flight_key = (key, self._write_generation)
+            response_object = self._get_flights.do(flight_key, lambda: self._get(url_path, auth_check, node_check))
+
+        if cache is not None:
+            cache.put(key, url_path, response_object, generation)
+        return response_object
+
+    def _get(self, url_path: str, auth_check: bool, node_check: bool) -> ResponseV2Get:
         response = self._execute_request(
             method="GET",
             url=self._build_url(url_path),
@@ -260,6 +340,16 @@ class VideoIPathRestConnector(VideoIPathBaseConnector):
         except PermissionError:
             return False
 
+    @property
+    def coalescing_stats(self) -> SingleFlightStats:
+        """Counters of executed and coalesced GET requests."""
+        return self._get_flights.stats
+
+    @property
+    def response_cache_stats(self) -> Optional[ResponseCacheStats]:
+        """Hit/miss counters of the response cache, `None` if it is not enabled."""
+        return self._response_cache.stats if self._response_cache is not None else None
+
     # --- Internal Methods ---
 
     def _validate_v2_response_data(self, response_data: ResponseV2Get, resource_path: str):
@@ -67,6 +67,9 @@ class VideoIPathRPCConnector(VideoIPathBaseConnector):
 
         url = self._build_url(url_path)
 
+        if self._before_request is not None:
+            self._before_request()
+
         file_content_bytes = file_content.encode("utf-8")
 
         files = {"files": (file_name, file_content_bytes, "application/octet-stream")}
@@ -82,6 +85,9 @@ class VideoIPathRPCConnector(VideoIPathBaseConnector):
 
         except Exception as e:
             self._handle_request_exceptions(url, e)
+        finally:
+            if self._after_write is not None:
+                self._after_write(url_path)
         if response.status_code != 200:
             raise ValueError(f"Error while executing POST request to '{url}': {response.text}")
         return ResponseRPC.model_validate(response.json())
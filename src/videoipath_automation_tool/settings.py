@@ -15,9 +15,14 @@ class Settings(BaseSettings):
     VIPAT_VERIFY_SSL_CERT: bool = Field(default=True)
     VIPAT_LOG_LEVEL: Optional[Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]] = None
     VIPAT_ADVANCED_DRIVER_SCHEMA_CHECK: bool = Field(default=True)
+    VIPAT_DRIVER_SCHEMA_CACHE_DIR: Optional[str] = None
     VIPAT_TIMEOUT_HTTP_GET: int = Field(default=10)
     VIPAT_TIMEOUT_HTTP_PATCH: int = Field(default=10)
     VIPAT_TIMEOUT_HTTP_POST: int = Field(default=10)
+    VIPAT_LAZY_CONNECT: bool = Field(default=False)
+    VIPAT_BOOTSTRAP_CACHE_TTL: int = Field(default=300)
+    VIPAT_RESPONSE_CACHE: bool = Field(default=False)
+    VIPAT_RESPONSE_CACHE_MAX_ENTRIES: int = Field(default=512)
 
     class Config:
         env_file = ".env"
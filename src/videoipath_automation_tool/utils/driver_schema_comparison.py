@@ -1,10 +1,19 @@
+import hashlib
+import json
 import os
-from typing import Any, Dict, List
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
 
 from deepdiff import DeepDiff
+from pydantic import BaseModel, Field, ValidationError
 
 ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
+# Default location of the on-disk server driver schema digest cache (one JSON file per server version).
+DEFAULT_DRIVER_SCHEMA_CACHE_DIR = Path.home() / ".cache" / "videoipath_automation_tool" / "driver_schema"
+
 
 def load_driver_schema_from_file(version: str) -> list[dict]:
     schema_dir = os.path.join(ROOT_DIR, "apps", "inventory", "model", "driver_schema")
@@ -23,7 +32,75 @@ def load_driver_schema_from_file(version: str) -> list[dict]:
             raise KeyError(f"Expected schema format not found: {e}")
 
 
+class DriverSchemaDigestCacheEntry(BaseModel):
+    """Digest of one server's driver schema, as persisted by :class:`DriverSchemaDigestCache`."""
+
+    server_version: str
+    # driver id -> canonical digest of the reduced server entry (``_id`` + ``customSettings``)
+    digests: Dict[str, str] = Field(default_factory=dict)
+    # Reduced server entries of the drivers that differed from the local schema when the cache was written,
+    # so a repeated comparison against the same local schema needs no download.
+    entries: Dict[str, dict] = Field(default_factory=dict)
+
+    def covers(self, local_digests: Dict[str, str]) -> bool:
+        """Whether every driver whose digest differs from ``local_digests`` has its server entry cached."""
+        return all(
+            driver_id in self.entries
+            for driver_id, digest in local_digests.items()
+            if driver_id in self.digests and self.digests[driver_id] != digest
+        )
+
+
+class DriverSchemaDigestCache:
+    """On-disk cache of server driver schema digests, keyed by VideoIPath server version."""
+
+    def __init__(self, cache_dir: Optional[Path | str] = None):
+        """
+        Args:
+            cache_dir (Optional[Path | str]): Cache directory. Defaults to `DEFAULT_DRIVER_SCHEMA_CACHE_DIR`.
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_DRIVER_SCHEMA_CACHE_DIR
+
+    def load(self, server_version: str) -> Optional[DriverSchemaDigestCacheEntry]:
+        """Returns the cached digest for `server_version`, or `None` if missing or unreadable."""
+        file_path = self._file_path(server_version)
+        if not file_path.is_file():
+            return None
+        try:
+            entry = DriverSchemaDigestCacheEntry.model_validate_json(file_path.read_text(encoding="utf-8"))
+        except (OSError, ValidationError):
+            return None
+        return entry if entry.server_version == server_version else None
+
+    def store(self, entry: DriverSchemaDigestCacheEntry) -> None:
+        """Writes `entry` atomically (temporary file + rename), replacing any previous digest for its version."""
+        file_path = self._file_path(entry.server_version)
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        temporary_path = file_path.with_suffix(".tmp")
+        temporary_path.write_text(entry.model_dump_json(), encoding="utf-8")
+        temporary_path.replace(file_path)
+
+    def _file_path(self, server_version: str) -> Path:
+        safe_version = "".join(char if char.isalnum() or char in ".-_" else "_" for char in server_version)
+        return self.cache_dir / f"{safe_version}.json"
+
+
 class DriverSchemaComparator:
+    # Number of mismatching drivers from which the DeepDiff runs are spread over a process pool
+    # (only when the caller opts in with `max_workers`).
+    PARALLEL_DIFF_THRESHOLD = 16
+
+    @staticmethod
+    def compute_driver_digests(schema: list[dict]) -> Dict[str, str]:
+        """
+        Computes a canonical digest per driver id over the fields relevant for the comparison.
+        Identical digests mean identical drivers, so those drivers can be skipped without a DeepDiff.
+        """
+        reduced = DriverSchemaComparator._map_drivers_by_id(
+            DriverSchemaComparator._process_driver_schema_entries(schema)
+        )
+        return DriverSchemaComparator._digest_drivers(reduced)
+
     @staticmethod
     def _reduce_driver_entry(entry):
         """
@@ -76,40 +153,77 @@ class DriverSchemaComparator:
         return sorted(set(reference) - set(compare))
 
     @staticmethod
-    def _get_changed_drivers(compare: Dict[str, dict], reference: Dict[str, dict]) -> Dict[str, dict]:
-        common_ids = set(compare) & set(reference)
-        changed = {}
+    def _get_changed_drivers(
+        compare: Dict[str, dict],
+        reference: Dict[str, dict],
+        compare_digests: Optional[Dict[str, str]] = None,
+        reference_digests: Optional[Dict[str, str]] = None,
+        max_workers: Optional[int] = None,
+    ) -> Dict[str, dict]:
+        """
+        DeepDiffs only the drivers whose digests differ. With `max_workers` > 1 and many mismatches the diffs
+        run in a process pool; otherwise they run serially in this process.
+        """
+        compare_digests = compare_digests or DriverSchemaComparator._digest_drivers(compare)
+        reference_digests = reference_digests or DriverSchemaComparator._digest_drivers(reference)
 
-        for driver_id in common_ids:
-            diff = DeepDiff(
-                reference[driver_id],
-                compare[driver_id],
-                ignore_order=True,
-                view="tree",
-            )
-            if not diff:
-                continue
+        mismatching_ids = sorted(
+            driver_id
+            for driver_id in set(compare_digests) & set(reference_digests)
+            if compare_digests[driver_id] != reference_digests[driver_id]
+        )
+        jobs = [(driver_id, compare[driver_id], reference[driver_id]) for driver_id in mismatching_ids]
 
-            descriptor_diff = DriverSchemaComparator._extract_descriptor_changes(diff)
-            custom_changes = DriverSchemaComparator._extract_custom_settings_changes(diff)
-            detailed_diffs = DriverSchemaComparator._extract_detailed_custom_diffs(
-                compare[driver_id], reference[driver_id]
-            )
+        if max_workers is not None and max_workers > 1 and len(jobs) >= DriverSchemaComparator.PARALLEL_DIFF_THRESHOLD:
+            results = DriverSchemaComparator._diff_drivers_in_process_pool(jobs, max_workers)
+        else:
+            results = [_diff_driver_job(job) for job in jobs]
 
-            entry = {}
-            if descriptor_diff:
-                entry["descriptor"] = descriptor_diff
+        return {driver_id: entry for driver_id, entry in results if entry is not None}
 
-            if custom_changes or detailed_diffs:
-                entry["customSettings"] = {}
-                if custom_changes:
-                    entry["customSettings"].update(custom_changes)
-                if detailed_diffs:
-                    entry["customSettings"]["changed"] = detailed_diffs
+    @staticmethod
+    def _diff_drivers_in_process_pool(
+        jobs: list[tuple[str, dict, dict]], max_workers: Optional[int]
+    ) -> list[tuple[str, Optional[dict]]]:
+        try:
+            with ProcessPoolExecutor(max_workers=max_workers) as pool:
+                return list(pool.map(_diff_driver_job, jobs, chunksize=4))
+        except (OSError, BrokenProcessPool):
+            # Process pools are unavailable in some environments (e.g. restricted sandboxes); diff serially.
+            return [_diff_driver_job(job) for job in jobs]
+
+    @staticmethod
+    def _diff_driver(compare_entry: dict, reference_entry: dict) -> Optional[dict]:
+        """Returns the change summary for one driver, or `None` if DeepDiff finds no difference."""
+        diff = DeepDiff(
+            reference_entry,
+            compare_entry,
+            ignore_order=True,
+            view="tree",
+        )
+        if not diff:
+            return None
+
+        descriptor_diff = DriverSchemaComparator._extract_descriptor_changes(diff)
+        custom_changes = DriverSchemaComparator._extract_custom_settings_changes(diff)
+        detailed_diffs = DriverSchemaComparator._extract_detailed_custom_diffs(compare_entry, reference_entry)
+
+        entry = {}
+        if descriptor_diff:
+            entry["descriptor"] = descriptor_diff
 
-            changed[driver_id] = entry
+        if custom_changes or detailed_diffs:
+            entry["customSettings"] = {}
+            if custom_changes:
+                entry["customSettings"].update(custom_changes)
+            if detailed_diffs:
+                entry["customSettings"]["changed"] = detailed_diffs
 
-        return changed
+        return entry
+
+    @staticmethod
+    def _digest_drivers(drivers: Dict[str, dict]) -> Dict[str, str]:
+        return {driver_id: _canonical_digest(entry) for driver_id, entry in drivers.items()}
 
     @staticmethod
     def _extract_descriptor_changes(diff: DeepDiff) -> dict:
@@ -192,13 +306,19 @@ class DriverSchemaComparator:
         return result
 
     @staticmethod
-    def compare_driver_schemas(compare_schema: list[dict], reference_schema: list[dict]) -> dict:
+    def compare_driver_schemas(
+        compare_schema: list[dict], reference_schema: list[dict], max_workers: Optional[int] = None
+    ) -> dict:
         """
         Compares two driver schemas and returns a summary of changes.
+        Drivers with identical canonical digests are skipped; only mismatching drivers are DeepDiffed.
 
         Args:
             compare_schema (list[dict]): The schema to compare against the reference.
             reference_schema (list[dict]): The reference schema to compare with.
+            max_workers (Optional[int]): Opt-in process pool size used when many drivers differ; `None` (default)
+                diffs serially. The pool may re-import `__main__` (spawn start method), so only opt in from
+                code guarded by `if __name__ == "__main__":`.
         """
         compare = DriverSchemaComparator._map_drivers_by_id(
             DriverSchemaComparator._process_driver_schema_entries(compare_schema)
@@ -210,7 +330,71 @@ class DriverSchemaComparator:
         return {
             "added_drivers": DriverSchemaComparator._get_added_drivers(compare, reference),
             "removed_drivers": DriverSchemaComparator._get_removed_drivers(compare, reference),
-            "changed_drivers": DriverSchemaComparator._get_changed_drivers(compare, reference),
+            "changed_drivers": DriverSchemaComparator._get_changed_drivers(compare, reference, max_workers=max_workers),
+        }
+
+    @staticmethod
+    def compare_driver_schema_with_server(
+        compare_schema: list[dict],
+        server_version: str,
+        fetch_server_schema: Callable[[], list[dict]],
+        cache: Optional[DriverSchemaDigestCache] = None,
+        max_workers: Optional[int] = None,
+    ) -> dict:
+        """
+        Compares a local driver schema with the server's schema, using the digest cache where possible.
+
+        If `cache` holds a digest for `server_version` that covers every mismatching driver, the server
+        schema is not downloaded at all. Otherwise `fetch_server_schema` is called once and the cache is updated
+        (best-effort: an unwritable cache directory is ignored).
+
+        Args:
+            compare_schema (list[dict]): The local schema to compare against the server.
+            server_version (str): The VideoIPath server version, used as cache key.
+            fetch_server_schema (Callable[[], list[dict]]): Downloads the server's driver schema.
+            cache (Optional[DriverSchemaDigestCache]): Digest cache; `None` disables caching.
+            max_workers (Optional[int]): Opt-in process pool size used when many drivers differ; `None` (default)
+                diffs serially. The pool may re-import `__main__` (spawn start method), so only opt in from
+                code guarded by `if __name__ == "__main__":`.
+
+        Returns:
+            dict: The same summary as `compare_driver_schemas`.
+        """
+        compare = DriverSchemaComparator._map_drivers_by_id(
+            DriverSchemaComparator._process_driver_schema_entries(compare_schema)
+        )
+        compare_digests = DriverSchemaComparator._digest_drivers(compare)
+
+        cached = cache.load(server_version) if cache is not None else None
+        if cached is not None and cached.covers(compare_digests):
+            reference_digests = cached.digests
+            reference = cached.entries
+        else:
+            reference = DriverSchemaComparator._map_drivers_by_id(
+                DriverSchemaComparator._process_driver_schema_entries(fetch_server_schema())
+            )
+            reference_digests = DriverSchemaComparator._digest_drivers(reference)
+            if cache is not None:
+                cache_entry = DriverSchemaDigestCacheEntry(
+                    server_version=server_version,
+                    digests=reference_digests,
+                    entries={
+                        driver_id: entry
+                        for driver_id, entry in reference.items()
+                        if compare_digests.get(driver_id, reference_digests[driver_id]) != reference_digests[driver_id]
+                    },
+                )
+                try:
+                    cache.store(cache_entry)
+                except OSError:
+                    pass  # The cache is best-effort; a read-only or missing cache directory only costs the download.
+
+        return {
+            "added_drivers": DriverSchemaComparator._get_added_drivers(compare_digests, reference_digests),
+            "removed_drivers": DriverSchemaComparator._get_removed_drivers(compare_digests, reference_digests),
+            "changed_drivers": DriverSchemaComparator._get_changed_drivers(
+                compare, reference, compare_digests, reference_digests, max_workers=max_workers
+            ),
         }
 
     @staticmethod
@@ -224,3 +408,15 @@ class DriverSchemaComparator:
             or bool(comparison_result["removed_drivers"])
             or bool(comparison_result["changed_drivers"])
         )
+
+
+def _canonical_digest(entry: dict) -> str:
+    """SHA-256 over a key-sorted, whitespace-free JSON dump (stable across processes and runs)."""
+    canonical = json.dumps(entry, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _diff_driver_job(job: tuple[str, dict, dict]) -> tuple[str, Optional[dict]]:
+    """Module-level (picklable) worker for the process pool: `(driver_id, compare, reference)` -> summary."""
+    driver_id, compare_entry, reference_entry = job
+    return driver_id, DriverSchemaComparator._diff_driver(compare_entry, reference_entry)
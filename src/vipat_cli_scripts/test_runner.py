@@ -1,4 +1,4 @@
-"""Pytest entry points for unit, e2e, and combined test suites."""
+"""Pytest entry points for unit, e2e, benchmark, and combined test suites."""
 
 from __future__ import annotations
 
@@ -8,8 +8,9 @@ import pytest
 
 from vipat_cli_scripts.project_env import prepare_e2e_env
 
-_UNIT_ARGS = ["-m", "not e2e", "--ignore=tests/e2e"]
+_UNIT_ARGS = ["-m", "not e2e and not benchmark", "--ignore=tests/e2e"]
 _E2E_ARGS = ["-m", "e2e", "tests/e2e", "--no-cov"]
+_BENCHMARK_ARGS = ["-m", "benchmark", "tests/benchmarks", "--no-cov", "-s"]
 
 
 def _run(args: list[str], *, extra: list[str] | None = None) -> int:
@@ -25,6 +26,10 @@ def run_e2e() -> None:
     raise SystemExit(_run(_E2E_ARGS))
 
 
+def run_benchmark() -> None:
+    raise SystemExit(_run(_BENCHMARK_ARGS))
+
+
 def run() -> None:
     rc = _run(_UNIT_ARGS, extra=[])
     if rc != 0:
@@ -0,0 +1,108 @@
+"""Synthetic Inspect payloads for scaling benchmarks (no server, no fixtures)."""
+
+from __future__ import annotations
+
+from videoipath_automation_tool.apps.inspect.model.alarms import InspectApiAlarmItem
+from videoipath_automation_tool.apps.inspect.model.collector import (
+    InspectApiExternalEdgesByDeviceKeyItem,
+    InspectApiNodeStatusItem,
+)
+
+
+def edge_pairs(
+    num_edges: int, edges_per_pair: int = 2, num_spines: int = 20
+) -> list[InspectApiExternalEdgesByDeviceKeyItem]:
+    """A leaf/spine fabric with ``num_edges`` edges: every leaf pairs with one spine via ``edges_per_pair`` links."""
+    pairs = []
+    for pair_index in range(num_edges // edges_per_pair):
+        leaf, spine = f"leaf-{pair_index}", f"spine-{pair_index % num_spines}"
+        data = {}
+        for link in range(edges_per_pair):
+            port_a, port_b = f"{leaf}.dev.0.up{link}", f"{spine}.dev.0.swp{pair_index}-{link}"
+            edge_id = f"{port_a}::{port_b}"
+            data[edge_id] = {
+                "id": edge_id,
+                "fromStatus": {"context": {"devicePid": leaf, "portPid": port_a}, "label": "out"},
+                "toStatus": {"context": {"devicePid": spine, "portPid": port_b}, "label": "in"},
+            }
+        pairs.append(
+            InspectApiExternalEdgesByDeviceKeyItem.model_validate(
+                {
+                    "_id": f"{leaf}::{spine}",
+                    "_vid": f"{leaf}::{spine}",
+                    "primary": {"devicePid": leaf, "label": leaf, "data": data},
+                    "secondary": {"devicePid": spine, "label": spine, "data": {}},
+                    "status": {"alarm": 0, "bandwidth": 0, "maintenance": 0, "ptp": 0},
+                }
+            )
+        )
+    return pairs
+
+
+def device_nodes(
+    num_devices: int, modules_per_device: int = 0, ports_per_module: int = 0, *, with_vertices: bool = False
+) -> list[InspectApiNodeStatusItem]:
+    """``num_devices`` devices, each with ``modules_per_device`` x ``ports_per_module`` ports.
+
+    With ``with_vertices`` every port carries a single vertex alternating Out/In, active on two of
+    every three ports and an endpoint on every fourth.
+    """
+    nodes = []
+    for index in range(num_devices):
+        device_id = f"device-{index}"
+        modules = {}
+        for module_index in range(modules_per_device):
+            module_id = f"{device_id}.dev.{module_index}"
+            ports = {
+                f"{module_id}.p{port_index}": {
+                    "pid": f"{module_id}.p{port_index}",
+                    "descriptor": {"label": f"p{port_index}"},
+                    "label": f"p{port_index}-factory",
+                    "status": {"sa": 0, "severity": 0},
+                }
+                for port_index in range(ports_per_module)
+            }
+            if with_vertices:
+                for port_index, port in enumerate(ports.values()):
+                    port["vertexInfo"] = {
+                        "type": "single",
+                        "id": f"{module_id}.v{port_index}",
+                        "vertexType": "Out" if port_index % 2 else "In",
+                        "fields": {
+                            "isActive": port_index % 3 != 0,
+                            "isControlled": True,
+                            "isEndpoint": port_index % 4 == 0,
+                        },
+                    }
+            modules[module_id] = {"pid": module_id, "descriptor": {"label": f"m{module_index}"}, "ports": ports}
+        nodes.append(
+            InspectApiNodeStatusItem.model_validate(
+                {
+                    "_id": device_id,
+                    "_vid": device_id,
+                    "deviceId": device_id,
+                    "descriptor": {"desc": "", "label": device_id.upper()},
+                    "status": {"sa": 0, "severity": 0},
+                    "modules": modules,
+                }
+            )
+        )
+    return nodes
+
+
+def alarm_items(num_alarms: int, num_devices: int = 100, offset: int = 0) -> list[InspectApiAlarmItem]:
+    """``num_alarms`` current alarms spread over devices, modules and ports, severities 2..6."""
+    items = []
+    for index in range(offset, offset + num_alarms):
+        device_id = f"device-{index % num_devices}"
+        point_id = [device_id, "dev", f"m{index % 4}", f"p{index % 12}"][: 2 + index % 3]
+        items.append(
+            InspectApiAlarmItem.model_validate(
+                {
+                    "_id": f"alarm-{index}",
+                    "id": {"alertId": "Synthetic", "component": 1, "pointId": point_id},
+                    "info": {"details": f"synthetic {index}", "severity": 2 + index % 5, "seqno": index},
+                }
+            )
+        )
+    return items
@@ -0,0 +1,65 @@
+"""Footprint benchmark: index records of a 2,000-device / 100k-port snapshot.
+
+Run with ``poetry run test-benchmark`` (excluded from the default unit run).
+"""
+
+from __future__ import annotations
+
+import gc
+import time
+import tracemalloc
+
+import pytest
+
+from videoipath_automation_tool.apps.inspect.snapshot import HydrationLevel, InspectSnapshot
+
+from .synthetic import device_nodes, edge_pairs
+
+pytestmark = pytest.mark.benchmark
+
+_DEVICES = 2_000
+_MODULES_PER_DEVICE = 5
+_PORTS_PER_MODULE = 10
+_EDGES = 20_000
+
+
+def test_snapshot_index_footprint_and_build_time() -> None:
+    nodes = device_nodes(_DEVICES, _MODULES_PER_DEVICE, _PORTS_PER_MODULE)
+    pairs = edge_pairs(_EDGES)
+    gc.collect()
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    snap = InspectSnapshot(fetcher=None, device_items=nodes, edge_items=pairs, device_level=HydrationLevel.FULL)
+    elapsed = time.perf_counter() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    num_ports = sum(len(entries) for entries in snap._ports_by_device_id.values())
+    assert num_ports == _DEVICES * _MODULES_PER_DEVICE * _PORTS_PER_MODULE
+    assert len(snap._devices_by_id) == _DEVICES
+    print(
+        f"\n{_DEVICES} devices / {num_ports} ports / {_EDGES} edges: build {elapsed * 1000:.0f} ms, "
+        f"index memory {current / 2**20:.1f} MiB (peak {peak / 2**20:.1f} MiB)"
+    )
+    # Slotted records: pydantic records needed ~950 B of index state per port + edge, slotted ones ~450 B.
+    assert current < (num_ports + _EDGES) * 640
+
+
+def test_streaming_csv_export_memory_is_bounded_by_batch(tmp_path) -> None:
+    snap = InspectSnapshot(
+        fetcher=None,
+        device_items=device_nodes(_DEVICES, _MODULES_PER_DEVICE, _PORTS_PER_MODULE),
+        device_level=HydrationLevel.FULL,
+    )
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    written = snap.write_tables(tmp_path, tables=["ports"], batch_size=5_000)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"\nports.csv ({written['ports'].stat().st_size / 2**20:.1f} MiB): {elapsed * 1000:.0f} ms, peak {peak / 2**20:.1f} MiB"
+    )
+    assert peak < 32 * 2**20
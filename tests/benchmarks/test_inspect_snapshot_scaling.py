@@ -0,0 +1,128 @@
+"""Scaling benchmark: post-commit edge-pair drops must cost O(affected edges), not O(all edges).
+
+Run with ``poetry run test-benchmark`` (excluded from the default unit run).
+"""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from videoipath_automation_tool.apps.inspect.model.alarms import InspectApiAlarmItem
+from videoipath_automation_tool.apps.inspect.model.common import InspectSeverity
+from videoipath_automation_tool.apps.inspect.snapshot import HydrationLevel, InspectSnapshot
+
+from .synthetic import alarm_items, device_nodes, edge_pairs
+
+pytestmark = pytest.mark.benchmark
+
+_TOUCHED_PAIRS = 200
+
+
+def _refresh_pairs_seconds(num_edges: int) -> float:
+    pairs = edge_pairs(num_edges)
+    snap = InspectSnapshot(fetcher=None, edge_items=pairs)
+    touched = pairs[:: max(1, len(pairs) // _TOUCHED_PAIRS)][:_TOUCHED_PAIRS]
+    start = time.perf_counter()
+    for pair in touched:
+        snap._drop_edge_pair(pair.id)
+        snap._index_edge_pair(pair)
+    snap._apply_removals([pair.id for pair in touched[: _TOUCHED_PAIRS // 2]])
+    elapsed = time.perf_counter() - start
+    assert len(snap._edge_pairs) == len(pairs)
+    return elapsed
+
+
+def test_edge_pair_refresh_cost_is_independent_of_snapshot_size() -> None:
+    small = min(_refresh_pairs_seconds(5_000) for _ in range(3))
+    large = min(_refresh_pairs_seconds(50_000) for _ in range(3))
+    print(f"\n{_TOUCHED_PAIRS} pair refreshes: 5k edges {small * 1000:.1f} ms, 50k edges {large * 1000:.1f} ms")
+    # 10x the edges must not mean 10x the work (the previous full scans were ~linear per pair).
+    assert large < small * 4
+
+
+def test_graph_queries_and_incremental_updates_stay_in_milliseconds() -> None:
+    snap = InspectSnapshot(fetcher=None, edge_items=edge_pairs(40_000))
+    start = time.perf_counter()
+    graph = snap.get_graph()
+    built = time.perf_counter() - start
+
+    start = time.perf_counter()
+    path = graph.shortest_path("leaf-0", "leaf-19980")
+    neighbourhood = graph.neighbourhood("spine-0", hops=2)
+    radius = graph.blast_radius("spine-0")
+    queried = time.perf_counter() - start
+    assert path == ["leaf-0", "spine-0", "leaf-19980"]
+    assert neighbourhood and radius.isolated_device_ids
+
+    pairs = edge_pairs(40_000)[:_TOUCHED_PAIRS]
+    start = time.perf_counter()
+    for pair in pairs:
+        snap._drop_edge_pair(pair.id)
+        snap._index_edge_pair(pair)
+    graph.neighbourhood("spine-0")
+    patched = time.perf_counter() - start
+    print(
+        f"\ngraph over 40k edges: build {built * 1000:.0f} ms, 3 queries {queried * 1000:.1f} ms, "
+        f"{_TOUCHED_PAIRS} pair updates + query {patched * 1000:.1f} ms"
+    )
+    assert queried < 1.0 and patched < 1.0
+
+
+def test_query_ports_scans_a_preloaded_site_in_milliseconds() -> None:
+    snap = InspectSnapshot(
+        fetcher=None, device_items=device_nodes(2_000, 4, 12, with_vertices=True), device_level=HydrationLevel.FULL
+    )
+    start = time.perf_counter()
+    first = snap.query_ports(vertex_type="Out", active=True, endpoint=False)
+    cold = time.perf_counter() - start
+
+    start = time.perf_counter()
+    again = snap.query_ports(vertex_type="Out", active=True, endpoint=False)
+    warm = time.perf_counter() - start
+
+    devices = snap.devices
+    start = time.perf_counter()
+    per_device = [p for device in devices for p in device.filter_ports(vertex_type="Out", active=True, endpoint=False)]
+    looped = time.perf_counter() - start
+    assert [p.id for p in first] == [p.id for p in again] == [p.id for p in per_device]
+    print(
+        f"\nquery_ports over 96k ports ({len(first)} matches): first {cold * 1000:.0f} ms (builds columns), "
+        f"warm {warm * 1000:.0f} ms, per-device filter_ports loop {looped * 1000:.0f} ms"
+    )
+    assert warm < cold
+
+
+class _AlarmFeed:
+    def __init__(self, items: list[InspectApiAlarmItem]) -> None:
+        self.items = items
+
+    def get_alarms_section(self) -> list[InspectApiAlarmItem]:
+        return list(self.items)
+
+
+def test_alarm_polls_and_rollups_scale_with_changes() -> None:
+    items = alarm_items(50_000, num_devices=2_000)
+    feed = _AlarmFeed(items)
+    snap = InspectSnapshot(fetcher=feed)  # type: ignore[arg-type]
+    start = time.perf_counter()
+    snap.poll_alarms()
+    first = time.perf_counter() - start
+
+    feed.items = items[500:] + alarm_items(500, num_devices=2_000, offset=50_000)
+    start = time.perf_counter()
+    deltas = snap.poll_alarms()
+    repoll = time.perf_counter() - start
+    assert len(deltas) == 1_000
+
+    start = time.perf_counter()
+    worst = snap.get_severity_rollups("device", min_severity=InspectSeverity.MAJOR)
+    for device_id in ("device-0", "device-1999"):
+        snap.get_severity_rollup("device", device_id)
+    queried = time.perf_counter() - start
+    print(
+        f"\n50k alarms: first poll {first * 1000:.0f} ms, re-poll with 1k changes {repoll * 1000:.0f} ms, "
+        f"site-wide MAJOR+ rollup ({len(worst)} devices) {queried * 1000:.1f} ms"
+    )
+    assert repoll < first and queried < 0.5
@@ -0,0 +1,104 @@
+"""Single-flight coalescing of identical concurrent GET requests."""
+
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import pytest
+
+from videoipath_automation_tool.connector.models.request_rpc import RequestRPC
+from videoipath_automation_tool.connector.request_coalescing import SingleFlight
+from videoipath_automation_tool.connector.vip_connector import VideoIPathConnector
+
+from .test_response_cache import _get_payload, _response
+
+
+def test_identical_concurrent_calls_share_one_execution() -> None:
+    flight: SingleFlight[object] = SingleFlight()
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def fetch() -> object:
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return object()
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        leader = pool.submit(flight.do, "nodeStatus/a", fetch)
+        started.wait(5)
+        followers = [pool.submit(flight.do, "nodeStatus/a", fetch) for _ in range(3)]
+        while flight.stats.coalesced < 3:
+            time.sleep(0.001)
+        release.set()
+        results = {id(leader.result())} | {id(f.result()) for f in followers}
+
+    assert len(calls) == 1
+    assert len(results) == 1
+    stats = flight.stats
+    assert (stats.executed, stats.coalesced, stats.in_flight) == (1, 3, 0)
+
+
+def test_exception_is_shared_and_nothing_is_cached() -> None:
+    flight: SingleFlight[int] = SingleFlight()
+
+    def fail() -> int:
+        raise ConnectionError("down")
+
+    with pytest.raises(ConnectionError):
+        flight.do("k", fail)
+    assert flight.do("k", lambda: 1) == 1
+    assert flight.stats.executed == 2
+
+
+def test_nested_call_for_same_key_does_not_deadlock() -> None:
+    flight: SingleFlight[int] = SingleFlight()
+    assert flight.do("k", lambda: flight.do("k", lambda: 2) + 1) == 3
+
+
+def test_get_after_a_write_does_not_join_a_flight_started_before_it(monkeypatch: pytest.MonkeyPatch) -> None:
+    VideoIPathConnector.clear_bootstrap_cache()
+    monkeypatch.setattr(
+        "videoipath_automation_tool.connector.vip_base_connector.requests.get",
+        MagicMock(side_effect=lambda **_: _response(_get_payload())),
+    )
+    monkeypatch.setattr(
+        "videoipath_automation_tool.connector.vip_base_connector.requests.post",
+        MagicMock(
+            side_effect=lambda **_: _response(
+                {"header": {"caption": "OK", "id": 0, "msg": [], "ok": True, "status": "OK"}, "data": {}}
+            )
+        ),
+    )
+    connector = VideoIPathConnector(
+        server_address="vip.example", username="user", password="secret", bootstrap_cache_ttl=0
+    )
+    connector.ensure_connected()
+
+    started, release = threading.Event(), threading.Event()
+    calls: list[int] = []
+
+    def slow_get(**_: object) -> MagicMock:
+        calls.append(1)
+        if len(calls) == 1:
+            started.set()
+            release.wait(5)
+        return _response(_get_payload())
+
+    monkeypatch.setattr("videoipath_automation_tool.connector.vip_base_connector.requests.get", slow_get)
+    path = "/rest/v2/data/status/system/about/version"
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        before_write = pool.submit(connector.rest.get, path)
+        started.wait(5)
+        connector.rpc.post("/api/updateMulticastRanges", RequestRPC())
+        after_write = connector.rest.get(path)
+        release.set()
+        before_write.result()
+
+    assert after_write is not before_write.result()
+    assert len(calls) == 2
+    assert connector.rest.coalescing_stats.coalesced == 0
+    VideoIPathConnector.clear_bootstrap_cache()
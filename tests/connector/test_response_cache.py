@@ -0,0 +1,139 @@
+"""Opt-in read-through GET response cache with per-prefix TTLs and write invalidation."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from videoipath_automation_tool.connector.models.request_rpc import RequestRPC
+from videoipath_automation_tool.connector.response_cache import ResponseCache
+from videoipath_automation_tool.connector.vip_connector import VideoIPathConnector
+
+_PROFILES = "/rest/v2/data/config/pathman/profiles/**"
+_DOMAINS = "/rest/v2/data/config/domainman/domains/**"
+
+
+def _response(payload: dict) -> MagicMock:
+    response = MagicMock()
+    response.ok = True
+    response.status_code = 200
+    response.json.return_value = payload
+    return response
+
+
+def _get_payload() -> dict:
+    return {
+        "header": {
+            "auth": True,
+            "caption": "Operation Successful",
+            "code": "OK",
+            "errorDetails": None,
+            "id": "0",
+            "msg": None,
+            "ok": True,
+            "user": "user",
+        },
+        "data": {
+            "status": {"system": {"about": {"version": "2024.4.30"}}},
+            "config": {"pathman": {"profiles": {}}, "domainman": {"domains": {}}},
+        },
+    }
+
+
+@pytest.fixture
+def http(monkeypatch: pytest.MonkeyPatch) -> tuple[MagicMock, MagicMock]:
+    VideoIPathConnector.clear_bootstrap_cache()
+    get = MagicMock(side_effect=lambda **_: _response(_get_payload()))
+    post = MagicMock(
+        side_effect=lambda **_: _response(
+            {"header": {"caption": "OK", "id": 0, "msg": [], "ok": True, "status": "OK"}, "data": {}}
+        )
+    )
+    monkeypatch.setattr("videoipath_automation_tool.connector.vip_base_connector.requests.get", get)
+    monkeypatch.setattr("videoipath_automation_tool.connector.vip_base_connector.requests.post", post)
+    yield get, post
+    VideoIPathConnector.clear_bootstrap_cache()
+
+
+def _connector() -> VideoIPathConnector:
+    return VideoIPathConnector(
+        server_address="vip.example", username="user", password="secret", response_cache=True, bootstrap_cache_ttl=0
+    )
+
+
+def test_slow_changing_paths_are_served_from_cache(http: tuple[MagicMock, MagicMock]) -> None:
+    get, _post = http
+    connector = _connector()
+    get.reset_mock()
+
+    first = connector.rest.get(_PROFILES)
+    assert connector.rest.get(_PROFILES) is first
+    connector.rest.get("/rest/v2/data/status/system/about/version")
+    connector.rest.get("/rest/v2/data/status/system/about/version")
+
+    assert get.call_count == 3  # profiles once, uncached version path twice
+    stats = connector.rest.response_cache_stats
+    assert stats is not None
+    assert (stats.hits, stats.size) == (1, 1)
+
+
+def test_rpc_write_invalidates_only_touched_domains(http: tuple[MagicMock, MagicMock]) -> None:
+    get, _post = http
+    connector = _connector()
+    connector.rest.get(_PROFILES)
+    connector.rest.get(_DOMAINS)
+    get.reset_mock()
+
+    connector.rpc.post("/api/updateMulticastRanges", RequestRPC())
+    connector.rest.get(_PROFILES)
+    assert get.call_count == 0
+
+    connector.rest._after_write("/rest/v2/data/config/pathman/profiles")
+    connector.rest.get(_PROFILES)
+    connector.rest.get(_DOMAINS)
+    assert get.call_count == 1
+
+
+def test_usage_counts_are_not_cached_and_fresh_reads_bypass_the_cache(http: tuple[MagicMock, MagicMock]) -> None:
+    get, _post = http
+    connector = _connector()
+    get.reset_mock()
+
+    assert connector.rest._response_cache is not None
+    assert connector.rest._response_cache.ttl_for("/rest/v2/data/status/pathman/profiles/*/usageCount") is None
+    cached = connector.rest.get(_DOMAINS)
+    fresh = connector.rest.get(_DOMAINS, use_cache=False)
+    assert fresh is not cached
+    assert connector.rest.get(_DOMAINS) is fresh
+    assert get.call_count == 2
+
+
+def test_collector_lookups_do_not_invalidate() -> None:
+    cache: ResponseCache[str] = ResponseCache()
+    cache.put("k", _PROFILES, "cached", cache.generation)
+    cache.invalidate_for_write("/rest/v2/actions/status/collector/lookupGraphElement")
+    assert cache.get("k") == "cached"
+
+
+def test_unknown_write_drops_everything_and_stale_fetches_are_not_stored() -> None:
+    cache: ResponseCache[str] = ResponseCache()
+    cache.put("k", _PROFILES, "cached", cache.generation)
+    generation = cache.generation
+    cache.invalidate_for_write("/api/somethingNew")
+    assert cache.get("k") is None
+
+    cache.put("k", _PROFILES, "fetched before the write", generation)
+    assert cache.get("k") is None
+
+
+def test_lru_eviction_and_uncached_paths() -> None:
+    cache: ResponseCache[str] = ResponseCache(max_entries=2, prefix_ttls={"/rest/v2/data/config/": 60})
+    for name in ("a", "b", "c"):
+        cache.put(name, f"/rest/v2/data/config/{name}", name, cache.generation)
+    cache.put("s", "/rest/v2/data/status/x", "s", cache.generation)
+
+    assert cache.get("a") is None
+    assert cache.get("c") == "c"
+    assert cache.get("s") is None
+    assert cache.stats.evictions == 1
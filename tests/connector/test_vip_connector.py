@@ -0,0 +1,134 @@
+"""VideoIPathConnector single-probe bootstrap, probe cache, lazy connect and capability registry."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from videoipath_automation_tool.connector.capabilities import VideoIPathCapabilities
+from videoipath_automation_tool.connector.vip_connector import VideoIPathConnector
+
+
+def _response(auth: bool = True) -> MagicMock:
+    response = MagicMock()
+    response.ok = True
+    response.status_code = 200
+    response.json.return_value = {
+        "header": {
+            "auth": auth,
+            "caption": "Operation Successful",
+            "code": "OK",
+            "errorDetails": None,
+            "id": "0",
+            "msg": None,
+            "ok": True,
+            "user": "user",
+        },
+        "data": {"status": {"system": {"about": {"version": "2024.4.30"}}}},
+    }
+    return response
+
+
+@pytest.fixture(autouse=True)
+def _clear_bootstrap_cache():
+    VideoIPathConnector.clear_bootstrap_cache()
+    yield
+    VideoIPathConnector.clear_bootstrap_cache()
+
+
+@pytest.fixture
+def http_get(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    get = MagicMock(return_value=_response())
+    monkeypatch.setattr("videoipath_automation_tool.connector.vip_base_connector.requests.get", get)
+    monkeypatch.setattr("videoipath_automation_tool.connector.vip_base_connector.requests.post", MagicMock())
+    return get
+
+
+def _connector(**kwargs) -> VideoIPathConnector:
+    return VideoIPathConnector(server_address="vip.example", username="user", password="secret", **kwargs)
+
+
+def test_bootstrap_uses_one_probe_for_both_connectors(http_get: MagicMock) -> None:
+    connector = _connector()
+
+    assert http_get.call_count == 1
+    assert http_get.call_args.kwargs["url"].endswith("/rest/v2/data/status/system/about/version")
+    assert connector.videoipath_version == "2024.4.30"
+    assert http_get.call_count == 1
+
+
+def test_bootstrap_probe_is_cached_per_server_and_user(http_get: MagicMock) -> None:
+    _connector()
+    _connector()
+    assert http_get.call_count == 1
+
+    VideoIPathConnector(server_address="vip.example", username="other", password="secret")
+    assert http_get.call_count == 2
+
+    _connector(bootstrap_cache_ttl=0)
+    assert http_get.call_count == 3
+
+
+def test_bootstrap_maps_failed_authentication(http_get: MagicMock) -> None:
+    http_get.return_value = _response(auth=False)
+    with pytest.raises(PermissionError, match="Authentication to VideoIPath failed"):
+        _connector()
+
+
+def test_bootstrap_maps_unreachable_server(http_get: MagicMock) -> None:
+    http_get.side_effect = OSError("unreachable")
+    with pytest.raises(ConnectionError, match="Connection to VideoIPath failed"):
+        _connector()
+
+
+def test_lazy_connect_probes_on_first_request(http_get: MagicMock) -> None:
+    connector = _connector(lazy_connect=True)
+    listener = MagicMock()
+    connector.on_connected(listener)
+    assert http_get.call_count == 0
+
+    connector.rest.get("/rest/v2/data/status/system/about/version")
+    assert http_get.call_count == 2  # probe + actual request
+    listener.assert_called_once()
+
+    connector.rest.get("/rest/v2/data/status/system/about/version")
+    assert http_get.call_count == 3
+    listener.assert_called_once()
+
+
+def test_capabilities_are_shared_across_connectors(http_get: MagicMock) -> None:
+    first = _connector()
+    second = VideoIPathConnector(server_address="vip.example", username="other", password="secret")
+    http_get.reset_mock()
+
+    assert first.capabilities is second.capabilities
+    assert first.capabilities.version_tuple == (2024, 4)
+    assert first.capabilities.topology_app_supported
+    assert http_get.call_count == 0
+
+
+def test_invalidate_capabilities_refetches_once(http_get: MagicMock) -> None:
+    connector = _connector()
+    http_get.reset_mock()
+
+    connector.invalidate_capabilities()
+    assert connector.videoipath_version == "2024.4.30"
+    assert connector.videoipath_version == "2024.4.30"
+    assert http_get.call_count == 1
+
+
+@pytest.mark.parametrize(
+    ("version", "supported", "deprecated", "inspect_verified"),
+    [
+        ("2024.4.30", True, False, False),
+        ("2025.4.9", True, True, True),
+        ("2026.1.0", False, False, True),
+        ("unknown", True, False, True),
+    ],
+)
+def test_capability_flags(version: str, supported: bool, deprecated: bool, inspect_verified: bool) -> None:
+    capabilities = VideoIPathCapabilities.from_version(version)
+    assert capabilities.topology_app_supported is supported
+    assert capabilities.topology_app_deprecated is deprecated
+    assert capabilities.inspect_verified is inspect_verified
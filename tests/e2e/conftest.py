@@ -31,7 +31,6 @@ from typing import Iterator, Optional
 
 import pytest
 
-from videoipath_automation_tool.apps.inspect.app.app import _parse_version
 from videoipath_automation_tool.apps.videoipath_app import VideoIPathApp
 from vipat_cli_scripts.project_env import load_project_env
 
@@ -52,7 +51,7 @@ def _e2e_enabled() -> bool:
 
 
 def _server_major(app: VideoIPathApp) -> Optional[int]:
-    parsed = _parse_version(app._videoipath_connector.videoipath_version)
+    parsed = app.get_server_capabilities().version_tuple
     return parsed[0] if parsed is not None else None
 
 
@@ -10,6 +10,9 @@ import pytest
 
 from videoipath_automation_tool.apps.inspect.app.actions import ConflictStrategy, InspectActionsMixin
 from videoipath_automation_tool.apps.inspect.api import InspectAPI
+from videoipath_automation_tool.apps.inspect.domain.drift import InspectDriftCounts
+from videoipath_automation_tool.apps.inspect.errors import InspectError
+from videoipath_automation_tool.apps.inspect.model.actions import InspectApiLookupSyncInfoItem
 
 _ADD_DEVICES = "/rest/v2/actions/status/network/addDevices"
 _SYNC_DEVICES = "/rest/v2/actions/status/network/syncDevices"
@@ -166,6 +169,67 @@ def test_add_devices_sync_failure_refreshes_and_returns_false() -> None:
     assert snap.network_refresh_calls == [["device12"]]
 
 
+# --- Drift report (chunked lookupSyncInfo) ---
+
+
+def _sync_info_app(fail_for: str | None = None) -> tuple[_App, list[list[str]]]:
+    app = _App()
+    calls: list[list[str]] = []
+
+    def lookup(device_ids: list[str]) -> SimpleNamespace:
+        calls.append(list(device_ids))
+        if fail_for in device_ids:
+            raise RuntimeError("collector unavailable")
+        data = {
+            device_id: InspectApiLookupSyncInfoItem(
+                label=device_id.upper(),
+                add={f"{device_id}.1.eth1.out": {}, f"{device_id}.1.eth1.in": {}} if device_id == "device2" else {},
+                remove={f"{device_id}.2.eth9.in": {}} if device_id == "device3" else {},
+                severity=3 if device_id in ("device2", "device3") else 0,
+            )
+            for device_id in device_ids
+        }
+        return SimpleNamespace(data=data)
+
+    app._inspect_api.lookup_sync_info = lookup  # type: ignore[method-assign]
+    return app, calls
+
+
+def test_drift_report_chunks_and_aggregates() -> None:
+    app, calls = _sync_info_app()
+    ids = [f"device{index}" for index in range(1, 6)]
+    report = app.get_drift_report(
+        ids, drivers={"device2": "com.example.a-1.0", "device3": "com.example.b-1.0"}, chunk_size=2
+    )
+    assert sorted(len(chunk) for chunk in calls) == [1, 2, 2]
+    assert report.checked == 5
+    assert sorted(report.devices) == ["device2", "device3"]
+    assert report.devices["device2"].counts.add == 2
+    assert report.devices["device2"].modules == {"device2.1": InspectDriftCounts(add=2)}
+    assert report.by_module["device3.2"] == InspectDriftCounts(remove=1)
+    assert report.by_driver["com.example.a-1.0"].add == 2
+    assert report.by_driver["unknown"].total == 0
+    assert report.totals == InspectDriftCounts(add=2, remove=1)
+    assert report.failed_device_ids == []
+
+
+def test_drift_report_records_failed_chunks() -> None:
+    app, _ = _sync_info_app(fail_for="device3")
+    report = app.get_drift_report(["device1", "device2", "device3", "device4"], chunk_size=2, include_clean=True)
+    assert report.failed_device_ids == ["device3", "device4"]
+    assert sorted(report.devices) == ["device1", "device2"]
+    assert report.by_driver == {}
+
+
+def test_iter_sync_info_streams_then_raises_for_failed_chunks() -> None:
+    app, _ = _sync_info_app(fail_for="device1")
+    seen: list[str] = []
+    with pytest.raises(InspectError):
+        for device_id, _item in app.iter_sync_info(["device1", "device2"], chunk_size=1):
+            seen.append(device_id)
+    assert seen == ["device2"]
+
+
 # --- Internal ---
 
 
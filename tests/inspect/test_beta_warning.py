@@ -9,10 +9,11 @@ from types import SimpleNamespace
 import pytest
 
 from videoipath_automation_tool.apps.inspect.app.app import InspectApp
+from videoipath_automation_tool.connector.capabilities import VideoIPathCapabilities
 
 
 def _fake_connector(version: str = "2025.4.9") -> SimpleNamespace:
-    return SimpleNamespace(videoipath_version=version)
+    return SimpleNamespace(capabilities=VideoIPathCapabilities.from_version(version))
 
 
 def test_inspect_app_emits_beta_user_warning() -> None:
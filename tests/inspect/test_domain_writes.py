@@ -10,6 +10,7 @@ import pytest
 from videoipath_automation_tool.apps.inspect.app.write import InspectWriteMixin
 from videoipath_automation_tool.apps.inspect.domain.edge import InspectEdge
 from videoipath_automation_tool.apps.inspect.domain.vertex import InspectCodecVertex, InspectIpVertex, build_vertex
+from videoipath_automation_tool.apps.inspect.errors import InspectError
 from videoipath_automation_tool.apps.inspect.model.actions import (
     InspectApiLookupEdgeResponseItem,
     InspectApiLookupInspectDeviceResponse,
@@ -164,6 +165,27 @@ def test_transaction_update_stages_domain_edits() -> None:
     assert api.update_calls[0].replaceDevices[DEVICE_ID].descriptor.label == "Via Tx"
 
 
+def test_transaction_update_prefetches_baselines_for_many_devices() -> None:
+    device_ids = [f"device-{n}" for n in range(12)]
+    api = FakeAPI()
+    for device_id in device_ids:
+        api.devices[device_id] = _device_response()
+    snapshot = InspectSnapshot(device_items=[_skeleton_node(d) for d in device_ids])
+    devices = [snapshot.get_device(d) for d in device_ids]
+    for n, device in enumerate(devices):
+        assert device is not None
+        device.label = f"Renamed {n}"
+
+    app = _WriteApp(api, snapshot)
+    with app.transaction() as tx:
+        tx.update(devices)  # type: ignore[arg-type]
+        assert sorted(api.lookup_device_calls) == sorted(device_ids)  # one prefetch lookup each
+        tx.commit()
+    assert sorted(api.lookup_device_calls) == sorted(device_ids * 2)  # + one conflict check each
+    delta = api.update_calls[0]
+    assert [delta.replaceDevices[d].descriptor.label for d in device_ids] == [f"Renamed {n}" for n in range(12)]
+
+
 def test_transaction_codec_nested_intents_round_trip() -> None:
     api = FakeAPI()
     codec_fixture = load_fixture("lookup_inspect_codec_vertex_by_id.json")
@@ -238,6 +260,29 @@ def test_update_module_diffs_assign_and_unassign() -> None:
     assert api.unassign_calls == [("Format~~Old", ["device:device-a.dev.0"])]
 
 
+def test_update_module_tag_failures_are_aggregated() -> None:
+    api = FakeAPI()
+    snapshot = _snapshot_with_module(DEVICE_ID, MODULE_ID, local_tags=["Format~~Old"])
+    app = _WriteApp(api, snapshot)
+    rejected = SimpleNamespace(header=SimpleNamespace(ok=True, msg=[]), data=SimpleNamespace(ok=False, msg=["nope"]))
+
+    def assign_tag(tag_id: str, element_ids: list[str]) -> SimpleNamespace:
+        api.assign_calls.append((tag_id, list(element_ids)))
+        if tag_id == "Format~~Boom":
+            raise RuntimeError("connection reset")
+        return rejected if tag_id == "Format~~Bad" else _ok_simple_action()
+
+    api.assign_tag = assign_tag  # type: ignore[method-assign]
+    with pytest.raises(InspectError) as exc:
+        app.update_module(MODULE_ID, tags=["Format~~Good", "Format~~Bad", "Format~~Boom"])
+    message = str(exc.value)
+    assert "2 of 4 tag action(s)" in message
+    assert "assignTag 'Format~~Bad': nope" in message
+    assert "assignTag 'Format~~Boom': connection reset" in message
+    assert sorted(tag for tag, _ in api.assign_calls) == ["Format~~Bad", "Format~~Boom", "Format~~Good"]
+    assert api.unassign_calls == [("Format~~Old", ["device:device-a.dev.0"])]
+
+
 def test_update_module_noop_when_tags_unchanged() -> None:
     api = FakeAPI()
     snapshot = _snapshot_with_module(DEVICE_ID, MODULE_ID, local_tags=["Format~~A"])
@@ -300,9 +345,13 @@ def _nested_get(obj: Any, path: str) -> Any:
 
 
 def _skeleton_snapshot_with_device(device_id: str, label: str = "Device A") -> InspectSnapshot:
+    return InspectSnapshot(device_items=[_skeleton_node(device_id, label)])
+
+
+def _skeleton_node(device_id: str, label: str = "Device A") -> Any:
     from videoipath_automation_tool.apps.inspect.model.collector import InspectApiNodeStatusItem
 
-    node = InspectApiNodeStatusItem.model_validate(
+    return InspectApiNodeStatusItem.model_validate(
         {
             "_id": device_id,
             "deviceId": device_id,
@@ -313,7 +362,6 @@ def _skeleton_snapshot_with_device(device_id: str, label: str = "Device A") -> I
             "status": {"sa": 0, "severity": 0},
         }
     )
-    return InspectSnapshot(device_items=[node])
 
 
 def _snapshot_with_module(
@@ -383,8 +431,10 @@ class FakeAPI:
         self.update_calls: list[Any] = []
         self.assign_calls: list[tuple[str, list[str]]] = []
         self.unassign_calls: list[tuple[str, list[str]]] = []
+        self.lookup_device_calls: list[str] = []
 
     def lookup_inspect_device(self, device_id: str) -> InspectApiLookupInspectDeviceResponse:
+        self.lookup_device_calls.append(device_id)
         if device_id not in self.devices:
             raise KeyError(device_id)
         return self.devices[device_id]
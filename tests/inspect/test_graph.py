@@ -0,0 +1,130 @@
+"""Device graph: CSR adjacency queries (paths, neighbourhoods, components, blast radius,
+services per edge) and incremental updates through the snapshot's post-commit hooks."""
+
+from __future__ import annotations
+
+import pytest
+
+from videoipath_automation_tool.apps.inspect import graph as graph_module
+from videoipath_automation_tool.apps.inspect.model.collector import InspectApiPathItem
+from videoipath_automation_tool.apps.inspect.snapshot import InspectSnapshot
+
+from .test_snapshot import FakeFetcher, _edge_pair, _path_item, _skeleton_node
+
+# spine-a -- leaf-a, spine-a -- leaf-b -- host-b, spine-b (isolated)
+_DEVICES = ["spine-a", "spine-b", "leaf-a", "leaf-b", "host-b"]
+_PAIRS = [
+    ("leaf-a", "spine-a", "leaf-a.dev.0.up1", "spine-a.dev.0.swp1"),
+    ("leaf-b", "spine-a", "leaf-b.dev.0.up1", "spine-a.dev.0.swp2"),
+    ("host-b", "leaf-b", "host-b.dev.0.eth0", "leaf-b.dev.0.host1"),
+]
+
+
+def _fabric(fetcher: FakeFetcher | None = None) -> InspectSnapshot:
+    return InspectSnapshot(
+        fetcher=fetcher,
+        device_items=[_skeleton_node(device_id, device_id.upper()) for device_id in _DEVICES],
+        edge_items=[_edge_pair(*pair) for pair in _PAIRS],
+    )
+
+
+def _ported_path(booking: str, hops: list[tuple[str, str | None, str | None]]) -> InspectApiPathItem:
+    """A service path over ``(device, input port, output port)`` hops."""
+    return InspectApiPathItem.model_validate(
+        {
+            "_id": f"{booking}::main",
+            "_vid": f"_:{booking}::main",
+            "serviceFields": {"bid": booking},
+            "path": [
+                {
+                    "bid": booking,
+                    "structure": {
+                        "deviceId": device_id,
+                        "inputStatus": {"context": {"portPid": in_port}} if in_port else None,
+                        "outputStatus": {"context": {"portPid": out_port}} if out_port else None,
+                    },
+                }
+                for device_id, in_port, out_port in hops
+            ],
+        }
+    )
+
+
+def test_shortest_path_neighbourhood_and_components() -> None:
+    graph = _fabric().get_graph()
+    assert graph.shortest_path("leaf-a", "host-b") == ["leaf-a", "spine-a", "leaf-b", "host-b"]
+    assert graph.shortest_path("leaf-a", "spine-b") == []
+    assert graph.shortest_path("leaf-a", "leaf-a") == ["leaf-a"]
+    assert graph.neighbourhood("spine-a") == ["leaf-a", "leaf-b"]
+    assert graph.neighbourhood("spine-a", hops=2) == ["leaf-a", "leaf-b", "host-b"]
+    assert graph.connected_components() == [["host-b", "leaf-a", "leaf-b", "spine-a"], ["spine-b"]]
+
+
+def test_directed_shortest_path_follows_edge_direction() -> None:
+    graph = _fabric().get_graph()
+    assert graph.shortest_path("leaf-a", "spine-a", directed=True) == ["leaf-a", "spine-a"]
+    assert graph.shortest_path("spine-a", "leaf-a", directed=True) == []
+
+
+def test_blast_radius_isolates_all_but_largest_part() -> None:
+    snap = _fabric()
+    snap._index_paths([_path_item("1001", "leaf-a", "spine-a"), _path_item("1002", "host-b", "leaf-b")])
+    snap._section_loaded["paths"] = True
+    graph = snap.get_graph()
+
+    spine = graph.blast_radius("spine-a")
+    assert spine.isolated_device_ids == ["leaf-a"]
+    assert spine.affected_booking_ids == ["1001"]
+
+    leaf = graph.blast_radius("leaf-b")
+    assert leaf.isolated_device_ids == ["host-b"]
+    assert graph.blast_radius("leaf-a").isolated_device_ids == []
+
+
+def test_services_for_edge_require_adjacent_segments_on_edge_ports() -> None:
+    fetcher = FakeFetcher()
+    fetcher._paths = [
+        _ported_path("on-edge", [("leaf-a", None, "leaf-a.dev.0.up1"), ("spine-a", "spine-a.dev.0.swp1", None)]),
+        _ported_path("other-port", [("leaf-a", None, "leaf-a.dev.0.up9"), ("spine-a", None, None)]),
+        _ported_path("reverse", [("spine-a", None, None), ("leaf-a", None, None)]),
+    ]
+    snap = _fabric(fetcher)
+    edge_id = "leaf-a.dev.0.up1::spine-a.dev.0.swp1"
+    assert [service.booking_id for service in snap.get_services_for_edge(edge_id)] == ["on-edge"]
+    edge = snap.get_edges_for_device("leaf-a")[0]
+    assert [service.booking_id for service in edge.crossing_services] == ["on-edge"]
+    assert {service.booking_id for service in edge.services} == {"on-edge", "other-port", "reverse"}
+    assert snap.get_services_for_edge("unknown::edge") == []
+
+
+def test_post_commit_changes_patch_the_graph_incrementally() -> None:
+    snap = _fabric()
+    graph = snap.get_graph()
+    assert graph.shortest_path("spine-b", "host-b") == []
+
+    # New pair spine-b -- host-b; then spine-a fails out of the topology.
+    snap._index_edge_pair(_edge_pair("spine-b", "host-b", "spine-b.dev.0.swp1", "host-b.dev.0.eth1"))
+    assert graph.shortest_path("spine-b", "leaf-a") == ["spine-b", "host-b", "leaf-b", "spine-a", "leaf-a"]
+    snap._apply_removals(["spine-a"])
+    assert graph.shortest_path("spine-b", "leaf-a") == []
+    assert graph.connected_components() == [["host-b", "leaf-b", "spine-b"], ["leaf-a"]]
+
+    # Dropping a single edge by id removes only that adjacency.
+    snap._apply_removals(["host-b.dev.0.eth0::leaf-b.dev.0.host1"])
+    assert graph.neighbourhood("host-b") == ["spine-b"]
+    assert snap.get_graph() is graph
+
+
+def test_graph_matches_rebuild_after_many_updates(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(graph_module, "_MIN_OVERLAY", 8)  # force several compactions
+    snap = _fabric()
+    graph = snap.get_graph()
+    for index in range(50):
+        snap._index_edge_pair(
+            _edge_pair(f"leaf-{index}", "spine-b", f"leaf-{index}.dev.0.up1", f"spine-b.dev.0.p{index}")
+        )
+        if index % 3 == 0:
+            snap._drop_edge_pair(f"leaf-{index}::spine-b")
+    rebuilt = type(graph)(snap)
+    assert graph.connected_components() == rebuilt.connected_components()
+    assert graph.neighbourhood("spine-b") == rebuilt.neighbourhood("spine-b")
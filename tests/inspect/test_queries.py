@@ -72,3 +72,37 @@ def test_query_too_long_raises(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr(queries, "MAX_QUERY_LENGTH", 10)
     with pytest.raises(InspectQueryTooLongError):
         queries.device_skeleton()
+
+
+def test_paths_for_bookings_chunks_within_length_limit() -> None:
+    ids = [f"booking-{n:05d}" for n in range(300)]
+    paths = queries.paths_for_bookings(ids + ids[:5])
+    assert len(paths) > 1
+    decoded = [urllib.parse.unquote(path) for path in paths]
+    for path, text in zip(paths, decoded):
+        assert len(path) <= queries.MAX_QUERY_LENGTH
+        assert text.startswith("/rest/v2/data/status/collector/inspect/paths/* where ")
+    assert sum(text.count("serviceFields.bid=") for text in decoded) == 300
+
+
+def test_paths_for_bookings_rejects_quotes() -> None:
+    with pytest.raises(ValueError):
+        queries.paths_for_bookings(["it's"])
+
+
+def test_device_details_filters_by_device_id_with_full_subtree() -> None:
+    paths = queries.device_details(["device1", "device2", "device1"])
+    assert len(paths) == 1
+    decoded = urllib.parse.unquote(paths[0])
+    assert decoded.endswith("nodeStatus/* where (deviceId='device1') or (deviceId='device2')/**")
+
+
+def test_device_skeleton_for_uses_skeleton_projection_with_where_filter() -> None:
+    paths = queries.device_skeleton_for(["virtual.1", "virtual.2"])
+    assert len(paths) == 1
+    decoded = urllib.parse.unquote(paths[0])
+    assert "nodeStatus/* where (deviceId='virtual.1') or (deviceId='virtual.2')/deviceId," in decoded
+    assert decoded.endswith(urllib.parse.unquote(queries.device_skeleton()).split("nodeStatus/*")[1])
+    chunked = queries.device_skeleton_for([f"virtual.{n}" for n in range(400)])
+    assert len(chunked) > 1
+    assert all(len(path) <= queries.MAX_QUERY_LENGTH for path in chunked)
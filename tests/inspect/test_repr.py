@@ -138,7 +138,7 @@ def test_internal_index_record_reprs(snap: tuple[InspectSnapshot, FakeFetcher])
     text = _assert_clean_repr(indexed_port, class_name="_IndexedPort", contains="leaf-a")
     assert "port_id=" in text
 
-    indexed_edge = snapshot._edges_by_device_id["leaf-a"][0]
+    indexed_edge = next(snapshot._iter_device_edges("leaf-a"))
     text = _assert_clean_repr(indexed_edge, class_name="_IndexedEdge", contains=indexed_edge.edge_id)
     assert "from_device_id=" in text
 
@@ -3,6 +3,7 @@ section laziness, preload fan-out, refresh, and post-commit targeted refresh."""
 
 from __future__ import annotations
 
+import threading
 from collections.abc import Iterator
 
 import pytest
@@ -137,6 +138,92 @@ def test_post_commit_marks_alarms_stale(snapshot: tuple[InspectSnapshot, FakeFet
     assert fetcher.alarm_section_calls == 2
 
 
+def test_poll_alarms_applies_only_changes_by_id(snapshot: tuple[InspectSnapshot, FakeFetcher]) -> None:
+    snap, fetcher = snapshot
+    fetcher._alarms = [_alarm("a", ["leaf-a", "dev"], 2), _alarm("b", ["leaf-a", "dev", "module-1"], 5)]
+    assert [(d.change, d.id) for d in snap.poll_alarms()] == [("raised", "a"), ("raised", "b")]
+    assert snap.get_device_alarm_severity("leaf-a") == InspectSeverity.MAJOR
+    assert snap.poll_alarms() == []  # unchanged re-read touches nothing
+
+    fetcher._alarms = [_alarm("b", ["leaf-a", "dev", "module-1"], 3, seqno=2), _alarm("c", ["spine-a", "dev"], 4)]
+    deltas = snap.poll_alarms()
+    assert [(d.change, d.id, d.device_id) for d in deltas] == [
+        ("cleared", "a", "leaf-a"),
+        ("updated", "b", "leaf-a"),
+        ("raised", "c", "spine-a"),
+    ]
+    assert deltas[1].previous is not None and deltas[1].previous.severity == InspectSeverity.MAJOR
+    assert [d.sequence for d in deltas] == [3, 4, 5]
+    assert snap.get_device_alarm_severity("leaf-a") == InspectSeverity.WARNING
+    assert snap.get_device_alarm_severity("spine-a") == InspectSeverity.MINOR
+    assert [a.id for a in snap.get_alarms_for_resource("leaf-a.dev.module-1")] == ["b"]
+    assert snap.get_alarms_for_resource("leaf-a.dev") == []
+
+    fetcher._alarms = []
+    assert {d.change for d in snap.poll_alarms()} == {"cleared"}
+    assert snap.get_device_alarm_severity("leaf-a") is None
+    assert snap._alarms_by_device_id == {} and snap._alarms_by_resource_key == {}
+
+
+def test_poll_alarms_keys_alarms_without_ids_by_content(snapshot: tuple[InspectSnapshot, FakeFetcher]) -> None:
+    snap, fetcher = snapshot
+    first = InspectApiAlarmItem.model_validate({"id": {"component": 1}, "info": {"details": "fan", "severity": 4}})
+    second = InspectApiAlarmItem.model_validate({"id": {"component": 1}, "info": {"details": "psu", "severity": 5}})
+    fetcher._alarms = [first, second]
+    assert [d.change for d in snap.poll_alarms()] == ["raised", "raised"]
+
+    fetcher._alarms = [second]  # the first alarm clears and the second moves up a position
+    deltas = snap.poll_alarms()
+    assert [(d.change, d.alarm.message) for d in deltas] == [("cleared", "fan")]
+
+
+def test_severity_rollups_per_device_module_and_pair(snapshot: tuple[InspectSnapshot, FakeFetcher]) -> None:
+    snap, fetcher = snapshot
+    fetcher._alarms = [
+        _alarm("a", ["leaf-a", "dev"], 2),
+        _alarm("b", ["leaf-a", "dev", "module-1"], 5),
+        _alarm("c", ["leaf-a", "dev", "module-1", "port-out-1"], 4),
+        _alarm("d", ["spine-a", "dev", "module-1"], 6),
+        _alarm("e", ["leaf-a", "leaf-a::spine-a"], 3),
+    ]
+    leaf = snap.get_severity_rollup("device", "leaf-a")
+    assert leaf is not None and leaf.worst == InspectSeverity.MAJOR and leaf.total == 4
+    assert leaf.counts[InspectSeverity.MINOR] == 1 and leaf.count_at_least(InspectSeverity.MINOR) == 2
+    module = snap.get_severity_rollup("module", "leaf-a.dev.module-1")
+    assert module is not None and module.total == 2  # the module and its port
+    assert snap.get_severity_rollup("pair", "leaf-a::spine-a").worst == InspectSeverity.WARNING
+    assert [r.key for r in snap.get_severity_rollups()] == ["spine-a", "leaf-a"]
+    assert [r.key for r in snap.get_severity_rollups("device", min_severity=InspectSeverity.CRITICAL)] == ["spine-a"]
+    assert snap.get_device("leaf-a").alarm_rollup == leaf
+    assert snap.edges[0].alarm_rollup is not None
+
+    # Only the touched keys change: clearing the MAJOR module alarm re-derives the worst severity.
+    fetcher._alarms = [item for item in fetcher._alarms if item.id_field != "b"]
+    snap.poll_alarms()
+    assert snap.get_severity_rollup("device", "leaf-a").worst == InspectSeverity.MINOR
+    assert snap.get_severity_rollup("module", "leaf-a.dev.module-1").total == 1
+    fetcher._alarms = []
+    snap.poll_alarms()
+    assert all(not rollups for rollups in snap._alarm_rollups.values())
+    with pytest.raises(ValueError, match="rollup scope"):
+        snap.get_severity_rollups("port")  # type: ignore[arg-type]
+
+
+def test_alarm_stream_includes_changes_from_lazy_reloads(snapshot: tuple[InspectSnapshot, FakeFetcher]) -> None:
+    snap, fetcher = snapshot
+    fetcher._alarms = [_alarm("a", ["leaf-a", "dev"], 2)]
+    _ = snap.get_device("leaf-a").alarms  # section loaded before the stream starts
+    stream = snap.iter_alarm_deltas(interval=0, max_polls=3)
+    fetcher._alarms = [_alarm("a", ["leaf-a", "dev"], 2), _alarm("b", ["spine-a", "dev"], 6)]
+    assert [(d.change, d.id) for d in stream] == [("raised", "b")]
+
+    stream = snap.iter_alarm_deltas(interval=0, max_polls=1)
+    fetcher._alarms = []
+    snap.apply_post_commit(mark_paths_stale=True)
+    assert snap.get_device("spine-a").alarms == []  # lazy reload diffs and applies the clears
+    assert [(d.change, d.id) for d in stream] == [("cleared", "a"), ("cleared", "b")]
+
+
 def test_linked_devices_from_edges(snapshot: tuple[InspectSnapshot, FakeFetcher]) -> None:
     snap, _ = snapshot
     assert {d.id for d in snap.get_device("leaf-a").linked_devices} == {"spine-a"}
@@ -180,6 +267,101 @@ def test_post_commit_marks_paths_stale(snapshot: tuple[InspectSnapshot, FakeFetc
     assert fetcher.section_calls == 2
 
 
+def test_post_commit_rereads_only_bookings_on_touched_devices(
+    snapshot: tuple[InspectSnapshot, FakeFetcher],
+) -> None:
+    snap, fetcher = snapshot
+    fetcher._paths = [_path_item("1001", "leaf-a", "spine-a"), _path_item("1002", "spine-a", "spine-a")]
+    _ = snap.services
+    assert fetcher.section_calls == 1
+
+    fetcher._paths = [_path_item("1002", "spine-a", "spine-a")]  # 1001 torn down server-side
+    snap.apply_post_commit(device_ids=["leaf-a"])
+    assert fetcher.booking_calls == []  # deferred until next access
+
+    assert [s.booking_id for s in snap.services] == ["1002"]
+    assert fetcher.section_calls == 1
+    assert fetcher.booking_calls == [["1001"]]
+    assert snap.get_services_for_device("leaf-a") == []
+    assert [s.booking_id for s in snap.get_services_for_device("spine-a")] == ["1002"]
+
+    _ = snap.services
+    assert fetcher.booking_calls == [["1001"]]
+
+
+def test_post_commit_with_removals_reloads_services_section(
+    snapshot: tuple[InspectSnapshot, FakeFetcher],
+) -> None:
+    snap, fetcher = snapshot
+    _ = snap.services
+    snap.apply_post_commit(removed_ids=["leaf-a"], device_ids=["spine-a"])
+    _ = snap.services
+    assert fetcher.section_calls == 2
+    assert fetcher.booking_calls == []
+
+
+def test_scoped_services_refresh_failure_falls_back_to_full_reload(
+    snapshot: tuple[InspectSnapshot, FakeFetcher],
+) -> None:
+    snap, fetcher = snapshot
+    _ = snap.services
+
+    def broken(booking_ids: list[str]) -> list[InspectApiPathItem]:
+        raise RuntimeError("boom")
+
+    fetcher.get_paths_for_bookings = broken  # type: ignore[method-assign]
+    snap.apply_post_commit(pair_ids=["leaf-a::spine-a"])
+    assert [s.booking_id for s in snap.services] == ["1001"]
+    assert fetcher.section_calls == 2
+
+
+def test_post_commit_batches_device_refetch(snapshot: tuple[InspectSnapshot, FakeFetcher]) -> None:
+    snap, fetcher = snapshot
+    fetcher._details["leaf-a"] = _detail_node("leaf-a", "LEAF-A-RENAMED", ["leaf-a.dev.0.up1"])
+    snap.apply_post_commit(device_ids=["leaf-a", "spine-a"], pair_ids=["leaf-a::spine-a"])
+    assert fetcher.batch_detail_calls == [["leaf-a", "spine-a"]]
+    assert fetcher.device_detail_calls == []
+    assert fetcher.edge_pair_calls == ["leaf-a::spine-a"]
+    assert snap.find_device_by_label("LEAF-A-RENAMED").id == "leaf-a"
+
+
+def test_post_commit_batch_failure_falls_back_to_per_device(
+    snapshot: tuple[InspectSnapshot, FakeFetcher],
+) -> None:
+    snap, fetcher = snapshot
+
+    def broken(device_ids: list[str]) -> list[InspectApiNodeStatusItem]:
+        raise RuntimeError("boom")
+
+    fetcher.get_device_details = broken  # type: ignore[method-assign]
+    snap.apply_post_commit(device_ids=["leaf-a", "spine-a"], mark_paths_stale=False)
+    assert sorted(fetcher.device_detail_calls) == ["leaf-a", "spine-a"]
+    assert snap.is_device_hydrated("leaf-a") and snap.is_device_hydrated("spine-a")
+
+
+def test_background_post_commit_marks_stale_until_refresh_lands(
+    snapshot: tuple[InspectSnapshot, FakeFetcher],
+) -> None:
+    snap, fetcher = snapshot
+    gate = threading.Event()
+    real = fetcher.get_device_detail
+
+    def slow(device_id: str) -> InspectApiNodeStatusItem | None:
+        gate.wait(5)
+        return real(device_id)
+
+    fetcher.get_device_detail = slow  # type: ignore[method-assign]
+    fetcher._details["leaf-a"] = _detail_node("leaf-a", "LEAF-A-RENAMED", ["leaf-a.dev.0.up1"])
+    snap.apply_post_commit(device_ids=["leaf-a"], mark_paths_stale=False, background=True)
+    assert "leaf-a" in snap._stale_devices
+    assert snap.wait_for_refresh(timeout=0.01) is False
+
+    gate.set()
+    assert snap.wait_for_refresh(timeout=5) is True
+    assert "leaf-a" not in snap._stale_devices
+    assert snap.find_device_by_label("LEAF-A-RENAMED").id == "leaf-a"
+
+
 def test_post_commit_reindexes_changed_label(snapshot: tuple[InspectSnapshot, FakeFetcher]) -> None:
     # Latent-bug guard: a committed label change must re-point the label index.
     snap, fetcher = snapshot
@@ -223,6 +405,22 @@ def test_apply_network_refresh_adds_new_device_and_edge(snapshot: tuple[InspectS
     assert {e.pair_id for e in snap.get_edges_for_device("leaf-b")} == {"leaf-b::spine-a"}
 
 
+def test_apply_network_refresh_reconciles_pairs_after_device_upserts(
+    snapshot: tuple[InspectSnapshot, FakeFetcher],
+) -> None:
+    snap, fetcher = snapshot
+    fetcher._details["leaf-b"] = _detail_node("leaf-b", "LEAF-B", ["leaf-b.dev.0.up1"])
+    seen_at_reconcile: list[bool] = []
+
+    def edge_skeleton() -> list:
+        seen_at_reconcile.append("leaf-b" in snap._devices_by_id)
+        return [_edge_pair("leaf-b", "spine-a", "leaf-b.dev.0.up1", "spine-a.dev.0.swp2")]
+
+    fetcher.get_edge_skeleton = edge_skeleton
+    snap.apply_network_refresh(["leaf-b", "leaf-a"])
+    assert seen_at_reconcile == [True]
+
+
 def test_full_snapshot_is_hydrated_without_fetcher() -> None:
     fetcher = FakeFetcher()
     # Build a full snapshot manually (device_level=FULL, path_items provided)
@@ -354,9 +552,62 @@ def test_filter_ports_by_kind_uses_one_batched_lookup(snapshot: tuple[InspectSna
     assert len(fetcher.vertex_lookup_calls) == 1
 
 
+def test_query_ports_across_hydrated_devices(snapshot: tuple[InspectSnapshot, FakeFetcher]) -> None:
+    snap, fetcher = snapshot
+    fetcher._details["leaf-a"] = _filter_detail_node("leaf-a", "LEAF-A")
+    fetcher._details["spine-a"] = _filter_detail_node("spine-a", "SPINE-A")
+    assert snap.query_ports(active=True) == []  # nothing hydrated yet, nothing fetched
+    assert fetcher.device_detail_calls == []
+
+    snap.preload()
+    ports = snap.query_ports(active=True)
+    assert [(p.indexed.device_id, p.label) for p in ports] == [
+        ("spine-a", "up1"),
+        ("spine-a", "bidi1"),
+        ("leaf-a", "up1"),
+        ("leaf-a", "bidi1"),
+    ]  # skeleton device order, then port order
+    assert {p.label for p in snap.query_ports(device_label="SPINE-A", active=False)} == {"host1"}
+    assert snap.query_ports(vertex_type="Undecided") == []
+    for device_id in ("leaf-a", "spine-a"):
+        device = snap.get_device(device_id)
+        for filters in (
+            {"vertex_type": "Out"},
+            {"module_id": f"{device_id}.dev.1"},
+            {"endpoint": True, "active": True},
+        ):
+            expected = [p.id for p in device.filter_ports(**filters)]
+            assert [p.id for p in snap.query_ports(device_ids=[device_id], **filters)] == expected
+    assert fetcher.vertex_lookup_calls == []
+
+
+def test_query_ports_columns_follow_port_rebuilds(snapshot: tuple[InspectSnapshot, FakeFetcher]) -> None:
+    snap, fetcher = snapshot
+    fetcher._details["leaf-a"] = _filter_detail_node("leaf-a", "LEAF-A")
+    assert {p.label for p in snap.query_ports(device_ids=["leaf-a"], vertex_type="Out")} == {"up1"}
+
+    detail = _filter_detail_node("leaf-a", "LEAF-A")
+    fetcher._details["leaf-a"] = detail.model_copy(update={"modules": {}})
+    snap.apply_post_commit(device_ids=["leaf-a"], mark_paths_stale=False)
+    assert snap.query_ports(vertex_type="Out") == []
+
+    snap._apply_removals(["leaf-a"])
+    assert "leaf-a" not in snap._port_columns
+
+
 # --- Internal ---
 
 
+def _alarm(alarm_id: str, point_id: list[str], severity: int, seqno: int = 1) -> InspectApiAlarmItem:
+    return InspectApiAlarmItem.model_validate(
+        {
+            "_id": alarm_id,
+            "id": {"alertId": "Mock", "component": 1, "pointId": point_id},
+            "info": {"details": f"alarm {alarm_id}", "severity": severity, "seqno": seqno},
+        }
+    )
+
+
 def _skeleton_node(
     device_id: str,
     label: str,
@@ -522,10 +773,12 @@ class FakeFetcher:
 
     def __init__(self) -> None:
         self.device_detail_calls: list[str] = []
+        self.batch_detail_calls: list[list[str]] = []
         self.edge_pair_calls: list[str] = []
         self.vertex_lookup_calls: list[list[str]] = []
         self.edge_lookup_calls: list[list[str]] = []
         self.section_calls = 0
+        self.booking_calls: list[list[str]] = []
         self.alarm_section_calls = 0
         self.skeleton_calls = 0
         self._details = {
@@ -546,6 +799,10 @@ class FakeFetcher:
         self.device_detail_calls.append(device_id)
         return self._details.get(device_id)
 
+    def get_device_details(self, device_ids: list[str]) -> list[InspectApiNodeStatusItem]:
+        self.batch_detail_calls.append(list(device_ids))
+        return [self._details[d] for d in device_ids if d in self._details]
+
     def get_edge_pair(self, pair_id: str) -> InspectApiExternalEdgesByDeviceKeyItem:
         self.edge_pair_calls.append(pair_id)
         a, b = pair_id.split("::")
@@ -555,6 +812,11 @@ class FakeFetcher:
         self.section_calls += 1
         return self._paths
 
+    def get_paths_for_bookings(self, booking_ids: list[str]) -> list[InspectApiPathItem]:
+        self.booking_calls.append(list(booking_ids))
+        wanted = set(booking_ids)
+        return [item for item in self._paths if item.serviceFields and item.serviceFields.bid in wanted]
+
     def get_alarms_section(self) -> list[InspectApiAlarmItem]:
         self.alarm_section_calls += 1
         return list(self._alarms)
@@ -747,3 +1009,55 @@ def snapshot() -> Iterator[tuple[InspectSnapshot, FakeFetcher]]:
     )
     fetcher.skeleton_calls = 0  # reset after construction
     yield snap, fetcher
+
+
+def _assert_edge_indexes_consistent(snap: InspectSnapshot) -> None:
+    """The pair-keyed reverse indexes must cover everything the forward indexes hold."""
+    devices_by_pair: dict[str, set[str]] = {}
+    edge_ids_by_pair: dict[str, set[str]] = {}
+    for device_id, pairs in snap._edges_by_device_id.items():
+        assert pairs, device_id
+        for pair_id, entries in pairs.items():
+            assert entries
+            devices_by_pair.setdefault(pair_id, set()).add(device_id)
+            edge_ids_by_pair.setdefault(pair_id, set()).update(e.edge_id for e in entries)
+    assert {k: v for k, v in snap._devices_by_pair_id.items() if v} == devices_by_pair
+    for pair_id, edge_ids in edge_ids_by_pair.items():
+        assert edge_ids <= snap._edge_ids_by_pair_id[pair_id]
+    for key, indexed in snap._edge_by_port_key.items():
+        assert key in snap._port_keys_by_pair_id[indexed.pair_id]
+    for edge_id, pair_ids in snap._pair_ids_by_edge_id.items():
+        assert all(edge_id in snap._edge_ids_by_pair_id[pair_id] for pair_id in pair_ids)
+
+
+def test_edge_pair_drop_and_reindex_keep_reverse_indexes_consistent() -> None:
+    pairs = [_edge_pair(f"leaf-{i}", "spine-a", f"leaf-{i}.dev.0.up1", f"spine-a.dev.0.swp{i}") for i in range(5)]
+    snap = InspectSnapshot(fetcher=None, edge_items=pairs)
+    _assert_edge_indexes_consistent(snap)
+    _ = [e for e in snap.edges]  # populate the wrapper cache
+
+    snap._drop_edge_pair("leaf-1::spine-a")
+    snap._index_edge_pair(_edge_pair("leaf-2", "spine-a", "leaf-2.dev.0.up9", "spine-a.dev.0.swp9"))
+    _assert_edge_indexes_consistent(snap)
+    assert "leaf-1::spine-a" not in {e.pair_id for e in snap.get_edges_for_device("spine-a")}
+    assert snap.get_edge_for_port("spine-a", "spine-a.dev.0.swp1") is None
+    assert snap.get_edge_for_port("spine-a", "spine-a.dev.0.swp2") is None
+    assert snap.get_edge_for_port("spine-a", "spine-a.dev.0.swp9").pair_id == "leaf-2::spine-a"
+    assert len(snap.edges) == 4
+
+
+def test_removals_by_edge_id_pair_id_and_device_use_reverse_indexes() -> None:
+    pairs = [_edge_pair(f"leaf-{i}", "spine-a", f"leaf-{i}.dev.0.up1", f"spine-a.dev.0.swp{i}") for i in range(4)]
+    snap = InspectSnapshot(fetcher=None, device_items=[_skeleton_node("leaf-2", "LEAF-2")], edge_items=pairs)
+
+    snap._apply_removals(["leaf-0.dev.0.up1::spine-a.dev.0.swp0", "leaf-1::spine-a"])
+    _assert_edge_indexes_consistent(snap)
+    assert {e.pair_id for e in snap.edges} == {"leaf-2::spine-a", "leaf-3::spine-a"}
+
+    snap._apply_removals(["leaf-2"])
+    _assert_edge_indexes_consistent(snap)
+    snap._drop_edge_pair("leaf-2::spine-a")
+    _assert_edge_indexes_consistent(snap)
+    assert {e.pair_id for e in snap.edges} == {"leaf-3::spine-a"}
+    assert "leaf-2::spine-a" not in snap._edge_ids_by_pair_id
+    assert "leaf-2.dev.0.up1::spine-a.dev.0.swp2" not in snap._pair_ids_by_edge_id
@@ -0,0 +1,92 @@
+"""Columnar export: tables built from the snapshot indexes (no wrapper I/O), row batching, and the
+streaming CSV writer."""
+
+from __future__ import annotations
+
+import csv
+from pathlib import Path
+
+import pytest
+
+from videoipath_automation_tool.apps.inspect.snapshot import InspectSnapshot
+from videoipath_automation_tool.apps.inspect.tables import TABLE_NAMES, TABLE_SCHEMAS, iter_table_batches
+
+from .test_snapshot import FakeFetcher
+
+
+@pytest.fixture
+def snap() -> tuple[InspectSnapshot, FakeFetcher]:
+    fetcher = FakeFetcher()
+    snapshot = InspectSnapshot(
+        fetcher=fetcher,
+        device_items=fetcher.get_device_skeleton(),
+        edge_items=fetcher.get_edge_skeleton(),
+    )
+    return snapshot, fetcher
+
+
+def test_to_tables_emits_every_table_with_its_schema(snap: tuple[InspectSnapshot, FakeFetcher]) -> None:
+    snapshot, fetcher = snap
+    snapshot.preload()
+    tables = snapshot.to_tables()
+    assert list(tables) == list(TABLE_NAMES)
+    for name, table in tables.items():
+        assert table.column_names == [column for column, _ in TABLE_SCHEMAS[name]]
+        assert len({len(values) for values in table.columns.values()}) == 1
+
+    devices = tables["devices"]
+    assert sorted(devices.column("device_id")) == ["leaf-a", "spine-a"]
+    assert devices.column("hydrated") == [True, True]
+    assert len(tables["ports"]) == 4
+    port = next(row for row in tables["ports"].rows() if row["port_id"] == "leaf-a.dev.0.up1")
+    assert port["direction"] == "Out" and port["active"] is True and port["endpoint"] is False
+    assert len(tables["vertices"]) == 4
+    edge = next(tables["edges"].rows())
+    assert (edge["from_device_id"], edge["to_device_id"]) == ("leaf-a", "spine-a")
+    assert [row["device_id"] for row in tables["paths"].rows()] == ["leaf-a", "spine-a"]
+    assert len(tables["alarms"]) == 0
+    assert fetcher.section_calls == 1 and fetcher.alarm_section_calls == 1
+
+
+def test_port_tables_cover_hydrated_devices_only(snap: tuple[InspectSnapshot, FakeFetcher]) -> None:
+    snapshot, fetcher = snap
+    tables = snapshot.to_tables(["devices", "ports", "edges"])
+    assert list(tables) == ["devices", "ports", "edges"]
+    assert len(tables["ports"]) == 0
+    assert tables["devices"].column("hydrated") == [False, False]
+    assert fetcher.device_detail_calls == []
+    assert fetcher.section_calls == 0
+
+
+def test_table_batches_respect_batch_size(snap: tuple[InspectSnapshot, FakeFetcher]) -> None:
+    snapshot, _ = snap
+    snapshot.preload()
+    batches = list(iter_table_batches(snapshot, "ports", batch_size=3))
+    assert [len(batch) for batch in batches] == [3, 1]
+    assert [len(batch) for batch in iter_table_batches(snapshot, "alarms")] == [0]
+    with pytest.raises(ValueError, match="Unknown Inspect table"):
+        snapshot.to_tables(["nope"])
+
+
+def test_write_tables_streams_csv(snap: tuple[InspectSnapshot, FakeFetcher], tmp_path: Path) -> None:
+    snapshot, _ = snap
+    snapshot.preload()
+    written = snapshot.write_tables(tmp_path / "export", tables=["devices", "ports"], batch_size=1)
+    assert set(written) == {"devices", "ports"}
+    with written["ports"].open(newline="", encoding="utf-8") as handle:
+        rows = list(csv.DictReader(handle))
+    assert len(rows) == 4
+    assert {row["direction"] for row in rows} == {"Out"}
+    with written["devices"].open(newline="", encoding="utf-8") as handle:
+        device = next(csv.DictReader(handle))
+    assert device["label"] in {"LEAF-A", "SPINE-A"} and device["fetched_at"].endswith("+00:00")
+    with pytest.raises(ValueError, match="Unsupported table format"):
+        snapshot.write_tables(tmp_path, format="xlsx")  # type: ignore[arg-type]
+
+
+def test_write_tables_parquet_round_trips(snap: tuple[InspectSnapshot, FakeFetcher], tmp_path: Path) -> None:
+    parquet = pytest.importorskip("pyarrow.parquet")
+    snapshot, _ = snap
+    snapshot.preload()
+    written = snapshot.write_tables(tmp_path, format="parquet", tables=["ports"], batch_size=3)
+    assert parquet.read_table(written["ports"]).num_rows == 4
@@ -14,6 +14,7 @@ import pytest
 
 from videoipath_automation_tool.apps.inspect.transaction import InspectTransaction
 from videoipath_automation_tool.apps.inspect.errors import (
+    InspectChunkedCommitError,
     InspectCommitConflictError,
     InspectCommitError,
     InspectEntityNotFoundError,
@@ -331,6 +332,145 @@ def test_commit_failure_raises_commit_error() -> None:
     assert "non-existent" in str(exc.value)
 
 
+# --- Chunked commit ---
+
+
+def _chunked_api(num_devices: int = 3, num_vertices: int = 4) -> FakeAPI:
+    api = FakeAPI()
+    for n in range(num_devices):
+        api.devices[f"device{n}"] = _device_response(label=f"Dev {n}")
+    for n in range(num_vertices):
+        api.vertices[f"device0.1.p{n}.out"] = _vertex_data()
+    api.edges[EDGE_ID] = _edge_item()
+    return api
+
+
+def _stage_chunked(tx: InspectTransaction, num_devices: int = 3, num_vertices: int = 4) -> None:
+    tx.remove("device9")
+    tx.update_edge(EDGE_ID, weight=7)
+    for n in range(num_vertices):
+        tx.update_vertex(f"device0.1.p{n}.out", label=f"v{n}")
+    for n in range(num_devices):
+        tx.update_device(f"device{n}", label=f"Renamed {n}")
+
+
+def test_commit_chunked_orders_by_dependency_and_bounds_count() -> None:
+    api = _chunked_api()
+    snapshot = FakeSnapshot()
+    with _txn(api, snapshot=snapshot) as tx:
+        _stage_chunked(tx)
+        results = tx.commit_chunked(max_entities=3)
+    sent = [
+        [*delta.replaceDevices, *delta.replaceVertices, *delta.replaceEdges, *delta.remove]
+        for delta in api.update_calls
+    ]
+    assert sent == [
+        ["device0", "device1", "device2"],
+        ["device0.1.p0.out", "device0.1.p1.out", "device0.1.p2.out"],
+        ["device0.1.p3.out", EDGE_ID, "device9"],
+    ]
+    assert [r.applied_ids for r in results] == sent
+    assert api.update_calls[0].replaceDevices["device1"].descriptor.label == "Renamed 1"
+    assert len(snapshot.calls) == 1
+    assert snapshot.calls[0]["removed_ids"] == ["device9"]
+
+
+def test_commit_chunked_splits_by_serialised_size() -> None:
+    api = _chunked_api()
+    with _txn(api) as tx:
+        for n in range(3):
+            tx.update_device(f"device{n}", label=f"Renamed {n}")
+        tx.commit_chunked(max_bytes=1)  # every entity exceeds the budget and goes alone
+    assert [list(delta.replaceDevices) for delta in api.update_calls] == [["device0"], ["device1"], ["device2"]]
+
+
+def test_commit_chunked_stops_on_first_rejection() -> None:
+    api = _chunked_api()
+    rejected = InspectApiUpdateTopologyResponse.model_validate(load_fixture("update_topology_fail_remove.json"))
+    responses = [api.update_response, rejected, api.update_response]
+    api.update_topology = lambda delta: (api.update_calls.append(delta), responses.pop(0))[1]  # type: ignore[method-assign]
+    snapshot = FakeSnapshot()
+    tx = _txn(api, snapshot=snapshot)
+    _stage_chunked(tx)
+    with pytest.raises(InspectChunkedCommitError) as exc:
+        tx.commit_chunked(max_entities=3)
+    assert len(api.update_calls) == 2
+    assert [index for index, _ in exc.value.failures] == [1]
+    assert [r.applied_ids for r in exc.value.results] == [["device0", "device1", "device2"]]
+    assert "device0.1.p0.out" in exc.value.unapplied_ids and "device9" in exc.value.unapplied_ids
+    assert snapshot.calls[0]["device_ids"] and snapshot.calls[0]["removed_ids"] == []
+
+
+def test_commit_chunked_can_continue_past_rejection() -> None:
+    api = _chunked_api()
+    rejected = InspectApiUpdateTopologyResponse.model_validate(load_fixture("update_topology_fail_remove.json"))
+    responses = [rejected, api.update_response, api.update_response]
+    api.update_topology = lambda delta: (api.update_calls.append(delta), responses.pop(0))[1]  # type: ignore[method-assign]
+    tx = _txn(api)
+    _stage_chunked(tx)
+    with pytest.raises(InspectChunkedCommitError) as exc:
+        tx.commit_chunked(max_entities=3, stop_on_rejection=False)
+    assert len(api.update_calls) == 3
+    assert len(exc.value.results) == 2
+    assert sorted(exc.value.unapplied_ids) == ["device0", "device1", "device2"]
+
+
+def test_commit_chunked_treats_request_error_as_rejection() -> None:
+    api = _chunked_api()
+    responses: list[Any] = [api.update_response, ConnectionError("connection reset"), api.update_response]
+
+    def update_topology(delta: Any) -> InspectApiUpdateTopologyResponse:
+        api.update_calls.append(delta)
+        response = responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    api.update_topology = update_topology  # type: ignore[method-assign]
+    snapshot = FakeSnapshot()
+    tx = _txn(api, snapshot=snapshot)
+    _stage_chunked(tx)
+    with pytest.raises(InspectChunkedCommitError) as exc:
+        tx.commit_chunked(max_entities=3)
+    assert len(api.update_calls) == 2
+    [(index, error)] = exc.value.failures
+    assert index == 1 and isinstance(error, ConnectionError)
+    assert [r.applied_ids for r in exc.value.results] == [["device0", "device1", "device2"]]
+    assert "device0.1.p0.out" in exc.value.unapplied_ids and "device0" not in exc.value.unapplied_ids
+    assert len(snapshot.calls) == 1
+    with pytest.raises(RuntimeError, match="already committed"):
+        tx.commit_chunked(max_entities=3)
+
+
+def test_commit_chunked_reports_applied_chunks_when_building_a_later_chunk_fails(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from videoipath_automation_tool.apps.inspect import transaction as transaction_module
+
+    original = transaction_module._desired_form
+
+    def desired_form(entry: Any) -> Any:
+        if entry.entity_id == EDGE_ID:
+            raise ValueError("invalid intent")
+        return original(entry)
+
+    monkeypatch.setattr(transaction_module, "_desired_form", desired_form)
+    api = _chunked_api()
+    snapshot = FakeSnapshot()
+    tx = _txn(api, snapshot=snapshot)
+    _stage_chunked(tx)
+    with pytest.raises(InspectChunkedCommitError) as exc:
+        tx.commit_chunked(max_entities=3)
+    assert len(api.update_calls) == 2
+    [(index, error)] = exc.value.failures
+    assert index == 2 and isinstance(error, ValueError)
+    assert len(exc.value.results) == 2
+    assert sorted(exc.value.unapplied_ids) == sorted(["device0.1.p3.out", EDGE_ID, "device9"])
+    assert len(snapshot.calls) == 1
+    with pytest.raises(RuntimeError, match="already committed"):
+        tx.commit_chunked(max_entities=3)
+
+
 def test_empty_commit_rejected() -> None:
     api = FakeAPI()
     tx = _txn(api)
@@ -377,6 +517,38 @@ def test_conflict_when_entity_vanishes() -> None:
     assert "__exists__" in exc.value.conflicts[0].field_diffs
 
 
+def test_unchanged_server_form_skips_field_diffs(monkeypatch: pytest.MonkeyPatch) -> None:
+    from videoipath_automation_tool.apps.inspect import transaction
+
+    def fail(*_: Any) -> None:
+        raise AssertionError("field diffs computed despite matching digests")
+
+    monkeypatch.setattr(transaction, "_field_diffs", fail)
+    api = FakeAPI()
+    api.edges[EDGE_ID] = _edge_item(weight=1)
+    with _txn(api) as tx:
+        tx.update_edge(EDGE_ID, weight=99)
+        tx.commit()
+    assert api.update_calls[0].replaceEdges[EDGE_ID].weight == 99
+
+
+def test_commit_form_overlays_intents_without_mutating_baseline() -> None:
+    api = FakeAPI()
+    api.edges[EDGE_ID] = _edge_item(weight=1)
+    tx = _txn(api)
+    tx.update_edge(EDGE_ID, weight=99, bandwidth_weight_factor=3, tags=["T"])
+    tx.update_edge(EDGE_ID, intents={"descriptor.label": "renamed"})
+    entry = tx._entries[("edge", EDGE_ID)]
+    before = entry.baseline_form.model_dump(mode="json")
+    tx.commit()
+    assert entry.baseline_form.model_dump(mode="json") == before
+    form = api.update_calls[0].replaceEdges[EDGE_ID]
+    assert form.weight == 99 and form.tags == ["T"]
+    assert form.descriptor.label == "renamed"
+    assert form.weightFactors["bandwidth"]["weight"] == 3
+    assert form.weightFactors["service"] == {"max": 100, "weight": 0}  # untouched sub-values kept
+
+
 def test_rebase_refetches_baseline() -> None:
     api = FakeAPI()
     api.edges[EDGE_ID] = _edge_item(weight=1)
@@ -210,6 +210,78 @@ def test_add_virtual_ports() -> None:
     }
 
 
+def test_create_virtual_devices_bulk_sends_one_action_and_one_upsert(
+    load: Callable[[str], dict[str, Any]],
+) -> None:
+    create = load("update_virtual_instances_create.json")["data"]
+    app = _App(post_data=create, skeleton_nodes=[_virtual_skeleton_node("virtual.1", "Virtual Device 1")])
+    devices = app.create_virtual_devices_bulk(
+        [
+            VirtualDeviceSpec.from_ports("generic_bidir"),
+            VirtualDeviceSpec.empty(),
+            VirtualDeviceSpec.from_ports("ip_out"),
+        ]
+    )
+    assert [device.id for device in devices] == ["virtual.1"]
+    post_calls = app._inspect_api.vip_connector.rest.post_calls
+    assert len(post_calls) == 1
+    assert post_calls[0][0].endswith("/network/updateVirtualInstances")
+    added = post_calls[0][1]["data"]["add"]
+    assert len(added) == 3
+    assert added[2]["modules"][0]["vertices"] == [{"templateId": "ip_out", "count": 1}]
+    assert app._snapshot.upsert_calls == [["virtual.1"]]
+    with pytest.raises(ValueError):
+        app.create_virtual_devices_bulk([])
+
+
+def test_add_virtual_ports_bulk_refreshes_once() -> None:
+    app = _App(post_data={"msg": [], "ok": True}, skeleton_nodes=[])
+    ok = app.add_virtual_ports_bulk(
+        {
+            "virtual.1": {
+                0: {"ip_out": 2},
+                1: [PortFromTemplate(template_id="video_in"), PortFromTemplate(template_id="video_in", count=2)],
+            },
+            "virtual.2": {0: {"ip_out": 1}},
+        }
+    )
+    assert ok is True
+    payloads = sorted(
+        (payload["data"]["deviceId"], payload["data"]["moduleId"], payload["data"]["countByVertexTemplate"])
+        for url, payload in app._inspect_api.vip_connector.rest.post_calls
+        if url.endswith("/network/addVirtualTopology")
+    )
+    assert payloads == [
+        ("virtual.1", 0, {"ip_out": 2}),
+        ("virtual.1", 1, {"video_in": 3}),
+        ("virtual.2", 0, {"ip_out": 1}),
+    ]
+    assert app._snapshot.network_refresh_calls == [["virtual.1", "virtual.2"]]
+
+
+def test_add_virtual_ports_bulk_reports_failure_without_refresh() -> None:
+    app = _App(post_data={"msg": ["no such module"], "ok": False}, skeleton_nodes=[])
+    assert app.add_virtual_ports_bulk({"virtual.1": {0: {"ip_out": 1}}}) is False
+    assert app._snapshot.network_refresh_calls == []
+    with pytest.raises(ValueError):
+        app.add_virtual_ports_bulk({})
+
+
+def test_add_virtual_ports_bulk_refreshes_successful_devices_when_a_job_raises() -> None:
+    app = _App(post_data={"msg": [], "ok": True}, skeleton_nodes=[])
+    add_virtual_topology = app._inspect_api.add_virtual_topology
+
+    def flaky(data: Any) -> Any:
+        if data.deviceId == "virtual.2":
+            raise ConnectionError("connection reset")
+        return add_virtual_topology(data)
+
+    app._inspect_api.add_virtual_topology = flaky  # type: ignore[method-assign]
+    ok = app.add_virtual_ports_bulk({"virtual.1": {0: {"ip_out": 1}}, "virtual.2": {0: {"ip_out": 1}}})
+    assert ok is False
+    assert app._snapshot.network_refresh_calls == [["virtual.1"]]
+
+
 def test_port_template_crud_payloads() -> None:
     app = _App(post_data={"msg": [], "ok": True}, skeleton_nodes=[])
     assert app.create_port_template("example_tpl", "Example", {"type": "genericVertex", "vertexType": "In"}) is True
@@ -281,6 +353,30 @@ def test_upsert_devices_from_skeleton_indexes_virtual_nodes() -> None:
     assert device.label == "Virtual Device 1"
 
 
+def test_upsert_devices_from_skeleton_reads_only_named_devices() -> None:
+    nodes = [_virtual_skeleton_node("virtual.1", "Virtual Device 1"), _virtual_skeleton_node("virtual.2", "VD 2")]
+    scoped_calls: list[list[str]] = []
+    full_calls: list[int] = []
+    api = InspectAPI(SimpleNamespace(rest=_FakeRest(get_data={}, post_data={})))
+
+    def scoped(device_ids: list[str]) -> list[InspectApiNodeStatusItem]:
+        scoped_calls.append(list(device_ids))
+        return [node for node in nodes if node.deviceId in device_ids and node.deviceId != "virtual.2"]
+
+    api.get_device_skeleton_for = scoped  # type: ignore[method-assign]
+    api.get_device_skeleton = lambda: full_calls.append(1) or list(nodes)  # type: ignore[method-assign]
+    snap = InspectSnapshot(fetcher=api, device_items=[], edge_items=[])
+
+    snap.upsert_devices_from_skeleton(["virtual.1"])
+    assert scoped_calls == [["virtual.1"]]
+    assert full_calls == []
+    assert snap.get_device("virtual.1") is not None
+
+    snap.upsert_devices_from_skeleton(["virtual.1", "virtual.2"])  # scoped read misses virtual.2
+    assert full_calls == [1]
+    assert snap.get_device("virtual.2") is not None
+
+
 # --- Internal ---
 
 
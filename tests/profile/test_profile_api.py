@@ -0,0 +1,128 @@
+"""ProfileAPI read paths with a fake connector."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any
+
+from videoipath_automation_tool.apps.profile.model.profile_model import Profile
+from videoipath_automation_tool.apps.profile.profile_api import ProfileAPI
+
+from ..rest_v2 import FakeRestV2
+
+_SERVICES = "/rest/v2/data/status/conman/services/*/connection/profileIds,generic/**"
+
+
+def _services(*services: tuple[str, list[str], int]) -> dict[str, Any]:
+    items = [
+        {"_id": service_id, "connection": {"profileIds": profile_ids, "generic": {"state": state}}}
+        for service_id, profile_ids, state in services
+    ]
+    return {"status": {"conman": {"services": {"_items": items}}}}
+
+
+def _api(by_path: dict[str, dict[str, Any]], **kwargs: Any) -> tuple[ProfileAPI, FakeRestV2]:
+    rest = FakeRestV2(by_path)
+    return ProfileAPI(SimpleNamespace(rest=rest), **kwargs), rest  # type: ignore[arg-type]
+
+
+def test_usage_counts_answer_every_profile_from_one_services_scan() -> None:
+    api, rest = _api({_SERVICES: _services(("svc-1", ["p1", "p2"], 1), ("svc-2", ["p1"], 1), ("svc-3", ["p2"], 0))})
+    assert api.get_usage_counts(["p1", "p2", "p3"]) == {"p1": 2, "p2": 1, "p3": 0}
+    assert api.get_services_using_profile("p1") == ["svc-1", "svc-2"]
+    assert api.get_services_using_profile("p2") == "svc-1"
+    assert api.get_services_using_profile("p3") is None
+    assert api.get_usage_count("p1", mode="enhanced") == 2
+    assert rest.get_calls == [_SERVICES]
+
+
+def test_active_services_by_profile_returns_a_copy() -> None:
+    api, rest = _api({_SERVICES: _services(("svc-1", ["p1"], 1))})
+    services = api.get_active_services_by_profile()
+    services["p1"].append("svc-x")
+    services["p2"] = ["svc-y"]
+    assert api.get_usage_counts(["p1", "p2"]) == {"p1": 1, "p2": 0}
+    assert api.get_services_using_profile("p1") == "svc-1"
+    assert rest.get_calls == [_SERVICES]
+
+
+def test_service_index_expires_and_can_be_invalidated() -> None:
+    api, rest = _api({_SERVICES: _services(("svc-1", ["p1"], 1))}, service_index_ttl=0)
+    api.get_usage_counts(["p1"])
+    api.get_usage_counts(["p1"])
+    assert len(rest.get_calls) == 2
+
+    api, rest = _api({_SERVICES: _services(("svc-1", ["p1"], 1))})
+    api.get_usage_counts(["p1"])
+    api.invalidate_service_index()
+    api.get_usage_counts(["p1"])
+    assert len(rest.get_calls) == 2
+
+
+def test_build_in_usage_counts_use_one_read() -> None:
+    path = "/rest/v2/data/status/pathman/profiles/*/usageCount"
+    items = [{"_id": "p1", "usageCount": 4}, {"_id": "p2", "usageCount": 0}]
+    api, rest = _api({path: {"status": {"pathman": {"profiles": {"_items": items}}}}})
+    assert api.get_usage_counts(["p1", "p2", "missing"], mode="build_in") == {"p1": 4, "p2": 0, "missing": 0}
+    assert rest.get_calls == [path]
+
+
+# --- Bulk add / update / remove ---
+
+_PROFILES = "/rest/v2/data/config/pathman/profiles/**"
+
+
+def _stored(*profiles: Profile) -> dict[str, Any]:
+    items = [profile.model_dump(mode="json", by_alias=True) for profile in profiles]
+    return {"config": {"pathman": {"profiles": {"_items": items}}}}
+
+
+def test_add_profiles_packs_batches_and_refetches_once() -> None:
+    profiles = [Profile.create(f"profile-{index}") for index in range(5)]
+    rest = FakeRestV2({_PROFILES: _stored(*profiles)})
+    api = ProfileAPI(SimpleNamespace(rest=rest))  # type: ignore[arg-type]
+    api.PROFILE_BATCH_MAX_ACTIONS = 2
+    outcomes = api.add_profiles(profiles)
+    assert [len(body["actions"]) for body in rest.patch_bodies] == [2, 2, 1]
+    assert all(outcome.ok for outcome in outcomes)
+    assert [outcome.profile_id for outcome in outcomes] == [profile.id for profile in profiles]
+    assert outcomes[3].profile is not None and outcomes[3].profile.name == "profile-3"
+    assert rest.get_calls == [_PROFILES]
+
+
+def test_remove_profiles_reports_failed_batches_per_profile() -> None:
+    profiles = [Profile.create(f"profile-{index}") for index in range(3)]
+    rest = FakeRestV2(fail_batch=2)
+    api = ProfileAPI(SimpleNamespace(rest=rest))  # type: ignore[arg-type]
+    api.PROFILE_BATCH_MAX_ACTIONS = 2
+    outcomes = api.remove_profiles(profiles)
+    assert [outcome.ok for outcome in outcomes] == [True, True, False]
+    assert "OTHER_ERROR" in (outcomes[2].message or "")
+    assert set(rest.patch_bodies[0]["actions"][0]) == {"_action", "_id", "_rev"}
+    assert rest.get_calls == []
+
+
+def test_analyze_many_profiles_uses_one_reference_read() -> None:
+    stored = [Profile.create("a"), Profile.create("b")]
+    api, rest = _api({_PROFILES: _stored(*stored)})
+    staged = [stored[0].model_copy(update={"description": "changed"}), stored[1], Profile.create("new")]
+    diffs = api.analyze_profiles_configuration_changes(staged)
+    assert "root['description']" in diffs[stored[0].id]["values_changed"]
+    assert not diffs[stored[1].id]
+    assert diffs[staged[2].id] is None
+    assert rest.get_calls == [_PROFILES]
+
+
+def test_update_profiles_reports_rejected_items() -> None:
+    profiles = [Profile.create(f"profile-{index}") for index in range(4)]
+    rejected = {profiles[1].id, profiles[2].id}
+    rest = FakeRestV2(
+        {_PROFILES: _stored(*profiles)},
+        result_for=lambda action: ("failed", "Validation failed") if action["_id"] in rejected else None,
+    )
+    api = ProfileAPI(SimpleNamespace(rest=rest))  # type: ignore[arg-type]
+    api.PROFILE_BATCH_MAX_ACTIONS = 2
+    outcomes = api.update_profiles(profiles)
+    assert [outcome.ok for outcome in outcomes] == [True, False, False, True]
+    assert outcomes[1].message == "Validation failed" and outcomes[1].profile is None
+    assert outcomes[3].profile is not None
@@ -0,0 +1,78 @@
+"""Fake REST v2 connector shared by the unit suites (GET by exact path, PATCH answered per action)."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any, Callable, Optional
+
+from videoipath_automation_tool.connector.models.response_rest_v2 import ResponseV2Patch
+
+PATCH_RESULTS = {"add": "added", "update": "updated", "remove": "removed"}
+
+
+class FakeRestV2:
+    """``get`` serves ``by_path[url_path]``; ``patch`` answers every action with the server's result value.
+
+    ``result_for(action)`` may return ``(res, msg)`` to override an action's result (e.g. a rejection);
+    ``fail_batch`` makes the n-th (1-based) PATCH raise like a failed request."""
+
+    def __init__(
+        self,
+        by_path: Optional[dict[str, dict[str, Any]]] = None,
+        *,
+        result_for: Optional[Callable[[dict[str, Any]], Optional[tuple[str, str]]]] = None,
+        fail_batch: Optional[int] = None,
+    ) -> None:
+        self.by_path = by_path or {}
+        self.get_calls: list[str] = []
+        self.patch_bodies: list[dict[str, Any]] = []
+        self._result_for = result_for
+        self._fail_batch = fail_batch
+
+    def get(self, url_path: str, **kwargs: Any) -> SimpleNamespace:
+        self.get_calls.append(url_path)
+        return SimpleNamespace(data=self.by_path[url_path], header=SimpleNamespace(ok=True))
+
+    def patch(self, url_path: str, body: Any, **kwargs: Any) -> ResponseV2Patch:
+        payload = body.model_dump(mode="json", by_alias=True)
+        self.patch_bodies.append(payload)
+        if len(self.patch_bodies) == self._fail_batch:
+            raise Exception("Error in API response: OTHER_ERROR")
+        items = []
+        for position, action in enumerate(payload["actions"]):
+            item_id = action.get("_id") or f"new-{len(self.patch_bodies)}-{position}"
+            res, msg = (self._result_for(action) if self._result_for else None) or (
+                PATCH_RESULTS[action["_action"]],
+                "",
+            )
+            items.append(
+                {
+                    "_clientId": "0",
+                    "_id": item_id,
+                    "_id_s": item_id,
+                    "_rev": "rev-new",
+                    "actionRef": {},
+                    "msg": msg,
+                    "res": res,
+                }
+            )
+        return ResponseV2Patch.model_validate(
+            {
+                "header": {
+                    "auth": True,
+                    "caption": "Operation Successful",
+                    "code": "OK",
+                    "errorDetails": [],
+                    "id": "0",
+                    "msg": [],
+                    "ok": True,
+                    "user": "api-user",
+                },
+                "result": {
+                    "items": items,
+                    "mode": payload["mode"],
+                    "stats": {"added": 0, "ignored": 0, "removed": 0, "updated": 0},
+                    "validateOnly": False,
+                },
+            }
+        )
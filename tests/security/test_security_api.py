@@ -0,0 +1,114 @@
+"""SecurityAPI domain / membership indexes and bulk membership writes with a fake connector."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any
+
+from videoipath_automation_tool.apps.security.app.security_resources_app import SecurityResources
+from videoipath_automation_tool.apps.security.model.domain_membership_model import LocalMemberships, ResourceType
+from videoipath_automation_tool.apps.security.model.domain_model import Domain
+from videoipath_automation_tool.apps.security.security_api import SecurityAPI
+
+from ..rest_v2 import FakeRestV2
+
+_DOMAINS = "/rest/v2/data/config/domainman/domains/**"
+_MEMBERSHIPS = "/rest/v2/data/config/domainman/localDomainMemberships/**"
+
+
+def _rest(domains: list[dict[str, Any]], memberships: list[dict[str, Any]]) -> FakeRestV2:
+    return FakeRestV2(
+        {
+            _DOMAINS: {"config": {"domainman": {"domains": {"_items": domains}}}},
+            _MEMBERSHIPS: {"config": {"domainman": {"localDomainMemberships": {"_items": memberships}}}},
+        }
+    )
+
+
+def _domain(domain_id: str, name: str) -> dict[str, Any]:
+    return {"_id": domain_id, "_rev": "1", "desc": {"desc": "", "label": name}}
+
+
+def _membership(resource: str, *domains: str) -> dict[str, Any]:
+    return {"_id": resource, "_vid": resource, "_rev": "1", "domains": list(domains)}
+
+
+def _api(rest: FakeRestV2, **kwargs: Any) -> SecurityAPI:
+    return SecurityAPI(SimpleNamespace(rest=rest), **kwargs)  # type: ignore[arg-type]
+
+
+def test_domain_lookups_and_writes_share_one_index_read() -> None:
+    rest = _rest([_domain("d1", "Studio"), _domain("d2", "News")], [])
+    api = _api(rest)
+    assert api.get_domain_by_name("News").id == "d2"
+    assert api.get_domain_by_id("d1").name == "Studio"
+
+    added = api.add_domain(Domain.model_validate({"desc": {"label": "Sport"}}))
+    assert api.get_domain_by_name("Sport").id == added.id
+
+    renamed = api.get_domain_by_id("d1")
+    renamed.name = "Studio A"
+    api.update_domain(renamed)
+    assert api.get_domain_by_name("Studio A").rev == "rev-new"
+    assert rest.get_calls == [_DOMAINS]
+
+
+def test_unknown_domain_re_reads_the_index_once() -> None:
+    rest = _rest([_domain("d1", "Studio")], [])
+    api = _api(rest, index_ttl=0)
+    api.get_domain_by_id("d1")
+    api.invalidate_indexes()
+    api.get_domain_by_name("Studio")
+    assert rest.get_calls == [_DOMAINS, _DOMAINS]
+
+
+def test_bulk_membership_writes_batch_and_update_the_index() -> None:
+    rest = _rest([], [_membership("device:device1", "d1")])
+    api = _api(rest)
+    api.MEMBERSHIP_BATCH_MAX_ACTIONS = 2
+    new = [LocalMemberships.model_validate(_membership(f"device:device{index}", "d1")) for index in range(1, 5)]
+    outcomes = api.add_memberships_bulk(new)
+    assert [outcome.ok for outcome in outcomes] == [False, True, True, True]
+    assert [len(body["actions"]) for body in rest.patch_bodies] == [2, 1]
+    assert all(body["mode"] == "ignore_revs" for body in rest.patch_bodies)
+    assert api.get_memberships_by_type_and_id(ResourceType.DEVICE, "device3").rev == "rev-new"
+    assert rest.get_calls == [_MEMBERSHIPS]
+
+
+def test_resources_bulk_update_adds_updates_and_removes() -> None:
+    rest = _rest(
+        [], [_membership("device:device1", "d1"), _membership("device:device2", "d1"), _membership("profile:p1", "d1")]
+    )
+    api = _api(rest)
+    resources = SecurityResources(api, api._logger)
+    updated = resources.get_device_memberships("device1")
+    updated.domains.append("d2")
+    emptied = resources.get_device_memberships("device2")
+    emptied.domains.clear()
+    stale = resources.get_profile_memberships("p1")
+    stale.rev = "0"
+    added = resources.get_device_memberships("device3")
+    added.domains.append("d1")
+
+    outcomes = resources.update_memberships_bulk([updated, emptied, stale, added])
+    assert [(outcome.action, outcome.ok) for outcome in outcomes] == [
+        ("update", True),
+        ("remove", True),
+        ("update", False),
+        ("add", True),
+    ]
+    assert [body["actions"][0]["_action"] for body in rest.patch_bodies] == ["add", "update", "remove"]
+    assert set(api.get_memberships_by_id()) == {"device:device1", "device:device3", "profile:p1"}
+    assert rest.get_calls == [_MEMBERSHIPS, _MEMBERSHIPS]  # lookups, then one fresh read for the whole bulk update
+
+
+def test_unknown_membership_re_reads_the_index_once() -> None:
+    rest = _rest([], [])
+    api = _api(rest)
+    assert api.get_memberships_by_id() == {}
+    rest.by_path[_MEMBERSHIPS]["config"]["domainman"]["localDomainMemberships"]["_items"].append(
+        _membership("device:device7", "d1")
+    )
+    api._membership_index_built_at -= 5  # created by another client after the index was built
+    assert api.get_memberships_by_type_and_id(ResourceType.DEVICE, "device7").domains == ["d1"]
+    assert rest.get_calls == [_MEMBERSHIPS, _MEMBERSHIPS]
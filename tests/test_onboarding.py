@@ -0,0 +1,146 @@
+"""Pipelined onboarding (inventory → reachable → topology → synced) with fake apps."""
+
+from __future__ import annotations
+
+import json
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from videoipath_automation_tool.apps.onboarding import OnboardingPipeline, OnboardingProgress, _PipelineRun
+
+
+class _FakeInventory:
+    def __init__(self, unreachable: set[str] | None = None) -> None:
+        self.unreachable = set(unreachable or ())
+        self.added: list[str] = []
+        self.reachability_calls: list[list[str]] = []
+        self._lock = threading.Lock()
+
+    def create_device_from_discovered_device(self, discovered_device_id: str) -> Any:
+        return SimpleNamespace(discovered=discovered_device_id)
+
+    def add_device(self, device: Any, label_check: bool, address_check: bool, config_only: bool) -> Any:
+        assert config_only is True
+        with self._lock:
+            self.added.append(device.discovered)
+        return SimpleNamespace(device_id=f"device{device.discovered[1:]}")
+
+    def get_devices_reachability(self, device_ids: list[str]) -> dict[str, bool]:
+        self.reachability_calls.append(list(device_ids))
+        return {device_id: device_id not in self.unreachable for device_id in device_ids}
+
+
+class _FakeInspect:
+    def __init__(self) -> None:
+        self.add_calls: list[list[tuple[str, float, float]]] = []
+        self.sync_calls: list[list[str]] = []
+
+    def add_devices_to_topology(self, specs: list[tuple[str, float, float]], sync: bool) -> bool:
+        assert sync is False
+        self.add_calls.append(list(specs))
+        return True
+
+    def sync_devices(self, device_ids: list[str], add_only: bool, conflict_strategy: Any) -> bool:
+        self.sync_calls.append(list(device_ids))
+        return True
+
+
+def _pipeline(inventory: _FakeInventory, inspect: _FakeInspect, **options: Any) -> OnboardingPipeline:
+    options = {"batch_size": 5, "batch_wait": 5.0, "inventory_workers": 1, "status_delay": 0.0, **options}
+    return OnboardingPipeline(inventory, inspect, **options)  # type: ignore[arg-type]
+
+
+def test_pipeline_batches_topology_adds_and_syncs() -> None:
+    inventory, inspect = _FakeInventory(), _FakeInspect()
+    progress: list[OnboardingProgress] = []
+    result = _pipeline(inventory, inspect).run(
+        [f"d{index}" for index in range(1, 6)], positions={"d2": (100.0, 50.0)}, on_progress=progress.append
+    )
+    assert result.ok is True
+    assert sorted(inventory.added) == ["d1", "d2", "d3", "d4", "d5"]
+    assert len(inspect.add_calls) == 1
+    assert ("device2", 100.0, 50.0) in inspect.add_calls[0]
+    assert ("device1", 0.0, 0.0) in inspect.add_calls[0]
+    assert len(inspect.sync_calls) == 1
+    assert sorted(inspect.sync_calls[0]) == [f"device{index}" for index in range(1, 6)]
+    stages = [entry.stage for entry in progress if entry.key == "d3"]
+    assert stages == ["inventory", "status", "topology", "synced"]
+
+
+def test_pipeline_resumes_from_checkpoint(tmp_path: Path) -> None:
+    checkpoint = tmp_path / "onboarding.json"
+    inventory, inspect = _FakeInventory(unreachable={"device3"}), _FakeInspect()
+    result = _pipeline(inventory, inspect, status_attempts=2).run(["d1", "d2", "d3"], checkpoint_path=checkpoint)
+    assert result.ok is False
+    assert [entry.key for entry in result.failed] == ["d3"]
+    assert result.devices["d3"].stage == "inventory"
+    saved = json.loads(checkpoint.read_text(encoding="utf-8"))
+    assert saved["devices"]["d3"]["device_id"] == "device3"
+    assert saved["devices"]["d1"]["stage"] == "synced"
+
+    inventory.unreachable.clear()
+    inventory.added.clear()
+    inspect = _FakeInspect()
+    resumed = _pipeline(inventory, inspect).run(["d1", "d2", "d3"], checkpoint_path=checkpoint)
+    assert resumed.ok is True
+    assert inventory.added == []
+    assert inspect.add_calls == [[("device3", 0.0, 0.0)]]
+    assert inspect.sync_calls == [["device3"]]
+
+
+def test_pipeline_debounces_checkpoint_writes(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    writes: list[int] = []
+    write_checkpoint = _PipelineRun._write_checkpoint
+
+    def counting_write(self: _PipelineRun) -> None:
+        writes.append(len(self._progress))
+        write_checkpoint(self)
+
+    monkeypatch.setattr(_PipelineRun, "_write_checkpoint", counting_write)
+    checkpoint = tmp_path / "onboarding.json"
+    devices = [f"d{index}" for index in range(1, 6)]
+    result = _pipeline(_FakeInventory(), _FakeInspect(), checkpoint_interval=60.0).run(
+        devices, checkpoint_path=checkpoint
+    )
+    assert result.ok is True
+    assert len(writes) == 2  # the first state change, then the final state when the run ends
+    saved = json.loads(checkpoint.read_text(encoding="utf-8"))
+    assert {entry["stage"] for entry in saved["devices"].values()} == {"synced"}
+
+
+def test_pipeline_reports_batch_failures_and_rejects_duplicates() -> None:
+    inventory, inspect = _FakeInventory(), _FakeInspect()
+    inspect.sync_devices = lambda device_ids, add_only, conflict_strategy: False  # type: ignore[method-assign]
+    result = _pipeline(inventory, inspect).run(["d1", "d2"])
+    assert {entry.key for entry in result.failed} == {"d1", "d2"}
+    assert all(entry.stage == "topology" for entry in result.failed)
+    assert result.devices["d1"].error == "syncDevices reported failure"
+
+    with pytest.raises(ValueError):
+        _pipeline(inventory, inspect).run(["d1", "d1"])
+
+
+def test_pipeline_raises_when_checkpoint_write_fails(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    def failing_write(self: _PipelineRun) -> None:
+        raise OSError("disk full")
+
+    monkeypatch.setattr(_PipelineRun, "_write_checkpoint", failing_write)
+    pipeline = _pipeline(_FakeInventory(), _FakeInspect(), queue_size=1, batch_wait=0.0)
+    outcome: dict[str, BaseException] = {}
+
+    def run() -> None:
+        try:
+            pipeline.run([f"d{index}" for index in range(1, 6)], checkpoint_path=tmp_path / "state" / "x.json")
+        except BaseException as error:
+            outcome["error"] = error
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    thread.join(timeout=10)
+    assert not thread.is_alive(), "run() hung after a stage failed"
+    assert isinstance(outcome.get("error"), OSError)
+    assert (tmp_path / "state").is_dir()
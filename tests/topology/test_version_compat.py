@@ -9,10 +9,11 @@ import pytest
 
 from videoipath_automation_tool.apps.topology.errors import TopologyUnsupportedError
 from videoipath_automation_tool.apps.topology.topology_app import TopologyApp
+from videoipath_automation_tool.connector.capabilities import VideoIPathCapabilities
 
 
 def _fake_connector(version: str) -> SimpleNamespace:
-    return SimpleNamespace(videoipath_version=version)
+    return SimpleNamespace(capabilities=VideoIPathCapabilities.from_version(version))
 
 
 def test_topology_app_supported_on_2024() -> None:
@@ -0,0 +1,120 @@
+"""Driver schema comparison: per-driver digest skip, process-pool diffing, and the on-disk digest cache."""
+
+from __future__ import annotations
+
+import copy
+from pathlib import Path
+
+import pytest
+
+from videoipath_automation_tool.utils.driver_schema_comparison import (
+    DriverSchemaComparator,
+    DriverSchemaDigestCache,
+)
+
+
+def test_identical_drivers_are_not_deep_diffed(monkeypatch: pytest.MonkeyPatch) -> None:
+    diffed: list[str] = []
+    original = DriverSchemaComparator._diff_driver
+
+    def spy(compare_entry: dict, reference_entry: dict) -> dict | None:
+        diffed.append(compare_entry["_id"])
+        return original(compare_entry, reference_entry)
+
+    monkeypatch.setattr(DriverSchemaComparator, "_diff_driver", staticmethod(spy))
+    reference = [_driver("com.nevion.a", "x"), _driver("com.nevion.b", "y")]
+    compare = [_driver("com.nevion.a", "x"), _driver("com.nevion.b", "changed")]
+
+    result = DriverSchemaComparator.compare_driver_schemas(compare_schema=compare, reference_schema=reference)
+
+    assert diffed == ["com.nevion.b"]
+    assert list(result["changed_drivers"]) == ["com.nevion.b"]
+    assert list(result["changed_drivers"]["com.nevion.b"]["customSettings"]["changed"]) == ["host"]
+
+
+def test_digest_ignores_fields_outside_custom_settings() -> None:
+    plain = _driver("com.nevion.a", "x")
+    decorated = {**copy.deepcopy(plain), "version": "9.9.9"}
+    assert DriverSchemaComparator.compute_driver_digests([plain]) == DriverSchemaComparator.compute_driver_digests(
+        [decorated]
+    )
+
+
+def test_process_pool_result_matches_serial(monkeypatch: pytest.MonkeyPatch) -> None:
+    reference = [_driver(f"com.nevion.d{i}", "old") for i in range(6)]
+    compare = [_driver(f"com.nevion.d{i}", "new") for i in range(6)]
+    serial = DriverSchemaComparator.compare_driver_schemas(compare, reference)
+
+    monkeypatch.setattr(DriverSchemaComparator, "PARALLEL_DIFF_THRESHOLD", 2)
+    parallel = DriverSchemaComparator.compare_driver_schemas(compare, reference, max_workers=2)
+
+    assert parallel == serial
+    assert len(parallel["changed_drivers"]) == 6
+
+
+def test_default_comparison_never_starts_a_process_pool(monkeypatch: pytest.MonkeyPatch) -> None:
+    def no_pool(jobs: list, max_workers: int | None) -> list:
+        raise AssertionError("process pool started without opt-in")
+
+    monkeypatch.setattr(DriverSchemaComparator, "_diff_drivers_in_process_pool", staticmethod(no_pool))
+    monkeypatch.setattr(DriverSchemaComparator, "PARALLEL_DIFF_THRESHOLD", 2)
+    reference = [_driver(f"com.nevion.d{i}", "old") for i in range(6)]
+    compare = [_driver(f"com.nevion.d{i}", "new") for i in range(6)]
+
+    assert len(DriverSchemaComparator.compare_driver_schemas(compare, reference)["changed_drivers"]) == 6
+
+
+def test_server_comparison_uses_cached_digest(tmp_path: Path) -> None:
+    cache = DriverSchemaDigestCache(tmp_path)
+    server = [_driver("com.nevion.a", "x"), _driver("com.nevion.b", "y"), _driver("com.nevion.c", "z")]
+    local = [_driver("com.nevion.a", "x"), _driver("com.nevion.b", "changed"), _driver("com.nevion.new", "n")]
+    downloads: list[int] = []
+
+    def fetch() -> list[dict]:
+        downloads.append(1)
+        return server
+
+    first = DriverSchemaComparator.compare_driver_schema_with_server(local, "2025.4.3", fetch, cache=cache)
+    second = DriverSchemaComparator.compare_driver_schema_with_server(local, "2025.4.3", fetch, cache=cache)
+
+    assert len(downloads) == 1
+    assert first == second == DriverSchemaComparator.compare_driver_schemas(local, server)
+    assert first["added_drivers"] == ["com.nevion.new"]
+    assert first["removed_drivers"] == ["com.nevion.c"]
+    assert (tmp_path / "2025.4.3.json").is_file()
+
+
+def test_server_comparison_downloads_when_cache_misses_a_mismatch(tmp_path: Path) -> None:
+    cache = DriverSchemaDigestCache(tmp_path)
+    server = [_driver("com.nevion.a", "x"), _driver("com.nevion.b", "y")]
+    downloads: list[int] = []
+
+    def fetch() -> list[dict]:
+        downloads.append(1)
+        return server
+
+    DriverSchemaComparator.compare_driver_schema_with_server(server, "2025.4.3", fetch, cache=cache)
+    # Local schema changed since the cache was written: driver 'a' now differs and its server entry is not cached.
+    changed_local = [_driver("com.nevion.a", "changed"), _driver("com.nevion.b", "y")]
+    result = DriverSchemaComparator.compare_driver_schema_with_server(changed_local, "2025.4.3", fetch, cache=cache)
+
+    assert len(downloads) == 2
+    assert list(result["changed_drivers"]) == ["com.nevion.a"]
+
+    # Other server versions never share a digest.
+    DriverSchemaComparator.compare_driver_schema_with_server(server, "2026.2.0", fetch, cache=cache)
+    assert len(downloads) == 3
+
+
+def _driver(driver_id: str, host_label: str) -> dict:
+    return {
+        "_id": driver_id,
+        "version": "1.0.0",
+        "customSettings": {
+            "_schema": {
+                "values": {
+                    "host": {"_schema": {"descriptor": {"label": host_label, "desc": ""}, "type": "string"}},
+                }
+            }
+        },
+    }